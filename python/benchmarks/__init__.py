@@ -0,0 +1,6 @@
+"""
+Go2 SDK benchmarks against the fake server.
+
+Run each one as a module from the ``python`` directory, e.g.
+``python -m benchmarks.suite``.
+"""
@@ -0,0 +1,87 @@
+"""
+Benchmark: one CreateLink call per link against links.batch_create.
+
+Imports links into a FakeGo2Server served over localhost with added
+per-call latency, first with one CreateLink call per link (with the same
+number of calls in flight), then with BatchCreateLinks calls. Reports
+links/sec and RPCs sent.
+
+Usage:
+    python -m benchmarks.batch_write --links 20000 --concurrency 4 --latency 0.001
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Dict, List
+
+from go2_sdk.concurrency import fan_out
+from go2_sdk.gen.links.v1 import links_pb2
+from go2_sdk.testing import FakeGo2Server, Faults
+
+
+def items(prefix: str, count: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "slug": "{}{}".format(prefix, i),
+            "title": "Link {}".format(i),
+            "web_url": "https://example.ge/{}".format(i),
+            "ios_url": "https://apps.apple.com/app/id{}".format(i),
+        }
+        for i in range(count)
+    ]
+
+
+def one_by_one(client: Any, links: List[Dict[str, Any]], concurrency: int) -> int:
+    failed: List[int] = []
+    fan_out(
+        client.links._stub.CreateLink,
+        (links_pb2.CreateLinkRequest(**item) for item in links),
+        concurrency,
+        lambda index, response: None,
+        lambda index, error: failed.append(index),
+    )
+    return len(failed)
+
+
+def batched(client: Any, links: List[Dict[str, Any]], concurrency: int) -> int:
+    results = client.links.batch_create(links, concurrency=concurrency)
+    return sum(1 for result in results if isinstance(result, Exception))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--links", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=4,
+                        help="calls in flight on either path")
+    parser.add_argument("--latency", type=float, default=0.001,
+                        help="seconds the server adds to every call")
+    args = parser.parse_args()
+
+    results: Dict[str, Any] = {"benchmark": "batch_write", "links": args.links,
+                               "concurrency": args.concurrency, "latency": args.latency}
+    with FakeGo2Server(seed=1, max_workers=max(4, args.concurrency)) as server:
+        server.set_faults(Faults(latency=args.latency))
+        client = server.client(in_process=False)
+        for name, create, prefix, method in (
+            ("create", one_by_one, "c", "CreateLink"),
+            ("batch_create", batched, "b", "BatchCreateLinks"),
+        ):
+            links = items(prefix, args.links)
+            before = server.calls.get(method, 0)
+            start = time.perf_counter()
+            failed = create(client, links, args.concurrency)
+            seconds = time.perf_counter() - start
+            results[name] = {
+                "seconds": seconds,
+                "links_per_second": args.links / seconds,
+                "failed": failed,
+                "rpcs": server.calls.get(method, 0) - before,
+            }
+        client.close()
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
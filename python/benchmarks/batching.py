@@ -0,0 +1,87 @@
+"""
+Benchmark: individual links.get calls against LinkLoader batching.
+
+Many threads look up random links on a FakeGo2Server served over
+localhost with added per-call latency, first with one GetLink call per
+lookup, then through a LinkLoader that coalesces them into
+BatchGetLinks calls. Reports lookups/sec, latency and RPCs sent.
+
+Usage:
+    python -m benchmarks.batching --callers 64 --lookups 20000 --latency 0.001
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, List
+
+from benchmarks.common import percentile
+from go2_sdk import LinkLoader
+from go2_sdk.testing import FakeGo2Server, Faults
+
+
+def run(callers: int, lookups: int, ids: List[str], get: Callable[[str], Any]) -> Dict[str, Any]:
+    latencies: List[List[float]] = [[] for _ in range(callers)]
+    per_caller = lookups // callers
+
+    def caller(out: List[float], seed: int) -> None:
+        rng = random.Random(seed)
+        for _ in range(per_caller):
+            start = time.perf_counter()
+            get(rng.choice(ids))
+            out.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=caller, args=(out, i)) for i, out in enumerate(latencies)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    seconds = time.perf_counter() - start
+    flat = sorted(v for out in latencies for v in out)
+    return {
+        "lookups": len(flat),
+        "seconds": seconds,
+        "lookups_per_second": len(flat) / seconds,
+        "p50_ms": percentile(flat, 0.50) * 1000,
+        "p99_ms": percentile(flat, 0.99) * 1000,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--callers", type=int, default=64)
+    parser.add_argument("--lookups", type=int, default=20000)
+    parser.add_argument("--links", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.001,
+                        help="seconds the server adds to every call")
+    parser.add_argument("--window", type=float, default=0.002)
+    args = parser.parse_args()
+
+    results: Dict[str, Any] = {"benchmark": "batching", "callers": args.callers,
+                               "latency": args.latency, "window": args.window}
+    with FakeGo2Server(seed=1, max_workers=args.callers) as server:
+        client = server.client(in_process=False)
+        ids = [
+            client.links.create(slug="b{}".format(i), web_url="https://example.ge").id
+            for i in range(args.links)
+        ]
+        server.set_faults(Faults(latency=args.latency))
+
+        before = dict(server.calls)
+        results["get"] = run(args.callers, args.lookups, ids, client.links.get)
+        results["get"]["rpcs"] = server.calls.get("GetLink", 0) - before.get("GetLink", 0)
+
+        with LinkLoader(client.links, window=args.window) as loader:
+            results["loader"] = run(args.callers, args.lookups, ids, loader.get)
+            results["loader"]["rpcs"] = loader.batches
+            results["loader"]["mean_batch"] = loader.loads / max(1, loader.batches)
+        client.close()
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
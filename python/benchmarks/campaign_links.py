@@ -0,0 +1,107 @@
+"""
+Benchmark: memory and iteration speed of compact CampaignLink views.
+
+Decodes a synthetic ListCampaignLinksResponse and compares raw
+CampaignLink messages with the "records" and "columns" views from
+go2_sdk.compact. Memory is resident set size growth (Linux /proc).
+
+Usage:
+    python -m benchmarks.campaign_links --links 10000
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict
+
+from benchmarks.common import measure
+from go2_sdk.compact import compact_links
+from go2_sdk.gen.campaigns.v1 import campaigns_pb2
+
+COUNTRIES = ("GE", "US", "DE", "TR", "UA")
+CITIES = ("Tbilisi", "Batumi", "Kutaisi", "Berlin", "Istanbul")
+PLATFORMS = ("ios", "android", "web")
+
+
+def make_response(n: int) -> bytes:
+    links = []
+    for i in range(n):
+        clicked = i % 3 == 0
+        links.append(
+            campaigns_pb2.CampaignLink(
+                id="cl_{:012d}".format(i),
+                campaign_id="cmp_000000000042",
+                slug="c{}".format(i),
+                recipient_id="+99555{:07d}".format(i),
+                recipient_name="Recipient {}".format(i),
+                recipient_metadata={"segment": "s{}".format(i % 4), "lang": "ka"},
+                clicked=clicked,
+                first_clicked_at="2024-06-01T12:00:00Z" if clicked else "",
+                last_clicked_at="2024-06-02T12:00:00Z" if clicked else "",
+                click_count=i % 5 if clicked else 0,
+                first_click_platform=PLATFORMS[i % 3] if clicked else "",
+                first_click_country=COUNTRIES[i % 5] if clicked else "",
+                first_click_city=CITIES[i % 5] if clicked else "",
+                created_at="2024-06-01T00:00:00Z",
+                short_url="https://go2.ge/c{}".format(i),
+            )
+        )
+    response = campaigns_pb2.ListCampaignLinksResponse(links=links, total=n)
+    return response.SerializeToString()
+
+
+def iterate(links: Any) -> Dict[str, int]:
+    by_country: Dict[str, int] = {}
+    for link in links:
+        if link.clicked:
+            country = link.first_click_country
+            by_country[country] = by_country.get(country, 0) + link.click_count
+    return by_country
+
+
+def timed(fn: Callable[[], Any], repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--links", type=int, default=10000)
+    args = parser.parse_args()
+
+    wire = make_response(args.links)
+
+    def raw() -> Any:
+        return campaigns_pb2.ListCampaignLinksResponse.FromString(wire)
+
+    def records() -> Any:
+        return compact_links(raw().links, "records")
+
+    def columns() -> Any:
+        return compact_links(raw().links, "columns")
+
+    results: Dict[str, Any] = {"benchmark": "campaign_links", "links": args.links}
+    for name, build in (("raw", raw), ("records", records), ("columns", columns)):
+        view = build()
+        links = view.links
+        results[name] = {
+            "bytes_per_link": measure(build) / args.links,
+            "decode_seconds": timed(build),
+            "iterate_seconds": timed(lambda: iterate(links)),
+        }
+
+    # Columns are fastest when aggregated column-wise rather than row by row.
+    cols = columns().links
+    results["columns"]["columnar_aggregate_seconds"] = timed(
+        lambda: sum(c for c, k in zip(cols.click_count, cols.clicked) if k)
+    )
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark: StreamClicks into a ClickAggregator against polling GetStats.
+
+Records clicks on many links of a FakeGo2Server served over localhost
+while one ClickStream feeds a ClickAggregator, and reports events/sec and
+click-to-aggregator latency. For comparison it times one round of
+GetStats polls over every link: the cost of a single refresh that the
+stream replaces.
+
+Usage:
+    python -m benchmarks.click_stream --links 1000 --clicks 20000
+"""
+
+import argparse
+import json
+import random
+import time
+from typing import Any, Dict, List
+
+from benchmarks.common import percentile
+from go2_sdk import ClickAggregator
+from go2_sdk.testing import FakeGo2Server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--links", type=int, default=1000)
+    parser.add_argument("--clicks", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=32,
+                        help="GetStats calls in flight while polling")
+    args = parser.parse_args()
+
+    results: Dict[str, Any] = {"benchmark": "click_stream", "links": args.links,
+                               "clicks": args.clicks}
+    with FakeGo2Server(seed=1) as server:
+        client = server.client(in_process=False)
+        links = client.links.batch_create(
+            {"slug": "c{}".format(i), "web_url": "https://example.ge/{}".format(i)}
+            for i in range(args.links)
+        )
+        ids = [link.id for link in links]
+
+        aggregator = ClickAggregator(window=600)
+        latencies: List[float] = []
+
+        def on_event(event: Any) -> None:
+            aggregator.add(event)
+            sent = event.timestamp.seconds + event.timestamp.nanos / 1e9
+            latencies.append(time.time() - sent)
+
+        stream = client.analytics.stream_clicks(ids)
+        stream.run(on_event)
+        time.sleep(0.2)
+
+        rng = random.Random(1)
+        start = time.perf_counter()
+        for _ in range(args.clicks):
+            server.click("c{}".format(rng.randrange(args.links)))
+        while stream.events < args.clicks and time.perf_counter() - start < 60:
+            time.sleep(0.01)
+        seconds = time.perf_counter() - start
+        stream.close()
+        latencies.sort()
+        results["stream"] = {
+            "events": stream.events,
+            "seconds": seconds,
+            "events_per_second": stream.events / seconds,
+            "p50_ms": percentile(latencies, 0.50) * 1000,
+            "p99_ms": percentile(latencies, 0.99) * 1000,
+            "rpcs": server.calls.get("StreamClicks", 0),
+            "aggregated": aggregator.total(),
+        }
+
+        start = time.perf_counter()
+        columns = client.analytics.get_stats_many(ids, concurrency=args.concurrency)
+        seconds = time.perf_counter() - start
+        results["poll_round"] = {
+            "seconds": seconds,
+            "rpcs": len(ids),
+            "errors": len(columns.errors),
+        }
+        client.close()
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Helpers shared by the benchmark scripts."""
+
+import gc
+import math
+import os
+import threading
+from typing import Any, Callable, Sequence, Tuple
+
+
+def rss() -> int:
+    # The upb protobuf runtime allocates outside the Python allocator, so
+    # tracemalloc cannot see message memory; resident set size can.
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def measure(build: Callable[[], Any]) -> int:
+    """Return the resident memory growth caused by keeping build()'s result alive."""
+    gc.collect()
+    before = rss()
+    obj = build()
+    size = rss() - before
+    del obj
+    gc.collect()
+    return size
+
+
+def peak(run: Callable[[], Any], interval: float = 0.001) -> Tuple[int, Any]:
+    """Return (peak resident memory growth while run() executes, its result)."""
+    gc.collect()
+    before = rss()
+    highest = [before]
+    done = threading.Event()
+
+    def sample() -> None:
+        while not done.wait(interval):
+            highest[0] = max(highest[0], rss())
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    try:
+        result = run()
+        highest[0] = max(highest[0], rss())
+    finally:
+        done.set()
+        sampler.join()
+    return highest[0] - before, result
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile (q in 0..1) of already sorted values."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, math.ceil(q * len(sorted_values)) - 1))
+    return sorted_values[index]
@@ -0,0 +1,50 @@
+"""
+Compare two benchmark JSON results, e.g. from two releases.
+
+Prints every numeric value present in both files with the new/old ratio.
+Whether higher is better depends on the metric (calls_per_second versus
+p99_ms).
+
+Usage:
+    python -m benchmarks.compare v1.2.6.json v1.2.7.json
+"""
+
+import argparse
+import json
+from typing import Any, Dict
+
+
+def flatten(value: Any, prefix: str = "") -> Dict[str, float]:
+    out: Dict[str, float] = {}
+    if isinstance(value, dict):
+        for key, item in value.items():
+            out.update(flatten(item, "{}.{}".format(prefix, key) if prefix else key))
+    elif isinstance(value, list):
+        for i, item in enumerate(value):
+            # Label list entries by their first field (threads, per_page, ...).
+            label = next(iter(item.values())) if isinstance(item, dict) and item else i
+            out.update(flatten(item, "{}[{}]".format(prefix, label)))
+    elif isinstance(value, (int, float)) and not isinstance(value, bool):
+        out[prefix] = float(value)
+    return out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("old")
+    parser.add_argument("new")
+    args = parser.parse_args()
+
+    with open(args.old) as f:
+        old = flatten(json.load(f))
+    with open(args.new) as f:
+        new = flatten(json.load(f))
+
+    print("{:<56} {:>14} {:>14} {:>8}".format("metric", "old", "new", "ratio"))
+    for key in sorted(old.keys() & new.keys()):
+        ratio = new[key] / old[key] if old[key] else float("nan")
+        print("{:<56} {:>14.6g} {:>14.6g} {:>8.2f}".format(key, old[key], new[key], ratio))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark: memory per link and lookups per second of SlugIndex.
+
+Compares a dict of full protobuf Link messages against SlugIndex's
+compact RedirectTarget records, using synthetic links. Memory is
+measured as resident set size growth and needs Linux /proc.
+
+Usage:
+    python -m benchmarks.slug_index --links 100000
+"""
+
+import argparse
+import json
+import random
+import time
+from typing import Any, Callable, Dict, List
+
+from benchmarks.common import measure
+from go2_sdk.gen.links.v1 import links_pb2
+from go2_sdk.index import SlugIndex
+
+
+def make_links(n: int) -> List[Any]:
+    links = []
+    for i in range(n):
+        app = i % 500  # Links share store URLs across a few hundred apps.
+        link = links_pb2.Link(
+            id="lnk_{:012d}".format(i),
+            user_id="usr_000000000001",
+            slug="s{}".format(i),
+            title="Campaign link {}".format(i),
+            ios_url="https://apps.apple.com/app/id{}".format(100000 + app),
+            android_url="https://play.google.com/store/apps/details?id=com.app{}".format(app),
+            web_url="https://example.com/landing/{}".format(i),
+            fallback_url="https://example.com/download",
+            app_name="App {}".format(app),
+            app_icon_url="https://cdn.example.com/icons/{}.png".format(app),
+            description="Smart link for app {} used in campaign {}".format(app, i),
+            is_active=i % 10 != 0,
+            total_clicks=i * 7,
+        )
+        link.created_at.seconds = 1700000000 + i
+        link.updated_at.seconds = 1700000000 + i
+        links.append(link)
+    return links
+
+
+def lookups_per_second(get: Callable[[str], Any], slugs: List[str]) -> float:
+    start = time.perf_counter()
+    for slug in slugs:
+        get(slug)
+    return len(slugs) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--links", type=int, default=100000)
+    parser.add_argument("--lookups", type=int, default=1000000)
+    args = parser.parse_args()
+
+    wire = [link.SerializeToString() for link in make_links(args.links)]
+
+    def proto_dict() -> Dict[str, Any]:
+        links = (links_pb2.Link.FromString(b) for b in wire)
+        return {link.slug: link for link in links}
+
+    def slug_index() -> SlugIndex:
+        return SlugIndex(links_pb2.Link.FromString(b) for b in wire)
+
+    index_bytes = measure(slug_index)
+    proto_bytes = measure(proto_dict)
+
+    slugs = ["s{}".format(random.randrange(args.links)) for _ in range(args.lookups)]
+    protos = proto_dict()
+    index = slug_index()
+
+    print(json.dumps({
+        "benchmark": "slug_index",
+        "links": args.links,
+        "proto_dict_bytes_per_link": proto_bytes / args.links,
+        "slug_index_bytes_per_link": index_bytes / args.links,
+        "proto_dict_lookups_per_sec": lookups_per_second(protos.get, slugs),
+        "slug_index_lookups_per_sec": lookups_per_second(index.get, slugs),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
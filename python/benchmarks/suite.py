@@ -0,0 +1,394 @@
+"""
+Benchmark suite: throughput, latency and memory of the SDK's main paths.
+
+Runs against go2_sdk.testing.FakeGo2Server, by default served from a
+child process over localhost so the server does not share the client's
+GIL (``--transport inprocess`` removes the network as well). Covers:
+
+    unary        links.get calls/sec and p50/p99 latency per thread count
+    generate     campaigns.generate_links with many recipients, chunked
+    pagination   links.list_all at several page sizes, all fields and masked
+    export       campaigns.export_links time and peak memory per view
+    startup      import go2_sdk and Go2Client construction time
+    interceptors per-call cost of the client's interceptors (always in-process)
+
+Prints one JSON document (and writes it with ``--output``); compare two
+runs with ``python -m benchmarks.compare``. Memory is resident set size growth
+and needs Linux /proc.
+
+Usage:
+    python -m benchmarks.suite --only unary,startup --output v1.2.7.json
+    python -m benchmarks.suite --recipients 10000,100000,1000000
+"""
+
+import argparse
+import json
+import multiprocessing
+import platform
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import grpc
+from google import protobuf
+
+from benchmarks.common import peak, percentile
+import go2_sdk
+from go2_sdk import Go2Client, MetricsInterceptor, TracingInterceptor
+from go2_sdk.gen.campaigns.v1 import campaigns_pb2
+from go2_sdk.gen.links.v1 import links_pb2, links_pb2_grpc
+from go2_sdk.testing import FakeGo2Server
+
+API_KEY = "go2_bench"
+
+# The Link fields an incremental sync job needs.
+SYNC_FIELDS = ["id", "slug", "updated_at", "total_clicks"]
+
+
+def _serve(conn: Any, seed: int) -> None:
+    with FakeGo2Server(seed=seed, max_workers=32) as server:
+        conn.send(server.start())
+        conn.recv()
+
+
+class Target:
+    """Where the benchmarks send calls: a fake server in a child process or in-process."""
+
+    def __init__(self, transport: str, seed: int):
+        self.transport = transport
+        self._server: Optional[FakeGo2Server] = None
+        self._process: Optional[Any] = None
+        self.endpoint = ""
+        if transport == "inprocess":
+            self._server = FakeGo2Server(seed=seed, max_workers=32)
+        else:
+            context = multiprocessing.get_context("spawn")
+            self._conn, child = context.Pipe()
+            self._process = context.Process(target=_serve, args=(child, seed), daemon=True)
+            self._process.start()
+            self.endpoint = self._conn.recv()
+
+    def client(self, **kwargs: Any) -> Go2Client:
+        if self._server is not None:
+            return self._server.client(api_key=API_KEY, **kwargs)
+        return Go2Client(api_key=API_KEY, endpoint=self.endpoint, insecure=True, **kwargs)
+
+    def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+        if self._process is not None:
+            self._conn.send("stop")
+            self._process.join(5)
+
+
+def _export_peak(endpoint: str, campaign_id: str, kwargs: Dict[str, Any]) -> int:
+    # Runs in a fresh process: memory freed by earlier exports would
+    # otherwise be reused and hide the peak.
+    with Go2Client(api_key=API_KEY, endpoint=endpoint, insecure=True) as client:
+        client.campaigns.get(campaign_id)
+        return peak(lambda: client.campaigns.export_links(campaign_id, **kwargs))[0]
+
+
+def timed(fn: Callable[[], Any], repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def latency_summary(latencies: List[float], seconds: float) -> Dict[str, float]:
+    latencies.sort()
+    return {
+        "calls": len(latencies),
+        "calls_per_second": len(latencies) / seconds,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+    }
+
+
+def recipients(n: int) -> Iterator[Dict[str, Any]]:
+    for i in range(n):
+        yield {
+            "id": "+99555{:07d}".format(i),
+            "name": "Recipient {}".format(i),
+            "metadata": {"segment": "s{}".format(i % 4)},
+        }
+
+
+def generate(client: Go2Client, campaign_id: str, n: int, chunk: int) -> int:
+    created = 0
+    batch: List[Dict[str, Any]] = []
+    for recipient in recipients(n):
+        batch.append(recipient)
+        if len(batch) == chunk:
+            created += client.campaigns.generate_links(campaign_id, batch).links_created
+            batch = []
+    if batch:
+        created += client.campaigns.generate_links(campaign_id, batch).links_created
+    return created
+
+
+def bench_unary(target: Target, args: argparse.Namespace) -> Any:
+    client = target.client()
+    link = client.links.create(slug="unary", web_url="https://example.ge")
+    for _ in range(100):
+        client.links.get(link.id)
+
+    results = []
+    for threads in args.threads:
+        latencies: List[List[float]] = [[] for _ in range(threads)]
+        deadline = time.perf_counter() + args.seconds
+
+        def worker(out: List[float]) -> None:
+            while True:
+                start = time.perf_counter()
+                if start >= deadline:
+                    return
+                client.links.get(link.id)
+                out.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        pool = [threading.Thread(target=worker, args=(out,)) for out in latencies]
+        for thread in pool:
+            thread.start()
+        for thread in pool:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        summary = latency_summary([v for out in latencies for v in out], elapsed)
+        results.append(dict(threads=threads, **summary))
+    client.close()
+    return results
+
+
+def bench_generate(target: Target, args: argparse.Namespace) -> Any:
+    client = target.client()
+    results = []
+    for n in args.recipients:
+        campaign = client.campaigns.create(
+            name="bench {}".format(n), destination_url="https://shop.example.ge"
+        )
+        chunk = min(args.chunk, n)
+        request = campaigns_pb2.GenerateLinksRequest(
+            campaign_id=campaign.id,
+            recipients=[campaigns_pb2.Recipient(**r) for r in recipients(chunk)],
+        )
+        start = time.perf_counter()
+        grown, created = peak(lambda: generate(client, campaign.id, n, chunk))
+        elapsed = time.perf_counter() - start
+        results.append({
+            "recipients": n,
+            "created": created,
+            "chunk": chunk,
+            "chunk_request_bytes": request.ByteSize(),
+            "seconds": elapsed,
+            "recipients_per_second": n / elapsed,
+            "peak_rss_growth_bytes": grown,
+        })
+        client.campaigns.delete(campaign.id)
+    client.close()
+    return results
+
+
+def bench_pagination(target: Target, args: argparse.Namespace) -> Any:
+    client = target.client()
+    for i in range(args.links):
+        client.links.create(slug="page{}".format(i), web_url="https://example.ge/{}".format(i))
+    results = []
+    for per_page in (20, 100, 1000):
+        entry: Dict[str, Any] = {"per_page": per_page}
+        for prefix, fields in (("", None), ("masked_", SYNC_FIELDS)):
+            count = [0]
+
+            def walk() -> None:
+                count[0] = sum(
+                    1 for _ in client.links.list_all(per_page=per_page, fields=fields)
+                )
+
+            seconds = timed(walk)
+            page = client.links.list(per_page=per_page, raw=True, fields=fields)
+            on_page = max(1, min(per_page, count[0]))
+            decode = timed(lambda: links_pb2.ListLinksResponse.FromString(page), repeat=20)
+            entry.update({
+                prefix + "seconds": seconds,
+                prefix + "links_per_second": count[0] / seconds,
+                prefix + "bytes_per_link": len(page) / on_page,
+                prefix + "decode_us_per_link": decode / on_page * 1e6,
+            })
+        entry["links"] = count[0]
+        entry["pages"] = -(-count[0] // per_page)
+        results.append(entry)
+    client.close()
+    return results
+
+
+def bench_export(target: Target, args: argparse.Namespace) -> Any:
+    client = target.client()
+    campaign = client.campaigns.create(name="export", destination_url="https://shop.example.ge")
+    generate(client, campaign.id, args.export_links, args.chunk)
+    results: Dict[str, Any] = {"links": args.export_links}
+    for name, kwargs in (
+        ("messages", {}),
+        ("records", {"view": "records"}),
+        ("columns", {"view": "columns"}),
+        ("raw", {"raw": True}),
+    ):
+        def export(kwargs: Dict[str, Any] = kwargs) -> Any:
+            return client.campaigns.export_links(campaign.id, **kwargs)
+
+        if target.endpoint:
+            with multiprocessing.get_context("spawn").Pool(1) as pool:
+                grown = pool.apply(_export_peak, (target.endpoint, campaign.id, kwargs))
+        else:
+            grown = peak(export)[0]
+        results[name] = {"seconds": timed(export), "peak_rss_growth_bytes": grown}
+    client.campaigns.delete(campaign.id)
+    client.close()
+    return results
+
+
+def bench_startup(target: Target, args: argparse.Namespace) -> Any:
+    imports = []
+    for _ in range(5):
+        out = subprocess.check_output([
+            sys.executable,
+            "-c",
+            "import time; t = time.perf_counter(); import go2_sdk; "
+            "print(time.perf_counter() - t)",
+        ])
+        imports.append(float(out))
+
+    def construct(n: int, **kwargs: Any) -> float:
+        start = time.perf_counter()
+        for _ in range(n):
+            Go2Client(api_key=API_KEY, **kwargs).close()
+        return (time.perf_counter() - start) / n
+
+    return {
+        "import_seconds_min": min(imports),
+        "import_seconds_median": statistics.median(imports),
+        "client_insecure_seconds": construct(200, endpoint="127.0.0.1:1", insecure=True),
+        "client_tls_seconds": construct(200, endpoint="127.0.0.1:1"),
+    }
+
+
+def bench_interceptors(target: Target, args: argparse.Namespace) -> Any:
+    # Always in-process: the overhead is tens of microseconds, well within
+    # the jitter of a localhost round trip.
+    server = FakeGo2Server(seed=args.seed)
+    link_id = server.client().links.create(slug="intercept", web_url="https://e.ge").id
+
+    def per_call(call: Callable[[], Any]) -> float:
+        for _ in range(100):
+            call()
+        runs = []
+        for _ in range(5):
+            start = time.perf_counter()
+            for _ in range(args.calls):
+                call()
+            runs.append((time.perf_counter() - start) / args.calls)
+        return statistics.median(runs)
+
+    stub = links_pb2_grpc.LinkServiceStub(server.channel())
+    request = links_pb2.GetLinkRequest(id=link_id)
+    metadata = (("x-api-key", API_KEY),)
+    results: Dict[str, Any] = {
+        "bare_us": per_call(lambda: stub.GetLink(request, metadata=metadata)) * 1e6
+    }
+
+    configs: Dict[str, Dict[str, Any]] = {
+        "client": {},
+        "metrics": {"metrics": MetricsInterceptor()},
+    }
+    try:
+        from opentelemetry.sdk.trace import TracerProvider
+
+        tracer = TracerProvider().get_tracer("go2-bench")
+        configs["tracing"] = {"tracing": TracingInterceptor(tracer=tracer)}
+    except ImportError:
+        pass
+    for name, kwargs in configs.items():
+        client = server.client(api_key=API_KEY, **kwargs)
+        results[name + "_us"] = per_call(lambda: client.links.get(link_id)) * 1e6
+        if name == "client":
+            with client.profile():
+                results["profile_us"] = per_call(lambda: client.links.get(link_id)) * 1e6
+        client.close()
+    for name in list(results):
+        if name != "bare_us":
+            results[name[:-3] + "_overhead_us"] = results[name] - results["bare_us"]
+    server.close()
+    return results
+
+
+BENCHMARKS = {
+    "unary": bench_unary,
+    "generate": bench_generate,
+    "pagination": bench_pagination,
+    "export": bench_export,
+    "startup": bench_startup,
+    "interceptors": bench_interceptors,
+}
+
+
+def ints(value: str) -> List[int]:
+    return [int(v) for v in value.split(",") if v]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--only", default=",".join(BENCHMARKS),
+                        help="comma-separated benchmarks to run")
+    parser.add_argument("--transport", choices=("network", "inprocess"), default="network")
+    parser.add_argument("--threads", type=ints, default=[1, 2, 4, 8, 16])
+    parser.add_argument("--seconds", type=float, default=2.0,
+                        help="duration of each unary thread-count run")
+    parser.add_argument("--recipients", type=ints, default=[10000, 100000])
+    parser.add_argument("--chunk", type=int, default=10000,
+                        help="recipients per GenerateLinks call")
+    parser.add_argument("--links", type=int, default=2000,
+                        help="links created for the pagination benchmark")
+    parser.add_argument("--export-links", type=int, default=50000)
+    parser.add_argument("--calls", type=int, default=1000,
+                        help="calls per run in the interceptor benchmark")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="also write the JSON results to this file")
+    args = parser.parse_args()
+
+    names = [n for n in args.only.split(",") if n]
+    unknown = set(names) - set(BENCHMARKS)
+    if unknown:
+        parser.error("unknown benchmarks: " + ", ".join(sorted(unknown)))
+
+    results: Dict[str, Any] = {
+        "benchmark": "suite",
+        "meta": {
+            "go2_sdk": go2_sdk.__version__,
+            "python": platform.python_version(),
+            "grpcio": grpc.__version__,
+            "protobuf": protobuf.__version__,
+            "platform": platform.platform(),
+            "transport": args.transport,
+            "time": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        },
+    }
+    target = Target(args.transport, args.seed)
+    try:
+        for name in names:
+            results[name] = BENCHMARKS[name](target, args)
+    finally:
+        target.close()
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
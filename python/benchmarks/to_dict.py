@@ -0,0 +1,134 @@
+"""
+Benchmark: go2_sdk.convert.to_dict against json_format.MessageToDict.
+
+Converts synthetic Link, Campaign, CampaignLink, Domain and Integration
+messages with both and checks that the outputs are identical.
+
+Usage:
+    python -m benchmarks.to_dict --messages 10000
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict, List
+
+from google.protobuf.json_format import MessageToDict
+from go2_sdk.convert import to_dict, to_dict_many
+from go2_sdk.gen.campaigns.v1 import campaigns_pb2
+from go2_sdk.gen.domains.v1 import domains_pb2
+from go2_sdk.gen.integrations.v1 import integrations_pb2
+from go2_sdk.gen.links.v1 import links_pb2
+
+
+def _stamp(message: Any, field: str, i: int) -> None:
+    getattr(message, field).FromSeconds(1717200000 + i)
+    getattr(message, field).nanos = (i % 4) * 250000000
+
+
+def make_link(i: int) -> Any:
+    link = links_pb2.Link(
+        id="lnk_{:012d}".format(i),
+        user_id="usr_000000000001",
+        slug="s{}".format(i),
+        title="Link {}".format(i),
+        ios_url="https://apps.apple.com/app/id{}".format(i),
+        android_url="https://play.google.com/store/apps/details?id=ge.app{}".format(i),
+        web_url="https://example.ge/{}".format(i),
+        fallback_url="https://example.ge",
+        is_active=i % 2 == 0,
+        total_clicks=i * 7,
+    )
+    _stamp(link, "created_at", i)
+    _stamp(link, "updated_at", i + 60)
+    return link
+
+
+def make_campaign(i: int) -> Any:
+    return campaigns_pb2.Campaign(
+        id="cmp_{:012d}".format(i),
+        name="Campaign {}".format(i),
+        destination_url="https://example.ge/sale",
+        total_recipients=1000 + i,
+        status="active",
+        total_clicks=i * 3,
+        created_at="2024-06-01T00:00:00Z",
+    )
+
+
+def make_campaign_link(i: int) -> Any:
+    return campaigns_pb2.CampaignLink(
+        id="cl_{:012d}".format(i),
+        campaign_id="cmp_000000000042",
+        slug="c{}".format(i),
+        recipient_id="+99555{:07d}".format(i),
+        recipient_metadata={"segment": "s{}".format(i % 4), "lang": "ka"},
+        clicked=i % 3 == 0,
+        click_count=i % 5,
+        first_click_country="GE",
+        short_url="https://go2.ge/c{}".format(i),
+    )
+
+
+def make_domain(i: int) -> Any:
+    domain = domains_pb2.Domain(
+        id="dom_{:012d}".format(i),
+        domain="links{}.example.ge".format(i),
+        status=domains_pb2.DOMAIN_STATUS_ACTIVE,
+        ssl_status=domains_pb2.SSL_STATUS_ACTIVE,
+    )
+    _stamp(domain, "verified_at", i)
+    _stamp(domain, "created_at", i)
+    return domain
+
+
+def make_integration(i: int) -> Any:
+    integration = integrations_pb2.Integration(
+        id="int_{:012d}".format(i),
+        name="Webhook {}".format(i),
+        type=integrations_pb2.INTEGRATION_TYPE_SLACK,
+        is_active=True,
+    )
+    _stamp(integration, "created_at", i)
+    return integration
+
+
+def timed(fn: Callable[[], Any], repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--messages", type=int, default=10000)
+    args = parser.parse_args()
+
+    results: Dict[str, Any] = {"benchmark": "to_dict", "messages": args.messages}
+    for name, make in (
+        ("Link", make_link),
+        ("Campaign", make_campaign),
+        ("CampaignLink", make_campaign_link),
+        ("Domain", make_domain),
+        ("Integration", make_integration),
+    ):
+        messages: List[Any] = [make(i) for i in range(args.messages)]
+        baseline = timed(lambda: [MessageToDict(m) for m in messages])
+        fast = timed(lambda: [to_dict(m) for m in messages])
+        bulk = timed(lambda: to_dict_many(messages))
+        results[name] = {
+            "message_to_dict_seconds": baseline,
+            "to_dict_seconds": fast,
+            "to_dict_many_seconds": bulk,
+            "speedup": baseline / bulk,
+            "identical": all(MessageToDict(m) == to_dict(m) for m in messages),
+        }
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -38,6 +38,14 @@ from go2_sdk.client import (
     QRService,
     CampaignsService,
 )
+from go2_sdk.batching import LinkLoader
+from go2_sdk.cache import AnalyticsCache
+from go2_sdk.clicks import ClickAggregator, ClickStream, WindowCounts
+from go2_sdk.columnar import StatsColumns, TimeseriesColumns
+from go2_sdk.compact import CampaignLinkColumns, CampaignLinkRecord, CompactPage
+from go2_sdk.convert import to_dict, to_dict_many, to_json, to_json_many
+from go2_sdk.dashboard import Dashboard
+from go2_sdk.futures import Go2Future, as_completed, gather
 from go2_sdk.errors import (
     Go2Error,
     AuthenticationError,
@@ -46,6 +54,15 @@ from go2_sdk.errors import (
     ValidationError,
     RateLimitError,
 )
+from go2_sdk.index import RedirectTarget, SlugIndex
+from go2_sdk.metrics import MetricsInterceptor
+from go2_sdk.mirror import LinkMirror
+from go2_sdk.raw import split_records
+from go2_sdk.rollup import AnalyticsRollup, RollupResult
+from go2_sdk.store import TimeseriesStore
+from go2_sdk.tracing import TracingInterceptor
+from go2_sdk.watch import CampaignDelta, CampaignWatcher
+from go2_sdk.watermark import HighWaterMark
 
 __version__ = "1.2.7"
 __all__ = [
@@ -56,6 +73,36 @@ __all__ = [
     "DomainsService",
     "QRService",
     "CampaignsService",
+    "AnalyticsCache",
+    "TimeseriesStore",
+    "LinkMirror",
+    "HighWaterMark",
+    "SlugIndex",
+    "LinkLoader",
+    "RedirectTarget",
+    "StatsColumns",
+    "TimeseriesColumns",
+    "Dashboard",
+    "ClickStream",
+    "ClickAggregator",
+    "WindowCounts",
+    "AnalyticsRollup",
+    "RollupResult",
+    "CampaignWatcher",
+    "CampaignDelta",
+    "CampaignLinkRecord",
+    "CampaignLinkColumns",
+    "CompactPage",
+    "MetricsInterceptor",
+    "TracingInterceptor",
+    "split_records",
+    "Go2Future",
+    "as_completed",
+    "gather",
+    "to_dict",
+    "to_dict_many",
+    "to_json",
+    "to_json_many",
     "Go2Error",
     "AuthenticationError",
     "NotFoundError",
@@ -74,6 +121,7 @@ try:
     IntegrationConfig = integrations_pb2.IntegrationConfig
     Integration = integrations_pb2.Integration
     Link = links_pb2.Link
+    LinkOrder = links_pb2.LinkOrder
     Campaign = campaigns_pb2.Campaign
 
     __all__.extend([
@@ -81,6 +129,7 @@ try:
         "IntegrationConfig",
         "Integration",
         "Link",
+        "LinkOrder",
         "Campaign",
     ])
 except ImportError:
@@ -0,0 +1,187 @@
+"""
+Go2 SDK NumPy converters for analytics and campaign stats.
+
+Requires the optional ``numpy`` dependency:
+
+    pip install go2-sdk[numpy]
+"""
+
+from typing import (
+    Any,
+    Dict,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from go2_sdk.columnar import STATS_FIELDS, StatsColumns, TimeseriesColumns
+
+
+def _numpy() -> Any:
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "NumPy is required for go2_sdk.arrays; install go2-sdk[numpy]"
+        ) from e
+    return numpy
+
+
+class AlignedSeries(NamedTuple):
+    """
+    Several daily series on one date axis: ``values[i, j]`` is ``keys[i]``
+    on ``dates[j]``.
+    """
+
+    dates: Any
+    keys: List[str]
+    values: Any
+
+
+def parse_dates(dates: Sequence[str]) -> Any:
+    """Parse ISO dates (or timestamps, truncated to the day) into datetime64[D]."""
+    np = _numpy()
+    return np.array(dates, dtype="U10").astype("datetime64[D]")
+
+
+def timeseries_to_numpy(response: Any) -> Dict[str, Any]:
+    """Convert a GetTimeseriesResponse into date, clicks and unique_clicks arrays."""
+    np = _numpy()
+    points = response.points
+    return {
+        "date": parse_dates([p.date for p in points]),
+        "clicks": np.fromiter((p.clicks for p in points), np.int64, len(points)),
+        "unique_clicks": np.fromiter(
+            (p.unique_clicks for p in points), np.int64, len(points)
+        ),
+    }
+
+
+def stats_to_numpy(stats: StatsColumns) -> Dict[str, Any]:
+    """View StatsColumns as int64 arrays without copying."""
+    np = _numpy()
+    result: Dict[str, Any] = {"link_id": np.array(stats.link_ids, dtype=object)}
+    for field in STATS_FIELDS:
+        result[field] = np.frombuffer(stats.column(field), dtype=np.int64)
+    return result
+
+
+def timeseries_columns_to_numpy(columns: TimeseriesColumns) -> Dict[str, Any]:
+    """
+    Convert TimeseriesColumns into flat arrays.
+
+    ``link_index`` gives, for every row, the position of its link in
+    ``columns.link_ids``, so per-link reductions are ``np.bincount`` calls.
+    """
+    np = _numpy()
+    offsets = np.frombuffer(columns.offsets, dtype=np.int64)
+    return {
+        "date": parse_dates(columns.dates),
+        "clicks": np.frombuffer(columns.clicks, dtype=np.int64),
+        "unique_clicks": np.frombuffer(columns.unique_clicks, dtype=np.int64),
+        "offsets": offsets,
+        "link_index": np.repeat(np.arange(len(columns.link_ids)), np.diff(offsets)),
+    }
+
+
+def campaign_stats_to_numpy(stats: Any) -> Dict[str, Any]:
+    """
+    Convert CampaignStats maps into sorted arrays.
+
+    Days are returned in date order, platforms and countries by clicks
+    descending.
+    """
+    np = _numpy()
+    days = sorted(stats.clicks_by_day.items())
+    platforms = sorted(stats.clicks_by_platform.items(), key=lambda kv: -kv[1])
+    countries = sorted(stats.clicks_by_country.items(), key=lambda kv: -kv[1])
+    return {
+        "date": parse_dates([d for d, _ in days]),
+        "clicks_by_day": np.array([c for _, c in days], dtype=np.int64),
+        "platform": np.array([p for p, _ in platforms], dtype=object),
+        "clicks_by_platform": np.array([c for _, c in platforms], dtype=np.int64),
+        "country": np.array([c for c, _ in countries], dtype=object),
+        "clicks_by_country": np.array([c for _, c in countries], dtype=np.int64),
+    }
+
+
+def align(
+    series: Union[Mapping[str, Any], TimeseriesColumns],
+    field: str = "clicks",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+) -> AlignedSeries:
+    """
+    Put several daily series on one continuous date axis.
+
+    ``series`` maps a key (link or campaign ID) to a GetTimeseriesResponse
+    or a CampaignStats, or is a TimeseriesColumns. ``field`` picks
+    ``clicks`` or ``unique_clicks`` from timeseries points; campaign stats
+    always use ``clicks_by_day``. Days without data are zero, and the axis
+    spans ``start`` to ``end`` (ISO dates) or the data's own range.
+
+    Example:
+        aligned = align({"a": client.analytics.get_timeseries("a", "90d"),
+                         "b": client.analytics.get_timeseries("b", "90d")})
+        values = aligned.values
+        weekly = values[:, -7:].sum(axis=1) - values[:, -14:-7].sum(axis=1)
+    """
+    np = _numpy()
+
+    keys: List[str]
+    parts: List[Tuple[Any, Any]] = []
+    if isinstance(series, TimeseriesColumns):
+        keys = list(series.link_ids)
+        flat = timeseries_columns_to_numpy(series)
+        for i in range(len(keys)):
+            rows = slice(flat["offsets"][i], flat["offsets"][i + 1])
+            parts.append((flat["date"][rows], flat[field][rows]))
+    else:
+        keys = list(series)
+        for key in keys:
+            parts.append(_daily(series[key], field))
+
+    all_dates = [d for d, _ in parts if len(d)]
+    if start is not None:
+        first = np.datetime64(start, "D")
+    elif all_dates:
+        first = min(d.min() for d in all_dates)
+    else:
+        first = None
+    if end is not None:
+        last = np.datetime64(end, "D")
+    elif all_dates:
+        last = max(d.max() for d in all_dates)
+    else:
+        last = None
+
+    if first is None or last is None or last < first:
+        return AlignedSeries(
+            np.array([], dtype="datetime64[D]"),
+            keys,
+            np.zeros((len(keys), 0), np.int64),
+        )
+
+    dates = np.arange(first, last + np.timedelta64(1, "D"), dtype="datetime64[D]")
+    values = np.zeros((len(keys), len(dates)), dtype=np.int64)
+    for row, (day, counts) in enumerate(parts):
+        index = (day - first).astype(np.int64)
+        inside = (index >= 0) & (index < len(dates))
+        np.add.at(values[row], index[inside], counts[inside])
+    return AlignedSeries(dates, keys, values)
+
+
+def _daily(item: Any, field: str) -> Tuple[Any, Any]:
+    np = _numpy()
+    if hasattr(item, "clicks_by_day"):
+        days = list(item.clicks_by_day.items())
+        return (
+            parse_dates([d for d, _ in days]),
+            np.array([c for _, c in days], dtype=np.int64),
+        )
+    converted = timeseries_to_numpy(item)
+    return converted["date"], converted[field]
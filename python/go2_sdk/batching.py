@@ -0,0 +1,170 @@
+"""Go2 SDK automatic batching of link lookups."""
+
+from concurrent.futures import Future
+from typing import Any, Dict, Iterable, List, Optional
+import itertools
+import threading
+import time
+
+from go2_sdk.client import BATCH_GET_LIMIT
+from go2_sdk.errors import Go2Error, NotFoundError, wrap_error
+from go2_sdk.futures import Go2Future
+
+
+class LinkLoader:
+    """
+    Coalesces individual link lookups into BatchGetLinks calls.
+
+    ``load(id)`` queues the ID and returns a Go2Future. Queued IDs are sent
+    in one call once ``max_batch`` are waiting, or ``window`` seconds after
+    the first of them was queued, whichever comes first. Each future then
+    resolves to its link, or fails with NotFoundError as ``links.get``
+    would. An ID queued several times within one batch is fetched once and
+    all its callers get the same message.
+
+    One background thread collects batches; the calls run as gRPC futures,
+    so a slow batch does not hold up the next one.
+
+    Example:
+        with LinkLoader(client.links) as loader:
+            # From many request handlers at once:
+            link = loader.get(link_id)
+
+    Args:
+        links: LinksService to send batches through
+        max_batch: Most IDs per call (at most BATCH_GET_LIMIT)
+        window: Seconds to wait for more IDs after the first is queued
+    """
+
+    def __init__(
+        self, links: Any, max_batch: int = BATCH_GET_LIMIT, window: float = 0.002
+    ):
+        if not 1 <= max_batch <= BATCH_GET_LIMIT:
+            raise ValueError(
+                "max_batch must be between 1 and {}".format(BATCH_GET_LIMIT)
+            )
+        if window < 0:
+            raise ValueError("window must not be negative")
+        self._links = links
+        self._max_batch = max_batch
+        self._window = window
+        self._cond = threading.Condition()
+        self._pending: Dict[str, List["Future[Any]"]] = {}
+        self._deadline = 0.0
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self.loads = 0
+        self.batches = 0
+
+    def load(self, id: str) -> Go2Future:
+        """Queue a lookup and return a future for the link."""
+        future: "Future[Any]" = Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("LinkLoader is closed")
+            self.loads += 1
+            waiters = self._pending.get(id)
+            if waiters is not None:
+                waiters.append(future)
+                return Go2Future(future)
+            self._pending[id] = [future]
+            if len(self._pending) == 1:
+                self._deadline = time.monotonic() + self._window
+                self._cond.notify()
+            elif len(self._pending) >= self._max_batch:
+                self._cond.notify()
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="go2-link-loader", daemon=True
+                )
+                self._thread.start()
+        return Go2Future(future)
+
+    def load_many(self, ids: Iterable[str]) -> List[Go2Future]:
+        """Queue several lookups; the futures are in the order of ``ids``."""
+        return [self.load(id) for id in ids]
+
+    def get(self, id: str, timeout: Optional[float] = None) -> Any:
+        """
+        Get a link, batched with other lookups made around the same time.
+
+        Raises:
+            NotFoundError: The link does not exist
+            Go2Error: The batch call failed
+        """
+        return self.load(id).result(timeout)
+
+    def flush(self) -> None:
+        """Send the queued IDs now instead of waiting for the window."""
+        with self._cond:
+            self._deadline = 0.0
+            self._cond.notify()
+
+    def close(self) -> None:
+        """Send any queued IDs and stop the background thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+
+    def __enter__(self) -> "LinkLoader":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if not self._pending:
+                        if self._closed:
+                            return
+                        self._cond.wait()
+                        continue
+                    if self._closed or len(self._pending) >= self._max_batch:
+                        break
+                    remaining = self._deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                ids = list(itertools.islice(self._pending, self._max_batch))
+                batch = {id: self._pending.pop(id) for id in ids}
+                if self._pending:
+                    # IDs left over from a full batch have waited long enough.
+                    self._deadline = 0.0
+                self.batches += 1
+            self._send(batch)
+
+    def _send(self, batch: Dict[str, List["Future[Any]"]]) -> None:
+        try:
+            call = self._links.batch_get(list(batch), wait=False)
+        except Exception as e:  # noqa: BLE001
+            # Starting the call can fail with more than RpcError (a closed
+            # channel raises ValueError). The waiters would hang and this
+            # thread would die, so every error is handed on as a Go2Error.
+            self._fail(batch, e if isinstance(e, Go2Error) else wrap_error(e))
+            return
+        call.add_done_callback(lambda done: self._resolve(batch, done))
+
+    def _resolve(self, batch: Dict[str, List["Future[Any]"]], call: Go2Future) -> None:
+        error = call.exception()
+        if error is not None:
+            self._fail(batch, error)
+            return
+        found = call.result()
+        for id, waiters in batch.items():
+            link = found.get(id)
+            for waiter in waiters:
+                if link is None:
+                    waiter.set_exception(NotFoundError("link not found: {}".format(id)))
+                else:
+                    waiter.set_result(link)
+
+    @staticmethod
+    def _fail(batch: Dict[str, List["Future[Any]"]], error: BaseException) -> None:
+        for waiters in batch.values():
+            for waiter in waiters:
+                waiter.set_exception(error)
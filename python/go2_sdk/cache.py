@@ -0,0 +1,260 @@
+"""Go2 SDK analytics response cache."""
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+import re
+import threading
+import time
+
+from go2_sdk.errors import Go2Error
+
+# Default freshness per period. A "90d" aggregate barely moves between
+# requests, so longer periods are allowed to live longer.
+DEFAULT_TTLS: Dict[str, float] = {
+    "7d": 60.0,
+    "30d": 300.0,
+    "90d": 900.0,
+}
+
+# Seconds of freshness granted per day of period for periods not listed above.
+_TTL_PER_DAY = 10.0
+
+_PERIOD_RE = re.compile(r"^(\d+)([hdwmy])$")
+_PERIOD_DAYS = {"h": 1.0 / 24, "d": 1.0, "w": 7.0, "m": 30.0, "y": 365.0}
+
+# Repeated field trimmed when a larger ``limit`` answers a smaller one.
+_LIMITED_FIELDS = {
+    "GetCountries": "countries",
+    "GetReferrers": "referrers",
+}
+
+_Key = Tuple[str, str, str]
+
+
+def period_days(period: str) -> Optional[float]:
+    """Return the length of a period such as "7d" or "12h" in days."""
+    match = _PERIOD_RE.match(period)
+    if match is None:
+        return None
+    return int(match.group(1)) * _PERIOD_DAYS[match.group(2)]
+
+
+class _Entry:
+    __slots__ = ("response", "limit", "fresh_until", "stale_until")
+
+    def __init__(
+        self,
+        response: Any,
+        limit: Optional[int],
+        fresh_until: float,
+        stale_until: float,
+    ):
+        self.response = response
+        self.limit = limit
+        self.fresh_until = fresh_until
+        self.stale_until = stale_until
+
+    def covers(self, limit: Optional[int], field: Optional[str]) -> bool:
+        """Whether this entry can answer a request for ``limit`` rows."""
+        if limit is None or self.limit is None:
+            return True
+        if limit <= 0 or self.limit <= 0:
+            # 0 means "server default", which we cannot reason about.
+            return limit == self.limit
+        if limit <= self.limit:
+            return True
+        # A short answer to a larger limit already holds every row.
+        return field is not None and len(getattr(self.response, field)) < self.limit
+
+
+class AnalyticsCache:
+    """
+    Period-aware cache for AnalyticsService responses.
+
+    Entries are fresh for a TTL that scales with the requested period and
+    are then served stale for ``stale_factor`` times as long while a
+    background refresh runs, so callers never wait on the API for data
+    that has been seen before.
+
+    Responses are shared between callers and must be treated as read-only.
+
+    Example:
+        cache = AnalyticsCache()
+        with Go2Client(api_key="go2_xxx", analytics_cache=cache) as client:
+            stats = client.analytics.get_stats(link_id="...", period="90d")
+
+    Args:
+        ttls: Freshness in seconds per period, merged over DEFAULT_TTLS
+        stale_factor: Stale-while-revalidate window as a multiple of the TTL
+        max_entries: Maximum number of cached responses (LRU eviction)
+        refresh_workers: Threads used for background refreshes
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        stale_factor: float = 1.0,
+        max_entries: int = 10000,
+        refresh_workers: int = 2,
+    ):
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+
+        self._ttls = dict(DEFAULT_TTLS)
+        if ttls:
+            self._ttls.update(ttls)
+        self._stale_factor = stale_factor
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[_Key, _Entry]" = OrderedDict()
+        self._refreshing: Set[_Key] = set()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._executor = ThreadPoolExecutor(
+            max_workers=refresh_workers, thread_name_prefix="go2-analytics-cache"
+        )
+
+    def ttl_for(self, period: str) -> float:
+        """Return the freshness TTL in seconds for a period such as "30d"."""
+        ttl = self._ttls.get(period)
+        if ttl is not None:
+            return ttl
+        days = period_days(period)
+        if days is None:
+            return self._ttls["30d"]
+        return days * _TTL_PER_DAY
+
+    def get_or_fetch(
+        self,
+        method: str,
+        link_id: str,
+        period: str,
+        fetch: Callable[[Optional[int]], Any],
+        limit: Optional[int] = None,
+    ) -> Any:
+        """
+        Return a cached response for the call, fetching it when needed.
+
+        Fresh entries are returned directly. Stale entries are returned
+        directly and refreshed in the background. Missing or expired
+        entries are fetched synchronously. ``fetch`` is called with the
+        limit to request, which for refreshes is the cached entry's limit.
+        """
+        response = self.lookup(method, link_id, period, fetch, limit)
+        if response is None:
+            response = fetch(limit)
+            self.put(method, link_id, period, response, limit)
+        return response
+
+    def lookup(
+        self,
+        method: str,
+        link_id: str,
+        period: str,
+        fetch: Callable[[Optional[int]], Any],
+        limit: Optional[int] = None,
+    ) -> Optional[Any]:
+        """
+        Return a fresh or stale cached response, or None on a miss.
+
+        A stale hit schedules a background refresh through ``fetch``; once
+        the cache is closed there is no one to run it, so stale entries
+        count as misses and the caller fetches them.
+        """
+        key = (method, link_id, period)
+        field = _LIMITED_FIELDS.get(method)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if (
+                entry is None
+                or not entry.covers(limit, field)
+                or now >= entry.stale_until
+            ):
+                return None
+            if now >= entry.fresh_until and self._closed:
+                return None
+            self._entries.move_to_end(key)
+            if now >= entry.fresh_until and key not in self._refreshing:
+                self._refreshing.add(key)
+                self._executor.submit(self._refresh, key, fetch, entry.limit)
+            return _trim(entry.response, field, limit)
+
+    def put(
+        self,
+        method: str,
+        link_id: str,
+        period: str,
+        response: Any,
+        limit: Optional[int] = None,
+    ) -> None:
+        """Store a response fetched outside the cache."""
+        self._store((method, link_id, period), response, limit)
+
+    def invalidate(self, link_id: Optional[str] = None) -> None:
+        """Drop cached responses for one link, or all of them."""
+        with self._lock:
+            if link_id is None:
+                self._entries.clear()
+                return
+            for key in [k for k in self._entries if k[1] == link_id]:
+                del self._entries[key]
+
+    def close(self) -> None:
+        """
+        Stop the background refresh workers. The cache can still be read;
+        stale entries are then fetched again by the caller.
+        """
+        with self._lock:
+            self._closed = True
+        self._executor.shutdown(wait=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _refresh(
+        self, key: _Key, fetch: Callable[[Optional[int]], Any], limit: Optional[int]
+    ) -> None:
+        try:
+            response = fetch(limit)
+        except Go2Error:
+            # Keep serving the stale entry; the next expired read retries.
+            return
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+        self._store(key, response, limit)
+
+    def _store(self, key: _Key, response: Any, limit: Optional[int]) -> None:
+        ttl = self.ttl_for(key[2])
+        now = time.monotonic()
+        with self._lock:
+            current = self._entries.get(key)
+            if (
+                current is not None
+                and limit is not None
+                and current.limit is not None
+                and 0 < limit < current.limit
+                and now < current.fresh_until
+            ):
+                # Keep the wider answer; it can serve this limit too.
+                self._entries.move_to_end(key)
+                return
+            self._entries[key] = _Entry(
+                response, limit, now + ttl, now + ttl * (1.0 + self._stale_factor)
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+
+def _trim(response: Any, field: Optional[str], limit: Optional[int]) -> Any:
+    if field is None or limit is None or limit <= 0:
+        return response
+    if len(getattr(response, field)) <= limit:
+        return response
+    trimmed = type(response)()
+    trimmed.CopyFrom(response)
+    del getattr(trimmed, field)[limit:]
+    return trimmed
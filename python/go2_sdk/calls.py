@@ -0,0 +1,89 @@
+"""Go2 SDK call details shared by client interceptors."""
+
+from typing import Any, Callable, Optional
+import collections
+import threading
+
+import grpc
+
+
+class _ClientCallDetails(
+    collections.namedtuple(
+        "_ClientCallDetails",
+        (
+            "method",
+            "timeout",
+            "metadata",
+            "credentials",
+            "wait_for_ready",
+            "compression",
+        ),
+    ),
+    grpc.ClientCallDetails,
+):
+    """Concrete ClientCallDetails; the grpc base class cannot be instantiated."""
+
+
+class _ObservedStream:
+    """
+    A server-streaming call that reports its responses and its end.
+
+    ``on_response`` is called with each response as it is read, and
+    ``on_done`` once with the final status code and details when the
+    stream is exhausted, fails or is cancelled. Everything else is
+    delegated to the wrapped call, so interceptors can return it in the
+    call's place.
+    """
+
+    def __init__(
+        self,
+        call: Any,
+        on_response: Callable[[Any], None],
+        on_done: Callable[[Optional[grpc.StatusCode], str], None],
+    ):
+        self._call = call
+        self._on_response = on_response
+        self._on_done = on_done
+        self._lock = threading.Lock()
+        self._finished = False
+        # gRPC calls report their end even when nobody reads them to it.
+        add_callback = getattr(call, "add_callback", None)
+        if add_callback is not None:
+            add_callback(self._terminated)
+
+    def __iter__(self) -> "_ObservedStream":
+        return self
+
+    def __next__(self) -> Any:
+        try:
+            response = next(self._call)
+        except StopIteration:
+            self._finish(grpc.StatusCode.OK, "")
+            raise
+        except grpc.RpcError as e:
+            if isinstance(e, grpc.Call):
+                self._finish(e.code(), e.details() or "")
+            else:
+                self._finish(grpc.StatusCode.UNKNOWN, str(e))
+            raise
+        self._on_response(response)
+        return response
+
+    def cancel(self) -> bool:
+        cancelled: bool = self._call.cancel()
+        if cancelled:
+            self._finish(grpc.StatusCode.CANCELLED, "Locally cancelled by application!")
+        return cancelled
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._call, name)
+
+    def _terminated(self) -> None:
+        self._finish(self._call.code(), self._call.details() or "")
+
+    def _finish(self, code: Optional[grpc.StatusCode], details: str) -> None:
+        with self._lock:
+            if self._finished:
+                return
+            self._finished = True
+        self._on_done(code, details)
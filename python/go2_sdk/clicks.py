@@ -0,0 +1,291 @@
+"""Go2 SDK real-time click stream and windowed click counts."""
+
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+import heapq
+import random
+import threading
+import time
+
+import grpc
+
+from go2_sdk.errors import Go2Error, wrap_error
+
+# Statuses after which a broken stream is reopened where it left off.
+RETRY_CODES = frozenset({
+    grpc.StatusCode.UNAVAILABLE,
+    grpc.StatusCode.INTERNAL,
+    grpc.StatusCode.UNKNOWN,
+    grpc.StatusCode.ABORTED,
+    grpc.StatusCode.DEADLINE_EXCEEDED,
+    grpc.StatusCode.RESOURCE_EXHAUSTED,
+})
+
+
+class ClickStream:
+    """
+    Click events from StreamClicks, resumed across reconnects.
+
+    Iterating yields ClickEvent messages as clicks happen. When the stream
+    breaks with a status in RETRY_CODES, or the server ends it, it is
+    reopened after an exponential backoff with ``resume_after`` set to the
+    last event received, so no event is lost or repeated. Other errors are
+    raised as Go2Error. ``close()`` ends the iteration from any thread.
+
+    ``resume_after`` moves past an event only when the next one is asked
+    for, i.e. once the consumer is done with it. A stream resumed from a
+    saved ``resume_after`` therefore delivers at least once: the event that
+    was being handled when the consumer stopped is delivered again.
+
+    Example:
+        stream = client.analytics.stream_clicks(link_ids)
+        for event in stream:
+            print(event.link_id, event.platform, event.country)
+
+    Args:
+        stub: AnalyticsService gRPC stub
+        link_ids: Links to follow; all links when empty
+        resume_after: event_id to resume after; new clicks only when empty
+        initial_backoff: Seconds before the first reconnect
+        max_backoff: Longest wait between reconnects
+    """
+
+    def __init__(
+        self,
+        stub: Any,
+        link_ids: Optional[Sequence[str]] = None,
+        resume_after: str = "",
+        initial_backoff: float = 0.1,
+        max_backoff: float = 10.0,
+    ):
+        self._stub = stub
+        self._link_ids = list(link_ids or ())
+        self._resume_after = resume_after
+        self._initial_backoff = initial_backoff
+        self._max_backoff = max_backoff
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._call: Any = None
+        self._thread: Optional[threading.Thread] = None
+        self.events = 0
+        self.reconnects = 0
+        self.error: Optional[Go2Error] = None
+
+    @property
+    def resume_after(self) -> str:
+        """event_id of the last event handled; pass it to resume later."""
+        return self._resume_after
+
+    def __iter__(self) -> Iterator[Any]:
+        from go2_sdk.gen.analytics.v1 import analytics_pb2
+
+        backoff = self._initial_backoff
+        while not self._closed.is_set():
+            request = analytics_pb2.StreamClicksRequest(
+                link_ids=self._link_ids, resume_after=self._resume_after
+            )
+            with self._lock:
+                if self._closed.is_set():
+                    return
+                call = self._call = self._stub.StreamClicks(request)
+            try:
+                for event in call:
+                    self.events += 1
+                    backoff = self._initial_backoff
+                    yield event
+                    self._resume_after = event.event_id
+            except grpc.RpcError as e:
+                if self._closed.is_set():
+                    return
+                if e.code() not in RETRY_CODES:
+                    raise wrap_error(e)
+            finally:
+                call.cancel()
+            # Jittered, so many clients do not reconnect in lockstep.
+            if self._closed.wait(backoff * (0.5 + random.random() / 2)):
+                return
+            backoff = min(self._max_backoff, backoff * 2)
+            self.reconnects += 1
+
+    def run(self, on_event: Callable[[Any], None]) -> threading.Thread:
+        """
+        Consume the stream on a daemon thread, calling ``on_event`` for
+        each event, until ``close()``. Returns the thread. An error that
+        ends the stream is kept in ``error``.
+        """
+        if self._thread is not None:
+            raise RuntimeError("ClickStream is already running")
+
+        def consume() -> None:
+            try:
+                for event in self:
+                    on_event(event)
+            except Go2Error as e:
+                self.error = e
+
+        self._thread = threading.Thread(
+            target=consume, name="go2-click-stream", daemon=True
+        )
+        self._thread.start()
+        return self._thread
+
+    def close(self) -> None:
+        """Stop the stream and wait for ``run``'s thread, if any."""
+        with self._lock:
+            self._closed.set()
+            call = self._call
+        if call is not None:
+            call.cancel()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def __enter__(self) -> "ClickStream":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+
+class WindowCounts:
+    """Clicks in a window, in total and by platform, country and referrer."""
+
+    __slots__ = ("total", "platforms", "countries", "referrers")
+
+    def __init__(self) -> None:
+        self.total = 0
+        self.platforms: Dict[str, int] = {}
+        self.countries: Dict[str, int] = {}
+        self.referrers: Dict[str, int] = {}
+
+    def _add(self, event: Any) -> None:
+        self.total += 1
+        _increment(self.platforms, event.platform, 1)
+        _increment(self.countries, event.country, 1)
+        _increment(self.referrers, event.referrer, 1)
+
+    def _subtract(self, other: "WindowCounts") -> None:
+        self.total -= other.total
+        for mine, theirs in (
+            (self.platforms, other.platforms),
+            (self.countries, other.countries),
+            (self.referrers, other.referrers),
+        ):
+            for key, count in theirs.items():
+                _increment(mine, key, -count)
+
+    def _copy(self) -> "WindowCounts":
+        copy = WindowCounts()
+        copy.total = self.total
+        copy.platforms = dict(self.platforms)
+        copy.countries = dict(self.countries)
+        copy.referrers = dict(self.referrers)
+        return copy
+
+    def __repr__(self) -> str:
+        return "WindowCounts(total={})".format(self.total)
+
+
+class ClickAggregator:
+    """
+    Click counts over the last ``window`` seconds, kept from ClickEvents.
+
+    Events are counted per link and overall into ``bucket``-second buckets
+    by their timestamp; a bucket drops out of the counts as a whole once
+    it is older than the window. Reading is O(1) for totals, so one stream
+    feeding an aggregator can answer what would otherwise be a GetStats
+    poll per link. Events that arrive already outside the window (e.g.
+    after a long reconnect) are ignored. Safe to feed from a ClickStream
+    thread while other threads read.
+
+    Example:
+        clicks = ClickAggregator(window=300)
+        stream = client.analytics.stream_clicks(link_ids)
+        stream.run(clicks.add)
+        ...
+        print(clicks.total(link_id), clicks.counts(link_id).platforms)
+        print(clicks.top_links(10))
+
+    Args:
+        window: Seconds of clicks counted
+        bucket: Resolution of the window in seconds
+        clock: Returns the current time in epoch seconds
+    """
+
+    def __init__(
+        self,
+        window: float = 60.0,
+        bucket: float = 1.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        if bucket <= 0 or window < bucket:
+            raise ValueError("bucket must be positive and no longer than window")
+        self._bucket = bucket
+        self._buckets_per_window = round(window / bucket)
+        self._clock = clock
+        self._lock = threading.Lock()
+        # bucket index -> link ID (None for all links) -> counts
+        self._buckets: Dict[int, Dict[Optional[str], WindowCounts]] = {}
+        self._totals: Dict[Optional[str], WindowCounts] = {}
+
+    def add(self, event: Any) -> None:
+        """Count one ClickEvent."""
+        timestamp = event.timestamp.seconds + event.timestamp.nanos / 1e9
+        index = int(timestamp // self._bucket)
+        with self._lock:
+            oldest = self._expire()
+            if index < oldest:
+                return
+            bucket = self._buckets.setdefault(index, {})
+            for key in (event.link_id, None):
+                counts = bucket.get(key)
+                if counts is None:
+                    counts = bucket[key] = WindowCounts()
+                counts._add(event)
+                counts = self._totals.get(key)
+                if counts is None:
+                    counts = self._totals[key] = WindowCounts()
+                counts._add(event)
+
+    def total(self, link_id: Optional[str] = None) -> int:
+        """Clicks on a link in the window, or on all links."""
+        with self._lock:
+            self._expire()
+            counts = self._totals.get(link_id)
+            return 0 if counts is None else counts.total
+
+    def counts(self, link_id: Optional[str] = None) -> WindowCounts:
+        """A copy of a link's counts in the window, or of all links'."""
+        with self._lock:
+            self._expire()
+            counts = self._totals.get(link_id)
+            return WindowCounts() if counts is None else counts._copy()
+
+    def top_links(self, n: int = 10) -> List[Tuple[str, int]]:
+        """The ``n`` links with the most clicks in the window, as (id, clicks)."""
+        with self._lock:
+            self._expire()
+            totals = [
+                (link_id, counts.total)
+                for link_id, counts in self._totals.items()
+                if link_id is not None
+            ]
+        return heapq.nlargest(n, totals, key=lambda item: item[1])
+
+    def _expire(self) -> int:
+        """Drop buckets that left the window; returns the oldest live index."""
+        oldest = int(self._clock() // self._bucket) - self._buckets_per_window + 1
+        for index in [i for i in self._buckets if i < oldest]:
+            for key, counts in self._buckets.pop(index).items():
+                total = self._totals[key]
+                total._subtract(counts)
+                if total.total == 0:
+                    del self._totals[key]
+        return oldest
+
+
+def _increment(counts: Dict[str, int], key: str, delta: int) -> None:
+    value = counts.get(key, 0) + delta
+    if value:
+        counts[key] = value
+    else:
+        counts.pop(key, None)
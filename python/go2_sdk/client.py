@@ -1,19 +1,64 @@
 """Go2 gRPC API Client."""
 
-from typing import List, Optional, Any, Dict
-import grpc
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+)
+import functools
 
-from go2_sdk.errors import wrap_error
+import grpc
+from google.protobuf import field_mask_pb2, timestamp_pb2
+
+from go2_sdk.cache import AnalyticsCache
+from go2_sdk.calls import _ClientCallDetails
+from go2_sdk.clicks import ClickStream
+from go2_sdk.columnar import StatsColumns, TimeseriesColumns, _compact_points
+from go2_sdk.compact import compact_links
+from go2_sdk.concurrency import fan_out
+from go2_sdk.dashboard import DASHBOARD_PARTS, Dashboard
+from go2_sdk.errors import Go2Error, error_for_status, wrap_error
+from go2_sdk.futures import Go2Future
+from go2_sdk.metrics import MetricsInterceptor
+from go2_sdk.profiling import Profile, Profiler
+from go2_sdk.raw import RawStub
+from go2_sdk.store import TimeseriesStore
+from go2_sdk.tracing import TracingInterceptor
 
 DEFAULT_ENDPOINT = "grpc.go2.ge:443"
 
+# Most IDs the API accepts in one BatchGetLinks request.
+BATCH_GET_LIMIT = 100
+
+# Most items the API accepts in one BatchCreateLinks/BatchUpdateLinks
+# request, and the serialized size batch_create/batch_update aim to stay
+# under: a quarter of gRPC's default 4 MiB message limit.
+BATCH_WRITE_LIMIT = 500
+BATCH_WRITE_BYTES = 1 << 20
 
-class _AuthInterceptor(grpc.UnaryUnaryClientInterceptor):
+
+class _AuthInterceptor(
+    grpc.UnaryUnaryClientInterceptor, grpc.UnaryStreamClientInterceptor
+):
     """Interceptor that adds API key to all requests."""
 
     def __init__(self, api_key: str):
         self._api_key = api_key
 
+    def intercept_unary_stream(
+        self,
+        continuation: Any,
+        client_call_details: grpc.ClientCallDetails,
+        request: Any,
+    ) -> Any:
+        return self.intercept_unary_unary(continuation, client_call_details, request)
+
     def intercept_unary_unary(
         self,
         continuation: Any,
@@ -23,7 +68,7 @@ class _AuthInterceptor(grpc.UnaryUnaryClientInterceptor):
         metadata = list(client_call_details.metadata or [])
         metadata.append(("x-api-key", self._api_key))
 
-        new_details = grpc.ClientCallDetails(
+        new_details = _ClientCallDetails(
             method=client_call_details.method,
             timeout=client_call_details.timeout,
             metadata=metadata,
@@ -41,17 +86,16 @@ class IntegrationsService:
     def __init__(self, stub: Any):
         self._stub = stub
 
-    def list(self) -> List[Any]:
+    def list(self, wait: bool = True) -> Any:
         """List all integrations."""
         from go2_sdk.gen.integrations.v1 import integrations_pb2
 
-        try:
-            response = self._stub.ListIntegrations(
-                integrations_pb2.ListIntegrationsRequest()
-            )
-            return list(response.integrations)
-        except grpc.RpcError as e:
-            raise wrap_error(e)
+        return _invoke(
+            self._stub.ListIntegrations,
+            integrations_pb2.ListIntegrationsRequest(),
+            wait,
+            then=lambda response: list(response.integrations),
+        )
 
     def create(
         self,
@@ -59,32 +103,31 @@ class IntegrationsService:
         name: str,
         config: Any,
         events: List[str],
+        wait: bool = True,
     ) -> Any:
         """Create a new integration."""
         from go2_sdk.gen.integrations.v1 import integrations_pb2
 
-        try:
-            return self._stub.CreateIntegration(
-                integrations_pb2.CreateIntegrationRequest(
-                    type=type,
-                    name=name,
-                    config=config,
-                    events=events,
-                )
-            )
-        except grpc.RpcError as e:
-            raise wrap_error(e)
+        return _invoke(
+            self._stub.CreateIntegration,
+            integrations_pb2.CreateIntegrationRequest(
+                type=type,
+                name=name,
+                config=config,
+                events=events,
+            ),
+            wait,
+        )
 
-    def get(self, id: str) -> Any:
+    def get(self, id: str, wait: bool = True) -> Any:
         """Get an integration by ID."""
         from go2_sdk.gen.integrations.v1 import integrations_pb2
 
-        try:
-            return self._stub.GetIntegration(
-                integrations_pb2.GetIntegrationRequest(id=id)
-            )
-        except grpc.RpcError as e:
-            raise wrap_error(e)
+        return _invoke(
+            self._stub.GetIntegration,
+            integrations_pb2.GetIntegrationRequest(id=id),
+            wait,
+        )
 
     def update(
         self,
@@ -93,6 +136,7 @@ class IntegrationsService:
         config: Optional[Any] = None,
         events: Optional[List[str]] = None,
         is_active: Optional[bool] = None,
+        wait: bool = True,
     ) -> Any:
         """Update an integration."""
         from go2_sdk.gen.integrations.v1 import integrations_pb2
@@ -107,62 +151,110 @@ class IntegrationsService:
         if is_active is not None:
             request.is_active = is_active
 
-        try:
-            return self._stub.UpdateIntegration(request)
-        except grpc.RpcError as e:
-            raise wrap_error(e)
+        return _invoke(self._stub.UpdateIntegration, request, wait)
 
-    def delete(self, id: str) -> bool:
+    def delete(self, id: str, wait: bool = True) -> Any:
         """Delete an integration."""
         from go2_sdk.gen.integrations.v1 import integrations_pb2
 
-        try:
-            response = self._stub.DeleteIntegration(
-                integrations_pb2.DeleteIntegrationRequest(id=id)
-            )
-            return response.success
-        except grpc.RpcError as e:
-            raise wrap_error(e)
+        return _invoke(
+            self._stub.DeleteIntegration,
+            integrations_pb2.DeleteIntegrationRequest(id=id),
+            wait,
+            then=_success,
+        )
 
-    def test(self, id: str) -> Any:
+    def test(self, id: str, wait: bool = True) -> Any:
         """Test an integration by sending a test notification."""
         from go2_sdk.gen.integrations.v1 import integrations_pb2
 
-        try:
-            return self._stub.TestIntegration(
-                integrations_pb2.TestIntegrationRequest(id=id)
-            )
-        except grpc.RpcError as e:
-            raise wrap_error(e)
+        return _invoke(
+            self._stub.TestIntegration,
+            integrations_pb2.TestIntegrationRequest(id=id),
+            wait,
+        )
 
-    def get_types(self) -> Any:
+    def get_types(self, wait: bool = True) -> Any:
         """Get available integration types and events."""
         from go2_sdk.gen.integrations.v1 import integrations_pb2
 
-        try:
-            return self._stub.GetIntegrationTypes(
-                integrations_pb2.GetIntegrationTypesRequest()
-            )
-        except grpc.RpcError as e:
-            raise wrap_error(e)
+        return _invoke(
+            self._stub.GetIntegrationTypes,
+            integrations_pb2.GetIntegrationTypesRequest(),
+            wait,
+        )
 
 
 class LinksService:
     """Service for managing smart links."""
 
-    def __init__(self, stub: Any):
+    def __init__(self, stub: Any, raw_stub: Optional[RawStub] = None):
         self._stub = stub
+        self._raw_stub = raw_stub
 
-    def list(self, page: int = 1, per_page: int = 20) -> Any:
-        """List all links."""
+    def list(
+        self,
+        page: int = 1,
+        per_page: int = 20,
+        raw: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        page_token: Optional[str] = None,
+        updated_since: Optional[Any] = None,
+        order: Any = None,
+        wait: bool = True,
+    ) -> Any:
+        """
+        List all links.
+
+        Pass a response's ``next_page_token`` as ``page_token`` to get the
+        page after it; it replaces ``page``, costs the same at any depth and
+        does not skip or repeat links that change between calls.
+
+        ``updated_since`` (a datetime or Timestamp) keeps only links updated
+        at or after that time, and ``order`` is a LinkOrder such as
+        ``LinkOrder.LINK_ORDER_UPDATED_AT_ASC``; see HighWaterMark for
+        incremental syncs built on both.
+
+        With ``fields`` only those Link fields are returned, e.g.
+        ``["id", "slug", "updated_at"]``; the others are left at their
+        defaults. With ``raw=True`` the serialized ListLinksResponse is
+        returned as bytes; see ``go2_sdk.raw.split_records``.
+        """
         from go2_sdk.gen.links.v1 import links_pb2
 
-        try:
-            return self._stub.ListLinks(
-                links_pb2.ListLinksRequest(page=page, per_page=per_page)
-            )
-        except grpc.RpcError as e:
-            raise wrap_error(e)
+        return _invoke(
+            _stub_for(self, raw).ListLinks,
+            links_pb2.ListLinksRequest(
+                page=page,
+                per_page=per_page,
+                read_mask=_read_mask(fields),
+                page_token=page_token or "",
+                updated_since=_timestamp(updated_since),
+                order=order or links_pb2.LINK_ORDER_UNSPECIFIED,
+            ),
+            wait,
+        )
+
+    def list_all(
+        self,
+        per_page: int = 100,
+        fields: Optional[Sequence[str]] = None,
+        updated_since: Optional[Any] = None,
+        order: Any = None,
+    ) -> Iterator[Any]:
+        """Iterate over every link, following page tokens; filters as in ``list``."""
+        for response in _pages(
+            lambda page, token: self.list(
+                page=page,
+                per_page=per_page,
+                fields=fields,
+                page_token=token,
+                updated_since=updated_since,
+                order=order,
+            ),
+            per_page,
+        ):
+            yield from response.links
 
     def create(
         self,
@@ -172,32 +264,51 @@ class LinksService:
         android_url: Optional[str] = None,
         web_url: Optional[str] = None,
         fallback_url: Optional[str] = None,
+        wait: bool = True,
     ) -> Any:
         """Create a new smart link."""
         from go2_sdk.gen.links.v1 import links_pb2
 
-        try:
-            return self._stub.CreateLink(
-                links_pb2.CreateLinkRequest(
-                    slug=slug,
-                    title=title or "",
-                    ios_url=ios_url or "",
-                    android_url=android_url or "",
-                    web_url=web_url or "",
-                    fallback_url=fallback_url or "",
-                )
-            )
-        except grpc.RpcError as e:
-            raise wrap_error(e)
+        return _invoke(
+            self._stub.CreateLink,
+            links_pb2.CreateLinkRequest(
+                slug=slug,
+                title=title or "",
+                ios_url=ios_url or "",
+                android_url=android_url or "",
+                web_url=web_url or "",
+                fallback_url=fallback_url or "",
+            ),
+            wait,
+        )
+
+    def get(
+        self, id: str, fields: Optional[Sequence[str]] = None, wait: bool = True
+    ) -> Any:
+        """Get a link by ID, with only ``fields`` set if given (see ``list``)."""
+        from go2_sdk.gen.links.v1 import links_pb2
+
+        return _invoke(
+            self._stub.GetLink,
+            links_pb2.GetLinkRequest(id=id, read_mask=_read_mask(fields)),
+            wait,
+        )
+
+    def batch_get(self, ids: Sequence[str], wait: bool = True) -> Any:
+        """
+        Get up to BATCH_GET_LIMIT links by ID in one call.
 
-    def get(self, id: str) -> Any:
-        """Get a link by ID."""
+        Returns a dict of ID to link; IDs that do not exist are left out.
+        To batch individual ``get`` calls automatically, see LinkLoader.
+        """
         from go2_sdk.gen.links.v1 import links_pb2
 
-        try:
-            return self._stub.GetLink(links_pb2.GetLinkRequest(id=id))
-        except grpc.RpcError as e:
-            raise wrap_error(e)
+        return _invoke(
+            self._stub.BatchGetLinks,
+            links_pb2.BatchGetLinksRequest(ids=ids),
+            wait,
+            then=_links_by_id,
+        )
 
     def update(
         self,
@@ -208,6 +319,7 @@ class LinksService:
         web_url: Optional[str] = None,
         fallback_url: Optional[str] = None,
         is_active: Optional[bool] = None,
+        wait: bool = True,
     ) -> Any:
         """Update a link."""
         from go2_sdk.gen.links.v1 import links_pb2
@@ -226,86 +338,433 @@ class LinksService:
         if is_active is not None:
             request.is_active = is_active
 
-        try:
-            return self._stub.UpdateLink(request)
-        except grpc.RpcError as e:
-            raise wrap_error(e)
+        return _invoke(self._stub.UpdateLink, request, wait)
+
+    def batch_create(
+        self,
+        links: Iterable[Any],
+        concurrency: int = 4,
+        max_batch: int = BATCH_WRITE_LIMIT,
+        max_bytes: int = BATCH_WRITE_BYTES,
+    ) -> List[Any]:
+        """
+        Create many links with BatchCreateLinks calls.
+
+        Each item is a dict of CreateLinkRequest fields (``slug``,
+        ``web_url``, ...) or a CreateLinkRequest. Items are sent in chunks
+        of at most ``max_batch`` items and about ``max_bytes`` serialized
+        bytes, with up to ``concurrency`` calls in flight.
+
+        Returns one entry per item, in order: the created link, or the
+        Go2Error that item failed with. Items fail on their own; a call
+        that fails as a whole fails every item in its chunk.
+        """
+        from go2_sdk.gen.links.v1 import links_pb2
+
+        requests = [
+            item if isinstance(item, links_pb2.CreateLinkRequest)
+            else links_pb2.CreateLinkRequest(**item)
+            for item in links
+        ]
+        return _batch_write(
+            self._stub.BatchCreateLinks,
+            lambda chunk: links_pb2.BatchCreateLinksRequest(requests=chunk),
+            requests,
+            concurrency,
+            max_batch,
+            max_bytes,
+        )
+
+    def batch_update(
+        self,
+        updates: Iterable[Any],
+        concurrency: int = 4,
+        max_batch: int = BATCH_WRITE_LIMIT,
+        max_bytes: int = BATCH_WRITE_BYTES,
+    ) -> List[Any]:
+        """
+        Update many links with BatchUpdateLinks calls.
+
+        Each item is a dict with the link's ``id`` and the fields to change
+        (as ``update``'s arguments, plus ``slug``; None values are left
+        unchanged) or an UpdateLinkRequest. Chunking and results are as in
+        ``batch_create``.
+        """
+        from go2_sdk.gen.links.v1 import links_pb2
+
+        requests = [
+            item if isinstance(item, links_pb2.UpdateLinkRequest)
+            else links_pb2.UpdateLinkRequest(
+                **{name: value for name, value in item.items() if value is not None}
+            )
+            for item in updates
+        ]
+        return _batch_write(
+            self._stub.BatchUpdateLinks,
+            lambda chunk: links_pb2.BatchUpdateLinksRequest(requests=chunk),
+            requests,
+            concurrency,
+            max_batch,
+            max_bytes,
+        )
 
-    def delete(self, id: str) -> bool:
+    def delete(self, id: str, wait: bool = True) -> Any:
         """Delete a link."""
         from go2_sdk.gen.links.v1 import links_pb2
 
-        try:
-            response = self._stub.DeleteLink(links_pb2.DeleteLinkRequest(id=id))
-            return response.success
-        except grpc.RpcError as e:
-            raise wrap_error(e)
+        return _invoke(
+            self._stub.DeleteLink,
+            links_pb2.DeleteLinkRequest(id=id),
+            wait,
+            then=_success,
+        )
 
 
 class AnalyticsService:
     """Service for link analytics."""
 
-    def __init__(self, stub: Any):
+    def __init__(
+        self,
+        stub: Any,
+        cache: Optional[AnalyticsCache] = None,
+        store: Optional[TimeseriesStore] = None,
+    ):
         self._stub = stub
+        self._cache = cache
+        self._store = store
 
-    def get_stats(self, link_id: str, period: str = "30d") -> Any:
+    def get_stats(self, link_id: str, period: str = "30d", wait: bool = True) -> Any:
         """Get stats for a link."""
         from go2_sdk.gen.analytics.v1 import analytics_pb2
 
-        try:
-            return self._stub.GetStats(
-                analytics_pb2.GetStatsRequest(link_id=link_id, period=period)
-            )
-        except grpc.RpcError as e:
-            raise wrap_error(e)
+        return self._call(
+            "GetStats",
+            lambda _: analytics_pb2.GetStatsRequest(link_id=link_id, period=period),
+            link_id,
+            period,
+            wait=wait,
+        )
 
-    def get_timeseries(self, link_id: str, period: str = "30d") -> Any:
+    def get_timeseries(
+        self,
+        link_id: str,
+        period: str = "30d",
+        wait: bool = True,
+    ) -> Any:
         """Get timeseries data for a link."""
         from go2_sdk.gen.analytics.v1 import analytics_pb2
 
-        try:
-            return self._stub.GetTimeseries(
-                analytics_pb2.GetTimeseriesRequest(link_id=link_id, period=period)
+        store = self._store
+        if store is None:
+            return self._call(
+                "GetTimeseries",
+                lambda _: analytics_pb2.GetTimeseriesRequest(
+                    link_id=link_id, period=period
+                ),
+                link_id,
+                period,
+                wait=wait,
             )
-        except grpc.RpcError as e:
-            raise wrap_error(e)
 
-    def get_platforms(self, link_id: str, period: str = "30d") -> Any:
+        def fetch_window(window: str) -> Any:
+            try:
+                return self._stub.GetTimeseries(
+                    analytics_pb2.GetTimeseriesRequest(link_id=link_id, period=window)
+                )
+            except grpc.RpcError as e:
+                raise wrap_error(e)
+
+        def fetch(_: Optional[int]) -> Any:
+            return store.get_timeseries(link_id, period, fetch_window)
+
+        if not wait:
+            # Syncing the store takes several windowed calls, so it runs now
+            # and the future is returned already complete.
+            try:
+                return Go2Future.completed(self.get_timeseries(link_id, period))
+            except Go2Error as e:
+                return Go2Future.failed(e)
+        if self._cache is None:
+            return fetch(None)
+        return self._cache.get_or_fetch("GetTimeseries", link_id, period, fetch)
+
+    def get_platforms(
+        self,
+        link_id: str,
+        period: str = "30d",
+        wait: bool = True,
+    ) -> Any:
         """Get platform breakdown for a link."""
         from go2_sdk.gen.analytics.v1 import analytics_pb2
 
-        try:
-            return self._stub.GetPlatforms(
-                analytics_pb2.GetPlatformsRequest(link_id=link_id, period=period)
-            )
-        except grpc.RpcError as e:
-            raise wrap_error(e)
+        return self._call(
+            "GetPlatforms",
+            lambda _: analytics_pb2.GetPlatformsRequest(
+                link_id=link_id, period=period
+            ),
+            link_id,
+            period,
+            wait=wait,
+        )
 
-    def get_countries(self, link_id: str, period: str = "30d", limit: int = 10) -> Any:
+    def get_countries(
+        self,
+        link_id: str,
+        period: str = "30d",
+        limit: int = 10,
+        wait: bool = True,
+    ) -> Any:
         """Get country breakdown for a link."""
         from go2_sdk.gen.analytics.v1 import analytics_pb2
 
-        try:
-            return self._stub.GetCountries(
-                analytics_pb2.GetCountriesRequest(
-                    link_id=link_id, period=period, limit=limit
-                )
-            )
-        except grpc.RpcError as e:
-            raise wrap_error(e)
+        return self._call(
+            "GetCountries",
+            lambda n: analytics_pb2.GetCountriesRequest(
+                link_id=link_id, period=period, limit=n
+            ),
+            link_id,
+            period,
+            limit,
+            wait=wait,
+        )
 
-    def get_referrers(self, link_id: str, period: str = "30d", limit: int = 10) -> Any:
+    def get_referrers(
+        self,
+        link_id: str,
+        period: str = "30d",
+        limit: int = 10,
+        wait: bool = True,
+    ) -> Any:
         """Get referrer breakdown for a link."""
         from go2_sdk.gen.analytics.v1 import analytics_pb2
 
-        try:
-            return self._stub.GetReferrers(
-                analytics_pb2.GetReferrersRequest(
-                    link_id=link_id, period=period, limit=limit
+        return self._call(
+            "GetReferrers",
+            lambda n: analytics_pb2.GetReferrersRequest(
+                link_id=link_id, period=period, limit=n
+            ),
+            link_id,
+            period,
+            limit,
+            wait=wait,
+        )
+
+    def stream_clicks(
+        self,
+        link_ids: Optional[Sequence[str]] = None,
+        resume_after: str = "",
+        max_backoff: float = 10.0,
+    ) -> ClickStream:
+        """
+        Follow clicks on ``link_ids`` (all links when empty) as they happen.
+
+        Returns a ClickStream: iterate it, or ``run`` it on a thread (e.g.
+        into a ClickAggregator). It reconnects and resumes after the last
+        event on its own; pass a saved ``resume_after`` to resume a stream
+        from an earlier process.
+        """
+        return ClickStream(
+            self._stub, link_ids, resume_after=resume_after, max_backoff=max_backoff
+        )
+
+    def get_stats_many(
+        self, link_ids: Sequence[str], period: str = "30d", concurrency: int = 32
+    ) -> StatsColumns:
+        """
+        Get stats for many links at once, as columns.
+
+        At most ``concurrency`` calls are in flight. Links whose call fails
+        are reported in the result's ``errors`` instead of raising.
+        """
+        from go2_sdk.gen.analytics.v1 import analytics_pb2
+
+        result = StatsColumns(link_ids)
+        failed: List[int] = []
+
+        def on_error(index: int, error: Go2Error) -> None:
+            failed.append(index)
+            result.errors[result.link_ids[index]] = error
+
+        fan_out(
+            self._stub.GetStats,
+            (
+                analytics_pb2.GetStatsRequest(link_id=link_id, period=period)
+                for link_id in result.link_ids
+            ),
+            concurrency,
+            result._set,
+            on_error,
+        )
+        result._drop(sorted(failed))
+        return result
+
+    def get_timeseries_many(
+        self, link_ids: Sequence[str], period: str = "30d", concurrency: int = 32
+    ) -> TimeseriesColumns:
+        """
+        Get timeseries data for many links at once, as columns.
+
+        At most ``concurrency`` calls are in flight. Links whose call fails
+        are reported in the result's ``errors`` instead of raising.
+        """
+        from go2_sdk.gen.analytics.v1 import analytics_pb2
+
+        link_ids = list(link_ids)
+        points: List[Any] = [None] * len(link_ids)
+        errors: Dict[str, Go2Error] = {}
+
+        def on_result(index: int, response: Any) -> None:
+            points[index] = _compact_points(response.points)
+
+        def on_error(index: int, error: Go2Error) -> None:
+            errors[link_ids[index]] = error
+
+        fan_out(
+            self._stub.GetTimeseries,
+            (
+                analytics_pb2.GetTimeseriesRequest(link_id=link_id, period=period)
+                for link_id in link_ids
+            ),
+            concurrency,
+            on_result,
+            on_error,
+        )
+
+        result = TimeseriesColumns()
+        for link_id, link_points in zip(link_ids, points):
+            if link_points is not None:
+                result._append(link_id, link_points)
+        result.errors = errors
+        return result
+
+    def get_dashboard(
+        self, link_id: str, period: str = "30d", limit: int = 10
+    ) -> Dashboard:
+        """
+        Get stats, timeseries, platforms, countries and referrers at once.
+
+        The five calls are issued together, so the page costs roughly one
+        round trip. Parts that fail are reported in the result's ``errors``
+        instead of raising.
+        """
+        from go2_sdk.gen.analytics.v1 import analytics_pb2
+
+        requests = {
+            "stats": analytics_pb2.GetStatsRequest(link_id=link_id, period=period),
+            "timeseries": analytics_pb2.GetTimeseriesRequest(
+                link_id=link_id, period=period
+            ),
+            "platforms": analytics_pb2.GetPlatformsRequest(
+                link_id=link_id, period=period
+            ),
+            "countries": analytics_pb2.GetCountriesRequest(
+                link_id=link_id, period=period, limit=limit
+            ),
+            "referrers": analytics_pb2.GetReferrersRequest(
+                link_id=link_id, period=period, limit=limit
+            ),
+        }
+        limits = {"countries": limit, "referrers": limit}
+        dashboard = Dashboard(link_id, period)
+        futures = {}
+
+        for part, request in requests.items():
+            method = DASHBOARD_PARTS[part]
+            if part == "timeseries" and self._store is not None:
+                continue
+            if self._cache is not None:
+                cached = self._cache.lookup(
+                    method,
+                    link_id,
+                    period,
+                    self._fetcher(method, functools.partial(_with_limit, request)),
+                    limits.get(part),
                 )
-            )
-        except grpc.RpcError as e:
-            raise wrap_error(e)
+                if cached is not None:
+                    setattr(dashboard, part, cached)
+                    continue
+            futures[part] = getattr(self._stub, method).future(request)
+
+        if self._store is not None:
+            # Syncing the store overlaps with the calls already in flight.
+            try:
+                dashboard.timeseries = self.get_timeseries(link_id, period)
+            except Go2Error as e:
+                dashboard.errors["timeseries"] = e
+
+        for part, future in futures.items():
+            try:
+                response = future.result()
+            except grpc.RpcError as e:
+                dashboard.errors[part] = wrap_error(e)
+                continue
+            setattr(dashboard, part, response)
+            if self._cache is not None:
+                self._cache.put(
+                    DASHBOARD_PARTS[part], link_id, period, response, limits.get(part)
+                )
+
+        return dashboard
+
+    def _fetcher(
+        self, method: str, build: Callable[[Optional[int]], Any]
+    ) -> Callable[[Optional[int]], Any]:
+        rpc = getattr(self._stub, method)
+
+        def fetch(limit: Optional[int]) -> Any:
+            try:
+                return rpc(build(limit))
+            except grpc.RpcError as e:
+                raise wrap_error(e)
+
+        return fetch
+
+    def _call(
+        self,
+        method: str,
+        build: Callable[[Optional[int]], Any],
+        link_id: str,
+        period: str,
+        limit: Optional[int] = None,
+        wait: bool = True,
+    ) -> Any:
+        fetch = self._fetcher(method, build)
+        if not wait:
+            return self._start(method, build, link_id, period, limit, fetch)
+        if self._cache is None:
+            return fetch(limit)
+        return self._cache.get_or_fetch(method, link_id, period, fetch, limit)
+
+    def _start(
+        self,
+        method: str,
+        build: Callable[[Optional[int]], Any],
+        link_id: str,
+        period: str,
+        limit: Optional[int],
+        fetch: Callable[[Optional[int]], Any],
+    ) -> Go2Future:
+        cache = self._cache
+        if cache is None:
+            return Go2Future(getattr(self._stub, method).future(build(limit)))
+        cached = cache.lookup(method, link_id, period, fetch, limit)
+        if cached is not None:
+            return Go2Future.completed(cached)
+
+        def store(response: Any) -> Any:
+            cache.put(method, link_id, period, response, limit)
+            return response
+
+        return Go2Future(getattr(self._stub, method).future(build(limit)), store)
+
+
+def _with_limit(request: Any, limit: Optional[int]) -> Any:
+    if limit is None or not hasattr(request, "limit"):
+        return request
+    copy = type(request)()
+    copy.CopyFrom(request)
+    copy.limit = limit
+    return copy
 
 
 class DomainsService:
@@ -314,56 +773,53 @@ class DomainsService:
     def __init__(self, stub: Any):
         self._stub = stub
 
-    def list(self) -> List[Any]:
+    def list(self, wait: bool = True) -> Any:
         """List all custom domains."""
         from go2_sdk.gen.domains.v1 import domains_pb2
 
-        try:
-            response = self._stub.ListDomains(domains_pb2.ListDomainsRequest())
-            return list(response.domains)
-        except grpc.RpcError as e:
-            raise wrap_error(e)
+        return _invoke(
+            self._stub.ListDomains,
+            domains_pb2.ListDomainsRequest(),
+            wait,
+            then=lambda response: list(response.domains),
+        )
 
-    def create(self, domain: str) -> Any:
+    def create(self, domain: str, wait: bool = True) -> Any:
         """Add a custom domain."""
         from go2_sdk.gen.domains.v1 import domains_pb2
 
-        try:
-            return self._stub.CreateDomain(
-                domains_pb2.CreateDomainRequest(domain=domain)
-            )
-        except grpc.RpcError as e:
-            raise wrap_error(e)
+        return _invoke(
+            self._stub.CreateDomain,
+            domains_pb2.CreateDomainRequest(domain=domain),
+            wait,
+        )
 
-    def get(self, id: str) -> Any:
+    def get(self, id: str, wait: bool = True) -> Any:
         """Get a domain by ID."""
         from go2_sdk.gen.domains.v1 import domains_pb2
 
-        try:
-            return self._stub.GetDomain(domains_pb2.GetDomainRequest(id=id))
-        except grpc.RpcError as e:
-            raise wrap_error(e)
+        return _invoke(self._stub.GetDomain, domains_pb2.GetDomainRequest(id=id), wait)
 
-    def delete(self, id: str) -> bool:
+    def delete(self, id: str, wait: bool = True) -> Any:
         """Delete a custom domain."""
         from go2_sdk.gen.domains.v1 import domains_pb2
 
-        try:
-            response = self._stub.DeleteDomain(
-                domains_pb2.DeleteDomainRequest(id=id)
-            )
-            return response.success
-        except grpc.RpcError as e:
-            raise wrap_error(e)
+        return _invoke(
+            self._stub.DeleteDomain,
+            domains_pb2.DeleteDomainRequest(id=id),
+            wait,
+            then=_success,
+        )
 
-    def verify(self, id: str) -> Any:
+    def verify(self, id: str, wait: bool = True) -> Any:
         """Verify a custom domain."""
         from go2_sdk.gen.domains.v1 import domains_pb2
 
-        try:
-            return self._stub.VerifyDomain(domains_pb2.VerifyDomainRequest(id=id))
-        except grpc.RpcError as e:
-            raise wrap_error(e)
+        return _invoke(
+            self._stub.VerifyDomain,
+            domains_pb2.VerifyDomainRequest(id=id),
+            wait,
+        )
 
 
 class QRService:
@@ -379,83 +835,100 @@ class QRService:
         format: str = "png",
         foreground_color: str = "#000000",
         background_color: str = "#FFFFFF",
+        wait: bool = True,
     ) -> Any:
         """Generate a QR code for a link."""
         from go2_sdk.gen.qr.v1 import qr_pb2
 
-        try:
-            return self._stub.GenerateQR(
-                qr_pb2.GenerateQRRequest(
-                    link_id=link_id,
-                    size=size,
-                    format=format,
-                    foreground_color=foreground_color,
-                    background_color=background_color,
-                )
-            )
-        except grpc.RpcError as e:
-            raise wrap_error(e)
+        return _invoke(
+            self._stub.GenerateQR,
+            qr_pb2.GenerateQRRequest(
+                link_id=link_id,
+                size=size,
+                format=format,
+                foreground_color=foreground_color,
+                background_color=background_color,
+            ),
+            wait,
+        )
 
 
 class CampaignsService:
     """Service for managing marketing campaigns."""
 
-    def __init__(self, stub: Any):
+    def __init__(self, stub: Any, raw_stub: Optional[RawStub] = None):
         self._stub = stub
+        self._raw_stub = raw_stub
 
-    def list(self, page: int = 1, per_page: int = 20) -> Any:
-        """List all campaigns."""
+    def list(
+        self,
+        page: int = 1,
+        per_page: int = 20,
+        status: Optional[str] = None,
+        search: Optional[str] = None,
+        wait: bool = True,
+    ) -> Any:
+        """List campaigns, optionally filtered by status or name."""
         from go2_sdk.gen.campaigns.v1 import campaigns_pb2
 
-        try:
-            return self._stub.ListCampaigns(
-                campaigns_pb2.ListCampaignsRequest(page=page, per_page=per_page)
-            )
-        except grpc.RpcError as e:
-            raise wrap_error(e)
+        return _invoke(
+            self._stub.ListCampaigns,
+            campaigns_pb2.ListCampaignsRequest(
+                limit=per_page,
+                offset=(page - 1) * per_page,
+                status=status or "",
+                search=search or "",
+            ),
+            wait,
+        )
 
     def create(
         self,
         name: str,
-        base_link_id: str,
-        type: str = "sms",
-        utm_source: Optional[str] = None,
-        utm_medium: Optional[str] = None,
-        utm_campaign: Optional[str] = None,
+        destination_url: str,
+        description: Optional[str] = None,
+        pass_recipient_id: bool = False,
+        recipient_param_name: Optional[str] = None,
+        expires_at: Optional[str] = None,
+        wait: bool = True,
     ) -> Any:
         """Create a new campaign."""
         from go2_sdk.gen.campaigns.v1 import campaigns_pb2
 
-        try:
-            return self._stub.CreateCampaign(
-                campaigns_pb2.CreateCampaignRequest(
-                    name=name,
-                    base_link_id=base_link_id,
-                    type=type,
-                    utm_source=utm_source or "",
-                    utm_medium=utm_medium or "",
-                    utm_campaign=utm_campaign or "",
-                )
-            )
-        except grpc.RpcError as e:
-            raise wrap_error(e)
+        return _invoke(
+            self._stub.CreateCampaign,
+            campaigns_pb2.CreateCampaignRequest(
+                name=name,
+                destination_url=destination_url,
+                description=description or "",
+                pass_recipient_id=pass_recipient_id,
+                recipient_param_name=recipient_param_name or "",
+                expires_at=expires_at or "",
+            ),
+            wait,
+        )
 
-    def get(self, id: str) -> Any:
+    def get(self, id: str, wait: bool = True) -> Any:
         """Get a campaign by ID."""
         from go2_sdk.gen.campaigns.v1 import campaigns_pb2
 
-        try:
-            return self._stub.GetCampaign(campaigns_pb2.GetCampaignRequest(id=id))
-        except grpc.RpcError as e:
-            raise wrap_error(e)
+        return _invoke(
+            self._stub.GetCampaign,
+            campaigns_pb2.GetCampaignRequest(id=id),
+            wait,
+        )
 
     def update(
         self,
         id: str,
         name: Optional[str] = None,
-        utm_source: Optional[str] = None,
-        utm_medium: Optional[str] = None,
-        utm_campaign: Optional[str] = None,
+        description: Optional[str] = None,
+        destination_url: Optional[str] = None,
+        pass_recipient_id: Optional[bool] = None,
+        recipient_param_name: Optional[str] = None,
+        status: Optional[str] = None,
+        expires_at: Optional[str] = None,
+        wait: bool = True,
     ) -> Any:
         """Update a campaign."""
         from go2_sdk.gen.campaigns.v1 import campaigns_pb2
@@ -463,87 +936,292 @@ class CampaignsService:
         request = campaigns_pb2.UpdateCampaignRequest(id=id)
         if name is not None:
             request.name = name
-        if utm_source is not None:
-            request.utm_source = utm_source
-        if utm_medium is not None:
-            request.utm_medium = utm_medium
-        if utm_campaign is not None:
-            request.utm_campaign = utm_campaign
-
-        try:
-            return self._stub.UpdateCampaign(request)
-        except grpc.RpcError as e:
-            raise wrap_error(e)
-
-    def delete(self, id: str) -> bool:
+        if description is not None:
+            request.description = description
+        if destination_url is not None:
+            request.destination_url = destination_url
+        if pass_recipient_id is not None:
+            request.pass_recipient_id = pass_recipient_id
+        if recipient_param_name is not None:
+            request.recipient_param_name = recipient_param_name
+        if status is not None:
+            request.status = status
+        if expires_at is not None:
+            request.expires_at = expires_at
+
+        return _invoke(self._stub.UpdateCampaign, request, wait)
+
+    def delete(self, id: str, wait: bool = True) -> Any:
         """Delete a campaign."""
         from go2_sdk.gen.campaigns.v1 import campaigns_pb2
 
-        try:
-            response = self._stub.DeleteCampaign(
-                campaigns_pb2.DeleteCampaignRequest(id=id)
-            )
-            return response.success
-        except grpc.RpcError as e:
-            raise wrap_error(e)
+        return _invoke(
+            self._stub.DeleteCampaign,
+            campaigns_pb2.DeleteCampaignRequest(id=id),
+            wait,
+            then=_success,
+        )
 
-    def generate_links(self, id: str, recipients: List[Dict[str, str]]) -> Any:
-        """Generate unique trackable links for recipients."""
+    def generate_links(
+        self,
+        id: str,
+        recipients: List[Dict[str, Any]],
+        wait: bool = True,
+    ) -> Any:
+        """
+        Generate unique trackable links for recipients.
+
+        Each recipient is a dict with ``id`` (e.g. a phone number), optional
+        ``name`` and optional ``metadata``; ``identifier`` is accepted as an
+        alias of ``id``.
+        """
         from go2_sdk.gen.campaigns.v1 import campaigns_pb2
 
         recipient_msgs = [
             campaigns_pb2.Recipient(
-                identifier=r.get("identifier", ""),
+                id=r.get("id", r.get("identifier", "")),
+                name=r.get("name", ""),
                 metadata=r.get("metadata", {}),
             )
             for r in recipients
         ]
 
-        try:
-            return self._stub.GenerateLinks(
-                campaigns_pb2.GenerateLinksRequest(
-                    campaign_id=id, recipients=recipient_msgs
-                )
-            )
-        except grpc.RpcError as e:
-            raise wrap_error(e)
+        return _invoke(
+            self._stub.GenerateLinks,
+            campaigns_pb2.GenerateLinksRequest(
+                campaign_id=id, recipients=recipient_msgs
+            ),
+            wait,
+        )
 
     def list_links(
-        self, id: str, page: int = 1, per_page: int = 100
+        self,
+        id: str,
+        page: int = 1,
+        per_page: int = 100,
+        view: Optional[str] = None,
+        raw: bool = False,
+        page_token: Optional[str] = None,
+        wait: bool = True,
     ) -> Any:
-        """List campaign links."""
+        """
+        List campaign links.
+
+        Pass a response's ``next_page_token`` as ``page_token`` to get the
+        page after it, in place of ``page``. With ``view="records"`` or
+        ``view="columns"`` the page is returned as a CompactPage of
+        __slots__ records or column arrays instead of CampaignLink messages.
+        With ``raw=True`` the serialized ListCampaignLinksResponse is
+        returned as bytes.
+        """
         from go2_sdk.gen.campaigns.v1 import campaigns_pb2
 
-        try:
-            return self._stub.ListCampaignLinks(
-                campaigns_pb2.ListCampaignLinksRequest(
-                    campaign_id=id, page=page, per_page=per_page
-                )
-            )
-        except grpc.RpcError as e:
-            raise wrap_error(e)
+        return _invoke(
+            _stub_for(self, raw).ListCampaignLinks,
+            campaigns_pb2.ListCampaignLinksRequest(
+                campaign_id=id,
+                limit=per_page,
+                offset=(page - 1) * per_page,
+                page_token=page_token or "",
+            ),
+            wait,
+            then=_view(view, raw, total=True),
+        )
 
-    def get_stats(self, id: str) -> Any:
+    def list_links_all(
+        self, id: str, per_page: int = 100, view: Optional[str] = None
+    ) -> Iterator[Any]:
+        """
+        Iterate over every link of a campaign, following page tokens.
+
+        Yields CampaignLink messages, or CampaignLinkRecords with a ``view``.
+        """
+        for response in _pages(
+            lambda page, token: self.list_links(
+                id, page=page, per_page=per_page, view=view, page_token=token
+            ),
+            per_page,
+        ):
+            yield from response.links
+
+    def get_stats(self, id: str, wait: bool = True) -> Any:
         """Get campaign statistics."""
         from go2_sdk.gen.campaigns.v1 import campaigns_pb2
 
-        try:
-            return self._stub.GetCampaignStats(
-                campaigns_pb2.GetCampaignStatsRequest(campaign_id=id)
-            )
-        except grpc.RpcError as e:
-            raise wrap_error(e)
+        return _invoke(
+            self._stub.GetCampaignStats,
+            campaigns_pb2.GetCampaignStatsRequest(campaign_id=id),
+            wait,
+        )
 
-    def export_links(self, id: str, format: str = "csv") -> Any:
-        """Export campaign links."""
+    def export_links(
+        self,
+        id: str,
+        format: str = "csv",
+        view: Optional[str] = None,
+        raw: bool = False,
+        wait: bool = True,
+    ) -> Any:
+        """
+        Export campaign links.
+
+        ``view`` works as in ``list_links``. With ``raw=True`` the serialized
+        ExportLinksResponse is returned as bytes, skipping deserialization;
+        ``go2_sdk.raw.split_records`` splits it into per-link views.
+        """
         from go2_sdk.gen.campaigns.v1 import campaigns_pb2
 
-        try:
-            return self._stub.ExportLinks(
-                campaigns_pb2.ExportLinksRequest(campaign_id=id, format=format)
-            )
-        except grpc.RpcError as e:
-            raise wrap_error(e)
+        return _invoke(
+            _stub_for(self, raw).ExportLinks,
+            campaigns_pb2.ExportLinksRequest(campaign_id=id, format=format),
+            wait,
+            then=_view(view, raw),
+        )
+
+
+def _invoke(
+    rpc: Any, request: Any, wait: bool, then: Optional[Callable[[Any], Any]] = None
+) -> Any:
+    """Call ``rpc``, or start it and return a Go2Future when not waiting."""
+    if not wait:
+        return Go2Future(rpc.future(request), then)
+    try:
+        response = rpc(request)
+    except grpc.RpcError as e:
+        raise wrap_error(e)
+    return response if then is None else then(response)
+
+
+def _timestamp(value: Optional[Any]) -> Any:
+    """Convert a datetime to a Timestamp; naive datetimes are taken as UTC."""
+    if value is None or isinstance(value, timestamp_pb2.Timestamp):
+        return value
+    timestamp = timestamp_pb2.Timestamp()
+    timestamp.FromDatetime(value)
+    return timestamp
+
+
+def _read_mask(fields: Optional[Sequence[str]]) -> Any:
+    """Build the FieldMask for a ``fields`` argument, checking the names."""
+    if fields is None:
+        return None
+    from go2_sdk.gen.links.v1 import links_pb2
+
+    if isinstance(fields, str):
+        raise TypeError("fields must be a sequence of field names, not a string")
+    known = links_pb2.Link.DESCRIPTOR.fields_by_name
+    for field in fields:
+        if field.split(".", 1)[0] not in known:
+            raise ValueError("Link has no field {!r}".format(field))
+    return field_mask_pb2.FieldMask(paths=fields)
+
+
+def _batch_write(
+    rpc: Any,
+    wrap: Callable[[List[Any]], Any],
+    requests: List[Any],
+    concurrency: int,
+    max_batch: int,
+    max_bytes: int,
+) -> List[Any]:
+    """Send ``requests`` in size-bounded chunks; return a link or error per item."""
+    if not 1 <= max_batch <= BATCH_WRITE_LIMIT:
+        raise ValueError("max_batch must be between 1 and {}".format(BATCH_WRITE_LIMIT))
+    chunks = list(_chunks(requests, max_batch, max_bytes))
+    starts = []
+    start = 0
+    for chunk in chunks:
+        starts.append(start)
+        start += len(chunk)
+    results: List[Any] = [None] * len(requests)
+
+    def on_result(index: int, response: Any) -> None:
+        chunk = chunks[index]
+        if len(response.results) != len(chunk):
+            on_error(index, Go2Error(
+                "expected {} results, got {}".format(len(chunk), len(response.results))
+            ))
+            return
+        for offset, result in enumerate(response.results, starts[index]):
+            if result.code == 0:
+                results[offset] = result.link
+            else:
+                results[offset] = error_for_status(result.code, result.message)
+
+    def on_error(index: int, error: Go2Error) -> None:
+        for offset in range(starts[index], starts[index] + len(chunks[index])):
+            results[offset] = error
+
+    fan_out(rpc, (wrap(chunk) for chunk in chunks), concurrency, on_result, on_error)
+    return results
+
+
+def _chunks(requests: List[Any], max_items: int, max_bytes: int) -> Iterator[List[Any]]:
+    """
+    Split ``requests`` into chunks of at most ``max_items`` items whose
+    encoding as a repeated field stays under ``max_bytes``. An item larger
+    than ``max_bytes`` on its own is sent alone.
+    """
+    chunk: List[Any] = []
+    size = 0
+    for request in requests:
+        # Tag byte plus at most a 5-byte length prefix per item.
+        item_size = request.ByteSize() + 6
+        if chunk and (len(chunk) == max_items or size + item_size > max_bytes):
+            yield chunk
+            chunk, size = [], 0
+        chunk.append(request)
+        size += item_size
+    if chunk:
+        yield chunk
+
+
+def _links_by_id(response: Any) -> Dict[str, Any]:
+    return {link.id: link for link in response.links}
+
+
+def _success(response: Any) -> bool:
+    return bool(response.success)
+
+
+def _pages(fetch: Callable[[int, Optional[str]], Any], per_page: int) -> Iterator[Any]:
+    """
+    Yield every page from ``fetch(page, page_token)``, following
+    ``next_page_token``. Servers that send no token are paged by number.
+    """
+    page, token = 1, None
+    while True:
+        response = fetch(page, token)
+        yield response
+        if response.next_page_token:
+            token = response.next_page_token
+        elif (
+            token
+            or len(response.links) < per_page
+            or 0 < response.total <= page * per_page
+        ):
+            return
+        page += 1
+
+
+def _view(
+    view: Optional[str], raw: bool, total: bool = False
+) -> Optional[Callable[[Any], Any]]:
+    if view is None or raw:
+        return None
+    if total:
+        return lambda response: compact_links(
+            response.links, view, response.total, response.next_page_token
+        )
+    return lambda response: compact_links(response.links, view)
+
+
+def _stub_for(service: Any, raw: bool) -> Any:
+    if not raw:
+        return service._stub
+    if service._raw_stub is None:
+        raise ValueError("raw responses need a service created by Go2Client")
+    return service._raw_stub
 
 
 class Go2Client:
@@ -571,10 +1249,23 @@ class Go2Client:
             # Campaigns
             campaigns = client.campaigns.list()
 
+    Service methods that make a single call accept ``wait=False`` and then
+    return a Go2Future instead of blocking, so one thread can keep many
+    calls in flight:
+
+        futures = [client.links.get(id, wait=False) for id in ids]
+        links = gather(futures)
+
     Args:
         api_key: Your Go2 API key (required)
         endpoint: gRPC endpoint (default: grpc.go2.ge:443)
         insecure: Use insecure connection for local development
+        analytics_cache: Optional AnalyticsCache shared by analytics calls
+        timeseries_store: Optional TimeseriesStore for incremental timeseries
+        metrics: Optional MetricsInterceptor recording per-RPC metrics
+        tracing: Optional TracingInterceptor creating a span per RPC
+        channel: Optional pre-built grpc.Channel to use instead of connecting
+            to ``endpoint`` (e.g. ``FakeGo2Server().channel()``)
     """
 
     def __init__(
@@ -582,20 +1273,34 @@ class Go2Client:
         api_key: str,
         endpoint: str = DEFAULT_ENDPOINT,
         insecure: bool = False,
+        analytics_cache: Optional[AnalyticsCache] = None,
+        timeseries_store: Optional[TimeseriesStore] = None,
+        metrics: Optional[MetricsInterceptor] = None,
+        tracing: Optional[TracingInterceptor] = None,
+        channel: Optional[grpc.Channel] = None,
     ):
         if not api_key:
             raise ValueError("API key is required")
 
         # Create channel
-        if insecure:
-            channel = grpc.insecure_channel(endpoint)
-        else:
-            credentials = grpc.ssl_channel_credentials()
-            channel = grpc.secure_channel(endpoint, credentials)
+        if channel is None:
+            if insecure:
+                channel = grpc.insecure_channel(endpoint)
+            else:
+                credentials = grpc.ssl_channel_credentials()
+                channel = grpc.secure_channel(endpoint, credentials)
 
         # Add auth interceptor
-        interceptor = _AuthInterceptor(api_key)
-        self._channel = grpc.intercept_channel(channel, interceptor)
+        interceptors: List[Any] = [_AuthInterceptor(api_key)]
+        if metrics is not None:
+            interceptors.append(metrics)
+        if tracing is not None and tracing.enabled:
+            interceptors.append(tracing)
+        self._profiler = Profiler()
+        self._channel = self._profiler.wrap_channel(
+            grpc.intercept_channel(channel, *interceptors)
+        )
+        self.metrics = metrics
 
         # Import generated code and create service clients
         from go2_sdk.gen.integrations.v1 import integrations_pb2_grpc
@@ -610,10 +1315,13 @@ class Go2Client:
             integrations_pb2_grpc.IntegrationServiceStub(self._channel)
         )
         self.links = LinksService(
-            links_pb2_grpc.LinkServiceStub(self._channel)
+            links_pb2_grpc.LinkServiceStub(self._channel),
+            raw_stub=RawStub(self._channel, "links.v1.LinkService"),
         )
         self.analytics = AnalyticsService(
-            analytics_pb2_grpc.AnalyticsServiceStub(self._channel)
+            analytics_pb2_grpc.AnalyticsServiceStub(self._channel),
+            cache=analytics_cache,
+            store=timeseries_store,
         )
         self.domains = DomainsService(
             domains_pb2_grpc.DomainServiceStub(self._channel)
@@ -622,9 +1330,25 @@ class Go2Client:
             qr_pb2_grpc.QRServiceStub(self._channel)
         )
         self.campaigns = CampaignsService(
-            campaigns_pb2_grpc.CampaignServiceStub(self._channel)
+            campaigns_pb2_grpc.CampaignServiceStub(self._channel),
+            raw_stub=RawStub(self._channel, "campaigns.v1.CampaignService"),
         )
 
+    def profile(self) -> ContextManager[Profile]:
+        """
+        Time request encoding, wire time and response decoding per method.
+
+        Only calls started in the same thread or asyncio task as the block
+        are recorded, including futures that finish after it.
+
+        Example:
+            with client.profile() as p:
+                client.campaigns.export_links(campaign_id)
+            print(p.report())
+            print(p["ExportLinks"].decode_seconds)
+        """
+        return self._profiler.profile()
+
     def close(self) -> None:
         """Close the client connection."""
         self._channel.close()
@@ -0,0 +1,112 @@
+"""Go2 SDK columnar analytics results."""
+
+from array import array
+from typing import Any, Dict, List, Sequence, Tuple
+
+from go2_sdk.errors import Go2Error
+
+STATS_FIELDS = (
+    "total_clicks",
+    "unique_clicks",
+    "ios_clicks",
+    "android_clicks",
+    "web_clicks",
+    "other_clicks",
+)
+
+_Points = Tuple[List[str], "array[int]", "array[int]"]
+
+
+class StatsColumns:
+    """
+    GetStats results for many links as parallel int64 arrays.
+
+    Row ``i`` of every column belongs to ``link_ids[i]``. Links whose call
+    failed are left out of the columns and listed in ``errors``.
+    """
+
+    link_ids: List[str]
+    total_clicks: "array[int]"
+    unique_clicks: "array[int]"
+    ios_clicks: "array[int]"
+    android_clicks: "array[int]"
+    web_clicks: "array[int]"
+    other_clicks: "array[int]"
+    errors: Dict[str, Go2Error]
+
+    def __init__(self, link_ids: Sequence[str]):
+        self.link_ids = list(link_ids)
+        for field in STATS_FIELDS:
+            setattr(self, field, array("q", bytes(8 * len(self.link_ids))))
+        self.errors = {}
+
+    def _set(self, index: int, response: Any) -> None:
+        for field in STATS_FIELDS:
+            getattr(self, field)[index] = getattr(response, field)
+
+    def _drop(self, failed: Sequence[int]) -> None:
+        if not failed:
+            return
+        skip = set(failed)
+        keep = [i for i in range(len(self.link_ids)) if i not in skip]
+        self.link_ids = [self.link_ids[i] for i in keep]
+        for field in STATS_FIELDS:
+            column = getattr(self, field)
+            setattr(self, field, array("q", (column[i] for i in keep)))
+
+    def column(self, field: str) -> "array[int]":
+        """Return a column by name."""
+        if field not in STATS_FIELDS:
+            raise KeyError(field)
+        column: "array[int]" = getattr(self, field)
+        return column
+
+    def totals(self) -> Dict[str, int]:
+        """Sum every column."""
+        return {field: sum(getattr(self, field)) for field in STATS_FIELDS}
+
+    def __len__(self) -> int:
+        return len(self.link_ids)
+
+
+class TimeseriesColumns:
+    """
+    GetTimeseries results for many links, concatenated into flat columns.
+
+    The points of ``link_ids[i]`` are rows ``offsets[i]:offsets[i + 1]`` of
+    ``dates``, ``clicks`` and ``unique_clicks``. Links whose call failed are
+    left out and listed in ``errors``.
+    """
+
+    def __init__(self) -> None:
+        self.link_ids: List[str] = []
+        self.offsets: "array[int]" = array("q", [0])
+        self.dates: List[str] = []
+        self.clicks: "array[int]" = array("q")
+        self.unique_clicks: "array[int]" = array("q")
+        self.errors: Dict[str, Go2Error] = {}
+
+    def _append(self, link_id: str, points: "_Points") -> None:
+        dates, clicks, unique_clicks = points
+        self.link_ids.append(link_id)
+        self.dates.extend(dates)
+        self.clicks.extend(clicks)
+        self.unique_clicks.extend(unique_clicks)
+        self.offsets.append(len(self.dates))
+
+    def rows(self, link_id: str) -> slice:
+        """Return the row slice holding a link's points."""
+        i = self.link_ids.index(link_id)
+        return slice(self.offsets[i], self.offsets[i + 1])
+
+    def __len__(self) -> int:
+        return len(self.link_ids)
+
+
+def _compact_points(points: Sequence[Any]) -> _Points:
+    """Copy TimeseriesPoints into plain columns so the response can be freed."""
+    return (
+        [p.date for p in points],
+        array("q", (p.clicks for p in points)),
+        array("q", (p.unique_clicks for p in points)),
+    )
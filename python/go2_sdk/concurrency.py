@@ -0,0 +1,75 @@
+"""Go2 SDK bounded fan-out over gRPC futures."""
+
+from typing import Any, Callable, Iterable, NoReturn
+import functools
+import threading
+
+import grpc
+
+from go2_sdk.errors import Go2Error, wrap_error
+
+
+def fan_out(
+    rpc: Any,
+    requests: Iterable[Any],
+    concurrency: int,
+    on_result: Callable[[int, Any], None],
+    on_error: Callable[[int, Go2Error], None],
+) -> None:
+    """
+    Issue ``rpc`` for every request with at most ``concurrency`` in flight.
+
+    Calls are made with the multicallable's ``future()`` so no thread is
+    spent per request. ``on_result`` or ``on_error`` is called with the
+    request's index once it completes, possibly from a gRPC thread.
+    Blocks until every call has completed.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    slots = threading.Semaphore(concurrency)
+    lock = threading.Lock()
+    finished = threading.Event()
+    state = {"outstanding": 0, "submitted": False}
+
+    def done(index: int, result: Callable[[], Any]) -> None:
+        try:
+            try:
+                response = result()
+            except grpc.RpcError as e:
+                on_error(index, wrap_error(e))
+            else:
+                on_result(index, response)
+        except Go2Error as e:
+            on_error(index, e)
+        except Exception as e:  # noqa: BLE001
+            # Runs on a gRPC thread, where an exception would be lost along
+            # with the item, so anything else raised here is reported too.
+            on_error(index, wrap_error(e))
+        finally:
+            slots.release()
+            with lock:
+                state["outstanding"] -= 1
+                if state["submitted"] and state["outstanding"] == 0:
+                    finished.set()
+
+    for index, request in enumerate(requests):
+        slots.acquire()
+        with lock:
+            state["outstanding"] += 1
+        try:
+            future = rpc.future(request)
+        except grpc.RpcError as e:
+            done(index, functools.partial(_raise, e))
+            continue
+        future.add_done_callback(lambda f, i=index: done(i, f.result))
+
+    with lock:
+        state["submitted"] = True
+        if state["outstanding"] == 0:
+            finished.set()
+    finished.wait()
+
+
+def _raise(error: BaseException) -> NoReturn:
+    raise error
@@ -0,0 +1,234 @@
+"""Go2 SDK fast dict and JSON conversion for SDK messages."""
+
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import base64
+import datetime
+import functools
+import json
+import math
+import threading
+
+from google.protobuf import json_format
+from google.protobuf.descriptor import Descriptor, FieldDescriptor
+
+Converter = Callable[[Any], Dict[str, Any]]
+
+# Per field: attribute name, output key, value converter, whether the
+# field tracks presence.
+_FieldPlan = Tuple[str, str, Optional[Callable[[Any], Any]], bool]
+
+_INT64_TYPES = frozenset(
+    (
+        FieldDescriptor.TYPE_INT64,
+        FieldDescriptor.TYPE_UINT64,
+        FieldDescriptor.TYPE_SINT64,
+        FieldDescriptor.TYPE_FIXED64,
+        FieldDescriptor.TYPE_SFIXED64,
+    )
+)
+_FLOAT_TYPES = frozenset((FieldDescriptor.TYPE_DOUBLE, FieldDescriptor.TYPE_FLOAT))
+
+_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
+_TIMES = ["T{:02d}".format(hour) for hour in range(24)]
+_CLOCK = [":{:02d}".format(n) for n in range(60)]
+
+_CONVERTERS: Dict[Tuple[Descriptor, bool], Converter] = {}
+_PENDING: Dict[Tuple[Descriptor, bool], Converter] = {}
+_COMPILE_LOCK = threading.RLock()
+
+
+def to_dict(message: Any, preserving_proto_field_name: bool = False) -> Dict[str, Any]:
+    """
+    Convert a message to a dict with the same output as ``MessageToDict``.
+
+    Fields holding their default value are omitted, int64 values become
+    strings, enums their names and Timestamps RFC 3339 strings. Keys are
+    lowerCamelCase unless ``preserving_proto_field_name`` is set.
+
+    The converter for each message type is built from its descriptor on
+    first use and cached, so no descriptor reflection happens per call.
+    """
+    return converter_for(message.DESCRIPTOR, preserving_proto_field_name)(message)
+
+
+def to_dict_many(
+    messages: Iterable[Any], preserving_proto_field_name: bool = False
+) -> List[Dict[str, Any]]:
+    """Convert messages of one type, e.g. ``response.links``, to dicts."""
+    convert: Optional[Converter] = None
+    result = []
+    for message in messages:
+        if convert is None:
+            convert = converter_for(message.DESCRIPTOR, preserving_proto_field_name)
+        result.append(convert(message))
+    return result
+
+
+def to_json(
+    message: Any,
+    preserving_proto_field_name: bool = False,
+    indent: Optional[int] = None,
+) -> str:
+    """Serialize a message to a JSON object string."""
+    return _dumps(to_dict(message, preserving_proto_field_name), indent)
+
+
+def to_json_many(
+    messages: Iterable[Any],
+    preserving_proto_field_name: bool = False,
+    indent: Optional[int] = None,
+) -> str:
+    """Serialize messages of one type to a JSON array string."""
+    return _dumps(to_dict_many(messages, preserving_proto_field_name), indent)
+
+
+def converter_for(
+    descriptor: Descriptor, preserving_proto_field_name: bool = False
+) -> Converter:
+    """Return the cached dict converter for a message descriptor."""
+    key = (descriptor, preserving_proto_field_name)
+    convert = _CONVERTERS.get(key)
+    if convert is not None:
+        return convert
+    with _COMPILE_LOCK:
+        convert = _CONVERTERS.get(key) or _PENDING.get(key)
+        if convert is not None:
+            return convert
+        if descriptor.full_name.startswith("google.protobuf."):
+            # Well-known types have special JSON forms; leave them to json_format.
+            convert = functools.partial(
+                json_format.MessageToDict,
+                preserving_proto_field_name=preserving_proto_field_name,
+            )
+            _CONVERTERS[key] = convert
+            return convert
+        return _compile(descriptor, preserving_proto_field_name)
+
+
+def _compile(descriptor: Descriptor, proto_names: bool) -> Converter:
+    # Each message type gets a closure over a precomputed plan of its
+    # fields, so converting a message is a loop of attribute reads.
+    key = (descriptor, proto_names)
+    # Stands in for this converter while nested fields of a recursive
+    # type are compiled.
+    _PENDING[key] = lambda m: _CONVERTERS[key](m)
+    plan: List[_FieldPlan] = [
+        (
+            field.name,
+            field.name if proto_names else field.json_name,
+            _field_converter(field, proto_names),
+            bool(field.has_presence) and not _is_repeated(field),
+        )
+        for field in descriptor.fields
+    ]
+
+    def convert(m: Any) -> Dict[str, Any]:
+        r = {}
+        for attr, name, value_converter, has_presence in plan:
+            if has_presence:
+                if not m.HasField(attr):
+                    continue
+                v = getattr(m, attr)
+            else:
+                # Proto3 fields without presence are omitted at their default.
+                v = getattr(m, attr)
+                if not v:
+                    continue
+            r[name] = v if value_converter is None else value_converter(v)
+        return r
+
+    _CONVERTERS[key] = convert
+    del _PENDING[key]
+    return convert
+
+
+def _field_converter(
+    field: FieldDescriptor, proto_names: bool
+) -> Optional[Callable[[Any], Any]]:
+    message_type = field.message_type
+    if message_type is not None and message_type.GetOptions().map_entry:
+        key_field = message_type.fields_by_name["key"]
+        value_converter = _value_converter(
+            message_type.fields_by_name["value"], proto_names
+        )
+        key_converter: Callable[[Any], str] = (
+            _bool_key if key_field.type == FieldDescriptor.TYPE_BOOL else str
+        )
+        if value_converter is None:
+            return lambda m: {key_converter(k): v for k, v in m.items()}
+        convert_value = value_converter
+        return lambda m: {key_converter(k): convert_value(v) for k, v in m.items()}
+
+    value_converter = _value_converter(field, proto_names)
+    if _is_repeated(field):
+        if value_converter is None:
+            return list
+        convert_item = value_converter
+        return lambda values: [convert_item(v) for v in values]
+    return value_converter
+
+
+def _value_converter(
+    field: FieldDescriptor, proto_names: bool
+) -> Optional[Callable[[Any], Any]]:
+    if field.type == FieldDescriptor.TYPE_MESSAGE:
+        full_name = field.message_type.full_name
+        if full_name == "google.protobuf.Timestamp":
+            return _timestamp
+        return converter_for(field.message_type, proto_names)
+    if field.type == FieldDescriptor.TYPE_ENUM:
+        names = {value.number: value.name for value in field.enum_type.values}
+        return lambda number: names.get(number, number)
+    if field.type in _INT64_TYPES:
+        return str
+    if field.type in _FLOAT_TYPES:
+        return _float
+    if field.type == FieldDescriptor.TYPE_BYTES:
+        return lambda data: base64.b64encode(data).decode("ascii")
+    return None
+
+
+def _bool_key(key: bool) -> str:
+    return "true" if key else "false"
+
+
+def _is_repeated(field: FieldDescriptor) -> bool:
+    # ``label`` was replaced by ``is_repeated`` in newer protobuf releases.
+    if hasattr(field, "is_repeated"):
+        return bool(field.is_repeated)
+    return bool(field.label == FieldDescriptor.LABEL_REPEATED)
+
+
+@functools.lru_cache(maxsize=4096)
+def _date(days: int) -> str:
+    return datetime.date.fromordinal(_EPOCH_ORDINAL + days).isoformat()
+
+
+def _timestamp(ts: Any) -> str:
+    seconds: int = ts.seconds
+    nanos: int = ts.nanos
+    days, seconds = divmod(seconds, 86400)
+    hours, seconds = divmod(seconds, 3600)
+    minutes, seconds = divmod(seconds, 60)
+    text = _date(days) + _TIMES[hours] + _CLOCK[minutes] + _CLOCK[seconds]
+    if not nanos:
+        return text + "Z"
+    if nanos % 1000000 == 0:
+        return "{}.{:03d}Z".format(text, nanos // 1000000)
+    if nanos % 1000 == 0:
+        return "{}.{:06d}Z".format(text, nanos // 1000)
+    return "{}.{:09d}Z".format(text, nanos)
+
+
+def _float(value: float) -> Any:
+    if math.isfinite(value):
+        return value
+    if math.isnan(value):
+        return "NaN"
+    return "Infinity" if value > 0 else "-Infinity"
+
+
+def _dumps(value: Any, indent: Optional[int]) -> str:
+    separators = (",", ":") if indent is None else None
+    return json.dumps(value, indent=indent, separators=separators, ensure_ascii=False)
@@ -0,0 +1,59 @@
+"""Go2 SDK combined analytics dashboard result."""
+
+from typing import Any, Dict, Optional
+
+from go2_sdk.errors import Go2Error
+
+# Dashboard part name -> AnalyticsService RPC.
+DASHBOARD_PARTS = {
+    "stats": "GetStats",
+    "timeseries": "GetTimeseries",
+    "platforms": "GetPlatforms",
+    "countries": "GetCountries",
+    "referrers": "GetReferrers",
+}
+
+
+class Dashboard:
+    """
+    All five analytics responses for one link and period.
+
+    A part whose call failed is None and its error is in ``errors``,
+    keyed by part name.
+    """
+
+    __slots__ = (
+        "link_id",
+        "period",
+        "stats",
+        "timeseries",
+        "platforms",
+        "countries",
+        "referrers",
+        "errors",
+    )
+
+    def __init__(self, link_id: str, period: str):
+        self.link_id = link_id
+        self.period = period
+        self.stats: Optional[Any] = None
+        self.timeseries: Optional[Any] = None
+        self.platforms: Optional[Any] = None
+        self.countries: Optional[Any] = None
+        self.referrers: Optional[Any] = None
+        self.errors: Dict[str, Go2Error] = {}
+
+    @property
+    def complete(self) -> bool:
+        """Whether every part was fetched."""
+        return not self.errors
+
+    def raise_for_errors(self) -> None:
+        """Raise the first part's error, if any part failed."""
+        for error in self.errors.values():
+            raise error
+
+    def __repr__(self) -> str:
+        return "Dashboard(link_id={!r}, period={!r}, errors={!r})".format(
+            self.link_id, self.period, sorted(self.errors)
+        )
@@ -53,8 +53,18 @@ def wrap_error(error: Any) -> Go2Error:
     if not isinstance(error, grpc.RpcError):
         return Go2Error(str(error))
 
-    code = error.code()
-    message = error.details() or str(error)
+    return error_for_status(error.code(), error.details() or str(error))
+
+
+def error_for_status(code: Any, message: str) -> Go2Error:
+    """
+    Build the Go2 SDK error for a status code and message.
+
+    ``code`` is a grpc.StatusCode or its integer value, as carried by the
+    per-item results of batch calls.
+    """
+    if not isinstance(code, grpc.StatusCode):
+        code = _STATUS_CODES.get(code, grpc.StatusCode.UNKNOWN)
 
     if code == grpc.StatusCode.UNAUTHENTICATED:
         return AuthenticationError(message)
@@ -68,3 +78,6 @@ def wrap_error(error: Any) -> Go2Error:
         return RateLimitError(message)
     else:
         return Go2Error(message, code)
+
+
+_STATUS_CODES = {code.value[0]: code for code in grpc.StatusCode}
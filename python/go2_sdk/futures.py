@@ -0,0 +1,189 @@
+"""Go2 SDK futures for calls made with ``wait=False``."""
+
+from concurrent.futures import CancelledError
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+import queue
+import threading
+import time
+
+import grpc
+
+from go2_sdk.errors import Go2Error, wrap_error
+
+
+class Go2Future:
+    """
+    Pending result of a service call made with ``wait=False``.
+
+    ``result()`` blocks until the call completes and returns what the
+    blocking call would have returned, or raises the Go2Error subclass it
+    would have raised. No thread is used while the call is in flight.
+
+    ``call`` is a gRPC call future, or a concurrent.futures.Future that
+    resolves to a response or fails with a Go2Error.
+
+    Example:
+        futures = [client.links.get(id, wait=False) for id in ids]
+        links = gather(futures)
+    """
+
+    def __init__(self, call: Any, then: Optional[Callable[[Any], Any]] = None):
+        self._call = call
+        self._then = then
+        self._lock = threading.Lock()
+        self._resolved = call is None
+        self._value: Any = None
+        self._error: Optional[BaseException] = None
+
+    @classmethod
+    def completed(cls, value: Any) -> "Go2Future":
+        """Return a future already holding ``value``, e.g. a cache hit."""
+        future = cls(None)
+        future._value = value
+        return future
+
+    @classmethod
+    def failed(cls, error: BaseException) -> "Go2Future":
+        """Return a future already holding ``error``."""
+        future = cls(None)
+        future._error = error
+        return future
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        """
+        Return the call's result, waiting up to ``timeout`` seconds.
+
+        Raises:
+            Go2Error: The call failed
+            TimeoutError: The call did not complete within ``timeout``
+        """
+        self._resolve(timeout)
+        if self._error is not None:
+            raise self._error
+        return self._value
+
+    def exception(self, timeout: Optional[float] = None) -> Optional[BaseException]:
+        """
+        Return the call's error, or None if it succeeded.
+
+        This is the exception ``result()`` would raise: a Go2Error for a
+        failed or cancelled call, or whatever converting the response raised.
+
+        Raises:
+            TimeoutError: The call did not complete within ``timeout``
+        """
+        self._resolve(timeout)
+        return self._error
+
+    def done(self) -> bool:
+        return self._resolved or self._call.done()
+
+    def cancel(self) -> bool:
+        """Cancel the call if it is still in flight."""
+        return self._call is not None and self._call.cancel()
+
+    def cancelled(self) -> bool:
+        return self._call is not None and self._call.cancelled()
+
+    def add_done_callback(self, fn: Callable[["Go2Future"], None]) -> None:
+        """
+        Call ``fn(future)`` once the call completes, immediately if it has.
+
+        The callback may run on a gRPC thread and should not block.
+        """
+        if self._call is None:
+            fn(self)
+        else:
+            self._call.add_done_callback(lambda _: fn(self))
+
+    def _resolve(self, timeout: Optional[float]) -> None:
+        if self._resolved:
+            return
+        value: Any = None
+        error: Optional[BaseException] = None
+        try:
+            response = self._call.result(timeout)
+        except (grpc.FutureTimeoutError, FutureTimeoutError):
+            raise TimeoutError("call did not complete within {}s".format(timeout))
+        except (grpc.FutureCancelledError, CancelledError):
+            error = Go2Error("call was cancelled", grpc.StatusCode.CANCELLED)
+        except grpc.RpcError as e:
+            error = wrap_error(e)
+        except Go2Error as e:
+            error = e
+        else:
+            try:
+                value = response if self._then is None else self._then(response)
+            except Exception as e:  # noqa: BLE001
+                # ``then`` converts the response; whatever it raises is what
+                # the blocking call would have raised, so result() re-raises it.
+                error = e
+        with self._lock:
+            if not self._resolved:
+                self._value, self._error = value, error
+                self._resolved = True
+
+    def __repr__(self) -> str:
+        if not self.done():
+            state = "pending"
+        elif self.cancelled():
+            state = "cancelled"
+        else:
+            state = "done"
+        return "<Go2Future {}>".format(state)
+
+
+def as_completed(
+    futures: Iterable[Go2Future], timeout: Optional[float] = None
+) -> Iterator[Go2Future]:
+    """
+    Yield futures as their calls complete, fastest first.
+
+    Raises:
+        TimeoutError: Not all calls completed within ``timeout`` seconds
+    """
+    futures = list(futures)
+    finished: "queue.Queue[Go2Future]" = queue.Queue()
+    for future in futures:
+        future.add_done_callback(finished.put)
+    deadline = None if timeout is None else time.monotonic() + timeout
+    for remaining in range(len(futures), 0, -1):
+        wait = None if deadline is None else max(0.0, deadline - time.monotonic())
+        try:
+            yield finished.get(timeout=wait)
+        except queue.Empty:
+            raise TimeoutError(
+                "{} of {} calls did not complete within {}s".format(
+                    remaining, len(futures), timeout
+                )
+            )
+
+
+def gather(
+    futures: Iterable[Go2Future],
+    return_exceptions: bool = False,
+    timeout: Optional[float] = None,
+) -> List[Any]:
+    """
+    Wait for every future and return their results in order.
+
+    The first failure (in order) is raised, unless ``return_exceptions``
+    is true, in which case errors are returned in place of results.
+
+    Raises:
+        Go2Error: A call failed and ``return_exceptions`` is false
+        TimeoutError: Not all calls completed within ``timeout`` seconds
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    results = []
+    for future in futures:
+        wait = None if deadline is None else max(0.0, deadline - time.monotonic())
+        error = future.exception(wait)
+        if error is None:
+            results.append(future.result())
+        elif return_exceptions:
+            results.append(error)
+        else:
+            raise error
+    return results
@@ -1,3 +1,6 @@
+import datetime
+
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
 from google.protobuf.internal import containers as _containers
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
@@ -135,3 +138,27 @@ class ReferrerStats(_message.Message):
     clicks: int
     percentage: float
     def __init__(self, referrer: _Optional[str] = ..., clicks: _Optional[int] = ..., percentage: _Optional[float] = ...) -> None: ...
+
+class StreamClicksRequest(_message.Message):
+    __slots__ = ("link_ids", "resume_after")
+    LINK_IDS_FIELD_NUMBER: _ClassVar[int]
+    RESUME_AFTER_FIELD_NUMBER: _ClassVar[int]
+    link_ids: _containers.RepeatedScalarFieldContainer[str]
+    resume_after: str
+    def __init__(self, link_ids: _Optional[_Iterable[str]] = ..., resume_after: _Optional[str] = ...) -> None: ...
+
+class ClickEvent(_message.Message):
+    __slots__ = ("event_id", "link_id", "platform", "country", "referrer", "timestamp")
+    EVENT_ID_FIELD_NUMBER: _ClassVar[int]
+    LINK_ID_FIELD_NUMBER: _ClassVar[int]
+    PLATFORM_FIELD_NUMBER: _ClassVar[int]
+    COUNTRY_FIELD_NUMBER: _ClassVar[int]
+    REFERRER_FIELD_NUMBER: _ClassVar[int]
+    TIMESTAMP_FIELD_NUMBER: _ClassVar[int]
+    event_id: str
+    link_id: str
+    platform: str
+    country: str
+    referrer: str
+    timestamp: _timestamp_pb2.Timestamp
+    def __init__(self, event_id: _Optional[str] = ..., link_id: _Optional[str] = ..., platform: _Optional[str] = ..., country: _Optional[str] = ..., referrer: _Optional[str] = ..., timestamp: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ...) -> None: ...
@@ -60,6 +60,11 @@ class AnalyticsServiceStub(object):
                 request_serializer=analytics_dot_v1_dot_analytics__pb2.GetReferrersRequest.SerializeToString,
                 response_deserializer=analytics_dot_v1_dot_analytics__pb2.GetReferrersResponse.FromString,
                 _registered_method=True)
+        self.StreamClicks = channel.unary_stream(
+                '/analytics.v1.AnalyticsService/StreamClicks',
+                request_serializer=analytics_dot_v1_dot_analytics__pb2.StreamClicksRequest.SerializeToString,
+                response_deserializer=analytics_dot_v1_dot_analytics__pb2.ClickEvent.FromString,
+                _registered_method=True)
 
 
 class AnalyticsServiceServicer(object):
@@ -101,6 +106,13 @@ class AnalyticsServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def StreamClicks(self, request, context):
+        """Stream click events as they happen
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_AnalyticsServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -129,6 +141,11 @@ def add_AnalyticsServiceServicer_to_server(servicer, server):
                     request_deserializer=analytics_dot_v1_dot_analytics__pb2.GetReferrersRequest.FromString,
                     response_serializer=analytics_dot_v1_dot_analytics__pb2.GetReferrersResponse.SerializeToString,
             ),
+            'StreamClicks': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamClicks,
+                    request_deserializer=analytics_dot_v1_dot_analytics__pb2.StreamClicksRequest.FromString,
+                    response_serializer=analytics_dot_v1_dot_analytics__pb2.ClickEvent.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'analytics.v1.AnalyticsService', rpc_method_handlers)
@@ -275,3 +292,30 @@ class AnalyticsService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def StreamClicks(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/analytics.v1.AnalyticsService/StreamClicks',
+            analytics_dot_v1_dot_analytics__pb2.StreamClicksRequest.SerializeToString,
+            analytics_dot_v1_dot_analytics__pb2.ClickEvent.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
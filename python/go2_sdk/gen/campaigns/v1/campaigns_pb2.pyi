@@ -189,26 +189,30 @@ class GenerateLinksResponse(_message.Message):
     def __init__(self, campaign_id: _Optional[str] = ..., links_created: _Optional[int] = ..., sample_links: _Optional[_Iterable[_Union[CampaignLink, _Mapping]]] = ...) -> None: ...
 
 class ListCampaignLinksRequest(_message.Message):
-    __slots__ = ("campaign_id", "limit", "offset", "clicked_only", "search")
+    __slots__ = ("campaign_id", "limit", "offset", "clicked_only", "search", "page_token")
     CAMPAIGN_ID_FIELD_NUMBER: _ClassVar[int]
     LIMIT_FIELD_NUMBER: _ClassVar[int]
     OFFSET_FIELD_NUMBER: _ClassVar[int]
     CLICKED_ONLY_FIELD_NUMBER: _ClassVar[int]
     SEARCH_FIELD_NUMBER: _ClassVar[int]
+    PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
     campaign_id: str
     limit: int
     offset: int
     clicked_only: bool
     search: str
-    def __init__(self, campaign_id: _Optional[str] = ..., limit: _Optional[int] = ..., offset: _Optional[int] = ..., clicked_only: bool = ..., search: _Optional[str] = ...) -> None: ...
+    page_token: str
+    def __init__(self, campaign_id: _Optional[str] = ..., limit: _Optional[int] = ..., offset: _Optional[int] = ..., clicked_only: bool = ..., search: _Optional[str] = ..., page_token: _Optional[str] = ...) -> None: ...
 
 class ListCampaignLinksResponse(_message.Message):
-    __slots__ = ("links", "total")
+    __slots__ = ("links", "total", "next_page_token")
     LINKS_FIELD_NUMBER: _ClassVar[int]
     TOTAL_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
     links: _containers.RepeatedCompositeFieldContainer[CampaignLink]
     total: int
-    def __init__(self, links: _Optional[_Iterable[_Union[CampaignLink, _Mapping]]] = ..., total: _Optional[int] = ...) -> None: ...
+    next_page_token: str
+    def __init__(self, links: _Optional[_Iterable[_Union[CampaignLink, _Mapping]]] = ..., total: _Optional[int] = ..., next_page_token: _Optional[str] = ...) -> None: ...
 
 class GetCampaignStatsRequest(_message.Message):
     __slots__ = ("campaign_id",)
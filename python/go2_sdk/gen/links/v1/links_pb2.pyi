@@ -1,7 +1,9 @@
 import datetime
 
+from google.protobuf import field_mask_pb2 as _field_mask_pb2
 from google.protobuf import timestamp_pb2 as _timestamp_pb2
 from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
 from collections.abc import Iterable as _Iterable, Mapping as _Mapping
@@ -9,6 +11,15 @@ from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
 
 DESCRIPTOR: _descriptor.FileDescriptor
 
+class LinkOrder(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    LINK_ORDER_UNSPECIFIED: _ClassVar[LinkOrder]
+    LINK_ORDER_UPDATED_AT_ASC: _ClassVar[LinkOrder]
+    LINK_ORDER_UPDATED_AT_DESC: _ClassVar[LinkOrder]
+LINK_ORDER_UNSPECIFIED: LinkOrder
+LINK_ORDER_UPDATED_AT_ASC: LinkOrder
+LINK_ORDER_UPDATED_AT_DESC: LinkOrder
+
 class Link(_message.Message):
     __slots__ = ("id", "user_id", "slug", "title", "ios_url", "android_url", "web_url", "fallback_url", "huawei_url", "amazon_url", "windows_url", "macos_url", "app_name", "app_icon_url", "description", "is_active", "total_clicks", "created_at", "updated_at")
     ID_FIELD_NUMBER: _ClassVar[int]
@@ -52,24 +63,34 @@ class Link(_message.Message):
     def __init__(self, id: _Optional[str] = ..., user_id: _Optional[str] = ..., slug: _Optional[str] = ..., title: _Optional[str] = ..., ios_url: _Optional[str] = ..., android_url: _Optional[str] = ..., web_url: _Optional[str] = ..., fallback_url: _Optional[str] = ..., huawei_url: _Optional[str] = ..., amazon_url: _Optional[str] = ..., windows_url: _Optional[str] = ..., macos_url: _Optional[str] = ..., app_name: _Optional[str] = ..., app_icon_url: _Optional[str] = ..., description: _Optional[str] = ..., is_active: bool = ..., total_clicks: _Optional[int] = ..., created_at: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., updated_at: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ...) -> None: ...
 
 class ListLinksRequest(_message.Message):
-    __slots__ = ("page", "per_page")
+    __slots__ = ("page", "per_page", "read_mask", "page_token", "updated_since", "order")
     PAGE_FIELD_NUMBER: _ClassVar[int]
     PER_PAGE_FIELD_NUMBER: _ClassVar[int]
+    READ_MASK_FIELD_NUMBER: _ClassVar[int]
+    PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    UPDATED_SINCE_FIELD_NUMBER: _ClassVar[int]
+    ORDER_FIELD_NUMBER: _ClassVar[int]
     page: int
     per_page: int
-    def __init__(self, page: _Optional[int] = ..., per_page: _Optional[int] = ...) -> None: ...
+    read_mask: _field_mask_pb2.FieldMask
+    page_token: str
+    updated_since: _timestamp_pb2.Timestamp
+    order: LinkOrder
+    def __init__(self, page: _Optional[int] = ..., per_page: _Optional[int] = ..., read_mask: _Optional[_Union[_field_mask_pb2.FieldMask, _Mapping]] = ..., page_token: _Optional[str] = ..., updated_since: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., order: _Optional[_Union[LinkOrder, str]] = ...) -> None: ...
 
 class ListLinksResponse(_message.Message):
-    __slots__ = ("links", "total", "page", "per_page")
+    __slots__ = ("links", "total", "page", "per_page", "next_page_token")
     LINKS_FIELD_NUMBER: _ClassVar[int]
     TOTAL_FIELD_NUMBER: _ClassVar[int]
     PAGE_FIELD_NUMBER: _ClassVar[int]
     PER_PAGE_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
     links: _containers.RepeatedCompositeFieldContainer[Link]
     total: int
     page: int
     per_page: int
-    def __init__(self, links: _Optional[_Iterable[_Union[Link, _Mapping]]] = ..., total: _Optional[int] = ..., page: _Optional[int] = ..., per_page: _Optional[int] = ...) -> None: ...
+    next_page_token: str
+    def __init__(self, links: _Optional[_Iterable[_Union[Link, _Mapping]]] = ..., total: _Optional[int] = ..., page: _Optional[int] = ..., per_page: _Optional[int] = ..., next_page_token: _Optional[str] = ...) -> None: ...
 
 class CreateLinkRequest(_message.Message):
     __slots__ = ("slug", "title", "ios_url", "android_url", "web_url", "fallback_url", "huawei_url", "amazon_url", "windows_url", "macos_url", "app_name", "app_icon_url", "description")
@@ -102,10 +123,26 @@ class CreateLinkRequest(_message.Message):
     def __init__(self, slug: _Optional[str] = ..., title: _Optional[str] = ..., ios_url: _Optional[str] = ..., android_url: _Optional[str] = ..., web_url: _Optional[str] = ..., fallback_url: _Optional[str] = ..., huawei_url: _Optional[str] = ..., amazon_url: _Optional[str] = ..., windows_url: _Optional[str] = ..., macos_url: _Optional[str] = ..., app_name: _Optional[str] = ..., app_icon_url: _Optional[str] = ..., description: _Optional[str] = ...) -> None: ...
 
 class GetLinkRequest(_message.Message):
-    __slots__ = ("id",)
+    __slots__ = ("id", "read_mask")
     ID_FIELD_NUMBER: _ClassVar[int]
+    READ_MASK_FIELD_NUMBER: _ClassVar[int]
     id: str
-    def __init__(self, id: _Optional[str] = ...) -> None: ...
+    read_mask: _field_mask_pb2.FieldMask
+    def __init__(self, id: _Optional[str] = ..., read_mask: _Optional[_Union[_field_mask_pb2.FieldMask, _Mapping]] = ...) -> None: ...
+
+class BatchGetLinksRequest(_message.Message):
+    __slots__ = ("ids",)
+    IDS_FIELD_NUMBER: _ClassVar[int]
+    ids: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, ids: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class BatchGetLinksResponse(_message.Message):
+    __slots__ = ("links", "missing_ids")
+    LINKS_FIELD_NUMBER: _ClassVar[int]
+    MISSING_IDS_FIELD_NUMBER: _ClassVar[int]
+    links: _containers.RepeatedCompositeFieldContainer[Link]
+    missing_ids: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, links: _Optional[_Iterable[_Union[Link, _Mapping]]] = ..., missing_ids: _Optional[_Iterable[str]] = ...) -> None: ...
 
 class UpdateLinkRequest(_message.Message):
     __slots__ = ("id", "slug", "title", "ios_url", "android_url", "web_url", "fallback_url", "is_active")
@@ -127,6 +164,40 @@ class UpdateLinkRequest(_message.Message):
     is_active: bool
     def __init__(self, id: _Optional[str] = ..., slug: _Optional[str] = ..., title: _Optional[str] = ..., ios_url: _Optional[str] = ..., android_url: _Optional[str] = ..., web_url: _Optional[str] = ..., fallback_url: _Optional[str] = ..., is_active: bool = ...) -> None: ...
 
+class BatchCreateLinksRequest(_message.Message):
+    __slots__ = ("requests",)
+    REQUESTS_FIELD_NUMBER: _ClassVar[int]
+    requests: _containers.RepeatedCompositeFieldContainer[CreateLinkRequest]
+    def __init__(self, requests: _Optional[_Iterable[_Union[CreateLinkRequest, _Mapping]]] = ...) -> None: ...
+
+class BatchCreateLinksResponse(_message.Message):
+    __slots__ = ("results",)
+    RESULTS_FIELD_NUMBER: _ClassVar[int]
+    results: _containers.RepeatedCompositeFieldContainer[LinkResult]
+    def __init__(self, results: _Optional[_Iterable[_Union[LinkResult, _Mapping]]] = ...) -> None: ...
+
+class BatchUpdateLinksRequest(_message.Message):
+    __slots__ = ("requests",)
+    REQUESTS_FIELD_NUMBER: _ClassVar[int]
+    requests: _containers.RepeatedCompositeFieldContainer[UpdateLinkRequest]
+    def __init__(self, requests: _Optional[_Iterable[_Union[UpdateLinkRequest, _Mapping]]] = ...) -> None: ...
+
+class BatchUpdateLinksResponse(_message.Message):
+    __slots__ = ("results",)
+    RESULTS_FIELD_NUMBER: _ClassVar[int]
+    results: _containers.RepeatedCompositeFieldContainer[LinkResult]
+    def __init__(self, results: _Optional[_Iterable[_Union[LinkResult, _Mapping]]] = ...) -> None: ...
+
+class LinkResult(_message.Message):
+    __slots__ = ("code", "message", "link")
+    CODE_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    LINK_FIELD_NUMBER: _ClassVar[int]
+    code: int
+    message: str
+    link: Link
+    def __init__(self, code: _Optional[int] = ..., message: _Optional[str] = ..., link: _Optional[_Union[Link, _Mapping]] = ...) -> None: ...
+
 class DeleteLinkRequest(_message.Message):
     __slots__ = ("id",)
     ID_FIELD_NUMBER: _ClassVar[int]
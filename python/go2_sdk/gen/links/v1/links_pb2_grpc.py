@@ -50,11 +50,26 @@ class LinkServiceStub(object):
                 request_serializer=links_dot_v1_dot_links__pb2.GetLinkRequest.SerializeToString,
                 response_deserializer=links_dot_v1_dot_links__pb2.Link.FromString,
                 _registered_method=True)
+        self.BatchGetLinks = channel.unary_unary(
+                '/links.v1.LinkService/BatchGetLinks',
+                request_serializer=links_dot_v1_dot_links__pb2.BatchGetLinksRequest.SerializeToString,
+                response_deserializer=links_dot_v1_dot_links__pb2.BatchGetLinksResponse.FromString,
+                _registered_method=True)
         self.UpdateLink = channel.unary_unary(
                 '/links.v1.LinkService/UpdateLink',
                 request_serializer=links_dot_v1_dot_links__pb2.UpdateLinkRequest.SerializeToString,
                 response_deserializer=links_dot_v1_dot_links__pb2.Link.FromString,
                 _registered_method=True)
+        self.BatchCreateLinks = channel.unary_unary(
+                '/links.v1.LinkService/BatchCreateLinks',
+                request_serializer=links_dot_v1_dot_links__pb2.BatchCreateLinksRequest.SerializeToString,
+                response_deserializer=links_dot_v1_dot_links__pb2.BatchCreateLinksResponse.FromString,
+                _registered_method=True)
+        self.BatchUpdateLinks = channel.unary_unary(
+                '/links.v1.LinkService/BatchUpdateLinks',
+                request_serializer=links_dot_v1_dot_links__pb2.BatchUpdateLinksRequest.SerializeToString,
+                response_deserializer=links_dot_v1_dot_links__pb2.BatchUpdateLinksResponse.FromString,
+                _registered_method=True)
         self.DeleteLink = channel.unary_unary(
                 '/links.v1.LinkService/DeleteLink',
                 request_serializer=links_dot_v1_dot_links__pb2.DeleteLinkRequest.SerializeToString,
@@ -92,6 +107,13 @@ class LinkServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def BatchGetLinks(self, request, context):
+        """Get several links by ID in one call
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def UpdateLink(self, request, context):
         """Update an existing link
         """
@@ -99,6 +121,20 @@ class LinkServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def BatchCreateLinks(self, request, context):
+        """Create several links in one call; each item succeeds or fails on its own
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def BatchUpdateLinks(self, request, context):
+        """Update several links in one call; each item succeeds or fails on its own
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def DeleteLink(self, request, context):
         """Delete a link
         """
@@ -131,11 +167,26 @@ def add_LinkServiceServicer_to_server(servicer, server):
                     request_deserializer=links_dot_v1_dot_links__pb2.GetLinkRequest.FromString,
                     response_serializer=links_dot_v1_dot_links__pb2.Link.SerializeToString,
             ),
+            'BatchGetLinks': grpc.unary_unary_rpc_method_handler(
+                    servicer.BatchGetLinks,
+                    request_deserializer=links_dot_v1_dot_links__pb2.BatchGetLinksRequest.FromString,
+                    response_serializer=links_dot_v1_dot_links__pb2.BatchGetLinksResponse.SerializeToString,
+            ),
             'UpdateLink': grpc.unary_unary_rpc_method_handler(
                     servicer.UpdateLink,
                     request_deserializer=links_dot_v1_dot_links__pb2.UpdateLinkRequest.FromString,
                     response_serializer=links_dot_v1_dot_links__pb2.Link.SerializeToString,
             ),
+            'BatchCreateLinks': grpc.unary_unary_rpc_method_handler(
+                    servicer.BatchCreateLinks,
+                    request_deserializer=links_dot_v1_dot_links__pb2.BatchCreateLinksRequest.FromString,
+                    response_serializer=links_dot_v1_dot_links__pb2.BatchCreateLinksResponse.SerializeToString,
+            ),
+            'BatchUpdateLinks': grpc.unary_unary_rpc_method_handler(
+                    servicer.BatchUpdateLinks,
+                    request_deserializer=links_dot_v1_dot_links__pb2.BatchUpdateLinksRequest.FromString,
+                    response_serializer=links_dot_v1_dot_links__pb2.BatchUpdateLinksResponse.SerializeToString,
+            ),
             'DeleteLink': grpc.unary_unary_rpc_method_handler(
                     servicer.DeleteLink,
                     request_deserializer=links_dot_v1_dot_links__pb2.DeleteLinkRequest.FromString,
@@ -239,6 +290,33 @@ class LinkService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def BatchGetLinks(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/links.v1.LinkService/BatchGetLinks',
+            links_dot_v1_dot_links__pb2.BatchGetLinksRequest.SerializeToString,
+            links_dot_v1_dot_links__pb2.BatchGetLinksResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def UpdateLink(request,
             target,
@@ -266,6 +344,60 @@ class LinkService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def BatchCreateLinks(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/links.v1.LinkService/BatchCreateLinks',
+            links_dot_v1_dot_links__pb2.BatchCreateLinksRequest.SerializeToString,
+            links_dot_v1_dot_links__pb2.BatchCreateLinksResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def BatchUpdateLinks(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/links.v1.LinkService/BatchUpdateLinks',
+            links_dot_v1_dot_links__pb2.BatchUpdateLinksRequest.SerializeToString,
+            links_dot_v1_dot_links__pb2.BatchUpdateLinksResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def DeleteLink(request,
             target,
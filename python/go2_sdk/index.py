@@ -0,0 +1,101 @@
+"""Go2 SDK in-memory slug index."""
+
+from typing import Any, Dict, Iterable, Iterator, Optional
+import sys
+
+from go2_sdk.mirror import URL_FIELDS
+
+
+class RedirectTarget:
+    """The fields of a Link needed to redirect a visitor, with interned strings."""
+
+    __slots__ = ("slug",) + URL_FIELDS + ("is_active",)
+
+    slug: str
+    ios_url: str
+    android_url: str
+    web_url: str
+    fallback_url: str
+    huawei_url: str
+    amazon_url: str
+    windows_url: str
+    macos_url: str
+    is_active: bool
+
+    def __init__(self, link: Any):
+        intern = sys.intern
+        self.slug = intern(link.slug)
+        for field in URL_FIELDS:
+            setattr(self, field, intern(getattr(link, field)))
+        self.is_active = bool(link.is_active)
+
+    def url_for(self, platform: str) -> str:
+        """Return the URL for a platform such as "ios", falling back to fallback/web."""
+        field = platform + "_url"
+        url = getattr(self, field) if field in URL_FIELDS else ""
+        return url or self.fallback_url or self.web_url
+
+    def __repr__(self) -> str:
+        return "RedirectTarget(slug={!r}, is_active={!r})".format(
+            self.slug, self.is_active
+        )
+
+
+class SlugIndex:
+    """
+    O(1) slug lookup over compact redirect records.
+
+    The index is rebuilt from ``ListLinks`` pages and swapped in with a
+    single reference assignment, so concurrent readers always see either
+    the old or the new index, never a partial one.
+
+    Example:
+        index = SlugIndex()
+        with Go2Client(api_key="go2_xxx") as client:
+            index.refresh(client.links)
+
+        target = index.get("myapp")
+        if target is not None and target.is_active:
+            redirect(target.url_for("ios"))
+    """
+
+    def __init__(self, links: Optional[Iterable[Any]] = None):
+        self._targets: Dict[str, RedirectTarget] = {}
+        if links is not None:
+            self.swap(_build(links))
+
+    def get(self, slug: str) -> Optional[RedirectTarget]:
+        """Look up a redirect target by slug."""
+        return self._targets.get(slug)
+
+    def refresh(self, links: Any, per_page: int = 100) -> int:
+        """Rebuild the index from a LinksService and swap it in. Returns its size."""
+        targets = _build(
+            links.list_all(per_page=per_page, fields=RedirectTarget.__slots__)
+        )
+        self.swap(targets)
+        return len(targets)
+
+    def swap(self, targets: Dict[str, RedirectTarget]) -> None:
+        """Atomically replace the index contents."""
+        self._targets = targets
+
+    def __getitem__(self, slug: str) -> RedirectTarget:
+        return self._targets[slug]
+
+    def __contains__(self, slug: object) -> bool:
+        return slug in self._targets
+
+    def __len__(self) -> int:
+        return len(self._targets)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._targets)
+
+
+def _build(links: Iterable[Any]) -> Dict[str, RedirectTarget]:
+    targets: Dict[str, RedirectTarget] = {}
+    for link in links:
+        target = RedirectTarget(link)
+        targets[target.slug] = target
+    return targets
@@ -0,0 +1,619 @@
+"""
+Go2 SDK load generator.
+
+Drives a weighted mix of RPCs through Go2Client at a fixed open-loop
+rate and reports latency percentiles and errors per operation:
+
+    python -m go2_sdk.loadgen --api-key go2_xxx --qps 500 --duration 30 \\
+        --mix get_link=70,get_stats=20,create_link=10 --workers 32
+
+    python -m go2_sdk.loadgen --fake --qps 2000 --mode async --workers 256
+
+Calls are scheduled at fixed intervals (``1 / qps``) whether or not
+earlier calls have finished. Each call gets two latencies: ``service``,
+measured from when it was actually sent, and ``corrected``, measured
+from when it was scheduled. When the workers fall behind, the time calls
+spend waiting for a free worker shows in ``corrected`` only; reporting
+``service`` alone is the coordinated-omission error.
+
+Workers are threads (``--mode thread``), asyncio tasks on one thread
+using gRPC futures (``--mode async``), or processes each running
+``--concurrency`` threads (``--mode process``).
+
+The run creates ``--links`` links to read from, plus one per
+``create_link`` call, and deletes them all afterwards unless
+``--keep`` is given.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import argparse
+import asyncio
+import bisect
+import functools
+import json
+import math
+import multiprocessing
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+
+import grpc
+
+from go2_sdk.client import DEFAULT_ENDPOINT, Go2Client
+from go2_sdk.errors import Go2Error, wrap_error
+
+# (operation, service latency, corrected latency, error class name or None)
+Sample = Tuple[str, float, float, Optional[str]]
+
+DEFAULT_MIX = "get_link=70,get_stats=20,create_link=10"
+OPERATIONS = (
+    "check_slug",
+    "create_link",
+    "get_link",
+    "get_stats",
+    "get_timeseries",
+    "list_links",
+)
+PERCENTILES = (0.5, 0.9, 0.99, 0.999)
+
+
+class _Run:
+    """What a worker needs to issue calls; picklable for process workers."""
+
+    def __init__(
+        self,
+        endpoint: str,
+        api_key: str,
+        insecure: bool,
+        mix: Sequence[Tuple[str, float]],
+        link_ids: Sequence[str],
+        run_id: str,
+        qps: float,
+        duration: float,
+        seed: int,
+    ):
+        self.endpoint = endpoint
+        self.api_key = api_key
+        self.insecure = insecure
+        self.mix = list(mix)
+        self.link_ids = list(link_ids)
+        self.run_id = run_id
+        self.qps = qps
+        self.duration = duration
+        self.seed = seed
+
+    def client(self) -> Go2Client:
+        return Go2Client(
+            api_key=self.api_key, endpoint=self.endpoint, insecure=self.insecure
+        )
+
+
+class _Operations:
+    """Builds (multicallable, request) pairs for each operation in the mix."""
+
+    def __init__(self, client: Go2Client, run: _Run, worker: int):
+        from go2_sdk.gen.analytics.v1 import analytics_pb2
+        from go2_sdk.gen.links.v1 import links_pb2
+
+        self._links = links_pb2
+        self._analytics = analytics_pb2
+        self._link_stub = client.links._stub
+        self._analytics_stub = client.analytics._stub
+        self._link_ids = run.link_ids
+        self._prefix = "lg{}w{}n".format(run.run_id, worker)
+        self._created = 0
+        self._random = random.Random("{}:{}".format(run.seed, worker))
+        names = [name for name, _ in run.mix]
+        self._ops = [getattr(self, "_" + name) for name in names]
+        self._names = names
+        total = sum(weight for _, weight in run.mix)
+        self._cumulative: List[float] = []
+        acc = 0.0
+        for _, weight in run.mix:
+            acc += weight / total
+            self._cumulative.append(acc)
+
+    def pick(self) -> Tuple[str, Any, Any]:
+        i = min(
+            bisect.bisect_left(self._cumulative, self._random.random()),
+            len(self._ops) - 1,
+        )
+        method, request = self._ops[i]()
+        return self._names[i], method, request
+
+    def _link_id(self) -> str:
+        return self._random.choice(self._link_ids)
+
+    def _get_link(self) -> Tuple[Any, Any]:
+        return self._link_stub.GetLink, self._links.GetLinkRequest(id=self._link_id())
+
+    def _list_links(self) -> Tuple[Any, Any]:
+        request = self._links.ListLinksRequest(page=1, per_page=20)
+        return self._link_stub.ListLinks, request
+
+    def _check_slug(self) -> Tuple[Any, Any]:
+        slug = "lgcheck{}".format(self._random.getrandbits(32))
+        return self._link_stub.CheckSlug, self._links.CheckSlugRequest(slug=slug)
+
+    def _create_link(self) -> Tuple[Any, Any]:
+        self._created += 1
+        request = self._links.CreateLinkRequest(
+            slug="{}{}".format(self._prefix, self._created),
+            web_url="https://example.com/loadgen",
+        )
+        return self._link_stub.CreateLink, request
+
+    def _get_stats(self) -> Tuple[Any, Any]:
+        request = self._analytics.GetStatsRequest(link_id=self._link_id(), period="30d")
+        return self._analytics_stub.GetStats, request
+
+    def _get_timeseries(self) -> Tuple[Any, Any]:
+        request = self._analytics.GetTimeseriesRequest(
+            link_id=self._link_id(), period="7d"
+        )
+        return self._analytics_stub.GetTimeseries, request
+
+
+class _Schedule:
+    """Hands out the scheduled send time of each call, shared by all workers."""
+
+    def __init__(self, counter: Any, start: float, qps: float, duration: float):
+        self._counter = counter
+        self._start = start
+        self._interval = 1.0 / qps
+        self._end = start + duration
+
+    def next(self) -> Optional[float]:
+        with self._counter.get_lock():
+            i = self._counter.value
+            self._counter.value = i + 1
+        at = self._start + i * self._interval
+        return at if at < self._end else None
+
+
+class _Counter:
+    """Thread-level stand-in for multiprocessing.Value("q")."""
+
+    def __init__(self) -> None:
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def get_lock(self) -> threading.Lock:
+        return self._lock
+
+
+def _error_name(error: BaseException) -> str:
+    if isinstance(error, grpc.RpcError):
+        error = wrap_error(error)
+    return type(error).__name__
+
+
+def _call_loop(
+    ops: _Operations, schedule: _Schedule, samples: List[Sample], created: List[str]
+) -> None:
+    while True:
+        scheduled = schedule.next()
+        if scheduled is None:
+            return
+        name, method, request = ops.pick()
+        delay = scheduled - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        sent = time.monotonic()
+        error = None
+        try:
+            response = method(request)
+            if name == "create_link":
+                created.append(response.id)
+        except grpc.RpcError as e:
+            error = _error_name(e)
+        done = time.monotonic()
+        samples.append((name, done - sent, done - scheduled, error))
+
+
+def _run_threads(
+    run: _Run, client: Go2Client, schedule: _Schedule, workers: int, first: int
+) -> Tuple[List[Sample], List[str]]:
+    samples: List[Sample] = []
+    created: List[str] = []
+    threads = [
+        threading.Thread(
+            target=_call_loop,
+            args=(_Operations(client, run, first + i), schedule, samples, created),
+            daemon=True,
+        )
+        for i in range(workers)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return samples, created
+
+
+def _wake(waiter: "asyncio.Future[None]") -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+def _wake_soon(
+    loop: asyncio.AbstractEventLoop, waiter: "asyncio.Future[None]", call: Any
+) -> None:
+    # Done callbacks run on a gRPC thread; the waiter belongs to the loop.
+    loop.call_soon_threadsafe(_wake, waiter)
+
+
+async def _async_task(
+    ops: _Operations, schedule: _Schedule, samples: List[Sample], created: List[str]
+) -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        scheduled = schedule.next()
+        if scheduled is None:
+            return
+        name, method, request = ops.pick()
+        delay = scheduled - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        sent = time.monotonic()
+        waiter = loop.create_future()
+        call = method.future(request)
+        call.add_done_callback(functools.partial(_wake_soon, loop, waiter))
+        await waiter
+        error = None
+        try:
+            response = call.result()
+            if name == "create_link":
+                created.append(response.id)
+        except grpc.RpcError as e:
+            error = _error_name(e)
+        done = time.monotonic()
+        samples.append((name, done - sent, done - scheduled, error))
+
+
+def _run_async(
+    run: _Run, client: Go2Client, schedule: _Schedule, workers: int
+) -> Tuple[List[Sample], List[str]]:
+    samples: List[Sample] = []
+    created: List[str] = []
+
+    async def main() -> None:
+        await asyncio.gather(
+            *(
+                _async_task(_Operations(client, run, i), schedule, samples, created)
+                for i in range(workers)
+            )
+        )
+
+    asyncio.run(main())
+    return samples, created
+
+
+def _process_worker(
+    run: _Run, index: int, threads: int, counter: Any, start: Any, ready: Any, go: Any,
+    results: Any,
+) -> None:
+    client = run.client()
+    ready.put(index)
+    go.wait()
+    schedule = _Schedule(counter, start.value, run.qps, run.duration)
+    try:
+        results.put(_run_threads(run, client, schedule, threads, index * threads))
+    finally:
+        client.close()
+
+
+def _run_processes(
+    run: _Run, processes: int, threads: int
+) -> Tuple[List[Sample], List[str], float]:
+    context = multiprocessing.get_context("spawn")
+    counter = context.Value("q", 0)
+    start = context.Value("d", 0.0)
+    ready, results, go = context.Queue(), context.Queue(), context.Event()
+    workers = [
+        context.Process(
+            target=_process_worker,
+            args=(run, i, threads, counter, start, ready, go, results),
+            daemon=True,
+        )
+        for i in range(processes)
+    ]
+    for worker in workers:
+        worker.start()
+    for _ in workers:
+        ready.get()
+    start.value = time.monotonic() + 0.1
+    go.set()
+    samples: List[Sample] = []
+    created: List[str] = []
+    for _ in workers:
+        worker_samples, worker_created = results.get()
+        samples.extend(worker_samples)
+        created.extend(worker_created)
+    for worker in workers:
+        worker.join()
+    return samples, created, start.value
+
+
+def _create_link(client: Go2Client, slug: str, attempts: int = 5) -> str:
+    # Setup links are retried so that a server shedding load does not
+    # abort the run before it starts.
+    for attempt in range(attempts):
+        try:
+            link = client.links.create(slug=slug, web_url="https://example.com/loadgen")
+        except Go2Error:
+            if attempt == attempts - 1:
+                raise
+            time.sleep(0.1 * 2 ** attempt)
+            continue
+        link_id: str = link.id
+        return link_id
+    raise AssertionError("unreachable")
+
+
+def _percentile(sorted_values: Sequence[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = math.ceil(q * len(sorted_values)) - 1
+    return sorted_values[min(len(sorted_values) - 1, max(0, index))]
+
+
+def _latencies(values: List[float]) -> Dict[str, float]:
+    values.sort()
+    stats = {
+        "p{}".format(("%g" % (q * 100)).replace(".", "")): _percentile(values, q) * 1000
+        for q in PERCENTILES
+    }
+    stats["max"] = values[-1] * 1000 if values else 0.0
+    return stats
+
+
+def summarize(
+    samples: Sequence[Sample], qps: float, duration: float, cleanup_errors: int = 0
+) -> Dict[str, Any]:
+    """
+    Aggregate samples into counts, errors and latency percentiles (ms).
+
+    ``cleanup_errors`` is the number of links the run failed to delete.
+    """
+    operations: Dict[str, List[Sample]] = {}
+    for sample in samples:
+        operations.setdefault(sample[0], []).append(sample)
+
+    def group(rows: Sequence[Sample]) -> Dict[str, Any]:
+        errors: Dict[str, int] = {}
+        for _, _, _, error in rows:
+            if error is not None:
+                errors[error] = errors.get(error, 0) + 1
+        return {
+            "calls": len(rows),
+            "errors": errors,
+            "service_ms": _latencies([r[1] for r in rows]),
+            "corrected_ms": _latencies([r[2] for r in rows]),
+        }
+
+    summary: Dict[str, Any] = {
+        "target_qps": qps,
+        "duration_seconds": duration,
+        "achieved_qps": len(samples) / duration if duration else 0.0,
+        "cleanup_errors": cleanup_errors,
+    }
+    summary.update(group(samples))
+    summary["operations"] = {
+        name: group(rows) for name, rows in sorted(operations.items())
+    }
+    return summary
+
+
+def format_summary(summary: Dict[str, Any]) -> str:
+    """Render a summary as a text table."""
+    row = "{:<16} {:>8} {:>7}  {:<10} {:>9.2f} {:>9.2f} {:>9.2f} {:>9.2f} {:>9.2f}"
+    lines = [
+        "target {:.1f} qps, achieved {:.1f} qps over {:.1f}s, {} calls, {} errors"
+        .format(
+            summary["target_qps"],
+            summary["achieved_qps"],
+            summary["duration_seconds"],
+            summary["calls"],
+            sum(summary["errors"].values()),
+        ),
+        "",
+        "{:<16} {:>8} {:>7}  {:<10} {:>9} {:>9} {:>9} {:>9} {:>9}".format(
+            "operation", "calls", "errors", "latency", "p50 ms", "p90 ms", "p99 ms",
+            "p99.9 ms", "max ms",
+        ),
+    ]
+    rows = list(summary["operations"].items()) + [("all", summary)]
+    for name, stats in rows:
+        for kind in ("service", "corrected"):
+            ms = stats[kind + "_ms"]
+            lines.append(
+                row.format(
+                    name if kind == "service" else "",
+                    stats["calls"] if kind == "service" else "",
+                    sum(stats["errors"].values()) if kind == "service" else "",
+                    kind,
+                    ms["p50"], ms["p90"], ms["p99"], ms["p999"], ms["max"],
+                )
+            )
+    if summary["errors"]:
+        lines.append("")
+        lines.append("errors:")
+        for name, count in sorted(summary["errors"].items(), key=lambda kv: -kv[1]):
+            lines.append("  {:<24} {}".format(name, count))
+    if summary["cleanup_errors"]:
+        lines.append("")
+        lines.append("{} links could not be deleted".format(summary["cleanup_errors"]))
+    return "\n".join(lines)
+
+
+def parse_mix(value: str) -> List[Tuple[str, float]]:
+    """Parse ``"get_link=70,get_stats=20"`` into [(operation, weight), ...]."""
+    mix = []
+    for part in value.split(","):
+        name, _, weight = part.strip().partition("=")
+        if name not in OPERATIONS:
+            raise ValueError(
+                "unknown operation {!r}; choose from {}".format(
+                    name, ", ".join(OPERATIONS)
+                )
+            )
+        mix.append((name, float(weight or 1)))
+    if not mix or sum(w for _, w in mix) <= 0:
+        raise ValueError("the mix needs at least one operation with a positive weight")
+    return mix
+
+
+def run(
+    endpoint: str,
+    api_key: str,
+    qps: float,
+    duration: float,
+    mix: Sequence[Tuple[str, float]],
+    workers: int = 16,
+    mode: str = "thread",
+    concurrency: int = 1,
+    insecure: bool = False,
+    links: int = 20,
+    keep: bool = False,
+    seed: Optional[int] = None,
+    log: Callable[[str], None] = lambda message: None,
+) -> Dict[str, Any]:
+    """
+    Run a load test and return its summary (see ``summarize``).
+
+    Args:
+        endpoint: gRPC endpoint to load
+        api_key: Go2 API key
+        qps: Target calls per second, scheduled open-loop
+        duration: Seconds to run
+        mix: (operation, weight) pairs, e.g. from ``parse_mix``
+        workers: Threads, asyncio tasks or processes, depending on ``mode``
+        mode: ``"thread"``, ``"async"`` or ``"process"``
+        concurrency: Threads per process in ``"process"`` mode
+        insecure: Use an insecure channel
+        links: Links created up front for read operations
+        keep: Keep the links created by the run
+        seed: Seed for operation and link choice
+        log: Called with progress messages
+    """
+    if mode not in ("thread", "async", "process"):
+        raise ValueError("mode must be thread, async or process")
+    if qps <= 0 or duration <= 0:
+        raise ValueError("qps and duration must be positive")
+    run_id = uuid.uuid4().hex[:8]
+    spec = _Run(
+        endpoint, api_key, insecure, mix, [], run_id, qps, duration,
+        seed if seed is not None else random.randrange(1 << 30),
+    )
+    client = spec.client()
+    try:
+        log("creating {} links".format(links))
+        spec.link_ids = [
+            _create_link(client, "lg{}r{}".format(run_id, i))
+            for i in range(max(1, links))
+        ]
+        log(
+            "running {} {} workers at {:g} qps for {:g}s".format(
+                workers, mode, qps, duration
+            )
+        )
+        if mode == "process":
+            samples, created, started = _run_processes(spec, workers, concurrency)
+        else:
+            started = time.monotonic()
+            schedule = _Schedule(_Counter(), started, qps, duration)
+            if mode == "async":
+                samples, created = _run_async(spec, client, schedule, workers)
+            else:
+                samples, created = _run_threads(spec, client, schedule, workers, 0)
+        elapsed = time.monotonic() - started
+        cleanup_errors = 0
+        if not keep:
+            log("deleting {} links".format(len(spec.link_ids) + len(created)))
+            for link_id in spec.link_ids + created:
+                try:
+                    client.links.delete(link_id)
+                except Go2Error as e:
+                    cleanup_errors += 1
+                    log("could not delete link {}: {}".format(link_id, e))
+    finally:
+        client.close()
+    return summarize(samples, qps, max(duration, elapsed), cleanup_errors)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m go2_sdk.loadgen", description="Go2 SDK load generator."
+    )
+    parser.add_argument("--endpoint", default=DEFAULT_ENDPOINT)
+    parser.add_argument("--api-key", default=os.environ.get("GO2_API_KEY", ""),
+                        help="API key (default: $GO2_API_KEY)")
+    parser.add_argument("--insecure", action="store_true")
+    parser.add_argument("--fake", action="store_true",
+                        help="start a go2_sdk.testing.FakeGo2Server on localhost "
+                             "and load it")
+    parser.add_argument("--fake-latency", type=float, default=0.0,
+                        help="latency the fake server adds to each call, in ms")
+    parser.add_argument("--fake-error-rate", type=float, default=0.0)
+    parser.add_argument("--qps", type=float, default=100.0)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds")
+    parser.add_argument("--mix", default=DEFAULT_MIX,
+                        help="weighted operations; choose from "
+                             + ", ".join(OPERATIONS))
+    parser.add_argument("--mode", choices=("thread", "async", "process"),
+                        default="thread")
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--concurrency", type=int, default=1,
+                        help="threads per process with --mode process")
+    parser.add_argument("--links", type=int, default=20,
+                        help="links created for read operations")
+    parser.add_argument("--keep", action="store_true",
+                        help="keep the links the run creates")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--json", action="store_true", help="print the summary as JSON")
+    args = parser.parse_args(argv)
+
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+
+    server = None
+    endpoint, api_key, insecure = args.endpoint, args.api_key, args.insecure
+    if args.fake:
+        from go2_sdk.testing import FakeGo2Server, Faults
+
+        server = FakeGo2Server(
+            faults=Faults(
+                latency=args.fake_latency / 1000, error_rate=args.fake_error_rate
+            ),
+            seed=args.seed,
+            max_workers=max(16, args.workers * max(1, args.concurrency)),
+        )
+        endpoint, api_key, insecure = server.start(), api_key or "go2_loadgen", True
+    elif not api_key:
+        parser.error("--api-key or GO2_API_KEY is required")
+
+    def log(message: str) -> None:
+        print(message, file=sys.stderr)
+
+    try:
+        summary = run(
+            endpoint, api_key, args.qps, args.duration, mix,
+            workers=args.workers, mode=args.mode, concurrency=args.concurrency,
+            insecure=insecure, links=args.links, keep=args.keep, seed=args.seed,
+            log=log,
+        )
+    finally:
+        if server is not None:
+            server.close()
+    print(json.dumps(summary, indent=2) if args.json else format_summary(summary))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,266 @@
+"""Go2 SDK per-RPC client metrics."""
+
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Sequence
+import threading
+import time
+
+import grpc
+
+from go2_sdk.calls import _ObservedStream
+
+# Prometheus client default buckets, in seconds.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class _MethodMetrics:
+    __slots__ = (
+        "lock",
+        "codes",
+        "buckets",
+        "latency_sum",
+        "in_flight",
+        "request_bytes",
+        "response_bytes",
+    )
+
+    def __init__(self, bucket_count: int):
+        self.lock = threading.Lock()
+        self.codes: Dict[str, int] = {}
+        # One slot per bound plus +Inf; counts are not cumulative here.
+        self.buckets = [0] * (bucket_count + 1)
+        self.latency_sum = 0.0
+        self.in_flight = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+
+class MetricsInterceptor(
+    grpc.UnaryUnaryClientInterceptor, grpc.UnaryStreamClientInterceptor
+):
+    """
+    Records call counts, latency, in-flight calls and payload sizes per RPC.
+
+    Metrics are kept per full method name (e.g.
+    ``/links.v1.LinkService/GetLink``) and read with ``snapshot()`` or
+    ``prometheus_text()``. The hot path only does a histogram bucket
+    lookup and a few additions under a per-method lock.
+
+    Server-streaming calls (StreamClicks) are counted when the stream
+    ends: exhausted, failed or cancelled. Their latency is the life of the
+    stream and their response size the sum of the messages read.
+
+    Example:
+        metrics = MetricsInterceptor()
+        client = Go2Client(api_key="go2_xxx", metrics=metrics)
+        ...
+        print(metrics.prometheus_text())
+
+    Args:
+        buckets: Latency histogram upper bounds in seconds
+        record_sizes: Measure serialized request and response sizes
+    """
+
+    def __init__(
+        self, buckets: Sequence[float] = DEFAULT_BUCKETS, record_sizes: bool = True
+    ):
+        self._bounds = tuple(sorted(buckets))
+        self._record_sizes = record_sizes
+        self._lock = threading.Lock()
+        self._methods: Dict[str, _MethodMetrics] = {}
+
+    def intercept_unary_unary(
+        self,
+        continuation: Any,
+        client_call_details: grpc.ClientCallDetails,
+        request: Any,
+    ) -> Any:
+        stats = self._begin(client_call_details.method, request)
+        start = time.perf_counter()
+        try:
+            outcome = continuation(client_call_details, request)
+        except Exception:
+            # Re-raised unchanged; caught broadly only so that a call that
+            # never started is still counted and leaves ``in_flight``.
+            self._record(stats, start, grpc.StatusCode.UNKNOWN, 0)
+            raise
+        outcome.add_done_callback(lambda call: self._done(stats, start, call))
+        return outcome
+
+    def intercept_unary_stream(
+        self,
+        continuation: Any,
+        client_call_details: grpc.ClientCallDetails,
+        request: Any,
+    ) -> Any:
+        stats = self._begin(client_call_details.method, request)
+        start = time.perf_counter()
+        try:
+            call = continuation(client_call_details, request)
+        except Exception:
+            # See intercept_unary_unary.
+            self._record(stats, start, grpc.StatusCode.UNKNOWN, 0)
+            raise
+        received = [0]
+
+        def on_response(response: Any) -> None:
+            if self._record_sizes:
+                received[0] += _size(response)
+
+        def on_done(code: Optional[grpc.StatusCode], details: str) -> None:
+            self._record(stats, start, code, received[0])
+
+        return _ObservedStream(call, on_response, on_done)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return current metrics per method.
+
+        Each entry has ``calls`` (count per status code name), ``in_flight``,
+        ``latency`` (cumulative ``buckets`` as ``[upper_bound, count]``
+        pairs ending with ``inf``, plus ``sum`` and ``count``),
+        ``request_bytes`` and ``response_bytes``.
+        """
+        with self._lock:
+            methods = list(self._methods.items())
+        result = {}
+        for method, stats in methods:
+            with stats.lock:
+                codes = dict(stats.codes)
+                counts = list(stats.buckets)
+                latency_sum = stats.latency_sum
+                in_flight = stats.in_flight
+                request_bytes = stats.request_bytes
+                response_bytes = stats.response_bytes
+            cumulative: List[List[float]] = []
+            total = 0
+            for bound, count in zip(self._bounds + (float("inf"),), counts):
+                total += count
+                cumulative.append([bound, total])
+            result[method] = {
+                "calls": codes,
+                "in_flight": in_flight,
+                "latency": {"buckets": cumulative, "sum": latency_sum, "count": total},
+                "request_bytes": request_bytes,
+                "response_bytes": response_bytes,
+            }
+        return result
+
+    def prometheus_text(self, prefix: str = "go2_client") -> str:
+        """Render the metrics in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        lines = [
+            "# HELP {}_requests_total Completed RPCs by status code.".format(prefix),
+            "# TYPE {}_requests_total counter".format(prefix),
+        ]
+        for method, stats in snapshot.items():
+            for code, count in sorted(stats["calls"].items()):
+                lines.append(
+                    '{}_requests_total{{method="{}",code="{}"}} {}'.format(
+                        prefix, method, code, count
+                    )
+                )
+
+        lines.append(
+            "# HELP {}_request_duration_seconds RPC latency.".format(prefix)
+        )
+        lines.append("# TYPE {}_request_duration_seconds histogram".format(prefix))
+        for method, stats in snapshot.items():
+            latency = stats["latency"]
+            for bound, count in latency["buckets"]:
+                lines.append(
+                    '{}_request_duration_seconds_bucket{{method="{}",le="{}"}} {}'
+                    .format(prefix, method, _format_bound(bound), count)
+                )
+            lines.append(
+                '{}_request_duration_seconds_sum{{method="{}"}} {}'.format(
+                    prefix, method, latency["sum"]
+                )
+            )
+            lines.append(
+                '{}_request_duration_seconds_count{{method="{}"}} {}'.format(
+                    prefix, method, latency["count"]
+                )
+            )
+
+        for name, kind, key, help_text in (
+            ("in_flight_requests", "gauge", "in_flight", "RPCs currently in flight."),
+            (
+                "request_bytes_total",
+                "counter",
+                "request_bytes",
+                "Serialized request bytes.",
+            ),
+            (
+                "response_bytes_total",
+                "counter",
+                "response_bytes",
+                "Serialized response bytes.",
+            ),
+        ):
+            lines.append("# HELP {}_{} {}".format(prefix, name, help_text))
+            lines.append("# TYPE {}_{} {}".format(prefix, name, kind))
+            for method, stats in snapshot.items():
+                lines.append(
+                    '{}_{}{{method="{}"}} {}'.format(prefix, name, method, stats[key])
+                )
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Drop all recorded metrics."""
+        with self._lock:
+            self._methods = {}
+
+    def _begin(self, method: str, request: Any) -> _MethodMetrics:
+        stats = self._methods.get(method)
+        if stats is None:
+            stats = self._register(method)
+        request_bytes = _size(request) if self._record_sizes else 0
+        with stats.lock:
+            stats.in_flight += 1
+            stats.request_bytes += request_bytes
+        return stats
+
+    def _register(self, method: str) -> _MethodMetrics:
+        with self._lock:
+            stats = self._methods.get(method)
+            if stats is None:
+                stats = _MethodMetrics(len(self._bounds))
+                self._methods[method] = stats
+            return stats
+
+    def _done(self, stats: _MethodMetrics, start: float, call: Any) -> None:
+        code = call.code()
+        response_bytes = 0
+        if self._record_sizes and code == grpc.StatusCode.OK:
+            response_bytes = _size(call.result())
+        self._record(stats, start, code, response_bytes)
+
+    def _record(
+        self,
+        stats: _MethodMetrics,
+        start: float,
+        code: Optional[grpc.StatusCode],
+        response_bytes: int,
+    ) -> None:
+        elapsed = time.perf_counter() - start
+        name = code.name if code is not None else "UNKNOWN"
+        index = bisect_left(self._bounds, elapsed)
+        with stats.lock:
+            stats.in_flight -= 1
+            stats.codes[name] = stats.codes.get(name, 0) + 1
+            stats.buckets[index] += 1
+            stats.latency_sum += elapsed
+            stats.response_bytes += response_bytes
+
+
+def _size(message: Any) -> int:
+    # Raw calls (go2_sdk.raw) send and receive bytes.
+    if isinstance(message, (bytes, bytearray, memoryview)):
+        return len(message)
+    size: int = message.ByteSize()
+    return size
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == float("inf") else repr(bound)
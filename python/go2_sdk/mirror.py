@@ -0,0 +1,234 @@
+"""Go2 SDK local link mirror."""
+
+from typing import Any, List, Optional, Set, Tuple
+import sqlite3
+import threading
+
+# Platform URL columns, indexed for reverse lookups.
+URL_FIELDS: Tuple[str, ...] = (
+    "ios_url",
+    "android_url",
+    "web_url",
+    "fallback_url",
+    "huawei_url",
+    "amazon_url",
+    "windows_url",
+    "macos_url",
+)
+
+_SCHEMA = (
+    """
+CREATE TABLE IF NOT EXISTS links (
+    id TEXT PRIMARY KEY,
+    slug TEXT NOT NULL,
+    is_active INTEGER NOT NULL,
+    updated_at INTEGER NOT NULL,
+    """
+    + "".join("{} TEXT NOT NULL,\n    ".format(f) for f in URL_FIELDS)
+    + """data BLOB NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS links_slug ON links (slug);
+CREATE INDEX IF NOT EXISTS links_is_active ON links (is_active);
+CREATE TABLE IF NOT EXISTS mirror_state (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+    + "".join(
+        "CREATE INDEX IF NOT EXISTS links_{0} ON links ({0}) "
+        "WHERE {0} != '';\n".format(f)
+        for f in URL_FIELDS
+    )
+)
+
+_INSERT = "INSERT OR REPLACE INTO links VALUES ({})".format(
+    ", ".join("?" * (len(URL_FIELDS) + 5))
+)
+
+
+class LinkMirror:
+    """
+    Local SQLite mirror of every Link in the account.
+
+    ``sync`` pages through ``ListLinks`` and upserts each Link, indexed by
+    id, slug, every platform URL and ``is_active``; lookups then never
+    touch the network.
+
+    An incremental sync lists only the links updated since the newest
+    ``updated_at`` of the previous sync. A full sync scans every page and
+    also drops links that were deleted upstream.
+
+    Example:
+        mirror = LinkMirror("links.db")
+        with Go2Client(api_key="go2_xxx") as client:
+            mirror.sync(client.links, full=True)
+
+        link = mirror.get_by_slug("myapp")
+        links = mirror.find_by_url("https://myapp.com", field="web_url")
+
+    Args:
+        path: Database file path (":memory:" for a throwaway mirror)
+    """
+
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def sync(self, links: Any, per_page: int = 100, full: bool = False) -> int:
+        """
+        Pull links from a LinksService into the mirror.
+
+        Returns the number of links inserted or updated.
+        """
+        from go2_sdk.gen.links.v1 import links_pb2
+
+        watermark = 0 if full else self._state("updated_at")
+        # updated_since is inclusive, and several links can share the
+        # watermark's timestamp: links at the watermark are skipped only
+        # when they are already mirrored at it.
+        at_watermark: Set[str] = set() if full else self._ids_updated_at(watermark)
+        newest = watermark
+        seen: List[str] = []
+        changed = 0
+
+        if full:
+            listed = links.list_all(per_page=per_page)
+        else:
+            listed = links.list_all(
+                per_page=per_page,
+                updated_since=_timestamp(watermark) if watermark else None,
+                order=links_pb2.LINK_ORDER_UPDATED_AT_ASC,
+            )
+        rows: List[Tuple[Any, ...]] = []
+        for link in listed:
+            updated_at = _timestamp_nanos(link.updated_at)
+            newest = max(newest, updated_at)
+            if full:
+                seen.append(link.id)
+            if (
+                full
+                or updated_at > watermark
+                or (updated_at == watermark and link.id not in at_watermark)
+            ):
+                rows.append(_row(link, updated_at))
+            if len(rows) >= per_page:
+                changed += self._upsert(rows)
+                rows = []
+        if rows:
+            changed += self._upsert(rows)
+
+        with self._lock, self._conn:
+            if full:
+                self._conn.execute(
+                    "CREATE TEMP TABLE IF NOT EXISTS seen (id TEXT PRIMARY KEY)"
+                )
+                self._conn.execute("DELETE FROM seen")
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO seen VALUES (?)", [(i,) for i in seen]
+                )
+                self._conn.execute(
+                    "DELETE FROM links WHERE id NOT IN (SELECT id FROM seen)"
+                )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO mirror_state VALUES ('updated_at', ?)",
+                (newest,),
+            )
+        return changed
+
+    def get(self, id: str) -> Optional[Any]:
+        """Get a mirrored link by ID."""
+        return self._one("SELECT data FROM links WHERE id = ?", (id,))
+
+    def get_by_slug(self, slug: str) -> Optional[Any]:
+        """Get a mirrored link by slug."""
+        return self._one("SELECT data FROM links WHERE slug = ?", (slug,))
+
+    def find_by_url(self, url: str, field: Optional[str] = None) -> List[Any]:
+        """Find links pointing at a URL, on one platform field or any of them."""
+        fields = URL_FIELDS if field is None else (field,)
+        for f in fields:
+            if f not in URL_FIELDS:
+                raise ValueError("Unknown URL field: {}".format(f))
+        query = " UNION ".join(
+            "SELECT id, data FROM links WHERE {} = ?".format(f) for f in fields
+        )
+        return self._many(query, (url,) * len(fields))
+
+    def list(self, is_active: Optional[bool] = None) -> List[Any]:
+        """List mirrored links, optionally filtered by ``is_active``."""
+        if is_active is None:
+            return self._many("SELECT id, data FROM links", ())
+        return self._many(
+            "SELECT id, data FROM links WHERE is_active = ?", (int(is_active),)
+        )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM links").fetchone()[0])
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "LinkMirror":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+    def _upsert(self, rows: List[Tuple[Any, ...]]) -> int:
+        with self._lock, self._conn:
+            self._conn.executemany(_INSERT, rows)
+        return len(rows)
+
+    def _ids_updated_at(self, updated_at: int) -> Set[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id FROM links WHERE updated_at = ?", (updated_at,)
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def _state(self, key: str) -> int:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM mirror_state WHERE key = ?", (key,)
+            ).fetchone()
+        return 0 if row is None else int(row[0])
+
+    def _one(self, query: str, params: Tuple[Any, ...]) -> Optional[Any]:
+        from go2_sdk.gen.links.v1 import links_pb2
+
+        with self._lock:
+            row = self._conn.execute(query, params).fetchone()
+        return None if row is None else links_pb2.Link.FromString(row[0])
+
+    def _many(self, query: str, params: Tuple[Any, ...]) -> List[Any]:
+        from go2_sdk.gen.links.v1 import links_pb2
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [links_pb2.Link.FromString(row[1]) for row in rows]
+
+
+def _timestamp_nanos(ts: Any) -> int:
+    return int(ts.seconds) * 1_000_000_000 + int(ts.nanos)
+
+
+def _timestamp(nanos: int) -> Any:
+    from google.protobuf import timestamp_pb2
+
+    return timestamp_pb2.Timestamp(
+        seconds=nanos // 1_000_000_000, nanos=nanos % 1_000_000_000
+    )
+
+
+def _row(link: Any, updated_at: int) -> Tuple[Any, ...]:
+    return (
+        (link.id, link.slug, int(link.is_active), updated_at)
+        + tuple(getattr(link, f) for f in URL_FIELDS)
+        + (link.SerializeToString(),)
+    )
@@ -0,0 +1,302 @@
+"""Go2 SDK encode/wire/decode timing per RPC method."""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, Tuple
+import threading
+import time
+
+
+class MethodProfile:
+    """
+    Aggregated timings for one RPC method.
+
+    ``wire_seconds`` is the call time not spent encoding the request or
+    decoding the response: network, server time and gRPC queuing.
+    """
+
+    __slots__ = (
+        "calls",
+        "total_seconds",
+        "encode_seconds",
+        "decode_seconds",
+        "request_bytes",
+        "response_bytes",
+    )
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.total_seconds = 0.0
+        self.encode_seconds = 0.0
+        self.decode_seconds = 0.0
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+    @property
+    def wire_seconds(self) -> float:
+        return max(0.0, self.total_seconds - self.encode_seconds - self.decode_seconds)
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            "calls": self.calls,
+            "total_seconds": self.total_seconds,
+            "encode_seconds": self.encode_seconds,
+            "wire_seconds": self.wire_seconds,
+            "decode_seconds": self.decode_seconds,
+            "request_bytes": self.request_bytes,
+            "response_bytes": self.response_bytes,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            "MethodProfile(calls={}, encode={:.6f}s, wire={:.6f}s, decode={:.6f}s)"
+        ).format(
+            self.calls, self.encode_seconds, self.wire_seconds, self.decode_seconds
+        )
+
+
+class Profile:
+    """Timings per full method name, collected inside a ``profile()`` block."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.methods: Dict[str, MethodProfile] = {}
+        # Timed multicallables used by calls made under this profile.
+        self._callables: Dict["_ProfiledMultiCallable", Any] = {}
+
+    def __getitem__(self, method: str) -> MethodProfile:
+        """Look up a method by full name or by its last part, e.g. ``"ExportLinks"``."""
+        with self._lock:
+            if method in self.methods:
+                return self.methods[method]
+            for name, stats in self.methods.items():
+                if name.rsplit("/", 1)[-1] == method:
+                    return stats
+        raise KeyError(method)
+
+    def as_dict(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {name: stats.as_dict() for name, stats in self.methods.items()}
+
+    def report(self) -> str:
+        """Format the timings as a table, slowest method first."""
+        with self._lock:
+            rows = sorted(self.methods.items(), key=lambda kv: -kv[1].total_seconds)
+            lines = [
+                "{:<48} {:>7} {:>11} {:>11} {:>11}".format(
+                    "method", "calls", "encode ms", "wire ms", "decode ms"
+                )
+            ]
+            for name, stats in rows:
+                lines.append(
+                    "{:<48} {:>7} {:>11.3f} {:>11.3f} {:>11.3f}".format(
+                        name.lstrip("/"),
+                        stats.calls,
+                        stats.encode_seconds * 1000,
+                        stats.wire_seconds * 1000,
+                        stats.decode_seconds * 1000,
+                    )
+                )
+        return "\n".join(lines)
+
+    def _callable_for(self, multicallable: "_ProfiledMultiCallable") -> Any:
+        with self._lock:
+            callable_ = self._callables.get(multicallable)
+        if callable_ is None:
+            callable_ = multicallable._timed(self)
+            with self._lock:
+                callable_ = self._callables.setdefault(multicallable, callable_)
+        return callable_
+
+    def _stats(self, method: str) -> MethodProfile:
+        stats = self.methods.get(method)
+        if stats is None:
+            stats = self.methods[method] = MethodProfile()
+        return stats
+
+    def _add_call(self, method: str, seconds: float) -> None:
+        with self._lock:
+            stats = self._stats(method)
+            stats.calls += 1
+            stats.total_seconds += seconds
+
+    def _add_encode(self, method: str, seconds: float, size: int) -> None:
+        with self._lock:
+            stats = self._stats(method)
+            stats.encode_seconds += seconds
+            stats.request_bytes += size
+
+    def _add_decode(self, method: str, seconds: float, size: int) -> None:
+        with self._lock:
+            stats = self._stats(method)
+            stats.decode_seconds += seconds
+            stats.response_bytes += size
+
+
+# The profile each Profiler is collecting into, per thread and asyncio task.
+_ACTIVE: "ContextVar[Mapping[Profiler, Profile]]" = ContextVar(
+    "go2_sdk_profiles", default=MappingProxyType({})
+)
+
+
+class Profiler:
+    """
+    Times request encoding, response decoding and whole calls per method.
+
+    ``wrap_channel`` returns a channel whose multicallables look up the
+    active profile when a call starts. Outside a ``profile()`` block the
+    call goes to the plain multicallable; inside it, to one whose
+    ``request_serializer`` and ``response_deserializer`` are wrapped with
+    timers reporting to that profile, so responses decoded later on a
+    gRPC thread still count toward the block the call was made in.
+    ``profile()`` blocks apply to the thread or asyncio task that opened
+    them.
+    """
+
+    @contextmanager
+    def profile(self) -> Iterator[Profile]:
+        """Collect timings for calls made inside the block."""
+        profile = Profile()
+        token = _ACTIVE.set(MappingProxyType({**_ACTIVE.get(), self: profile}))
+        try:
+            yield profile
+        finally:
+            _ACTIVE.reset(token)
+
+    def wrap_channel(self, channel: Any) -> "_ProfiledChannel":
+        return _ProfiledChannel(channel, self)
+
+
+def _timed_serializer(
+    profile: Profile, method: str, serialize: Optional[Callable[[Any], bytes]]
+) -> Optional[Callable[[Any], bytes]]:
+    if serialize is None:
+        return None
+
+    def timed(message: Any) -> bytes:
+        start = time.perf_counter()
+        data = serialize(message)
+        profile._add_encode(method, time.perf_counter() - start, len(data))
+        return data
+
+    return timed
+
+
+def _timed_deserializer(
+    profile: Profile, method: str, deserialize: Optional[Callable[[bytes], Any]]
+) -> Optional[Callable[[bytes], Any]]:
+    if deserialize is None:
+        return None
+
+    def timed(data: bytes) -> Any:
+        start = time.perf_counter()
+        message = deserialize(data)
+        profile._add_decode(method, time.perf_counter() - start, len(data))
+        return message
+
+    return timed
+
+
+class _ProfiledChannel:
+    """Channel proxy handing out profiled unary-unary multicallables."""
+
+    def __init__(self, channel: Any, profiler: Profiler):
+        self._channel = channel
+        self._profiler = profiler
+
+    def unary_unary(
+        self,
+        method: str,
+        request_serializer: Optional[Callable[[Any], bytes]] = None,
+        response_deserializer: Optional[Callable[[bytes], Any]] = None,
+        **kwargs: Any,
+    ) -> "_ProfiledMultiCallable":
+        return _ProfiledMultiCallable(
+            self._channel,
+            self._profiler,
+            method,
+            request_serializer,
+            response_deserializer,
+            kwargs,
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._channel, name)
+
+
+class _ProfiledMultiCallable:
+    def __init__(
+        self,
+        channel: Any,
+        profiler: Profiler,
+        method: str,
+        request_serializer: Optional[Callable[[Any], bytes]],
+        response_deserializer: Optional[Callable[[bytes], Any]],
+        kwargs: Dict[str, Any],
+    ):
+        self._channel = channel
+        self._profiler = profiler
+        self._method = method
+        self._request_serializer = request_serializer
+        self._response_deserializer = response_deserializer
+        self._kwargs = kwargs
+        self._callable = channel.unary_unary(
+            method,
+            request_serializer=request_serializer,
+            response_deserializer=response_deserializer,
+            **kwargs,
+        )
+
+    def __call__(self, request: Any, *args: Any, **kwargs: Any) -> Any:
+        callable_, profile = self._target()
+        if profile is None:
+            return callable_(request, *args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return callable_(request, *args, **kwargs)
+        finally:
+            profile._add_call(self._method, time.perf_counter() - start)
+
+    def with_call(self, request: Any, *args: Any, **kwargs: Any) -> Any:
+        callable_, profile = self._target()
+        if profile is None:
+            return callable_.with_call(request, *args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return callable_.with_call(request, *args, **kwargs)
+        finally:
+            profile._add_call(self._method, time.perf_counter() - start)
+
+    def future(self, request: Any, *args: Any, **kwargs: Any) -> Any:
+        callable_, profile = self._target()
+        if profile is None:
+            return callable_.future(request, *args, **kwargs)
+        start = time.perf_counter()
+        method = self._method
+
+        def record_call(_: Any) -> None:
+            profile._add_call(method, time.perf_counter() - start)
+
+        future = callable_.future(request, *args, **kwargs)
+        future.add_done_callback(record_call)
+        return future
+
+    def _target(self) -> Tuple[Any, Optional[Profile]]:
+        """Return the multicallable for a call starting now, and its profile."""
+        profile = _ACTIVE.get().get(self._profiler)
+        if profile is None:
+            return self._callable, None
+        return profile._callable_for(self), profile
+
+    def _timed(self, profile: Profile) -> Any:
+        return self._channel.unary_unary(
+            self._method,
+            request_serializer=_timed_serializer(
+                profile, self._method, self._request_serializer
+            ),
+            response_deserializer=_timed_deserializer(
+                profile, self._method, self._response_deserializer
+            ),
+            **self._kwargs,
+        )
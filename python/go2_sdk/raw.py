@@ -0,0 +1,80 @@
+"""Go2 SDK raw-bytes responses and zero-copy record splitting."""
+
+from typing import Any, Iterator, Tuple, Union
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+_LENGTH_DELIMITED = 2
+
+
+class RawStub:
+    """
+    Stub whose methods return serialized responses instead of messages.
+
+    The multicallables are created without a response deserializer, so
+    gRPC hands back the received bytes untouched.
+    """
+
+    def __init__(self, channel: Any, service: str):
+        self._channel = channel
+        self._service = service
+
+    def __getattr__(self, method: str) -> Any:
+        if method.startswith("_"):
+            raise AttributeError(method)
+        callable_ = self._channel.unary_unary(
+            "/{}/{}".format(self._service, method),
+            request_serializer=_serialize,
+            response_deserializer=None,
+        )
+        setattr(self, method, callable_)
+        return callable_
+
+
+def split_records(buffer: Buffer, field: int = 1) -> Iterator[memoryview]:
+    """
+    Yield each length-delimited entry of ``field`` in a serialized message.
+
+    For a serialized ListLinksResponse or ExportLinksResponse, field 1 is
+    the repeated links, so every yielded view is one serialized Link or
+    CampaignLink. Views share memory with ``buffer``; nothing is copied.
+    """
+    view = memoryview(buffer)
+    pos, end = 0, len(view)
+    while pos < end:
+        key, pos = read_varint(view, pos)
+        number, wire_type = key >> 3, key & 7
+        if wire_type == _LENGTH_DELIMITED:
+            length, pos = read_varint(view, pos)
+            if pos + length > end:
+                raise ValueError("Truncated message")
+            if number == field:
+                yield view[pos : pos + length]
+            pos += length
+        elif wire_type == 0:
+            _, pos = read_varint(view, pos)
+        elif wire_type == 1:
+            pos += 8
+        elif wire_type == 5:
+            pos += 4
+        else:
+            raise ValueError("Unsupported wire type {}".format(wire_type))
+
+
+def read_varint(view: memoryview, pos: int) -> Tuple[int, int]:
+    """Decode a base-128 varint at ``pos``; returns (value, next position)."""
+    result = shift = 0
+    while True:
+        if pos >= len(view):
+            raise ValueError("Truncated varint")
+        byte = view[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+
+
+def _serialize(message: Any) -> bytes:
+    data: bytes = message.SerializeToString()
+    return data
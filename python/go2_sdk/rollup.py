@@ -0,0 +1,342 @@
+"""Go2 SDK account-wide analytics rollups."""
+
+from typing import Any, Dict, List, Optional, Tuple
+import heapq
+import json
+import os
+import threading
+
+from go2_sdk.concurrency import fan_out
+from go2_sdk.errors import Go2Error
+
+
+class _Dispatch:
+    """Routes (method, request) pairs to a stub for fan_out."""
+
+    def __init__(self, stub: Any):
+        self._stub = stub
+
+    def future(self, item: Tuple[str, Any]) -> Any:
+        method, request = item
+        return getattr(self._stub, method).future(request)
+
+
+class _TopCounter:
+    """
+    Counter with bounded memory for high-cardinality keys such as referrers.
+
+    When it grows past ``capacity`` it keeps only the largest half, so
+    counts for keys near the cut-off are approximate while the heavy
+    hitters stay exact.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.counts: Dict[str, int] = {}
+        self.pruned = False
+
+    def add(self, key: str, count: int) -> None:
+        self.counts[key] = self.counts.get(key, 0) + count
+        if len(self.counts) > self.capacity:
+            keep = heapq.nlargest(
+                self.capacity // 2, self.counts.items(), key=lambda kv: kv[1]
+            )
+            self.counts = dict(keep)
+            self.pruned = True
+
+    def top(self, k: int) -> List[Tuple[str, int]]:
+        return heapq.nlargest(k, self.counts.items(), key=lambda kv: kv[1])
+
+
+class RollupResult:
+    """
+    Account-wide breakdowns with percentages of all clicks.
+
+    ``platforms``, ``countries`` and ``referrers`` hold PlatformStats,
+    CountryStats and ReferrerStats messages, largest first.
+
+    Platform counts are exact. Country and referrer counts are sums of
+    each link's top ``breakdown_limit`` rows, so they are lower bounds
+    when ``approximate`` is true: ``truncated_links`` links returned a
+    full breakdown and may have had more rows, or the referrer counter
+    had to drop rare referrers.
+    """
+
+    def __init__(
+        self,
+        total_clicks: int,
+        platforms: List[Any],
+        countries: List[Any],
+        referrers: List[Any],
+        links_processed: int,
+        failed_links: List[str],
+        truncated_links: int = 0,
+        referrers_pruned: bool = False,
+    ):
+        self.total_clicks = total_clicks
+        self.platforms = platforms
+        self.countries = countries
+        self.referrers = referrers
+        self.links_processed = links_processed
+        self.failed_links = failed_links
+        self.truncated_links = truncated_links
+        self.referrers_pruned = referrers_pruned
+
+    @property
+    def approximate(self) -> bool:
+        """Whether country or referrer counts may be understated."""
+        return self.truncated_links > 0 or self.referrers_pruned
+
+    def __repr__(self) -> str:
+        return "RollupResult(total_clicks={}, links_processed={}, failed={})".format(
+            self.total_clicks, self.links_processed, len(self.failed_links)
+        )
+
+
+class AnalyticsRollup:
+    """
+    Totals per platform, country and referrer across every link.
+
+    Links are streamed page by page from ``ListLinks``; for each page the
+    platform, country and referrer breakdowns of every link are fetched
+    concurrently and merged into running aggregates, so memory does not
+    grow with the number of links. Links whose calls fail are skipped and
+    listed in the result.
+
+    Country and referrer breakdowns are fetched per link with
+    ``breakdown_limit`` rows, so a category that misses the cut on links
+    where it is rare is undercounted; the result reports how many links
+    were cut off (see RollupResult.approximate). Raise the limit for
+    exact counts.
+
+    With ``checkpoint_path`` the aggregates are saved after every page and
+    a later run with the same path resumes after the last completed page,
+    following the saved page token so links created or deleted meanwhile
+    do not shift the pages.
+
+    Example:
+        with Go2Client(api_key="go2_xxx") as client:
+            rollup = AnalyticsRollup(client.links, client.analytics, period="30d",
+                                     checkpoint_path="rollup.json")
+            result = rollup.run()
+            for country in result.countries:
+                print(country.country_code, country.clicks, country.percentage)
+
+    Args:
+        links: LinksService used to stream links
+        analytics: AnalyticsService used for per-link breakdowns
+        period: Analytics period, e.g. "30d"
+        top_k: Number of countries and referrers in the result
+        breakdown_limit: ``limit`` sent with GetCountries and GetReferrers
+        concurrency: Maximum calls in flight
+        per_page: ListLinks page size
+        referrer_capacity: Distinct referrers tracked before pruning
+        checkpoint_path: JSON file to save progress to and resume from
+    """
+
+    def __init__(
+        self,
+        links: Any,
+        analytics: Any,
+        period: str = "30d",
+        top_k: int = 10,
+        breakdown_limit: int = 50,
+        concurrency: int = 32,
+        per_page: int = 100,
+        referrer_capacity: int = 10000,
+        checkpoint_path: Optional[str] = None,
+    ):
+        self._links = links
+        self._stub = analytics._stub
+        self._period = period
+        self._top_k = top_k
+        self._breakdown_limit = breakdown_limit
+        self._concurrency = concurrency
+        self._per_page = per_page
+        self._checkpoint_path = checkpoint_path
+        self._lock = threading.Lock()
+
+        self._next_page = 1
+        self._page_token = ""
+        self._links_processed = 0
+        self._failed_links: List[str] = []
+        self._truncated_links = 0
+        self._platforms: Dict[str, int] = {}
+        self._countries: Dict[str, int] = {}
+        self._country_names: Dict[str, str] = {}
+        self._referrers = _TopCounter(referrer_capacity)
+        self._load_checkpoint()
+
+    def run(self) -> RollupResult:
+        """Process every remaining page and return the rollup."""
+        while True:
+            response = self._links.list(
+                page=self._next_page,
+                per_page=self._per_page,
+                fields=["id"],
+                page_token=self._page_token,
+            )
+            self._process([link.id for link in response.links])
+            self._next_page += 1
+            paged_by_token = bool(self._page_token)
+            self._page_token = response.next_page_token
+            self._save_checkpoint()
+            if self._page_token:
+                continue
+            if (
+                paged_by_token
+                or len(response.links) < self._per_page
+                or 0 < response.total <= (self._next_page - 1) * self._per_page
+            ):
+                return self.result()
+
+    def result(self) -> RollupResult:
+        """Return the rollup of the pages processed so far."""
+        from go2_sdk.gen.analytics.v1 import analytics_pb2
+
+        with self._lock:
+            total = sum(self._platforms.values())
+            platforms = sorted(self._platforms.items(), key=lambda kv: -kv[1])
+            countries = heapq.nlargest(
+                self._top_k, self._countries.items(), key=lambda kv: kv[1]
+            )
+            referrers = self._referrers.top(self._top_k)
+            return RollupResult(
+                total_clicks=total,
+                platforms=[
+                    analytics_pb2.PlatformStats(
+                        platform=p, clicks=c, percentage=_percent(c, total)
+                    )
+                    for p, c in platforms
+                ],
+                countries=[
+                    analytics_pb2.CountryStats(
+                        country_code=code,
+                        country_name=self._country_names.get(code, ""),
+                        clicks=c,
+                        percentage=_percent(c, total),
+                    )
+                    for code, c in countries
+                ],
+                referrers=[
+                    analytics_pb2.ReferrerStats(
+                        referrer=r, clicks=c, percentage=_percent(c, total)
+                    )
+                    for r, c in referrers
+                ],
+                links_processed=self._links_processed,
+                failed_links=list(self._failed_links),
+                truncated_links=self._truncated_links,
+                referrers_pruned=self._referrers.pruned,
+            )
+
+    def _process(self, link_ids: List[str]) -> None:
+        from go2_sdk.gen.analytics.v1 import analytics_pb2
+
+        period, limit = self._period, self._breakdown_limit
+        calls: List[Tuple[str, Any]] = []
+        for link_id in link_ids:
+            calls.append(
+                (
+                    "GetPlatforms",
+                    analytics_pb2.GetPlatformsRequest(link_id=link_id, period=period),
+                )
+            )
+            calls.append(
+                (
+                    "GetCountries",
+                    analytics_pb2.GetCountriesRequest(
+                        link_id=link_id, period=period, limit=limit
+                    ),
+                )
+            )
+            calls.append(
+                (
+                    "GetReferrers",
+                    analytics_pb2.GetReferrersRequest(
+                        link_id=link_id, period=period, limit=limit
+                    ),
+                )
+            )
+
+        # A link only counts once all three of its breakdowns arrived.
+        parts: List[Any] = [None] * len(calls)
+        failed = set()
+
+        def on_result(index: int, response: Any) -> None:
+            parts[index] = response
+
+        def on_error(index: int, error: Go2Error) -> None:
+            failed.add(index // 3)
+
+        fan_out(_Dispatch(self._stub), calls, self._concurrency, on_result, on_error)
+
+        with self._lock:
+            for i, link_id in enumerate(link_ids):
+                if i in failed:
+                    self._failed_links.append(link_id)
+                    continue
+                platforms, countries, referrers = parts[3 * i : 3 * i + 3]
+                for p in platforms.platforms:
+                    name = p.platform
+                    self._platforms[name] = self._platforms.get(name, 0) + p.clicks
+                for c in countries.countries:
+                    code = c.country_code
+                    self._countries[code] = self._countries.get(code, 0) + c.clicks
+                    if c.country_name:
+                        self._country_names[code] = c.country_name
+                for r in referrers.referrers:
+                    self._referrers.add(r.referrer, r.clicks)
+                if 0 < limit <= max(len(countries.countries), len(referrers.referrers)):
+                    # A full page may have left rows out.
+                    self._truncated_links += 1
+                self._links_processed += 1
+
+    def _save_checkpoint(self) -> None:
+        if self._checkpoint_path is None:
+            return
+        with self._lock:
+            state = {
+                "period": self._period,
+                "next_page": self._next_page,
+                "page_token": self._page_token,
+                "per_page": self._per_page,
+                "links_processed": self._links_processed,
+                "failed_links": self._failed_links,
+                "truncated_links": self._truncated_links,
+                "referrers_pruned": self._referrers.pruned,
+                "platforms": self._platforms,
+                "countries": self._countries,
+                "country_names": self._country_names,
+                "referrers": self._referrers.counts,
+            }
+        tmp = self._checkpoint_path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(state, f)
+        os.replace(tmp, self._checkpoint_path)
+
+    def _load_checkpoint(self) -> None:
+        if self._checkpoint_path is None or not os.path.exists(self._checkpoint_path):
+            return
+        with open(self._checkpoint_path) as f:
+            state = json.load(f)
+        if state["period"] != self._period or state["per_page"] != self._per_page:
+            raise ValueError(
+                "Checkpoint {} was written for period={} per_page={}".format(
+                    self._checkpoint_path, state["period"], state["per_page"]
+                )
+            )
+        self._next_page = state["next_page"]
+        self._page_token = state.get("page_token", "")
+        self._links_processed = state["links_processed"]
+        self._failed_links = state["failed_links"]
+        self._truncated_links = state.get("truncated_links", 0)
+        self._referrers.pruned = state.get("referrers_pruned", False)
+        self._platforms = state["platforms"]
+        self._countries = state["countries"]
+        self._country_names = state["country_names"]
+        self._referrers.counts = state["referrers"]
+
+
+def _percent(clicks: int, total: int) -> float:
+    return clicks * 100.0 / total if total else 0.0
@@ -0,0 +1,212 @@
+"""Go2 SDK persistent analytics store."""
+
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+import sqlite3
+import threading
+import time
+
+from go2_sdk.cache import period_days
+
+# Periods the API accepts, used to pick the smallest window worth refetching.
+DEFAULT_WINDOWS: Tuple[str, ...] = ("7d", "30d", "90d")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS timeseries (
+    link_id TEXT NOT NULL,
+    date TEXT NOT NULL,
+    clicks INTEGER NOT NULL,
+    unique_clicks INTEGER NOT NULL,
+    PRIMARY KEY (link_id, date)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS timeseries_sync (
+    link_id TEXT PRIMARY KEY,
+    covered_from TEXT NOT NULL,
+    covered_through TEXT NOT NULL,
+    synced_at REAL NOT NULL
+);
+"""
+
+
+class TimeseriesStore:
+    """
+    SQLite-backed store of per-link click timeseries.
+
+    Points are merged by ``date``, so after the first full download a
+    ``get_timeseries`` call only asks the server for the smallest window
+    that covers the days since the last sync and serves the rest from disk.
+
+    Example:
+        store = TimeseriesStore("analytics.db")
+        with Go2Client(api_key="go2_xxx", timeseries_store=store) as client:
+            series = client.analytics.get_timeseries(link_id="...", period="90d")
+
+        # Range queries without network calls
+        points = store.points("link-id", start="2024-01-01", end="2024-03-31")
+
+    Args:
+        path: Database file path (":memory:" for a throwaway store)
+        windows: Periods the server accepts, smallest first
+        min_sync_interval: Seconds during which a synced link is served
+            entirely from disk
+    """
+
+    def __init__(
+        self,
+        path: str,
+        windows: Sequence[str] = DEFAULT_WINDOWS,
+        min_sync_interval: float = 60.0,
+    ):
+        self._windows = sorted(
+            ((int(period_days(w) or 0), w) for w in windows), key=lambda x: x[0]
+        )
+        self._min_sync_interval = min_sync_interval
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def get_timeseries(
+        self, link_id: str, period: str, fetch: Callable[[str], Any]
+    ) -> Any:
+        """
+        Return a GetTimeseriesResponse for the period, syncing as needed.
+
+        ``fetch`` is called with the period to request from the server and
+        must return a GetTimeseriesResponse.
+        """
+        from go2_sdk.gen.analytics.v1 import analytics_pb2
+
+        days = period_days(period)
+        if days is None or days < 1:
+            return fetch(period)
+
+        today = _today()
+        start = today - timedelta(days=int(days) - 1)
+        coverage = self.coverage(link_id)
+
+        window = period
+        if coverage is not None:
+            covered_from, covered_through, synced_at = coverage
+            if covered_from <= start.isoformat():
+                if (
+                    covered_through >= today.isoformat()
+                    and time.time() - synced_at < self._min_sync_interval
+                ):
+                    window = ""
+                else:
+                    # Refetch from the last synced day, whose count may have grown.
+                    gap = (today - date.fromisoformat(covered_through)).days + 1
+                    window = self._window_for(gap) or period
+
+        if window:
+            response = fetch(window)
+            self._sync(link_id, window, today, response.points)
+
+        return analytics_pb2.GetTimeseriesResponse(
+            points=self.points(link_id, start.isoformat(), today.isoformat())
+        )
+
+    def merge(self, link_id: str, points: Sequence[Any]) -> None:
+        """Insert or replace points for a link, keyed by date."""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO timeseries VALUES (?, ?, ?, ?)",
+                _rows(link_id, points),
+            )
+
+    def points(
+        self, link_id: str, start: Optional[str] = None, end: Optional[str] = None
+    ) -> List[Any]:
+        """Return a link's stored TimeseriesPoints between two ISO dates, inclusive."""
+        from go2_sdk.gen.analytics.v1 import analytics_pb2
+
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT date, clicks, unique_clicks FROM timeseries"
+                " WHERE link_id = ? AND date >= ? AND date <= ? ORDER BY date",
+                (link_id, start or "", end or "\uffff"),
+            ).fetchall()
+        return [
+            analytics_pb2.TimeseriesPoint(date=d, clicks=c, unique_clicks=u)
+            for d, c, u in rows
+        ]
+
+    def coverage(self, link_id: str) -> Optional[Tuple[str, str, float]]:
+        """Return (covered_from, covered_through, synced_at) for a link."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT covered_from, covered_through, synced_at"
+                " FROM timeseries_sync WHERE link_id = ?",
+                (link_id,),
+            ).fetchone()
+        return None if row is None else (row[0], row[1], row[2])
+
+    def delete(self, link_id: str) -> None:
+        """Forget everything stored for a link."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM timeseries WHERE link_id = ?", (link_id,))
+            self._conn.execute(
+                "DELETE FROM timeseries_sync WHERE link_id = ?", (link_id,)
+            )
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "TimeseriesStore":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+    def _window_for(self, days: int) -> Optional[str]:
+        for window_days, window in self._windows:
+            if window_days >= days:
+                return window
+        return None
+
+    def _sync(
+        self, link_id: str, window: str, today: date, points: Sequence[Any]
+    ) -> None:
+        fetched_from = (
+            today - timedelta(days=int(period_days(window) or 1) - 1)
+        ).isoformat()
+        with self._lock, self._conn:
+            # A fetched window is authoritative: days it no longer reports had
+            # no clicks.
+            self._conn.execute(
+                "DELETE FROM timeseries WHERE link_id = ? AND date >= ? AND date <= ?",
+                (link_id, fetched_from, today.isoformat()),
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO timeseries VALUES (?, ?, ?, ?)",
+                _rows(link_id, points),
+            )
+            row = self._conn.execute(
+                "SELECT covered_from, covered_through FROM timeseries_sync"
+                " WHERE link_id = ?",
+                (link_id,),
+            ).fetchone()
+            covered_from = fetched_from
+            if row is not None and row[1] >= _previous_day(fetched_from):
+                covered_from = min(row[0], fetched_from)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO timeseries_sync VALUES (?, ?, ?, ?)",
+                (link_id, covered_from, today.isoformat(), time.time()),
+            )
+
+
+def _rows(link_id: str, points: Sequence[Any]) -> List[Tuple[str, str, int, int]]:
+    # Dates are stored as YYYY-MM-DD so range comparisons stay lexical.
+    return [(link_id, p.date[:10], p.clicks, p.unique_clicks) for p in points]
+
+
+def _today() -> date:
+    return datetime.now(timezone.utc).date()
+
+
+def _previous_day(iso: str) -> str:
+    return (date.fromisoformat(iso) - timedelta(days=1)).isoformat()
@@ -0,0 +1,23 @@
+"""
+Go2 SDK testing helpers.
+
+FakeGo2Server implements the whole Go2 API in memory, for tests and
+benchmarks that should not touch the real service:
+
+    from go2_sdk.testing import FakeGo2Server, Faults
+
+    with FakeGo2Server() as server:
+        client = server.client()
+        link = client.links.create(slug="promo", web_url="https://example.ge")
+"""
+
+from go2_sdk.testing.channel import InProcessChannel
+from go2_sdk.testing.server import FakeGo2Server, Faults
+from go2_sdk.testing.servicers import State
+
+__all__ = [
+    "FakeGo2Server",
+    "Faults",
+    "InProcessChannel",
+    "State",
+]
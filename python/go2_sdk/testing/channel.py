@@ -0,0 +1,411 @@
+"""A channel that calls servicers in-process, without sockets."""
+
+from concurrent.futures import Executor, Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+import threading
+import time
+
+import grpc
+
+Handler = Tuple[Callable[[Any, Any], Any], Callable[[bytes], Any]]
+
+
+class _Abort(Exception):
+    def __init__(self, code: grpc.StatusCode, details: str):
+        super().__init__(details)
+        self.code = code
+        self.details = details
+
+
+class ServicerContext:
+    """The parts of grpc.ServicerContext the fake servicers use."""
+
+    def __init__(self, metadata: Sequence[Tuple[str, str]], timeout: Optional[float]):
+        self._metadata = tuple(metadata)
+        self._deadline = None if timeout is None else time.monotonic() + timeout
+        self._code: Optional[grpc.StatusCode] = None
+        self._details = ""
+        self._cancelled = False
+
+    def invocation_metadata(self) -> Tuple[Tuple[str, str], ...]:
+        return self._metadata
+
+    def abort(self, code: grpc.StatusCode, details: str) -> None:
+        raise _Abort(code, details)
+
+    def set_code(self, code: grpc.StatusCode) -> None:
+        self._code = code
+
+    def set_details(self, details: str) -> None:
+        self._details = details
+
+    def is_active(self) -> bool:
+        return not self._cancelled and self.time_remaining() != 0.0
+
+    def time_remaining(self) -> Optional[float]:
+        if self._deadline is None:
+            return None
+        return max(0.0, self._deadline - time.monotonic())
+
+    def peer(self) -> str:
+        return "inprocess"
+
+
+class _Call(grpc.RpcError, grpc.Call, grpc.Future):
+    """A finished (or pending) in-process call; raised as the error when it fails."""
+
+    def __init__(self) -> None:
+        self._future: "Future[None]" = Future()
+        self._lock = threading.Lock()
+        self._callbacks: List[Callable[[Any], None]] = []
+
+    def _finish(self, response: Any, code: grpc.StatusCode, details: str) -> None:
+        self._response = response
+        self._code = code
+        self._details = details
+        with self._lock:
+            self._future.set_result(None)
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback(self)
+
+    # grpc.Call
+    def code(self) -> grpc.StatusCode:
+        self._future.result()
+        return self._code
+
+    def details(self) -> str:
+        self._future.result()
+        return self._details
+
+    def initial_metadata(self) -> Tuple[()]:
+        return ()
+
+    def trailing_metadata(self) -> Tuple[()]:
+        return ()
+
+    def is_active(self) -> bool:
+        return not self._future.done()
+
+    def time_remaining(self) -> Optional[float]:
+        return None
+
+    def add_callback(self, callback: Callable[[], None]) -> bool:
+        return False
+
+    # grpc.Future
+    def cancel(self) -> bool:
+        return False
+
+    def cancelled(self) -> bool:
+        return False
+
+    def running(self) -> bool:
+        return not self._future.done()
+
+    def done(self) -> bool:
+        return self._future.done()
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        self._wait(timeout)
+        if self._code != grpc.StatusCode.OK:
+            raise self
+        return self._response
+
+    def exception(self, timeout: Optional[float] = None) -> Optional[Exception]:
+        self._wait(timeout)
+        return None if self._code == grpc.StatusCode.OK else self
+
+    def _wait(self, timeout: Optional[float]) -> None:
+        try:
+            self._future.result(timeout)
+        except FutureTimeoutError:
+            raise grpc.FutureTimeoutError()
+
+    def traceback(self, timeout: Optional[float] = None) -> Any:
+        return None
+
+    def add_done_callback(self, fn: Callable[[Any], None]) -> None:
+        with self._lock:
+            if not self._future.done():
+                self._callbacks.append(fn)
+                return
+        fn(self)
+
+    def __str__(self) -> str:
+        return "<in-process call: {} {!r}>".format(self._code, self._details)
+
+
+class _UnaryUnary:
+    def __init__(
+        self,
+        channel: "InProcessChannel",
+        method: str,
+        request_serializer: Optional[Callable[[Any], bytes]],
+        response_deserializer: Optional[Callable[[bytes], Any]],
+    ):
+        self._channel = channel
+        self._method = method
+        self._serialize = request_serializer
+        self._deserialize = response_deserializer
+
+    def __call__(
+        self,
+        request: Any,
+        timeout: Optional[float] = None,
+        metadata: Any = None,
+        **kwargs: Any,
+    ) -> Any:
+        return self.with_call(request, timeout, metadata)[0]
+
+    def with_call(
+        self,
+        request: Any,
+        timeout: Optional[float] = None,
+        metadata: Any = None,
+        **kwargs: Any,
+    ) -> Tuple[Any, _Call]:
+        call = _Call()
+        self._run(call, self._encode(request), timeout, metadata)
+        return call.result(), call
+
+    def future(
+        self,
+        request: Any,
+        timeout: Optional[float] = None,
+        metadata: Any = None,
+        **kwargs: Any,
+    ) -> _Call:
+        call = _Call()
+        data = self._encode(request)
+        self._channel._executor.submit(self._run, call, data, timeout, metadata)
+        return call
+
+    def _encode(self, request: Any) -> bytes:
+        return self._serialize(request) if self._serialize is not None else request
+
+    def _run(
+        self, call: _Call, data: bytes, timeout: Optional[float], metadata: Any
+    ) -> None:
+        handler = self._channel._handlers.get(self._method)
+        if handler is None:
+            call._finish(None, grpc.StatusCode.UNIMPLEMENTED, "Method not found!")
+            return
+        behavior, deserialize_request = handler
+        context = ServicerContext(metadata or (), timeout)
+        try:
+            response = behavior(deserialize_request(data), context)
+        except _Abort as e:
+            call._finish(None, e.code, e.details)
+            return
+        except Exception as e:  # noqa: BLE001
+            # A gRPC server turns any exception a servicer raises into
+            # UNKNOWN; so does this channel, rather than raising it here.
+            call._finish(
+                None,
+                grpc.StatusCode.UNKNOWN,
+                "Exception calling application: {}".format(e),
+            )
+            return
+        if context._code not in (None, grpc.StatusCode.OK):
+            call._finish(None, context._code, context._details)
+            return
+        if context.time_remaining() == 0.0:
+            call._finish(None, grpc.StatusCode.DEADLINE_EXCEEDED, "Deadline Exceeded")
+            return
+        # A real round trip: the response goes through the wire format too.
+        payload = response.SerializeToString()
+        call._finish(
+            self._deserialize(payload) if self._deserialize is not None else payload,
+            grpc.StatusCode.OK,
+            "",
+        )
+
+
+class _StreamCall(grpc.RpcError, grpc.Call):
+    """
+    An in-process server-streaming call. Iterating runs the servicer's
+    generator in the caller's thread; the call is raised as the error
+    when it fails.
+    """
+
+    def __init__(
+        self,
+        context: ServicerContext,
+        deserialize: Optional[Callable[[bytes], Any]],
+    ):
+        self._context = context
+        self._deserialize = deserialize
+        self._responses: Iterator[Any] = iter(())
+        self._code: Optional[grpc.StatusCode] = None
+        self._details = ""
+
+    def _start(self, behavior: Callable[[Any, Any], Any], request: Any) -> None:
+        try:
+            self._responses = iter(behavior(request, self._context))
+        except _Abort as e:
+            self._finish(e.code, e.details)
+        except Exception as e:  # noqa: BLE001
+            # Reported as UNKNOWN like a gRPC server would; see _UnaryUnary._run.
+            self._finish(
+                grpc.StatusCode.UNKNOWN, "Exception calling application: {}".format(e)
+            )
+
+    def _finish(self, code: grpc.StatusCode, details: str) -> None:
+        if self._code is None:
+            self._code = code
+            self._details = details
+
+    def __iter__(self) -> "_StreamCall":
+        return self
+
+    def __next__(self) -> Any:
+        if self._code is None:
+            self._advance()
+        if self._code is None:
+            return self._response
+        if self._code == grpc.StatusCode.OK:
+            raise StopIteration
+        raise self
+
+    def _advance(self) -> None:
+        context = self._context
+        try:
+            response = next(self._responses)
+        except StopIteration:
+            if context._code not in (None, grpc.StatusCode.OK):
+                self._finish(context._code, context._details)
+            self._finish(grpc.StatusCode.OK, "")
+        except _Abort as e:
+            self._finish(e.code, e.details)
+        except Exception as e:  # noqa: BLE001
+            # Reported as UNKNOWN like a gRPC server would; see _UnaryUnary._run.
+            self._finish(
+                grpc.StatusCode.UNKNOWN, "Exception iterating responses: {}".format(e)
+            )
+        else:
+            payload = response.SerializeToString()
+            self._response = (
+                self._deserialize(payload) if self._deserialize is not None else payload
+            )
+        if context._cancelled:
+            self._finish(grpc.StatusCode.CANCELLED, "Locally cancelled by application!")
+        elif context.time_remaining() == 0.0:
+            self._finish(grpc.StatusCode.DEADLINE_EXCEEDED, "Deadline Exceeded")
+
+    # grpc.Call
+    def code(self) -> Optional[grpc.StatusCode]:
+        return self._code
+
+    def details(self) -> str:
+        return self._details
+
+    def initial_metadata(self) -> Tuple[()]:
+        return ()
+
+    def trailing_metadata(self) -> Tuple[()]:
+        return ()
+
+    def is_active(self) -> bool:
+        return self._code is None
+
+    def time_remaining(self) -> Optional[float]:
+        return self._context.time_remaining()
+
+    def cancel(self) -> bool:
+        """Stop the call; the servicer notices on its next ``is_active()``."""
+        if self._code is not None:
+            return False
+        self._context._cancelled = True
+        return True
+
+    def add_callback(self, callback: Callable[[], None]) -> bool:
+        return False
+
+    def __str__(self) -> str:
+        return "<in-process stream: {} {!r}>".format(self._code, self._details)
+
+
+class _UnaryStream:
+    def __init__(
+        self,
+        channel: "InProcessChannel",
+        method: str,
+        request_serializer: Optional[Callable[[Any], bytes]],
+        response_deserializer: Optional[Callable[[bytes], Any]],
+    ):
+        self._channel = channel
+        self._method = method
+        self._serialize = request_serializer
+        self._deserialize = response_deserializer
+
+    def __call__(
+        self,
+        request: Any,
+        timeout: Optional[float] = None,
+        metadata: Any = None,
+        **kwargs: Any,
+    ) -> _StreamCall:
+        data = self._serialize(request) if self._serialize is not None else request
+        call = _StreamCall(ServicerContext(metadata or (), timeout), self._deserialize)
+        handler = self._channel._handlers.get(self._method)
+        if handler is None:
+            call._finish(grpc.StatusCode.UNIMPLEMENTED, "Method not found!")
+        else:
+            behavior, deserialize_request = handler
+            call._start(behavior, deserialize_request(data))
+        return call
+
+
+class InProcessChannel:
+    """
+    Channel dispatching unary-unary and server-streaming calls straight to
+    servicer methods.
+
+    Requests and responses are still serialized and parsed, so encode and
+    decode costs match a real channel; there is just no network. Blocking
+    calls and stream iteration run in the caller's thread, ``future()``
+    calls on ``executor``.
+
+    It implements the grpc.Channel methods the SDK uses. No Go2 RPC is
+    client-streaming, so there is no ``stream_unary`` or ``stream_stream``,
+    and the class does not subclass grpc.Channel, which requires them.
+    """
+
+    def __init__(self, handlers: Dict[str, Handler], executor: Executor):
+        self._handlers = handlers
+        self._executor = executor
+
+    def unary_unary(
+        self,
+        method: str,
+        request_serializer: Optional[Callable[[Any], bytes]] = None,
+        response_deserializer: Optional[Callable[[bytes], Any]] = None,
+        _registered_method: bool = False,
+    ) -> _UnaryUnary:
+        return _UnaryUnary(self, method, request_serializer, response_deserializer)
+
+    def unary_stream(
+        self,
+        method: str,
+        request_serializer: Optional[Callable[[Any], bytes]] = None,
+        response_deserializer: Optional[Callable[[bytes], Any]] = None,
+        _registered_method: bool = False,
+    ) -> _UnaryStream:
+        return _UnaryStream(self, method, request_serializer, response_deserializer)
+
+    def subscribe(self, callback: Any, try_to_connect: bool = False) -> None:
+        callback(grpc.ChannelConnectivity.READY)
+
+    def unsubscribe(self, callback: Any) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "InProcessChannel":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
@@ -0,0 +1,287 @@
+"""FakeGo2Server: the six Go2 services in memory, with fault injection."""
+
+from concurrent import futures
+from typing import Any, Callable, Dict, Optional
+import random
+import threading
+import time
+
+import grpc
+
+from go2_sdk.gen.analytics.v1 import analytics_pb2, analytics_pb2_grpc
+from go2_sdk.gen.campaigns.v1 import campaigns_pb2, campaigns_pb2_grpc
+from go2_sdk.gen.domains.v1 import domains_pb2, domains_pb2_grpc
+from go2_sdk.gen.integrations.v1 import integrations_pb2, integrations_pb2_grpc
+from go2_sdk.gen.links.v1 import links_pb2, links_pb2_grpc
+from go2_sdk.gen.qr.v1 import qr_pb2, qr_pb2_grpc
+from go2_sdk.testing.channel import Handler, InProcessChannel
+from go2_sdk.testing.servicers import (
+    AnalyticsServicer,
+    CampaignServicer,
+    DomainServicer,
+    IntegrationServicer,
+    LinkServicer,
+    QRServicer,
+    State,
+)
+
+# (servicer class, pb2 module, pb2_grpc module, service name)
+_SERVICES = (
+    (LinkServicer, links_pb2, links_pb2_grpc, "LinkService"),
+    (AnalyticsServicer, analytics_pb2, analytics_pb2_grpc, "AnalyticsService"),
+    (DomainServicer, domains_pb2, domains_pb2_grpc, "DomainService"),
+    (QRServicer, qr_pb2, qr_pb2_grpc, "QRService"),
+    (
+        IntegrationServicer,
+        integrations_pb2,
+        integrations_pb2_grpc,
+        "IntegrationService",
+    ),
+    (CampaignServicer, campaigns_pb2, campaigns_pb2_grpc, "CampaignService"),
+)
+
+
+class Faults:
+    """
+    Misbehaviour injected into calls.
+
+    Args:
+        latency: Seconds added to every call
+        jitter: Extra uniformly random seconds, up to this much
+        error_rate: Fraction of calls failed with ``error_code``
+        error_code: Status code of injected failures
+        max_qps: Calls per second admitted before RESOURCE_EXHAUSTED
+        burst: Calls admitted at once above ``max_qps`` (default: ``max_qps``)
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_code: grpc.StatusCode = grpc.StatusCode.UNAVAILABLE,
+        max_qps: Optional[float] = None,
+        burst: Optional[float] = None,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_code = error_code
+        self.max_qps = max_qps
+        self.burst = burst if burst is not None else max_qps
+        self._lock = threading.Lock()
+        self._tokens = self.burst or 0.0
+        self._last = time.monotonic()
+
+    def _admit(self) -> bool:
+        if self.max_qps is None:
+            return True
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst or 0.0, self._tokens + (now - self._last) * self.max_qps
+            )
+            self._last = now
+            if self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+            return True
+
+    def _apply(self, context: Any, rng: random.Random) -> None:
+        if not self._admit():
+            context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, "rate limit exceeded")
+        delay = self.latency + (rng.random() * self.jitter if self.jitter else 0.0)
+        if delay > 0:
+            time.sleep(delay)
+        if self.error_rate and rng.random() < self.error_rate:
+            context.abort(self.error_code, "injected failure")
+
+
+class _FaultInterceptor(grpc.ServerInterceptor):
+    def __init__(self, server: "FakeGo2Server"):
+        self._server = server
+
+    def intercept_service(self, continuation: Any, handler_call_details: Any) -> Any:
+        handler = continuation(handler_call_details)
+        if handler is None:
+            return handler
+        if handler.unary_unary is not None:
+            wrap, behavior = grpc.unary_unary_rpc_method_handler, handler.unary_unary
+        elif handler.unary_stream is not None:
+            wrap, behavior = grpc.unary_stream_rpc_method_handler, handler.unary_stream
+        else:
+            return handler
+        return wrap(
+            self._server._guard(handler_call_details.method, behavior),
+            request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer,
+        )
+
+
+class FakeGo2Server:
+    """
+    Stateful in-memory Go2 API for tests and benchmarks.
+
+    Implements every RPC of the six services with the real API's shape:
+    page/offset pagination, unique slugs shared by links and campaign
+    links, generated campaign links with short URLs, domain verification
+    and analytics computed from recorded clicks (``click`` and
+    ``seed_clicks``), which StreamClicks also streams. Requests must carry
+    an ``x-api-key``, as Go2Client sends.
+
+    Clients reach it either over a localhost port (``start()``) or through
+    an in-process channel that skips the network but still serializes
+    every message (``channel()``). ``client()`` returns a Go2Client for
+    either.
+
+    Example:
+        with FakeGo2Server(faults=Faults(latency=0.005)) as server:
+            client = server.client()
+            link = client.links.create(slug="promo", web_url="https://example.ge")
+            server.seed_clicks("promo", 500)
+            print(client.analytics.get_stats(link.id).total_clicks)
+
+    Args:
+        faults: Faults applied to every method
+        api_key: Only accept this key (default: any non-empty key)
+        seed: Seed for IDs, slugs, synthetic clicks and injected faults
+        short_domain: Host used for short URLs
+        max_workers: Threads serving calls
+    """
+
+    def __init__(
+        self,
+        faults: Optional[Faults] = None,
+        api_key: Optional[str] = None,
+        seed: Optional[int] = None,
+        short_domain: str = "go2.ge",
+        max_workers: int = 16,
+    ):
+        self.state = State(short_domain, seed)
+        self.faults = faults or Faults()
+        self._api_key = api_key
+        self._method_faults: Dict[str, Faults] = {}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls: Dict[str, int] = {}
+        self._max_workers = max_workers
+        self._executor = futures.ThreadPoolExecutor(
+            max_workers, thread_name_prefix="go2-fake"
+        )
+        self._servicers = [
+            (servicer(self.state), pb2, pb2_grpc, name)
+            for servicer, pb2, pb2_grpc, name in _SERVICES
+        ]
+        self._handlers: Dict[str, Handler] = {}
+        for servicer, pb2, _, name in self._servicers:
+            service = pb2.DESCRIPTOR.services_by_name[name]
+            for method in service.methods:
+                path = "/{}/{}".format(service.full_name, method.name)
+                self._handlers[path] = (
+                    self._guard(path, getattr(servicer, method.name)),
+                    getattr(pb2, method.input_type.name).FromString,
+                )
+        self._server: Optional[grpc.Server] = None
+        self.endpoint: Optional[str] = None
+
+    def set_faults(
+        self, faults: Optional[Faults], method: Optional[str] = None
+    ) -> None:
+        """
+        Replace the faults for all methods, or for one method by name
+        (e.g. ``"ExportLinks"``); ``None`` clears a method override.
+        """
+        if method is None:
+            self.faults = faults or Faults()
+        elif faults is None:
+            self._method_faults.pop(method, None)
+        else:
+            self._method_faults[method] = faults
+
+    def start(self, port: int = 0) -> str:
+        """Serve on 127.0.0.1 (a free port by default) and return the endpoint."""
+        if self._server is not None:
+            raise RuntimeError("FakeGo2Server is already started")
+        server = grpc.server(
+            futures.ThreadPoolExecutor(
+                self._max_workers, thread_name_prefix="go2-fake"
+            ),
+            interceptors=[_FaultInterceptor(self)],
+            options=[
+                ("grpc.max_receive_message_length", -1),
+                ("grpc.max_send_message_length", -1),
+            ],
+        )
+        for servicer, _, pb2_grpc, name in self._servicers:
+            getattr(pb2_grpc, "add_{}Servicer_to_server".format(name))(servicer, server)
+        bound = server.add_insecure_port("127.0.0.1:{}".format(port))
+        server.start()
+        self._server = server
+        self.endpoint = "127.0.0.1:{}".format(bound)
+        return self.endpoint
+
+    def stop(self, grace: Optional[float] = None) -> None:
+        """Stop serving on the port, if started."""
+        if self._server is not None:
+            self._server.stop(grace).wait()
+            self._server = None
+            self.endpoint = None
+
+    def channel(self) -> InProcessChannel:
+        """Return a channel that calls the services in-process."""
+        return InProcessChannel(self._handlers, self._executor)
+
+    def client(
+        self, api_key: str = "go2_test", in_process: bool = True, **kwargs: Any
+    ) -> Any:
+        """
+        Return a Go2Client for this server.
+
+        In-process by default; with ``in_process=False`` the client connects
+        to the port, starting the server first if needed. Other keyword
+        arguments go to Go2Client.
+        """
+        from go2_sdk.client import Go2Client
+
+        if in_process:
+            return Go2Client(api_key=api_key, channel=self.channel(), **kwargs)
+        endpoint = self.endpoint or self.start()
+        return Go2Client(api_key=api_key, endpoint=endpoint, insecure=True, **kwargs)
+
+    def click(self, slug: str, **kwargs: Any) -> None:
+        """Record a click on a link or campaign link; see State.click."""
+        self.state.click(slug, **kwargs)
+
+    def seed_clicks(self, slug: str, count: int, days: int = 30) -> None:
+        """Record ``count`` random clicks on ``slug`` over the last ``days``."""
+        self.state.seed_clicks(slug, count, days)
+
+    def reset_streams(self) -> None:
+        """Break every open StreamClicks call, as a server restart would."""
+        self.state.reset_streams()
+
+    def close(self) -> None:
+        self.stop()
+        self._executor.shutdown(wait=False)
+
+    def __enter__(self) -> "FakeGo2Server":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+    def _guard(
+        self, path: str, behavior: Callable[[Any, Any], Any]
+    ) -> Callable[[Any, Any], Any]:
+        name = path.rsplit("/", 1)[-1]
+
+        def guarded(request: Any, context: Any) -> Any:
+            with self._lock:
+                self.calls[name] = self.calls.get(name, 0) + 1
+            key = dict(context.invocation_metadata()).get("x-api-key")
+            if not key or (self._api_key is not None and key != self._api_key):
+                context.abort(grpc.StatusCode.UNAUTHENTICATED, "invalid API key")
+            self._method_faults.get(name, self.faults)._apply(context, self._rng)
+            return behavior(request, context)
+
+        return guarded
@@ -0,0 +1,1045 @@
+"""In-memory implementations of the six Go2 gRPC services."""
+
+from typing import Any, Dict, Iterable, List, NoReturn, Optional, Sequence, Tuple
+import base64
+import bisect
+import datetime
+import random
+import string
+import threading
+import time
+import uuid
+
+import grpc
+
+from go2_sdk.cache import period_days
+from go2_sdk.client import BATCH_GET_LIMIT, BATCH_WRITE_LIMIT
+from go2_sdk.gen.analytics.v1 import analytics_pb2, analytics_pb2_grpc
+from go2_sdk.gen.campaigns.v1 import campaigns_pb2, campaigns_pb2_grpc
+from go2_sdk.gen.domains.v1 import domains_pb2, domains_pb2_grpc
+from go2_sdk.gen.integrations.v1 import integrations_pb2, integrations_pb2_grpc
+from go2_sdk.gen.links.v1 import links_pb2, links_pb2_grpc
+from go2_sdk.gen.qr.v1 import qr_pb2, qr_pb2_grpc
+
+_SLUG_ALPHABET = string.ascii_letters + string.digits
+
+LINK_URL_FIELDS = (
+    "ios_url",
+    "android_url",
+    "web_url",
+    "fallback_url",
+    "huawei_url",
+    "amazon_url",
+    "windows_url",
+    "macos_url",
+)
+
+COUNTRY_NAMES = {
+    "GE": "Georgia",
+    "US": "United States",
+    "DE": "Germany",
+    "TR": "Turkey",
+    "UA": "Ukraine",
+    "AM": "Armenia",
+    "GB": "United Kingdom",
+}
+
+CITIES = {
+    "GE": ("Tbilisi", "Batumi", "Kutaisi"),
+    "US": ("New York", "San Francisco"),
+    "DE": ("Berlin", "Munich"),
+    "TR": ("Istanbul", "Ankara"),
+    "UA": ("Kyiv", "Lviv"),
+    "AM": ("Yerevan",),
+    "GB": ("London",),
+}
+
+PLATFORMS = ("ios", "android", "web", "other")
+
+REFERRERS = (
+    "",
+    "facebook.com",
+    "instagram.com",
+    "t.co",
+    "google.com",
+    "linkedin.com",
+)
+
+_INTEGRATION_EVENTS = (
+    "link.created",
+    "link.clicked",
+    "link.deleted",
+    "campaign.created",
+    "campaign.completed",
+)
+
+_CAMPAIGN_STATUSES = ("active", "paused", "completed", "archived")
+
+_DEFAULT_PERIOD = "30d"
+
+
+class Click:
+    """One recorded click on a link or campaign link."""
+
+    __slots__ = ("timestamp", "platform", "country", "city", "referrer", "visitor")
+
+    def __init__(
+        self,
+        timestamp: float,
+        platform: str,
+        country: str,
+        city: str,
+        referrer: str,
+        visitor: str,
+    ):
+        self.timestamp = timestamp
+        self.platform = platform
+        self.country = country
+        self.city = city
+        self.referrer = referrer
+        self.visitor = visitor
+
+
+class State:
+    """
+    Data shared by the fake services.
+
+    Links and campaign links share one slug namespace, like the real API.
+    All access goes through ``lock``.
+    """
+
+    def __init__(self, short_domain: str = "go2.ge", seed: Optional[int] = None):
+        self.lock = threading.RLock()
+        self.short_domain = short_domain
+        self.random = random.Random(seed)
+        self.links: Dict[str, Any] = {}
+        # Creation sequence number of every link, the key page tokens use.
+        self.link_sequence: Dict[str, int] = {}
+        self.last_sequence = 0
+        self.slugs: Dict[str, str] = {}
+        self.clicks: Dict[str, List[Click]] = {}
+        # Every recorded click as (owner ID, click), in order; a click's
+        # event_id in StreamClicks is its position plus one.
+        self.events: List[Tuple[str, Click]] = []
+        self.events_added = threading.Condition(self.lock)
+        # Bumped to break every open StreamClicks call.
+        self.stream_generation = 0
+        self.campaigns: Dict[str, Any] = {}
+        self.campaign_links: Dict[str, List[Any]] = {}
+        self.campaign_link_slugs: Dict[str, Any] = {}
+        self.domains: Dict[str, Any] = {}
+        self.integrations: Dict[str, Any] = {}
+
+    def new_id(self) -> str:
+        return str(uuid.UUID(int=self.random.getrandbits(128), version=4))
+
+    def new_slug(self, length: int = 7) -> str:
+        while True:
+            slug = "".join(self.random.choice(_SLUG_ALPHABET) for _ in range(length))
+            if slug not in self.slugs:
+                return slug
+
+    def short_url(self, slug: str) -> str:
+        return "https://{}/{}".format(self.short_domain, slug)
+
+    def click(
+        self,
+        slug: str,
+        platform: str = "web",
+        country: str = "GE",
+        city: str = "",
+        referrer: str = "",
+        visitor: Optional[str] = None,
+        timestamp: Optional[float] = None,
+    ) -> None:
+        """Record a click on the link or campaign link with ``slug``."""
+        now = time.time() if timestamp is None else timestamp
+        city = city or CITIES.get(country, ("",))[0]
+        visitor = visitor or self.new_id()
+        with self.lock:
+            owner = self.slugs.get(slug)
+            if owner is None:
+                raise KeyError(slug)
+            click = Click(now, platform, country, city, referrer, visitor)
+            self.clicks.setdefault(owner, []).append(click)
+            self.events.append((owner, click))
+            self.events_added.notify_all()
+            link = self.links.get(owner)
+            if link is not None:
+                link.total_clicks += 1
+                return
+
+            campaign_link = self.campaign_link_slugs[slug]
+            stamp = _iso(now)
+            if not campaign_link.clicked:
+                campaign_link.clicked = True
+                campaign_link.first_clicked_at = stamp
+                campaign_link.first_click_platform = platform
+                campaign_link.first_click_country = country
+                campaign_link.first_click_city = city
+                self.campaigns[campaign_link.campaign_id].unique_clicks += 1
+            campaign_link.last_clicked_at = stamp
+            campaign_link.click_count += 1
+            self.campaigns[campaign_link.campaign_id].total_clicks += 1
+
+    def reset_streams(self) -> None:
+        """Fail every open StreamClicks call with UNAVAILABLE."""
+        with self.lock:
+            self.stream_generation += 1
+            self.events_added.notify_all()
+
+    def seed_clicks(self, slug: str, count: int, days: int = 30) -> None:
+        """Record ``count`` random clicks on ``slug`` spread over the last ``days``."""
+        now = time.time()
+        rng = self.random
+        visitors = [self.new_id() for _ in range(max(1, count // 3))]
+        countries = list(COUNTRY_NAMES)
+        for _ in range(count):
+            country = rng.choice(countries)
+            self.click(
+                slug,
+                platform=rng.choice(PLATFORMS),
+                country=country,
+                city=rng.choice(CITIES[country]),
+                referrer=rng.choice(REFERRERS),
+                visitor=rng.choice(visitors),
+                timestamp=now - rng.random() * days * 86400,
+            )
+
+
+def _abort(context: Any, code: grpc.StatusCode, details: str) -> NoReturn:
+    context.abort(code, details)
+    # abort() raises; this only satisfies type checkers.
+    raise AssertionError(details)
+
+
+class _ItemError(Exception):
+    def __init__(self, code: grpc.StatusCode, details: str):
+        super().__init__(details)
+        self.code = code
+        self.details = details
+
+
+class _ItemContext:
+    """Context for one item of a batch call; abort() fails only that item."""
+
+    def abort(self, code: grpc.StatusCode, details: str) -> None:
+        raise _ItemError(code, details)
+
+
+def _now_timestamp(message: Any, field: str) -> None:
+    getattr(message, field).GetCurrentTime()
+
+
+def _iso(seconds: float) -> str:
+    return (
+        datetime.datetime.fromtimestamp(seconds, datetime.timezone.utc)
+        .isoformat(timespec="seconds")
+        .replace("+00:00", "Z")
+    )
+
+
+def _page(items: List[Any], offset: int, limit: int) -> List[Any]:
+    return items[offset : offset + limit] if limit > 0 else []
+
+
+Key = Tuple[int, ...]
+
+
+def _keyset(
+    keys: Sequence[Key],
+    offset: int,
+    limit: int,
+    after: Optional[Key],
+    until: int,
+    kind: str,
+) -> Tuple[int, int, str]:
+    """
+    Find a page in ascending ``keys``: after the key ``after`` when paging
+    by token, at ``offset`` otherwise. Returns the page's slice bounds and
+    the token for the next page, empty on the last one.
+    """
+    start = offset if after is None else bisect.bisect_right(keys, after)
+    end = min(start + max(limit, 0), len(keys))
+    if end <= start or end == len(keys):
+        return start, end, ""
+    last = ",".join(str(part) for part in keys[end - 1])
+    token = "{}:{}:{}".format(kind, until, last)
+    return start, end, base64.urlsafe_b64encode(token.encode()).decode()
+
+
+def _cursor(token: str, kind: str, context: Any) -> Tuple[Key, int]:
+    """Decode a page token into (last key returned, snapshot bound)."""
+    try:
+        decoded = base64.urlsafe_b64decode(token.encode()).decode()
+        name, until, last = decoded.rsplit(":", 2)
+        if name != kind:
+            raise ValueError(name)
+        return tuple(int(part) for part in last.split(",")), int(until)
+    except ValueError:
+        return _abort(context, grpc.StatusCode.INVALID_ARGUMENT, "invalid page_token")
+
+
+def _masked(links: List[Any], request: Any, context: Any) -> List[Any]:
+    """Apply the request's read_mask to ``links``; an empty mask keeps all fields."""
+    mask = request.read_mask
+    if not mask.paths:
+        return links
+    if not mask.IsValidForDescriptor(links_pb2.Link.DESCRIPTOR):
+        _abort(context, grpc.StatusCode.INVALID_ARGUMENT, "invalid read_mask")
+    masked = []
+    for link in links:
+        out = links_pb2.Link()
+        mask.MergeMessage(link, out)
+        masked.append(out)
+    return masked
+
+
+_LINK_ORDERS = (
+    links_pb2.LINK_ORDER_UNSPECIFIED,
+    links_pb2.LINK_ORDER_UPDATED_AT_ASC,
+    links_pb2.LINK_ORDER_UPDATED_AT_DESC,
+)
+
+
+def _nanos(timestamp: Any) -> int:
+    return int(timestamp.seconds) * 1_000_000_000 + int(timestamp.nanos)
+
+
+def _link_key(link: Any, sequence: int, order: int) -> Key:
+    """Sort key of a link in ``order``; unique, as it ends in the sequence."""
+    if order == links_pb2.LINK_ORDER_UPDATED_AT_ASC:
+        return (_nanos(link.updated_at), sequence)
+    if order == links_pb2.LINK_ORDER_UPDATED_AT_DESC:
+        return (-_nanos(link.updated_at), -sequence)
+    return (sequence,)
+
+
+class LinkServicer(links_pb2_grpc.LinkServiceServicer):
+    def __init__(self, state: State):
+        self._state = state
+
+    def ListLinks(self, request: Any, context: Any) -> Any:
+        page = request.page or 1
+        per_page = request.per_page or 20
+        if page < 1 or not 0 < per_page <= 1000:
+            _abort(
+                context, grpc.StatusCode.INVALID_ARGUMENT, "invalid page or per_page"
+            )
+        order = request.order
+        if order not in _LINK_ORDERS:
+            _abort(context, grpc.StatusCode.INVALID_ARGUMENT, "invalid order")
+        kind = "links/{}".format(order)
+        since = None
+        if request.HasField("updated_since"):
+            since = _nanos(request.updated_since)
+        state = self._state
+        with state.lock:
+            if request.page_token:
+                after, until = _cursor(request.page_token, kind, context)
+            else:
+                after, until = None, state.last_sequence
+            # Links created after the first page are left out, so a scan
+            # sees a consistent set of links.
+            rows = [
+                (_link_key(link, state.link_sequence[link.id], order), link)
+                for link in state.links.values()
+                if state.link_sequence[link.id] <= until
+                and (since is None or _nanos(link.updated_at) >= since)
+            ]
+        rows.sort(key=lambda row: row[0])
+        keys = [key for key, _ in rows]
+        start, end, token = _keyset(
+            keys, (page - 1) * per_page, per_page, after, until, kind
+        )
+        return links_pb2.ListLinksResponse(
+            links=_masked([link for _, link in rows[start:end]], request, context),
+            total=len(rows),
+            page=page,
+            per_page=per_page,
+            next_page_token=token,
+        )
+
+    def CreateLink(self, request: Any, context: Any) -> Any:
+        state = self._state
+        if not any(getattr(request, name) for name in LINK_URL_FIELDS):
+            _abort(
+                context,
+                grpc.StatusCode.INVALID_ARGUMENT,
+                "at least one URL is required",
+            )
+        with state.lock:
+            slug = request.slug or state.new_slug()
+            if slug in state.slugs:
+                _abort(context, grpc.StatusCode.ALREADY_EXISTS, "slug already taken")
+            link = links_pb2.Link(
+                id=state.new_id(),
+                user_id="user_fake",
+                slug=slug,
+                title=request.title,
+                ios_url=request.ios_url,
+                android_url=request.android_url,
+                web_url=request.web_url,
+                fallback_url=request.fallback_url,
+                huawei_url=request.huawei_url,
+                amazon_url=request.amazon_url,
+                windows_url=request.windows_url,
+                macos_url=request.macos_url,
+                app_name=request.app_name,
+                app_icon_url=request.app_icon_url,
+                description=request.description,
+                is_active=True,
+            )
+            _now_timestamp(link, "created_at")
+            link.updated_at.CopyFrom(link.created_at)
+            state.links[link.id] = link
+            state.last_sequence += 1
+            state.link_sequence[link.id] = state.last_sequence
+            state.slugs[slug] = link.id
+            return link
+
+    def GetLink(self, request: Any, context: Any) -> Any:
+        with self._state.lock:
+            link = self._state.links.get(request.id)
+            if link is None:
+                _abort(context, grpc.StatusCode.NOT_FOUND, "link not found")
+            return _masked([link], request, context)[0]
+
+    def BatchGetLinks(self, request: Any, context: Any) -> Any:
+        if len(request.ids) > BATCH_GET_LIMIT:
+            _abort(
+                context,
+                grpc.StatusCode.INVALID_ARGUMENT,
+                "at most {} ids per request".format(BATCH_GET_LIMIT),
+            )
+        response = links_pb2.BatchGetLinksResponse()
+        with self._state.lock:
+            for id in request.ids:
+                link = self._state.links.get(id)
+                if link is None:
+                    response.missing_ids.append(id)
+                else:
+                    response.links.append(link)
+        return response
+
+    def BatchCreateLinks(self, request: Any, context: Any) -> Any:
+        return links_pb2.BatchCreateLinksResponse(
+            results=self._batch(self.CreateLink, request.requests, context)
+        )
+
+    def BatchUpdateLinks(self, request: Any, context: Any) -> Any:
+        return links_pb2.BatchUpdateLinksResponse(
+            results=self._batch(self.UpdateLink, request.requests, context)
+        )
+
+    def _batch(self, method: Any, requests: Any, context: Any) -> List[Any]:
+        if len(requests) > BATCH_WRITE_LIMIT:
+            _abort(
+                context,
+                grpc.StatusCode.INVALID_ARGUMENT,
+                "at most {} requests per batch".format(BATCH_WRITE_LIMIT),
+            )
+        results = []
+        for item in requests:
+            try:
+                link = method(item, _ItemContext())
+            except _ItemError as e:
+                results.append(
+                    links_pb2.LinkResult(code=e.code.value[0], message=e.details)
+                )
+            else:
+                results.append(links_pb2.LinkResult(link=link))
+        return results
+
+    def UpdateLink(self, request: Any, context: Any) -> Any:
+        state = self._state
+        with state.lock:
+            link = state.links.get(request.id)
+            if link is None:
+                _abort(context, grpc.StatusCode.NOT_FOUND, "link not found")
+            if request.HasField("slug") and request.slug != link.slug:
+                if request.slug in state.slugs:
+                    _abort(
+                        context, grpc.StatusCode.ALREADY_EXISTS, "slug already taken"
+                    )
+                del state.slugs[link.slug]
+                state.slugs[request.slug] = link.id
+            for name in ("slug", "title", "ios_url", "android_url", "web_url",
+                         "fallback_url", "is_active"):
+                if request.HasField(name):
+                    setattr(link, name, getattr(request, name))
+            _now_timestamp(link, "updated_at")
+            return link
+
+    def DeleteLink(self, request: Any, context: Any) -> Any:
+        state = self._state
+        with state.lock:
+            link = state.links.pop(request.id, None)
+            if link is None:
+                _abort(context, grpc.StatusCode.NOT_FOUND, "link not found")
+            del state.link_sequence[link.id]
+            del state.slugs[link.slug]
+            state.clicks.pop(link.id, None)
+        return links_pb2.DeleteLinkResponse(success=True, message="Link deleted")
+
+    def CheckSlug(self, request: Any, context: Any) -> Any:
+        if not request.slug:
+            _abort(context, grpc.StatusCode.INVALID_ARGUMENT, "slug is required")
+        with self._state.lock:
+            available = request.slug not in self._state.slugs
+        return links_pb2.CheckSlugResponse(available=available, slug=request.slug)
+
+
+class AnalyticsServicer(analytics_pb2_grpc.AnalyticsServiceServicer):
+    def __init__(self, state: State):
+        self._state = state
+
+    def StreamClicks(self, request: Any, context: Any) -> Iterable[Any]:
+        state = self._state
+        link_ids = set(request.link_ids)
+        with state.lock:
+            generation = state.stream_generation
+            if not request.resume_after:
+                position = len(state.events)
+            elif (
+                request.resume_after.isdigit()
+                and int(request.resume_after) <= len(state.events)
+            ):
+                position = int(request.resume_after)
+            else:
+                _abort(
+                    context, grpc.StatusCode.INVALID_ARGUMENT, "invalid resume_after"
+                )
+        while context.is_active():
+            with state.events_added:
+                caught_up = position == len(state.events)
+                if caught_up and generation == state.stream_generation:
+                    # Wake up now and then to notice cancelled calls.
+                    state.events_added.wait(0.1)
+                if generation != state.stream_generation:
+                    _abort(context, grpc.StatusCode.UNAVAILABLE, "stream reset")
+                events = state.events[position:]
+            for owner, click in events:
+                position += 1
+                if link_ids and owner not in link_ids:
+                    continue
+                event = analytics_pb2.ClickEvent(
+                    event_id=str(position),
+                    link_id=owner,
+                    platform=click.platform,
+                    country=click.country,
+                    referrer=click.referrer,
+                )
+                event.timestamp.FromNanoseconds(int(click.timestamp * 1e9))
+                yield event
+
+    def GetStats(self, request: Any, context: Any) -> Any:
+        clicks = self._clicks(request, context)
+        platforms = _count(c.platform for c in clicks)
+        return analytics_pb2.GetStatsResponse(
+            total_clicks=len(clicks),
+            unique_clicks=len({c.visitor for c in clicks}),
+            ios_clicks=platforms.get("ios", 0),
+            android_clicks=platforms.get("android", 0),
+            web_clicks=platforms.get("web", 0),
+            other_clicks=platforms.get("other", 0),
+            top_countries=_countries(clicks, 5),
+            top_referrers=_referrers(clicks, 5),
+        )
+
+    def GetTimeseries(self, request: Any, context: Any) -> Any:
+        clicks = self._clicks(request, context)
+        days = int(self._days(request, context))
+        today = datetime.datetime.now(datetime.timezone.utc).date()
+        totals: Dict[str, List[Any]] = {}
+        for c in clicks:
+            day = datetime.datetime.fromtimestamp(
+                c.timestamp, datetime.timezone.utc
+            ).date().isoformat()
+            entry = totals.setdefault(day, [0, set()])
+            entry[0] += 1
+            entry[1].add(c.visitor)
+        points = []
+        for offset in range(days - 1, -1, -1):
+            day = (today - datetime.timedelta(days=offset)).isoformat()
+            count, visitors = totals.get(day, (0, ()))
+            points.append(
+                analytics_pb2.TimeseriesPoint(
+                    date=day, clicks=count, unique_clicks=len(visitors)
+                )
+            )
+        return analytics_pb2.GetTimeseriesResponse(points=points)
+
+    def GetPlatforms(self, request: Any, context: Any) -> Any:
+        clicks = self._clicks(request, context)
+        total = len(clicks)
+        return analytics_pb2.GetPlatformsResponse(
+            platforms=[
+                analytics_pb2.PlatformStats(
+                    platform=name, clicks=count, percentage=_percent(count, total)
+                )
+                for name, count in _ranked(c.platform for c in clicks)
+            ]
+        )
+
+    def GetCountries(self, request: Any, context: Any) -> Any:
+        clicks = self._clicks(request, context)
+        return analytics_pb2.GetCountriesResponse(
+            countries=_countries(clicks, request.limit or 10)
+        )
+
+    def GetReferrers(self, request: Any, context: Any) -> Any:
+        clicks = self._clicks(request, context)
+        return analytics_pb2.GetReferrersResponse(
+            referrers=_referrers(clicks, request.limit or 10)
+        )
+
+    def _days(self, request: Any, context: Any) -> float:
+        days = period_days(request.period or _DEFAULT_PERIOD)
+        if days is None or days <= 0:
+            _abort(context, grpc.StatusCode.INVALID_ARGUMENT, "invalid period")
+        return days
+
+    def _clicks(self, request: Any, context: Any) -> List[Click]:
+        since = time.time() - self._days(request, context) * 86400
+        with self._state.lock:
+            if request.link_id not in self._state.links:
+                _abort(context, grpc.StatusCode.NOT_FOUND, "link not found")
+            clicks = self._state.clicks.get(request.link_id, [])
+            return [c for c in clicks if c.timestamp >= since]
+
+
+def _count(values: Iterable[str]) -> Dict[str, int]:
+    counts: Dict[str, int] = {}
+    for value in values:
+        counts[value] = counts.get(value, 0) + 1
+    return counts
+
+
+def _ranked(values: Iterable[str]) -> List[Tuple[str, int]]:
+    return sorted(_count(values).items(), key=lambda kv: (-kv[1], kv[0]))
+
+
+def _percent(count: int, total: int) -> float:
+    return round(count * 100.0 / total, 2) if total else 0.0
+
+
+def _countries(clicks: List[Click], limit: int) -> List[Any]:
+    total = len(clicks)
+    return [
+        analytics_pb2.CountryStats(
+            country_code=code,
+            country_name=COUNTRY_NAMES.get(code, code),
+            clicks=count,
+            percentage=_percent(count, total),
+        )
+        for code, count in _ranked(c.country for c in clicks)[:limit]
+    ]
+
+
+def _referrers(clicks: List[Click], limit: int) -> List[Any]:
+    total = len(clicks)
+    return [
+        analytics_pb2.ReferrerStats(
+            referrer=name or "direct", clicks=count, percentage=_percent(count, total)
+        )
+        for name, count in _ranked(c.referrer for c in clicks)[:limit]
+    ]
+
+
+class DomainServicer(domains_pb2_grpc.DomainServiceServicer):
+    def __init__(self, state: State):
+        self._state = state
+
+    def ListDomains(self, request: Any, context: Any) -> Any:
+        with self._state.lock:
+            return domains_pb2.ListDomainsResponse(
+                domains=list(self._state.domains.values())
+            )
+
+    def CreateDomain(self, request: Any, context: Any) -> Any:
+        state = self._state
+        name = request.domain.strip().lower()
+        if "." not in name or " " in name:
+            _abort(context, grpc.StatusCode.INVALID_ARGUMENT, "invalid domain")
+        with state.lock:
+            if any(d.domain == name for d in state.domains.values()):
+                _abort(context, grpc.StatusCode.ALREADY_EXISTS, "domain already added")
+            token = "go2-verify-" + state.new_slug(24)
+            domain = domains_pb2.Domain(
+                id=state.new_id(),
+                user_id="user_fake",
+                domain=name,
+                status=domains_pb2.DOMAIN_STATUS_PENDING,
+                verification_token=token,
+                ssl_status=domains_pb2.SSL_STATUS_PENDING,
+            )
+            _now_timestamp(domain, "created_at")
+            domain.updated_at.CopyFrom(domain.created_at)
+            state.domains[domain.id] = domain
+        return domains_pb2.CreateDomainResponse(
+            domain=domain,
+            dns_records=[
+                domains_pb2.DNSRecord(
+                    type="CNAME", name=name, value=state.short_domain
+                ),
+                domains_pb2.DNSRecord(type="TXT", name="_go2." + name, value=token),
+            ],
+        )
+
+    def GetDomain(self, request: Any, context: Any) -> Any:
+        with self._state.lock:
+            domain = self._state.domains.get(request.id)
+            if domain is None:
+                _abort(context, grpc.StatusCode.NOT_FOUND, "domain not found")
+            return domain
+
+    def VerifyDomain(self, request: Any, context: Any) -> Any:
+        with self._state.lock:
+            domain = self._state.domains.get(request.id)
+            if domain is None:
+                _abort(context, grpc.StatusCode.NOT_FOUND, "domain not found")
+            domain.status = domains_pb2.DOMAIN_STATUS_ACTIVE
+            domain.ssl_status = domains_pb2.SSL_STATUS_ACTIVE
+            _now_timestamp(domain, "verified_at")
+            domain.updated_at.CopyFrom(domain.verified_at)
+            return domain
+
+    def DeleteDomain(self, request: Any, context: Any) -> Any:
+        with self._state.lock:
+            if self._state.domains.pop(request.id, None) is None:
+                _abort(context, grpc.StatusCode.NOT_FOUND, "domain not found")
+        return domains_pb2.DeleteDomainResponse(success=True, message="Domain deleted")
+
+
+class QRServicer(qr_pb2_grpc.QRServiceServicer):
+    def __init__(self, state: State):
+        self._state = state
+
+    def GenerateQR(self, request: Any, context: Any) -> Any:
+        size = request.size or 256
+        fmt = request.format or "png"
+        if size not in (128, 256, 512, 1024):
+            _abort(
+                context,
+                grpc.StatusCode.INVALID_ARGUMENT,
+                "size must be 128, 256, 512 or 1024",
+            )
+        if fmt not in ("png", "svg"):
+            _abort(
+                context, grpc.StatusCode.INVALID_ARGUMENT, "format must be png or svg"
+            )
+        with self._state.lock:
+            link = self._state.links.get(request.link_id)
+            if link is None:
+                _abort(context, grpc.StatusCode.NOT_FOUND, "link not found")
+            slug = link.slug
+        return qr_pb2.GenerateQRResponse(
+            url="https://{}/qr/{}-{}.{}".format(
+                self._state.short_domain, slug, size, fmt
+            ),
+            size=size,
+            format=fmt,
+        )
+
+
+_INTEGRATION_TYPES = (
+    (integrations_pb2.INTEGRATION_TYPE_SLACK, "Slack", "webhook_url", "Webhook URL"),
+    (
+        integrations_pb2.INTEGRATION_TYPE_DISCORD,
+        "Discord",
+        "webhook_url",
+        "Webhook URL",
+    ),
+    (integrations_pb2.INTEGRATION_TYPE_TELEGRAM, "Telegram", "bot_token", "Bot token"),
+    (integrations_pb2.INTEGRATION_TYPE_SEGMENT, "Segment", "write_key", "Write key"),
+    (integrations_pb2.INTEGRATION_TYPE_ZAPIER, "Zapier", "webhook_url", "Webhook URL"),
+)
+
+
+class IntegrationServicer(integrations_pb2_grpc.IntegrationServiceServicer):
+    def __init__(self, state: State):
+        self._state = state
+
+    def ListIntegrations(self, request: Any, context: Any) -> Any:
+        with self._state.lock:
+            return integrations_pb2.ListIntegrationsResponse(
+                integrations=list(self._state.integrations.values())
+            )
+
+    def CreateIntegration(self, request: Any, context: Any) -> Any:
+        state = self._state
+        if request.type == integrations_pb2.INTEGRATION_TYPE_UNSPECIFIED:
+            _abort(context, grpc.StatusCode.INVALID_ARGUMENT, "type is required")
+        if not request.name:
+            _abort(context, grpc.StatusCode.INVALID_ARGUMENT, "name is required")
+        _check_events(request.events, context)
+        with state.lock:
+            integration = integrations_pb2.Integration(
+                id=state.new_id(),
+                user_id="user_fake",
+                type=request.type,
+                name=request.name,
+                config=request.config,
+                events=request.events,
+                is_active=True,
+            )
+            _now_timestamp(integration, "created_at")
+            integration.updated_at.CopyFrom(integration.created_at)
+            state.integrations[integration.id] = integration
+            return integration
+
+    def GetIntegration(self, request: Any, context: Any) -> Any:
+        with self._state.lock:
+            return self._get(request.id, context)
+
+    def UpdateIntegration(self, request: Any, context: Any) -> Any:
+        _check_events(request.events, context)
+        with self._state.lock:
+            integration = self._get(request.id, context)
+            if request.HasField("name"):
+                integration.name = request.name
+            if request.HasField("config"):
+                integration.config.CopyFrom(request.config)
+            if request.events:
+                del integration.events[:]
+                integration.events.extend(request.events)
+            if request.HasField("is_active"):
+                integration.is_active = request.is_active
+            _now_timestamp(integration, "updated_at")
+            return integration
+
+    def DeleteIntegration(self, request: Any, context: Any) -> Any:
+        with self._state.lock:
+            if self._state.integrations.pop(request.id, None) is None:
+                _abort(context, grpc.StatusCode.NOT_FOUND, "integration not found")
+        return integrations_pb2.DeleteIntegrationResponse(success=True)
+
+    def TestIntegration(self, request: Any, context: Any) -> Any:
+        with self._state.lock:
+            integration = self._get(request.id, context)
+            if not integration.is_active:
+                return integrations_pb2.TestIntegrationResponse(
+                    success=False, message="Integration is disabled"
+                )
+            integration.trigger_count += 1
+            _now_timestamp(integration, "last_triggered_at")
+        return integrations_pb2.TestIntegrationResponse(
+            success=True, message="Test notification sent"
+        )
+
+    def GetIntegrationTypes(self, request: Any, context: Any) -> Any:
+        return integrations_pb2.GetIntegrationTypesResponse(
+            types=[
+                integrations_pb2.IntegrationTypeInfo(
+                    type=type_,
+                    name=name,
+                    description="Send Go2 events to {}".format(name),
+                    icon=name.lower(),
+                    available=True,
+                    config_fields=[
+                        integrations_pb2.ConfigField(
+                            name=field, label=label, field_type="text", required=True
+                        )
+                    ],
+                )
+                for type_, name, field, label in _INTEGRATION_TYPES
+            ],
+            events=_INTEGRATION_EVENTS,
+        )
+
+    def _get(self, id: str, context: Any) -> Any:
+        integration = self._state.integrations.get(id)
+        if integration is None:
+            _abort(context, grpc.StatusCode.NOT_FOUND, "integration not found")
+        return integration
+
+
+def _check_events(events: Iterable[str], context: Any) -> None:
+    unknown = sorted(set(events) - set(_INTEGRATION_EVENTS))
+    if unknown:
+        _abort(
+            context,
+            grpc.StatusCode.INVALID_ARGUMENT,
+            "unknown events: {}".format(", ".join(unknown)),
+        )
+
+
+class CampaignServicer(campaigns_pb2_grpc.CampaignServiceServicer):
+    def __init__(self, state: State):
+        self._state = state
+
+    def ListCampaigns(self, request: Any, context: Any) -> Any:
+        if request.status and request.status not in _CAMPAIGN_STATUSES:
+            _abort(context, grpc.StatusCode.INVALID_ARGUMENT, "invalid status")
+        search = request.search.lower()
+        with self._state.lock:
+            campaigns = [
+                c
+                for c in self._state.campaigns.values()
+                if (not request.status or c.status == request.status)
+                and (not search or search in c.name.lower())
+            ]
+        return campaigns_pb2.ListCampaignsResponse(
+            campaigns=_page(campaigns, request.offset, request.limit or 20),
+            total=len(campaigns),
+        )
+
+    def CreateCampaign(self, request: Any, context: Any) -> Any:
+        state = self._state
+        if not request.name:
+            _abort(context, grpc.StatusCode.INVALID_ARGUMENT, "name is required")
+        if not request.destination_url:
+            _abort(
+                context, grpc.StatusCode.INVALID_ARGUMENT, "destination_url is required"
+            )
+        now = _iso(time.time())
+        with state.lock:
+            campaign = campaigns_pb2.Campaign(
+                id=state.new_id(),
+                user_id="user_fake",
+                name=request.name,
+                description=request.description,
+                destination_url=request.destination_url,
+                pass_recipient_id=request.pass_recipient_id,
+                recipient_param_name=request.recipient_param_name or "rid",
+                status="active",
+                created_at=now,
+                updated_at=now,
+                expires_at=request.expires_at,
+            )
+            state.campaigns[campaign.id] = campaign
+            state.campaign_links[campaign.id] = []
+            return campaign
+
+    def GetCampaign(self, request: Any, context: Any) -> Any:
+        with self._state.lock:
+            return self._get(request.id, context)
+
+    def UpdateCampaign(self, request: Any, context: Any) -> Any:
+        if request.status and request.status not in _CAMPAIGN_STATUSES:
+            _abort(context, grpc.StatusCode.INVALID_ARGUMENT, "invalid status")
+        with self._state.lock:
+            campaign = self._get(request.id, context)
+            # proto3 fields without presence: empty means "unchanged".
+            for name in ("name", "description", "destination_url",
+                         "recipient_param_name", "status", "expires_at"):
+                value = getattr(request, name)
+                if value:
+                    setattr(campaign, name, value)
+            if request.pass_recipient_id:
+                campaign.pass_recipient_id = True
+            campaign.updated_at = _iso(time.time())
+            return campaign
+
+    def DeleteCampaign(self, request: Any, context: Any) -> Any:
+        state = self._state
+        with state.lock:
+            if state.campaigns.pop(request.id, None) is None:
+                _abort(context, grpc.StatusCode.NOT_FOUND, "campaign not found")
+            for link in state.campaign_links.pop(request.id, []):
+                del state.slugs[link.slug]
+                del state.campaign_link_slugs[link.slug]
+                state.clicks.pop(link.id, None)
+        return campaigns_pb2.DeleteCampaignResponse(success=True)
+
+    def GenerateLinks(self, request: Any, context: Any) -> Any:
+        state = self._state
+        if not request.recipients:
+            _abort(context, grpc.StatusCode.INVALID_ARGUMENT, "recipients are required")
+        now = _iso(time.time())
+        with state.lock:
+            campaign = self._get(request.campaign_id, context)
+            links = state.campaign_links[campaign.id]
+            created = []
+            for recipient in request.recipients:
+                slug = state.new_slug(8)
+                link = campaigns_pb2.CampaignLink(
+                    id=state.new_id(),
+                    campaign_id=campaign.id,
+                    slug=slug,
+                    recipient_id=recipient.id,
+                    recipient_name=recipient.name,
+                    recipient_metadata=recipient.metadata,
+                    created_at=now,
+                    short_url=state.short_url(slug),
+                )
+                state.slugs[slug] = link.id
+                state.campaign_link_slugs[slug] = link
+                created.append(link)
+            links.extend(created)
+            campaign.total_recipients += len(created)
+        return campaigns_pb2.GenerateLinksResponse(
+            campaign_id=campaign.id,
+            links_created=len(created),
+            sample_links=created[:10],
+        )
+
+    def ListCampaignLinks(self, request: Any, context: Any) -> Any:
+        search = request.search.lower()
+        kind = "campaign/" + request.campaign_id
+        limit = request.limit or 100
+        with self._state.lock:
+            self._get(request.campaign_id, context)
+            # Campaign links are only ever appended, so their index is a
+            # stable key.
+            links = self._state.campaign_links[request.campaign_id]
+            if request.page_token:
+                after, until = _cursor(request.page_token, kind, context)
+            else:
+                after, until = None, len(links)
+            keys = [
+                (i,)
+                for i in range(until)
+                if (not request.clicked_only or links[i].clicked)
+                and (
+                    not search
+                    or search in links[i].recipient_id.lower()
+                    or search in links[i].recipient_name.lower()
+                )
+            ]
+            start, end, token = _keyset(keys, request.offset, limit, after, until, kind)
+            return campaigns_pb2.ListCampaignLinksResponse(
+                links=[links[key[0]] for key in keys[start:end]],
+                total=len(keys),
+                next_page_token=token,
+            )
+
+    def GetCampaignStats(self, request: Any, context: Any) -> Any:
+        state = self._state
+        with state.lock:
+            campaign = self._get(request.campaign_id, context)
+            clicks = [
+                c
+                for link in state.campaign_links[campaign.id]
+                if link.clicked
+                for c in state.clicks.get(link.id, ())
+            ]
+            stats = campaigns_pb2.CampaignStats(
+                campaign_id=campaign.id,
+                total_recipients=campaign.total_recipients,
+                total_clicks=campaign.total_clicks,
+                unique_clicks=campaign.unique_clicks,
+                click_rate=_percent(campaign.unique_clicks, campaign.total_recipients),
+                clicks_by_platform=_count(c.platform for c in clicks),
+                clicks_by_country=_count(c.country for c in clicks),
+                clicks_by_day=_count(_iso(c.timestamp)[:10] for c in clicks),
+            )
+        return stats
+
+    def ExportLinks(self, request: Any, context: Any) -> Any:
+        if request.format not in ("", "csv", "json"):
+            _abort(
+                context, grpc.StatusCode.INVALID_ARGUMENT, "format must be csv or json"
+            )
+        with self._state.lock:
+            self._get(request.campaign_id, context)
+            return campaigns_pb2.ExportLinksResponse(
+                links=self._state.campaign_links[request.campaign_id]
+            )
+
+    def _get(self, id: str, context: Any) -> Any:
+        campaign = self._state.campaigns.get(id)
+        if campaign is None:
+            _abort(context, grpc.StatusCode.NOT_FOUND, "campaign not found")
+        return campaign
@@ -0,0 +1,184 @@
+"""
+Go2 SDK OpenTelemetry tracing for RPCs.
+
+Uses the optional ``opentelemetry-api`` dependency when it is installed:
+
+    pip install go2-sdk[tracing]
+
+Without it the interceptor passes calls through untouched.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+import grpc
+
+from go2_sdk.calls import _ClientCallDetails, _ObservedStream
+from go2_sdk.metrics import _size
+
+_INSTRUMENTATION_NAME = "go2_sdk"
+
+
+def _opentelemetry() -> Optional[Any]:
+    try:
+        from opentelemetry import propagate, trace
+    except ImportError:
+        return None
+    return propagate, trace
+
+
+class TracingInterceptor(
+    grpc.UnaryUnaryClientInterceptor, grpc.UnaryStreamClientInterceptor
+):
+    """
+    Creates a client span per RPC and propagates trace context in metadata.
+
+    Spans are named after the full method (``links.v1.LinkService/GetLink``)
+    and carry the ``rpc.*`` semantic-convention attributes, the gRPC status
+    code, and serialized request and response sizes. The trace context is
+    injected into the call metadata with the globally configured propagator
+    (W3C ``traceparent`` by default), so server-side spans join the trace.
+
+    Sampling is left to the tracer provider's Sampler. Every call starts a
+    span and injects its context, so a sampling decision made here (or
+    inherited from a parent span) reaches the server; spans the sampler
+    drops skip the size and status work. Without OpenTelemetry installed,
+    calls go straight to the channel.
+
+    A click stream (StreamClicks) gets one span for its whole life, ended
+    when the stream is exhausted, fails or is cancelled; its response size
+    is the sum of the events read.
+
+    Example:
+        client = Go2Client(api_key="go2_xxx", tracing=TracingInterceptor())
+
+    Args:
+        tracer: OpenTelemetry tracer (default: the global provider's "go2_sdk" tracer)
+        record_sizes: Add request and response sizes to spans
+    """
+
+    def __init__(self, tracer: Optional[Any] = None, record_sizes: bool = True):
+        self._record_sizes = record_sizes
+        self._propagate: Any = None
+        self._trace: Any = None
+        self._tracer: Any = None
+        otel = _opentelemetry()
+        if otel is not None:
+            self._propagate, self._trace = otel
+            self._tracer = tracer or self._trace.get_tracer(_INSTRUMENTATION_NAME)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether OpenTelemetry is available."""
+        return self._tracer is not None
+
+    def intercept_unary_unary(
+        self,
+        continuation: Any,
+        client_call_details: grpc.ClientCallDetails,
+        request: Any,
+    ) -> Any:
+        if self._tracer is None:
+            return continuation(client_call_details, request)
+        span, details = self._start(client_call_details, request)
+        if not span.is_recording():
+            # The sampler dropped this span; its context is injected, and
+            # there is nothing to record.
+            return continuation(details, request)
+        outcome = self._call(span, continuation, details, request)
+        outcome.add_done_callback(lambda call: self._done(span, call))
+        return outcome
+
+    def intercept_unary_stream(
+        self,
+        continuation: Any,
+        client_call_details: grpc.ClientCallDetails,
+        request: Any,
+    ) -> Any:
+        if self._tracer is None:
+            return continuation(client_call_details, request)
+        span, details = self._start(client_call_details, request)
+        if not span.is_recording():
+            return continuation(details, request)
+        call = self._call(span, continuation, details, request)
+        received = [0]
+
+        def on_response(response: Any) -> None:
+            if self._record_sizes:
+                received[0] += _size(response)
+
+        def on_done(code: Optional[grpc.StatusCode], message: str) -> None:
+            self._end(span, code, message, received[0])
+
+        return _ObservedStream(call, on_response, on_done)
+
+    def _start(
+        self, client_call_details: grpc.ClientCallDetails, request: Any
+    ) -> Tuple[Any, _ClientCallDetails]:
+        trace = self._trace
+        method = client_call_details.method
+        service, _, name = method.lstrip("/").rpartition("/")
+        span = self._tracer.start_span(
+            method.lstrip("/"),
+            kind=trace.SpanKind.CLIENT,
+            attributes={
+                "rpc.system": "grpc",
+                "rpc.service": service,
+                "rpc.method": name,
+            },
+        )
+        if span.is_recording() and self._record_sizes:
+            span.set_attribute("rpc.request.size", _size(request))
+
+        carrier: Dict[str, str] = {}
+        self._propagate.inject(carrier, context=trace.set_span_in_context(span))
+        metadata = list(client_call_details.metadata or [])
+        metadata.extend(carrier.items())
+        details = _ClientCallDetails(
+            method=method,
+            timeout=client_call_details.timeout,
+            metadata=metadata,
+            credentials=client_call_details.credentials,
+            wait_for_ready=client_call_details.wait_for_ready,
+            compression=client_call_details.compression,
+        )
+        return span, details
+
+    def _call(self, span: Any, continuation: Any, details: Any, request: Any) -> Any:
+        trace = self._trace
+        try:
+            return continuation(details, request)
+        except Exception as e:
+            # Re-raised unchanged; caught broadly only to end the span.
+            span.record_exception(e)
+            span.set_status(trace.Status(trace.StatusCode.ERROR, str(e)))
+            span.end()
+            raise
+
+    def _done(self, span: Any, call: Any) -> None:
+        code = call.code()
+        if code != grpc.StatusCode.OK:
+            self._end(span, code, call.details(), 0)
+        elif self._record_sizes:
+            self._end(span, code, "", _size(call.result()))
+        else:
+            self._end(span, code, "", 0)
+
+    def _end(
+        self,
+        span: Any,
+        code: Optional[grpc.StatusCode],
+        message: Optional[str],
+        response_size: int,
+    ) -> None:
+        trace = self._trace
+        if code is not None:
+            span.set_attribute("rpc.grpc.status_code", code.value[0])
+        if code == grpc.StatusCode.OK:
+            if self._record_sizes:
+                span.set_attribute("rpc.response.size", response_size)
+        else:
+            name = code.name if code is not None else "UNKNOWN"
+            span.set_status(
+                trace.Status(trace.StatusCode.ERROR, "{}: {}".format(name, message))
+            )
+        span.end()
@@ -0,0 +1,426 @@
+"""Go2 SDK adaptive campaign stats watcher."""
+
+from concurrent.futures import CancelledError
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+import asyncio
+import collections
+import heapq
+import itertools
+import threading
+import time
+
+import grpc
+
+from go2_sdk.errors import Go2Error, wrap_error
+
+
+class CampaignDelta:
+    """New clicks for a campaign since its previous poll."""
+
+    __slots__ = (
+        "campaign_id",
+        "new_clicks",
+        "new_unique_clicks",
+        "clicks_by_platform",
+        "clicks_by_country",
+        "clicks_by_day",
+        "stats",
+    )
+
+    def __init__(self, previous: Optional[Any], stats: Any):
+        self.campaign_id: str = stats.campaign_id
+        self.new_clicks: int = stats.total_clicks - (
+            previous.total_clicks if previous else 0
+        )
+        self.new_unique_clicks: int = stats.unique_clicks - (
+            previous.unique_clicks if previous else 0
+        )
+        self.clicks_by_platform = _map_delta(
+            previous.clicks_by_platform if previous else {}, stats.clicks_by_platform
+        )
+        self.clicks_by_country = _map_delta(
+            previous.clicks_by_country if previous else {}, stats.clicks_by_country
+        )
+        self.clicks_by_day = _map_delta(
+            previous.clicks_by_day if previous else {}, stats.clicks_by_day
+        )
+        self.stats = stats
+
+    @property
+    def changed(self) -> bool:
+        return bool(
+            self.new_clicks
+            or self.new_unique_clicks
+            or self.clicks_by_platform
+            or self.clicks_by_country
+            or self.clicks_by_day
+        )
+
+    def __repr__(self) -> str:
+        return "CampaignDelta(campaign_id={!r}, new_clicks={})".format(
+            self.campaign_id, self.new_clicks
+        )
+
+
+class _Budget:
+    """Token bucket shared by every poll."""
+
+    def __init__(self, rate: float, burst: float):
+        self._rate = rate
+        self._burst = burst
+        self._tokens = burst
+        self._last = time.monotonic()
+
+    def wait_time(self) -> float:
+        """Take a token if one is available, else return seconds until one is."""
+        now = time.monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._last) * self._rate)
+        self._last = now
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return 0.0
+        return (1.0 - self._tokens) / self._rate
+
+
+class _State:
+    # ``token`` tells this watch apart from an earlier one of the same
+    # campaign that was removed, whose polls may still be queued.
+    __slots__ = ("interval", "last", "last_delta", "token")
+
+    def __init__(self, interval: float, token: int):
+        self.interval = interval
+        self.last: Optional[Any] = None
+        self.last_delta = 0
+        self.token = token
+
+
+class CampaignWatcher:
+    """
+    Polls GetCampaignStats for many campaigns and emits only changes.
+
+    Each campaign has its own polling interval: it grows by ``backoff``
+    while ``total_clicks`` is flat and halves when the number of new
+    clicks per poll grows, within ``[min_interval, max_interval]``. All
+    polls share a ``max_requests_per_second`` budget and at most
+    ``concurrency`` calls are in flight.
+
+    Changes are delivered as CampaignDelta objects to ``on_change`` (called
+    from a gRPC thread) and to the ``events()``/``aevents()`` iterators.
+    With ``on_change`` set, deltas are only queued for the iterators while
+    one is running. Without it they are queued until read, but at most
+    ``max_pending`` of them; beyond that the oldest are dropped and
+    counted in ``dropped``.
+
+    A poll that fails in any way is passed to ``on_error`` as a Go2Error
+    and retried after backing off, so a campaign is never silently
+    dropped. Exceptions raised by ``on_change`` or ``on_error`` do not
+    stop the watcher; they are counted in ``callback_errors`` and the
+    latest is kept in ``callback_error``.
+
+    Example:
+        with Go2Client(api_key="go2_xxx") as client:
+            watcher = CampaignWatcher(client.campaigns, campaign_ids,
+                                      max_requests_per_second=5)
+            watcher.start()
+            for delta in watcher.events():
+                print(delta.campaign_id, delta.new_clicks, delta.clicks_by_country)
+
+    Args:
+        campaigns: CampaignsService to poll
+        campaign_ids: Campaigns to watch; more can be added with ``add``
+        on_change: Callback for each CampaignDelta
+        on_error: Callback for failed polls, with the campaign ID and error
+        initial_interval: Seconds between the first polls of a campaign
+        min_interval: Shortest interval when clicks surge
+        max_interval: Longest interval when nothing changes
+        backoff: Interval multiplier for polls without new clicks or with errors
+        max_requests_per_second: Global polling budget
+        concurrency: Maximum polls in flight
+        emit_initial: Emit each campaign's first snapshot as a delta from zero
+        max_pending: Most deltas queued for ``events()``/``aevents()``
+    """
+
+    def __init__(
+        self,
+        campaigns: Any,
+        campaign_ids: Iterable[str] = (),
+        on_change: Optional[Callable[[CampaignDelta], None]] = None,
+        on_error: Optional[Callable[[str, Go2Error], None]] = None,
+        initial_interval: float = 5.0,
+        min_interval: float = 1.0,
+        max_interval: float = 60.0,
+        backoff: float = 1.5,
+        max_requests_per_second: float = 10.0,
+        concurrency: int = 8,
+        emit_initial: bool = False,
+        max_pending: int = 1000,
+    ):
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+        self._stub = campaigns._stub
+        self._on_change = on_change
+        self._on_error = on_error
+        self._initial_interval = initial_interval
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._backoff = backoff
+        self._emit_initial = emit_initial
+        self._budget = _Budget(
+            max_requests_per_second, max(1.0, max_requests_per_second)
+        )
+        self._slots = threading.Semaphore(concurrency)
+
+        self._cond = threading.Condition()
+        self._states: Dict[str, _State] = {}
+        self._tokens = itertools.count()
+        # (due time, campaign ID, token of the watch that scheduled it)
+        self._due: List[Tuple[float, str, int]] = []
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self._events_cond = threading.Condition()
+        self._events: Deque[CampaignDelta] = collections.deque()
+        self._max_pending = max_pending
+        self._consumers = 0
+        self._closed = False
+        self.dropped = 0
+        self.callback_errors = 0
+        self.callback_error: Optional[BaseException] = None
+
+        for campaign_id in campaign_ids:
+            self.add(campaign_id)
+
+    def add(self, campaign_id: str) -> None:
+        """Start watching a campaign; it is polled immediately."""
+        with self._cond:
+            if campaign_id in self._states:
+                return
+            state = _State(self._initial_interval, next(self._tokens))
+            self._states[campaign_id] = state
+            heapq.heappush(self._due, (time.monotonic(), campaign_id, state.token))
+            self._cond.notify()
+
+    def remove(self, campaign_id: str) -> None:
+        """Stop watching a campaign."""
+        with self._cond:
+            self._states.pop(campaign_id, None)
+
+    def interval(self, campaign_id: str) -> float:
+        """Return a campaign's current polling interval in seconds."""
+        with self._cond:
+            return self._states[campaign_id].interval
+
+    def start(self) -> None:
+        """Start polling in a background thread."""
+        if self._thread is not None:
+            return
+        self._reopen()
+        self._thread = threading.Thread(
+            target=self._run, name="go2-campaign-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop polling and end the event iterators."""
+        self._stopped.set()
+        with self._cond:
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        with self._events_cond:
+            self._closed = True
+            self._events_cond.notify_all()
+
+    def run(self, duration: Optional[float] = None) -> None:
+        """Poll in the calling thread until ``stop()`` or for ``duration`` seconds."""
+        self._reopen()
+        if duration is not None:
+            timer = threading.Timer(duration, self.stop)
+            timer.daemon = True
+            timer.start()
+        self._run()
+
+    def events(self, timeout: Optional[float] = None) -> Iterator[CampaignDelta]:
+        """Yield deltas until the watcher stops (or ``timeout`` passes without one)."""
+        self._attach(1)
+        try:
+            while True:
+                delta = self._next_event(timeout)
+                if delta is None:
+                    return
+                yield delta
+        finally:
+            self._attach(-1)
+
+    async def aevents(self) -> AsyncIterator[CampaignDelta]:
+        """Async variant of ``events()``."""
+        loop = asyncio.get_running_loop()
+        self._attach(1)
+        try:
+            while True:
+                delta = await loop.run_in_executor(None, self._next_event, None)
+                if delta is None:
+                    return
+                yield delta
+        finally:
+            self._attach(-1)
+
+    def __enter__(self) -> "CampaignWatcher":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.stop()
+
+    def _reopen(self) -> None:
+        self._stopped.clear()
+        with self._events_cond:
+            self._closed = False
+
+    def _attach(self, consumers: int) -> None:
+        with self._events_cond:
+            self._consumers += consumers
+
+    def _next_event(self, timeout: Optional[float]) -> Optional[CampaignDelta]:
+        """Take the oldest queued delta; None once stopped or after ``timeout``."""
+        with self._events_cond:
+            self._events_cond.wait_for(lambda: self._events or self._closed, timeout)
+            return self._events.popleft() if self._events else None
+
+    def _emit(self, delta: CampaignDelta) -> None:
+        with self._events_cond:
+            if self._on_change is None or self._consumers:
+                if len(self._events) >= self._max_pending:
+                    self._events.popleft()
+                    self.dropped += 1
+                self._events.append(delta)
+                self._events_cond.notify()
+        if self._on_change is not None:
+            try:
+                self._on_change(delta)
+            except Exception as e:  # noqa: BLE001
+                # User code on the polling threads must not stop the watcher.
+                self._callback_failed(e)
+
+    def _run(self) -> None:
+        from go2_sdk.gen.campaigns.v1 import campaigns_pb2
+
+        while not self._stopped.is_set():
+            with self._cond:
+                if not self._due:
+                    self._cond.wait(timeout=1.0)
+                    continue
+                due, campaign_id, token = self._due[0]
+                delay = due - time.monotonic()
+                if delay > 0:
+                    self._cond.wait(timeout=delay)
+                    continue
+                heapq.heappop(self._due)
+                state = self._states.get(campaign_id)
+                if state is None or state.token != token:
+                    continue
+                wait = self._budget.wait_time()
+                if wait > 0:
+                    retry_at = time.monotonic() + wait
+                    heapq.heappush(self._due, (retry_at, campaign_id, token))
+                    continue
+
+            self._slots.acquire()
+            request = campaigns_pb2.GetCampaignStatsRequest(campaign_id=campaign_id)
+            try:
+                future = self._stub.GetCampaignStats.future(request)
+            except Exception as e:  # noqa: BLE001
+                # Not only RpcError: a closed channel raises ValueError, and
+                # this thread must survive it to keep the other campaigns.
+                self._slots.release()
+                self._handle_error(campaign_id, token, _as_go2_error(e))
+                continue
+            future.add_done_callback(
+                lambda f, c=campaign_id, t=token: self._done(c, t, f)
+            )
+
+    def _done(self, campaign_id: str, token: int, future: Any) -> None:
+        self._slots.release()
+        try:
+            stats = future.result()
+        except Exception as e:  # noqa: BLE001
+            # Includes FutureCancelledError; the campaign must be rescheduled
+            # whatever ended the poll, or it would stop being watched.
+            self._handle_error(campaign_id, token, _as_go2_error(e))
+            return
+
+        with self._cond:
+            state = self._states.get(campaign_id)
+            if state is None or state.token != token:
+                return
+            previous = state.last
+            state.last = stats
+            delta = CampaignDelta(previous, stats)
+            self._adapt(state, delta.new_clicks if previous is not None else 0)
+            self._schedule(campaign_id, state)
+
+        if (previous is not None or self._emit_initial) and delta.changed:
+            self._emit(delta)
+
+    def _handle_error(self, campaign_id: str, token: int, error: Go2Error) -> None:
+        with self._cond:
+            state = self._states.get(campaign_id)
+            if state is None or state.token != token:
+                return
+            state.interval = min(self._max_interval, state.interval * self._backoff)
+            self._schedule(campaign_id, state)
+        if self._on_error is not None:
+            try:
+                self._on_error(campaign_id, error)
+            except Exception as e:  # noqa: BLE001
+                # See _emit.
+                self._callback_failed(e)
+
+    def _callback_failed(self, error: Exception) -> None:
+        with self._events_cond:
+            self.callback_errors += 1
+            self.callback_error = error
+
+    def _adapt(self, state: _State, new_clicks: int) -> None:
+        if new_clicks <= 0:
+            state.interval = min(self._max_interval, state.interval * self._backoff)
+        elif new_clicks > state.last_delta:
+            state.interval = max(self._min_interval, state.interval / 2)
+        state.last_delta = max(new_clicks, 0)
+
+    def _schedule(self, campaign_id: str, state: _State) -> None:
+        heapq.heappush(
+            self._due, (time.monotonic() + state.interval, campaign_id, state.token)
+        )
+        self._cond.notify()
+
+
+def _as_go2_error(error: Exception) -> Go2Error:
+    """The Go2Error to report for whatever ended a poll."""
+    if isinstance(error, Go2Error):
+        return error
+    if isinstance(error, (grpc.FutureCancelledError, CancelledError)):
+        return Go2Error("call was cancelled", grpc.StatusCode.CANCELLED)
+    return wrap_error(error)
+
+
+def _map_delta(before: Mapping[str, int], after: Mapping[str, int]) -> Dict[str, int]:
+    delta = {}
+    for key, count in after.items():
+        change = count - before.get(key, 0)
+        if change:
+            delta[key] = change
+    return delta
@@ -0,0 +1,37 @@
+from typing import Any, Iterator
+
+import pytest
+
+from go2_sdk.testing import FakeGo2Server
+
+
+@pytest.fixture
+def server() -> Iterator[FakeGo2Server]:
+    with FakeGo2Server(seed=1) as server:
+        yield server
+
+
+@pytest.fixture
+def client(server: FakeGo2Server) -> Iterator[Any]:
+    client = server.client()
+    yield client
+    client.close()
+
+
+class FakeClock:
+    """A clock that only moves when told to."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
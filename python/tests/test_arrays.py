@@ -0,0 +1,118 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from go2_sdk.arrays import (
+    align,
+    campaign_stats_to_numpy,
+    parse_dates,
+    stats_to_numpy,
+    timeseries_columns_to_numpy,
+    timeseries_to_numpy,
+)
+from go2_sdk.columnar import StatsColumns, TimeseriesColumns, _compact_points
+from go2_sdk.gen.analytics.v1 import analytics_pb2
+from go2_sdk.gen.campaigns.v1 import campaigns_pb2
+
+
+def series(*points):
+    return analytics_pb2.GetTimeseriesResponse(
+        points=[
+            analytics_pb2.TimeseriesPoint(date=d, clicks=c, unique_clicks=c // 2)
+            for d, c in points
+        ]
+    )
+
+
+def test_parse_dates_truncates_timestamps():
+    dates = parse_dates(["2024-01-01", "2024-01-02T10:00:00Z"])
+    assert dates.dtype == np.dtype("datetime64[D]")
+    assert list(dates.astype(str)) == ["2024-01-01", "2024-01-02"]
+
+
+def test_timeseries_to_numpy():
+    arrays = timeseries_to_numpy(series(("2024-01-01", 4), ("2024-01-02", 6)))
+    assert arrays["clicks"].dtype == np.int64
+    assert list(arrays["clicks"]) == [4, 6]
+    assert list(arrays["unique_clicks"]) == [2, 3]
+
+
+def test_stats_to_numpy_shares_memory():
+    stats = StatsColumns(["a", "b"])
+    stats._set(1, analytics_pb2.GetStatsResponse(total_clicks=9))
+    arrays = stats_to_numpy(stats)
+    assert list(arrays["link_id"]) == ["a", "b"]
+    assert list(arrays["total_clicks"]) == [0, 9]
+    stats.total_clicks[0] = 5
+    assert arrays["total_clicks"][0] == 5
+
+
+def test_timeseries_columns_link_index():
+    columns = TimeseriesColumns()
+    columns._append("a", _compact_points(series(("2024-01-01", 1)).points))
+    columns._append(
+        "b", _compact_points(series(("2024-01-01", 2), ("2024-01-02", 3)).points)
+    )
+    arrays = timeseries_columns_to_numpy(columns)
+    assert list(arrays["link_index"]) == [0, 1, 1]
+    assert list(np.bincount(arrays["link_index"], weights=arrays["clicks"])) == [1, 5]
+
+
+def test_campaign_stats_sorted():
+    stats = campaigns_pb2.CampaignStats(
+        clicks_by_day={"2024-01-02": 3, "2024-01-01": 1},
+        clicks_by_platform={"web": 1, "ios": 5},
+        clicks_by_country={"GE": 2, "US": 7},
+    )
+    arrays = campaign_stats_to_numpy(stats)
+    assert list(arrays["date"].astype(str)) == ["2024-01-01", "2024-01-02"]
+    assert list(arrays["clicks_by_day"]) == [1, 3]
+    assert list(arrays["platform"]) == ["ios", "web"]
+    assert list(arrays["country"]) == ["US", "GE"]
+
+
+def test_align_fills_gaps_with_zero():
+    aligned = align(
+        {
+            "a": series(("2024-01-01", 1), ("2024-01-03", 3)),
+            "b": series(("2024-01-02", 2)),
+        }
+    )
+    assert list(aligned.dates.astype(str)) == ["2024-01-01", "2024-01-02", "2024-01-03"]
+    assert aligned.keys == ["a", "b"]
+    assert aligned.values.tolist() == [[1, 0, 3], [0, 2, 0]]
+
+
+def test_align_clips_to_range_and_mixes_campaign_stats():
+    stats = campaigns_pb2.CampaignStats(clicks_by_day={"2024-01-02": 4, "2024-01-09": 1})
+    aligned = align(
+        {"link": series(("2024-01-01", 1), ("2024-01-02", 2)), "campaign": stats},
+        start="2024-01-02",
+        end="2024-01-03",
+    )
+    assert aligned.values.tolist() == [[2, 0], [4, 0]]
+
+
+def test_align_unique_clicks_from_columns():
+    columns = TimeseriesColumns()
+    columns._append("a", _compact_points(series(("2024-01-01", 4)).points))
+    columns._append("b", _compact_points(series(("2024-01-02", 8)).points))
+    aligned = align(columns, field="unique_clicks")
+    assert aligned.values.tolist() == [[2, 0], [0, 4]]
+
+
+def test_align_empty():
+    aligned = align({"a": series()})
+    assert aligned.values.shape == (1, 0)
+    assert len(aligned.dates) == 0
+
+
+def test_align_live_timeseries(server, client):
+    ids = []
+    for slug in ("a", "b"):
+        ids.append(client.links.create(slug=slug, web_url="https://example.ge").id)
+        server.seed_clicks(slug, 40, days=5)
+    columns = client.analytics.get_timeseries_many(ids, period="7d")
+    aligned = align(columns)
+    assert aligned.values.shape == (2, 7)
+    assert aligned.values.sum() == 80
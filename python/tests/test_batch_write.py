@@ -0,0 +1,84 @@
+import grpc
+import pytest
+
+from go2_sdk import Go2Error, NotFoundError, ValidationError
+from go2_sdk.client import BATCH_WRITE_LIMIT, _chunks
+from go2_sdk.gen.links.v1 import links_pb2
+from go2_sdk.testing import Faults
+
+
+def items(n, start=0):
+    return [
+        {"slug": f"s{i}", "web_url": f"https://example.ge/{i}"}
+        for i in range(start, start + n)
+    ]
+
+
+def test_results_are_in_order(server, client):
+    links = client.links.batch_create(items(5))
+    assert [link.slug for link in links] == ["s0", "s1", "s2", "s3", "s4"]
+    assert all(client.links.get(link.id) == link for link in links)
+    assert server.calls["BatchCreateLinks"] == 1
+
+
+def test_items_fail_on_their_own(client):
+    client.links.create(slug="taken", web_url="https://example.ge")
+    first, taken, no_url = client.links.batch_create([
+        items(1)[0],
+        {"slug": "taken", "web_url": "https://example.ge"},
+        links_pb2.CreateLinkRequest(slug="empty"),
+    ])
+    assert first.slug == "s0"
+    assert isinstance(taken, Go2Error)
+    assert taken.code == grpc.StatusCode.ALREADY_EXISTS
+    assert isinstance(no_url, ValidationError)
+
+
+def test_chunks_by_count(server, client):
+    links = client.links.batch_create(items(7), max_batch=3, concurrency=2)
+    assert [link.slug for link in links] == [f"s{i}" for i in range(7)]
+    assert server.calls["BatchCreateLinks"] == 3
+
+
+def test_chunks_by_size():
+    requests = [links_pb2.CreateLinkRequest(**item) for item in items(10)]
+    size = requests[0].ByteSize() + 6
+    chunks = list(_chunks(requests, 500, size * 4))
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+    assert [r for chunk in chunks for r in chunk] == requests
+    assert [len(chunk) for chunk in _chunks(requests[:3], 500, 1)] == [1, 1, 1]
+
+
+def test_failed_calls_fail_their_chunk(server, client):
+    server.set_faults(Faults(error_rate=1.0), method="BatchCreateLinks")
+    results = client.links.batch_create(items(4), max_batch=2)
+    assert all(isinstance(result, Go2Error) for result in results)
+    assert results[0] is results[1]
+    assert results[1] is not results[2]
+    assert server.state.links == {}
+
+
+def test_batch_update(client):
+    a, b = client.links.batch_create(items(2))
+    updated, missing, renamed = client.links.batch_update([
+        {"id": a.id, "title": "A", "is_active": None},
+        {"id": "missing", "title": "B"},
+        links_pb2.UpdateLinkRequest(id=b.id, slug="b2"),
+    ])
+    assert updated.title == "A"
+    assert updated.is_active
+    assert isinstance(missing, NotFoundError)
+    assert renamed.slug == "b2"
+    assert client.links.get(b.id).slug == "b2"
+
+
+def test_max_batch_is_checked(client):
+    with pytest.raises(ValueError):
+        client.links.batch_create(items(1), max_batch=BATCH_WRITE_LIMIT + 1)
+    with pytest.raises(ValueError):
+        client.links.batch_update([], max_batch=0)
+
+
+def test_empty_input_makes_no_calls(server, client):
+    assert client.links.batch_create([]) == []
+    assert "BatchCreateLinks" not in server.calls
@@ -0,0 +1,89 @@
+import pytest
+
+from go2_sdk import Go2Error, LinkLoader, NotFoundError
+from go2_sdk.client import BATCH_GET_LIMIT
+from go2_sdk.testing import Faults
+
+
+@pytest.fixture
+def links(client):
+    return [
+        client.links.create(slug=f"s{i}", web_url="https://example.ge") for i in range(5)
+    ]
+
+
+def test_lookups_share_one_call(server, client, links):
+    with LinkLoader(client.links, window=10) as loader:
+        futures = loader.load_many([link.id for link in links])
+        loader.flush()
+        assert [f.result(timeout=5) for f in futures] == links
+    assert server.calls["BatchGetLinks"] == 1
+    assert (loader.loads, loader.batches) == (5, 1)
+
+
+def test_duplicates_are_fetched_once(server, client, links):
+    with LinkLoader(client.links, window=10) as loader:
+        first, second = loader.load_many([links[0].id, links[0].id])
+        loader.flush()
+        assert first.result(timeout=5) is second.result(timeout=5)
+    assert (loader.loads, loader.batches) == (2, 1)
+    assert server.calls["BatchGetLinks"] == 1
+
+
+def test_full_batches_go_out_without_waiting(server, client, links):
+    with LinkLoader(client.links, max_batch=2, window=10) as loader:
+        futures = loader.load_many([link.id for link in links[:4]])
+        assert [f.result(timeout=5) for f in futures] == links[:4]
+        assert loader.batches == 2
+
+
+def test_missing_links_fail_alone(client, links):
+    with LinkLoader(client.links) as loader:
+        found, missing = loader.load_many([links[0].id, "missing"])
+        assert found.result(timeout=5) == links[0]
+        with pytest.raises(NotFoundError):
+            missing.result(timeout=5)
+        with pytest.raises(NotFoundError):
+            loader.get("missing", timeout=5)
+
+
+def test_failed_batches_fail_every_waiter(server, client, links):
+    server.set_faults(Faults(error_rate=1.0), method="BatchGetLinks")
+    with LinkLoader(client.links) as loader:
+        futures = loader.load_many([link.id for link in links])
+        errors = [f.exception(timeout=5) for f in futures]
+    assert all(isinstance(e, Go2Error) for e in errors)
+    assert len({id(e) for e in errors}) == 1
+
+
+class ClosedLinks:
+    """A LinksService whose channel has been closed."""
+
+    def batch_get(self, ids, wait=True):
+        raise ValueError("Cannot invoke RPC on closed channel!")
+
+
+def test_calls_that_cannot_start_fail_the_waiters():
+    with LinkLoader(ClosedLinks()) as loader:
+        with pytest.raises(Go2Error, match="closed channel"):
+            loader.get("a", timeout=5)
+        with pytest.raises(Go2Error, match="closed channel"):
+            loader.get("b", timeout=5)
+
+
+def test_close_sends_the_queue_and_refuses_more(client, links):
+    loader = LinkLoader(client.links, window=10)
+    future = loader.load(links[0].id)
+    loader.close()
+    assert future.result(timeout=0) == links[0]
+    with pytest.raises(RuntimeError):
+        loader.load(links[0].id)
+
+
+def test_arguments_are_checked(client):
+    with pytest.raises(ValueError):
+        LinkLoader(client.links, max_batch=BATCH_GET_LIMIT + 1)
+    with pytest.raises(ValueError):
+        LinkLoader(client.links, max_batch=0)
+    with pytest.raises(ValueError):
+        LinkLoader(client.links, window=-1)
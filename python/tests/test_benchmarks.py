@@ -0,0 +1,69 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.common import percentile
+from benchmarks.compare import flatten
+
+
+def run(module, *args):
+    return subprocess.run(
+        [sys.executable, "-m", "benchmarks." + module, *args],
+        check=True, capture_output=True, text=True, timeout=120, cwd=ROOT,
+    ).stdout
+
+
+@pytest.fixture(scope="module")
+def suite_result(tmp_path_factory):
+    path = tmp_path_factory.mktemp("bench") / "suite.json"
+    run(
+        "suite", "--transport", "inprocess", "--threads", "1,2", "--seconds", "0.05",
+        "--recipients", "200", "--chunk", "100", "--links", "30", "--export-links", "30",
+        "--calls", "20", "--output", str(path),
+    )
+    return path
+
+
+def test_suite_covers_every_benchmark(suite_result):
+    result = json.loads(suite_result.read_text())
+    for name in ("unary", "generate", "pagination", "export", "startup", "interceptors"):
+        assert result[name], name
+    assert [run["threads"] for run in result["unary"]] == [1, 2]
+    assert all(run["calls_per_second"] > 0 for run in result["unary"])
+
+
+def test_only_runs_the_named_benchmarks(tmp_path):
+    path = tmp_path / "startup.json"
+    run("suite", "--only", "startup", "--output", str(path))
+    result = json.loads(path.read_text())
+    assert "startup" in result
+    assert "unary" not in result
+
+
+def test_compare_reports_ratios(suite_result):
+    output = run("compare", str(suite_result), str(suite_result))
+    lines = output.splitlines()
+    assert lines[0].split() == ["metric", "old", "new", "ratio"]
+    assert any(line.startswith("unary[1].calls_per_second") for line in lines)
+    assert all(line.split()[-1] in ("1.00", "nan") for line in lines[1:])
+
+
+def test_flatten_labels_list_entries():
+    flat = flatten(
+        {"unary": [{"threads": 4, "p99_ms": 2.5}], "ok": True, "name": "x", "n": 3}
+    )
+    assert flat == {"unary[4].threads": 4.0, "unary[4].p99_ms": 2.5, "n": 3.0}
+
+
+def test_percentile_nearest_rank():
+    values = [1.0, 2.0, 3.0, 4.0]
+    assert percentile(values, 0.5) == 2.0
+    assert percentile(values, 0.99) == 4.0
+    assert percentile(values, 0.0) == 1.0
+    assert percentile([], 0.5) == 0.0
@@ -0,0 +1,172 @@
+import time
+
+import pytest
+from conftest import FakeClock
+
+from go2_sdk import AnalyticsCache, NotFoundError
+from go2_sdk import cache as cache_module
+from go2_sdk.testing import Faults
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(cache_module, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def cache():
+    cache = AnalyticsCache(refresh_workers=1)
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def cached(server, cache):
+    client = server.client(analytics_cache=cache)
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def link(server, cached):
+    link = cached.links.create(slug="promo", web_url="https://example.ge")
+    server.seed_clicks("promo", 200)
+    return link
+
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def test_ttl_scales_with_period():
+    cache = AnalyticsCache(ttls={"7d": 30.0})
+    assert cache.ttl_for("7d") == 30.0
+    assert cache.ttl_for("30d") == 300.0
+    assert cache.ttl_for("90d") == 900.0
+    assert cache.ttl_for("14d") == 140.0
+    assert cache.ttl_for("2w") == 140.0
+    assert cache.ttl_for("all") == 300.0
+    cache.close()
+
+
+def test_fresh_entry_is_served_without_a_call(server, cached, link, clock):
+    first = cached.analytics.get_stats(link.id, period="7d")
+    clock.advance(59)
+    second = cached.analytics.get_stats(link.id, period="7d")
+    assert second == first
+    assert server.calls["GetStats"] == 1
+
+
+def test_periods_are_cached_separately(server, cached, link, clock):
+    cached.analytics.get_stats(link.id, period="7d")
+    cached.analytics.get_stats(link.id, period="30d")
+    assert server.calls["GetStats"] == 2
+
+
+def test_stale_entry_is_served_and_refreshed_in_background(server, cached, link, clock):
+    before = cached.analytics.get_stats(link.id, period="7d")
+    server.click("promo")
+    clock.advance(61)
+    stale = cached.analytics.get_stats(link.id, period="7d")
+    assert stale.total_clicks == before.total_clicks
+    wait_for(lambda: server.calls["GetStats"] == 2)
+    wait_for(
+        lambda: cached.analytics.get_stats(link.id, period="7d").total_clicks
+        == before.total_clicks + 1
+    )
+    assert server.calls["GetStats"] == 2
+
+
+def test_expired_entry_is_fetched_again(server, cached, link, clock):
+    cached.analytics.get_stats(link.id, period="7d")
+    clock.advance(121)
+    cached.analytics.get_stats(link.id, period="7d")
+    assert server.calls["GetStats"] == 2
+
+
+def test_closed_cache_fetches_stale_entries_inline(server, cache, cached, link, clock):
+    before = cached.analytics.get_stats(link.id, period="7d")
+    cache.close()
+    assert cached.analytics.get_stats(link.id, period="7d") == before
+    server.click("promo")
+    clock.advance(61)
+    fetched = cached.analytics.get_stats(link.id, period="7d", wait=False).result()
+    assert fetched.total_clicks == before.total_clicks + 1
+    assert server.calls["GetStats"] == 2
+    assert cached.analytics.get_stats(link.id, period="7d") == fetched
+
+
+def test_failed_refresh_keeps_the_stale_entry(server, cached, link, clock):
+    before = cached.analytics.get_stats(link.id, period="7d")
+    server.set_faults(Faults(error_rate=1.0), method="GetStats")
+    clock.advance(61)
+    assert cached.analytics.get_stats(link.id, period="7d") == before
+    wait_for(lambda: server.calls["GetStats"] == 2)
+    wait_for(lambda: not cached.analytics._cache._refreshing)
+    assert cached.analytics.get_stats(link.id, period="7d") == before
+
+
+def test_larger_limit_answers_smaller_limit(server, cached, link, clock):
+    wide = cached.analytics.get_countries(link.id, period="30d", limit=5)
+    narrow = cached.analytics.get_countries(link.id, period="30d", limit=3)
+    assert server.calls["GetCountries"] == 1
+    assert list(narrow.countries) == list(wide.countries[:3])
+
+
+def test_smaller_limit_does_not_answer_larger_limit(server, cached, link, clock):
+    cached.analytics.get_countries(link.id, period="30d", limit=3)
+    wide = cached.analytics.get_countries(link.id, period="30d", limit=5)
+    assert server.calls["GetCountries"] == 2
+    assert len(wide.countries) == 5
+    # The wider answer replaces the narrower one and serves both limits.
+    cached.analytics.get_countries(link.id, period="30d", limit=3)
+    assert server.calls["GetCountries"] == 2
+
+
+def test_short_answer_covers_any_larger_limit(server, cached, link, clock):
+    # The fake server only knows seven countries.
+    cached.analytics.get_countries(link.id, period="30d", limit=10)
+    response = cached.analytics.get_countries(link.id, period="30d", limit=50)
+    assert server.calls["GetCountries"] == 1
+    assert len(response.countries) == 7
+
+
+def test_errors_are_not_cached(server, cached, clock):
+    for _ in range(2):
+        with pytest.raises(NotFoundError):
+            cached.analytics.get_stats("missing", period="7d")
+    assert server.calls["GetStats"] == 2
+
+
+def test_invalidate_one_link(server, cached, link, clock):
+    other = cached.links.create(slug="other", web_url="https://example.ge/other")
+    cached.analytics.get_stats(link.id, period="7d")
+    cached.analytics.get_stats(other.id, period="7d")
+    cached.analytics._cache.invalidate(link.id)
+    cached.analytics.get_stats(link.id, period="7d")
+    cached.analytics.get_stats(other.id, period="7d")
+    assert server.calls["GetStats"] == 3
+
+
+def test_least_recently_used_entries_are_evicted(clock):
+    cache = AnalyticsCache(max_entries=2)
+    fetched = []
+
+    def fetch(link_id):
+        return lambda limit: fetched.append(link_id) or link_id
+
+    for link_id in ("a", "b", "a", "c", "a", "b"):
+        cache.get_or_fetch("GetStats", link_id, "7d", fetch(link_id))
+    assert fetched == ["a", "b", "c", "b"]
+    assert len(cache) == 2
+    cache.close()
+
+
+def test_max_entries_must_be_positive():
+    with pytest.raises(ValueError):
+        AnalyticsCache(max_entries=0)
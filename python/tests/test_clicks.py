@@ -0,0 +1,174 @@
+import threading
+import time
+
+import pytest
+from conftest import FakeClock
+
+from go2_sdk import ClickAggregator, ValidationError
+from go2_sdk.gen.analytics.v1 import analytics_pb2
+
+
+class Collector:
+    """An on_event callback that lets a test wait for events."""
+
+    def __init__(self):
+        self.events = []
+        self._cond = threading.Condition()
+
+    def __call__(self, event):
+        with self._cond:
+            self.events.append(event)
+            self._cond.notify_all()
+
+    def wait_for(self, count, timeout=5.0):
+        with self._cond:
+            assert self._cond.wait_for(lambda: len(self.events) >= count, timeout)
+        return self.events
+
+
+@pytest.fixture
+def links(client):
+    return [
+        client.links.create(slug=f"s{i}", web_url="https://example.ge") for i in range(2)
+    ]
+
+
+@pytest.fixture(params=[True, False], ids=["in_process", "network"])
+def analytics(request, server):
+    client = server.client(in_process=request.param)
+    yield client.analytics
+    client.close()
+
+
+def test_events_arrive_as_clicks_happen(server, analytics, links):
+    collector = Collector()
+    with analytics.stream_clicks(resume_after="0") as stream:
+        stream.run(collector)
+        server.click("s0", platform="ios", country="US", referrer="x.com")
+        server.click("s1")
+        first, second = collector.wait_for(2)
+    assert (first.link_id, first.platform, first.country, first.referrer) == (
+        links[0].id, "ios", "US", "x.com",
+    )
+    assert second.link_id == links[1].id
+    assert stream.resume_after == second.event_id
+    assert stream.events == 2
+    assert stream.error is None
+
+
+def test_only_the_given_links(server, analytics, links):
+    collector = Collector()
+    with analytics.stream_clicks([links[1].id], resume_after="0") as stream:
+        stream.run(collector)
+        server.click("s0")
+        server.click("s1")
+        server.click("s1")
+        events = collector.wait_for(2)
+    assert {event.link_id for event in events} == {links[1].id}
+
+
+def test_reconnects_resume_without_gaps(server, analytics, links):
+    collector = Collector()
+    with analytics.stream_clicks(resume_after="0") as stream:
+        stream.run(collector)
+        server.click("s0")
+        collector.wait_for(1)
+        server.reset_streams()
+        server.click("s0")
+        server.click("s1")
+        events = collector.wait_for(3)
+        assert stream.reconnects >= 1
+    assert [event.event_id for event in events] == ["1", "2", "3"]
+
+
+def test_resume_after_moves_once_the_next_event_is_requested(server, client, links):
+    server.click("s0")
+    server.click("s1")
+    stream = client.analytics.stream_clicks(resume_after="0")
+    events = iter(stream)
+    assert next(events).event_id == "1"
+    assert stream.resume_after == "0"
+    next(events)
+    assert stream.resume_after == "1"
+    stream.close()
+
+
+def test_resume_after_a_saved_event(server, client, links):
+    for _ in range(3):
+        server.click("s0")
+    stream = client.analytics.stream_clicks(resume_after="1")
+    events = iter(stream)
+    assert [next(events).event_id, next(events).event_id] == ["2", "3"]
+    stream.close()
+
+
+def test_errors_end_the_stream(client):
+    stream = client.analytics.stream_clicks(resume_after="bogus")
+    with pytest.raises(ValidationError):
+        next(iter(stream))
+    stream = client.analytics.stream_clicks(resume_after="bogus")
+    stream.run(lambda event: None).join(5)
+    assert isinstance(stream.error, ValidationError)
+    with pytest.raises(RuntimeError):
+        stream.run(lambda event: None)
+
+
+def test_close_stops_an_idle_stream(client):
+    stream = client.analytics.stream_clicks()
+    thread = stream.run(lambda event: None)
+    time.sleep(0.05)
+    stream.close()
+    assert not thread.is_alive()
+
+
+def event(link_id, at, platform="web", country="GE", referrer=""):
+    message = analytics_pb2.ClickEvent(
+        link_id=link_id, platform=platform, country=country, referrer=referrer
+    )
+    message.timestamp.FromNanoseconds(int(at * 1e9))
+    return message
+
+
+def test_aggregator_counts_within_the_window():
+    clock = FakeClock(1000.0)
+    clicks = ClickAggregator(window=10, bucket=1, clock=clock)
+    clicks.add(event("a", 995.5, platform="ios", country="US"))
+    clicks.add(event("a", 999.2))
+    clicks.add(event("b", 999.9))
+    assert clicks.total() == 3
+    assert clicks.total("a") == 2
+    assert clicks.total("missing") == 0
+    counts = clicks.counts("a")
+    assert counts.platforms == {"ios": 1, "web": 1}
+    assert counts.countries == {"US": 1, "GE": 1}
+    assert counts.referrers == {"": 2}
+    assert clicks.top_links(1) == [("a", 2)]
+
+
+def test_aggregator_drops_old_buckets():
+    clock = FakeClock(1000.0)
+    clicks = ClickAggregator(window=10, bucket=1, clock=clock)
+    clicks.add(event("a", 995.5, platform="ios"))
+    clicks.add(event("a", 999.2))
+    clock.advance(5)
+    assert clicks.total("a") == 1
+    assert clicks.counts("a").platforms == {"web": 1}
+    clock.advance(5)
+    assert clicks.total() == 0
+    assert clicks.top_links() == []
+    clicks.add(event("a", 995.0))
+    assert clicks.total() == 0
+
+
+def test_counts_are_copies():
+    clicks = ClickAggregator(clock=FakeClock(1000.0))
+    clicks.add(event("a", 999.0))
+    clicks.counts("a").platforms["web"] = 100
+    assert clicks.counts("a").platforms == {"web": 1}
+
+
+def test_aggregator_arguments_are_checked():
+    with pytest.raises(ValueError):
+        ClickAggregator(window=1, bucket=2)
+    with pytest.raises(ValueError):
+        ClickAggregator(bucket=0)
@@ -0,0 +1,145 @@
+import threading
+from concurrent.futures import Future
+
+import pytest
+
+from go2_sdk import Go2Error, NotFoundError
+from go2_sdk.columnar import STATS_FIELDS
+from go2_sdk.concurrency import fan_out
+
+
+@pytest.fixture
+def link_ids(server, client):
+    ids = []
+    for i in range(12):
+        ids.append(client.links.create(slug=f"s{i}", web_url="https://example.ge").id)
+        server.seed_clicks(f"s{i}", i * 5, days=5)
+    return ids
+
+
+def test_stats_many_matches_individual_calls(client, link_ids):
+    columns = client.analytics.get_stats_many(link_ids, period="7d", concurrency=4)
+    assert columns.link_ids == link_ids
+    assert len(columns) == 12
+    assert not columns.errors
+    for i, link_id in enumerate(link_ids):
+        stats = client.analytics.get_stats(link_id, period="7d")
+        for field in STATS_FIELDS:
+            assert columns.column(field)[i] == getattr(stats, field)
+    assert columns.totals()["total_clicks"] == sum(i * 5 for i in range(12))
+
+
+def test_stats_many_reports_failed_links(client, link_ids):
+    ids = [link_ids[0], "missing", link_ids[1]]
+    columns = client.analytics.get_stats_many(ids)
+    assert columns.link_ids == [link_ids[0], link_ids[1]]
+    assert list(columns.total_clicks) == [0, 5]
+    assert isinstance(columns.errors["missing"], NotFoundError)
+
+
+def test_unknown_column_is_a_key_error(client, link_ids):
+    columns = client.analytics.get_stats_many(link_ids[:1])
+    with pytest.raises(KeyError):
+        columns.column("link_id")
+
+
+def test_timeseries_many_concatenates_points(client, link_ids):
+    columns = client.analytics.get_timeseries_many(link_ids + ["missing"], period="7d")
+    assert columns.link_ids == link_ids
+    assert len(columns.dates) == 7 * 12
+    assert list(columns.offsets) == [7 * i for i in range(13)]
+    for link_id in link_ids[:3]:
+        series = client.analytics.get_timeseries(link_id, period="7d")
+        rows = columns.rows(link_id)
+        assert columns.dates[rows] == [p.date for p in series.points]
+        assert list(columns.clicks[rows]) == [p.clicks for p in series.points]
+    assert isinstance(columns.errors["missing"], NotFoundError)
+
+
+class FakeRPC:
+    """A multicallable whose futures complete when release() is called."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.pending = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def future(self, request):
+        future = Future()
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            self.pending.append((future, request))
+        return future
+
+    def release(self):
+        while True:
+            with self.lock:
+                if not self.pending:
+                    return
+                future, request = self.pending.pop(0)
+                self.in_flight -= 1
+            if request < 0:
+                future.set_exception(ValueError("negative"))
+            else:
+                future.set_result(request * 2)
+
+
+def run_fan_out(rpc, requests, concurrency, on_result=None):
+    results, errors = {}, {}
+    stop = threading.Event()
+
+    def release():
+        while not stop.is_set():
+            rpc.release()
+            stop.wait(0.001)
+
+    releaser = threading.Thread(target=release)
+    releaser.start()
+    try:
+        fan_out(
+            rpc,
+            requests,
+            concurrency,
+            on_result or results.__setitem__,
+            errors.__setitem__,
+        )
+    finally:
+        stop.set()
+        releaser.join()
+    return results, errors
+
+
+def test_fan_out_bounds_calls_in_flight():
+    rpc = FakeRPC()
+    results, errors = run_fan_out(rpc, range(50), concurrency=3)
+    assert results == {i: i * 2 for i in range(50)}
+    assert not errors
+    assert rpc.max_in_flight <= 3
+
+
+def test_fan_out_reports_failures_per_request():
+    results, errors = run_fan_out(FakeRPC(), [1, -1, 2], concurrency=2)
+    assert results == {0: 2, 2: 4}
+    assert list(errors) == [1]
+    assert isinstance(errors[1], Go2Error)
+
+
+def test_fan_out_reports_callback_failures():
+    def on_result(index, response):
+        if index == 1:
+            raise RuntimeError("bad row")
+
+    _, errors = run_fan_out(FakeRPC(), [1, 2, 3], concurrency=2, on_result=on_result)
+    assert list(errors) == [1]
+    assert "bad row" in str(errors[1])
+
+
+def test_fan_out_with_no_requests_returns():
+    assert run_fan_out(FakeRPC(), [], concurrency=1) == ({}, {})
+
+
+def test_fan_out_rejects_zero_concurrency():
+    with pytest.raises(ValueError):
+        fan_out(FakeRPC(), [1], 0, print, print)
@@ -0,0 +1,79 @@
+import pytest
+
+from go2_sdk import CampaignLinkColumns, CampaignLinkRecord, CompactPage
+from go2_sdk.compact import CAMPAIGN_LINK_FIELDS, compact_links
+
+
+@pytest.fixture
+def campaign_id(server, client):
+    campaign = client.campaigns.create(name="Spring", destination_url="https://example.ge")
+    recipients = [
+        {"id": str(i), "name": f"r{i}", "metadata": {"tier": "gold"} if i % 2 else {}}
+        for i in range(6)
+    ]
+    client.campaigns.generate_links(campaign.id, recipients)
+    for link in client.campaigns.list_links_all(campaign.id):
+        for _ in range(int(link.recipient_id) % 3):
+            server.click(link.slug, country="GE")
+    return campaign.id
+
+
+def as_dict(link):
+    values = {name: getattr(link, name) for name in CAMPAIGN_LINK_FIELDS}
+    values["recipient_metadata"] = dict(values["recipient_metadata"])
+    return values
+
+
+def test_records_match_messages(client, campaign_id):
+    messages = client.campaigns.list_links(campaign_id, per_page=100)
+    page = client.campaigns.list_links(campaign_id, per_page=100, view="records")
+    assert isinstance(page, CompactPage)
+    assert page.total == messages.total == 6
+    assert all(isinstance(link, CampaignLinkRecord) for link in page.links)
+    assert [as_dict(r) for r in page.links] == [as_dict(m) for m in messages.links]
+
+
+def test_columns_match_messages(client, campaign_id):
+    messages = client.campaigns.list_links(campaign_id, per_page=100).links
+    columns = client.campaigns.list_links(campaign_id, per_page=100, view="columns").links
+    assert isinstance(columns, CampaignLinkColumns)
+    assert len(columns) == 6
+    for name in CAMPAIGN_LINK_FIELDS:
+        expected = [getattr(m, name) for m in messages]
+        if name == "recipient_metadata":
+            expected = [dict(m) for m in expected]
+        assert list(getattr(columns, name)) == expected
+    assert [as_dict(r) for r in columns] == [as_dict(m) for m in messages]
+    assert as_dict(columns[-1]) == as_dict(messages[-1])
+    assert [r.id for r in columns[1:3]] == [m.id for m in messages[1:3]]
+    with pytest.raises(IndexError):
+        columns[6]
+
+
+def test_columns_are_decoded_on_first_access(client, campaign_id):
+    messages = client.campaigns.list_links(campaign_id, per_page=100).links
+    columns = compact_links(messages, "columns").links
+    assert "slug" not in vars(columns)
+    assert columns.slug is columns.slug
+    assert type(columns[0].clicked) is bool
+    for name in CAMPAIGN_LINK_FIELDS:
+        getattr(columns, name)
+    assert columns._links is None
+    assert as_dict(columns[0]) == as_dict(messages[0])
+    assert type(columns[0].clicked) is bool
+    with pytest.raises(AttributeError):
+        _ = columns.color
+
+
+def test_repeated_strings_are_shared(client, campaign_id):
+    export = client.campaigns.export_links(campaign_id, view="records")
+    clicked = [link for link in export.links if link.clicked]
+    assert len({id(link.first_click_country) for link in clicked}) == 1
+    assert len({id(link.campaign_id) for link in export.links}) == 1
+    empty = [link.recipient_metadata for link in export.links if not link.recipient_metadata]
+    assert len({id(m) for m in empty}) == 1
+
+
+def test_unknown_view_is_rejected():
+    with pytest.raises(ValueError):
+        compact_links([], "rows")
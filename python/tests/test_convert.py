@@ -0,0 +1,89 @@
+import json
+import math
+
+import pytest
+from google.protobuf import field_mask_pb2, json_format, timestamp_pb2
+
+from go2_sdk import to_dict, to_dict_many, to_json, to_json_many
+from go2_sdk.convert import converter_for
+from go2_sdk.gen.analytics.v1 import analytics_pb2
+from go2_sdk.gen.campaigns.v1 import campaigns_pb2
+from go2_sdk.gen.domains.v1 import domains_pb2
+from go2_sdk.gen.links.v1 import links_pb2
+
+
+def ts(seconds, nanos=0):
+    return timestamp_pb2.Timestamp(seconds=seconds, nanos=nanos)
+
+
+MESSAGES = [
+    links_pb2.Link(
+        id="1", slug="promo", total_clicks=2**40, is_active=True,
+        created_at=ts(1700000000), updated_at=ts(1700000000, 5000000),
+    ),
+    links_pb2.Link(),
+    links_pb2.ListLinksResponse(
+        links=[links_pb2.Link(slug="a"), links_pb2.Link(slug="b", updated_at=ts(0, 1))],
+        total=2,
+    ),
+    links_pb2.UpdateLinkRequest(id="1", title="", is_active=False),
+    links_pb2.ListLinksRequest(
+        read_mask=field_mask_pb2.FieldMask(paths=["id", "total_clicks"]),
+        order=links_pb2.LINK_ORDER_UPDATED_AT_DESC,
+    ),
+    campaigns_pb2.CampaignLink(
+        slug="x", recipient_metadata={"tier": "gold"}, clicked=True, click_count=3
+    ),
+    campaigns_pb2.CampaignStats(
+        total_clicks=7, click_rate=0.25, clicks_by_country={"GE": 5, "US": 2}
+    ),
+    analytics_pb2.GetPlatformsResponse(
+        platforms=[analytics_pb2.PlatformStats(platform="ios", clicks=3, percentage=60.0)]
+    ),
+    analytics_pb2.ClickEvent(timestamp=ts(1700000000, 123456)),
+    domains_pb2.Domain(
+        domain="go2.ge", status=domains_pb2.DOMAIN_STATUS_ACTIVE, verified_at=ts(86399)
+    ),
+]
+
+
+@pytest.mark.parametrize("message", MESSAGES, ids=lambda m: m.DESCRIPTOR.name)
+@pytest.mark.parametrize("proto_names", [False, True])
+def test_matches_message_to_dict(message, proto_names):
+    expected = json_format.MessageToDict(message, preserving_proto_field_name=proto_names)
+    assert to_dict(message, preserving_proto_field_name=proto_names) == expected
+
+
+def test_live_responses_match(server, client):
+    client.links.create(slug="promo", web_url="https://example.ge")
+    server.seed_clicks("promo", 30, days=5)
+    links = client.links.list()
+    assert to_dict_many(links.links) == [json_format.MessageToDict(m) for m in links.links]
+    stats = client.analytics.get_timeseries(links.links[0].id, "7d")
+    assert to_dict(stats) == json_format.MessageToDict(stats)
+
+
+def test_non_finite_floats():
+    stats = campaigns_pb2.CampaignStats(click_rate=math.inf)
+    assert to_dict(stats)["clickRate"] == "Infinity"
+    stats.click_rate = -math.inf
+    assert to_dict(stats)["clickRate"] == "-Infinity"
+    stats.click_rate = math.nan
+    assert to_dict(stats)["clickRate"] == "NaN"
+
+
+def test_json_output():
+    link = links_pb2.Link(slug="ქართული", total_clicks=5)
+    assert to_json(link) == '{"slug":"ქართული","totalClicks":"5"}'
+    assert json.loads(to_json(link, indent=2)) == to_dict(link)
+    assert json.loads(to_json_many([link, link])) == [to_dict(link)] * 2
+
+
+def test_converters_are_cached():
+    descriptor = links_pb2.Link.DESCRIPTOR
+    assert converter_for(descriptor) is converter_for(descriptor)
+    assert converter_for(descriptor) is not converter_for(descriptor, True)
+
+
+def test_empty_iterable():
+    assert to_dict_many([]) == []
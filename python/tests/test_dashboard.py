@@ -0,0 +1,73 @@
+import pytest
+
+from go2_sdk import AnalyticsCache, Go2Error, TimeseriesStore
+from go2_sdk.dashboard import DASHBOARD_PARTS
+from go2_sdk.testing import Faults
+
+
+@pytest.fixture
+def link(server, client):
+    link = client.links.create(slug="promo", web_url="https://example.ge")
+    server.seed_clicks("promo", 300, days=20)
+    return link
+
+
+def test_dashboard_matches_individual_calls(client, link):
+    dashboard = client.analytics.get_dashboard(link.id, period="30d", limit=3)
+    assert dashboard.complete
+    dashboard.raise_for_errors()
+    assert dashboard.stats == client.analytics.get_stats(link.id, "30d")
+    assert dashboard.timeseries == client.analytics.get_timeseries(link.id, "30d")
+    assert dashboard.platforms == client.analytics.get_platforms(link.id, "30d")
+    assert dashboard.countries == client.analytics.get_countries(link.id, "30d", limit=3)
+    assert dashboard.referrers == client.analytics.get_referrers(link.id, "30d", limit=3)
+    assert len(dashboard.countries.countries) == 3
+
+
+def test_dashboard_makes_one_call_per_part(server, client, link):
+    client.analytics.get_dashboard(link.id)
+    for method in DASHBOARD_PARTS.values():
+        assert server.calls[method] == 1
+
+
+def test_failed_parts_are_reported(server, client, link):
+    server.set_faults(Faults(error_rate=1.0), method="GetReferrers")
+    dashboard = client.analytics.get_dashboard(link.id)
+    assert not dashboard.complete
+    assert dashboard.referrers is None
+    assert list(dashboard.errors) == ["referrers"]
+    assert dashboard.stats is not None
+    with pytest.raises(Go2Error):
+        dashboard.raise_for_errors()
+
+
+def test_unknown_link_fails_every_part(client):
+    dashboard = client.analytics.get_dashboard("missing")
+    assert sorted(dashboard.errors) == sorted(DASHBOARD_PARTS)
+
+
+def test_cached_parts_are_not_fetched_again(server, link):
+    cache = AnalyticsCache()
+    client = server.client(analytics_cache=cache)
+    client.analytics.get_stats(link.id, "30d")
+    client.analytics.get_countries(link.id, "30d", limit=10)
+    dashboard = client.analytics.get_dashboard(link.id, "30d", limit=5)
+    assert server.calls["GetStats"] == 1
+    assert server.calls["GetCountries"] == 1
+    assert len(dashboard.countries.countries) == 5
+    client.analytics.get_dashboard(link.id, "30d", limit=5)
+    for method in DASHBOARD_PARTS.values():
+        assert server.calls[method] == 1
+    client.close()
+    cache.close()
+
+
+def test_timeseries_comes_from_the_store(server, link):
+    with TimeseriesStore(":memory:") as store:
+        client = server.client(timeseries_store=store)
+        client.analytics.get_timeseries(link.id, "30d")
+        dashboard = client.analytics.get_dashboard(link.id, "30d")
+        client.close()
+    assert dashboard.complete
+    assert server.calls["GetTimeseries"] == 1
+    assert sum(p.clicks for p in dashboard.timeseries.points) == 300
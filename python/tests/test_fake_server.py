@@ -0,0 +1,131 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import grpc
+import pytest
+
+from go2_sdk import AuthenticationError, NotFoundError, RateLimitError, ValidationError
+from go2_sdk.gen.links.v1 import links_pb2
+from go2_sdk.testing import FakeGo2Server, Faults, InProcessChannel
+
+GET_LINK = "/links.v1.LinkService/GetLink"
+
+
+@pytest.fixture(params=[True, False], ids=["in_process", "network"])
+def any_client(request, server):
+    client = server.client(in_process=request.param)
+    yield client
+    client.close()
+
+
+def test_links_round_trip(any_client):
+    link = any_client.links.create(slug="promo", web_url="https://example.ge")
+    assert any_client.links.get(link.id) == link
+    updated = any_client.links.update(link.id, title="Promo", is_active=False)
+    assert updated.title == "Promo"
+    assert not updated.is_active
+    assert any_client.links.delete(link.id)
+    with pytest.raises(NotFoundError):
+        any_client.links.get(link.id)
+
+
+def test_slugs_stay_unique(any_client):
+    first = any_client.links.create(slug="a", web_url="https://example.ge")
+    any_client.links.create(slug="b", web_url="https://example.ge")
+    with pytest.raises(grpc.RpcError) as info:
+        any_client.links._stub.UpdateLink(links_pb2.UpdateLinkRequest(id=first.id, slug="b"))
+    assert info.value.code() == grpc.StatusCode.ALREADY_EXISTS
+    renamed = any_client.links._stub.UpdateLink(
+        links_pb2.UpdateLinkRequest(id=first.id, slug="a2")
+    )
+    assert renamed.slug == "a2"
+    any_client.links.create(slug="a", web_url="https://example.ge")
+
+
+def test_invalid_arguments(any_client):
+    link = any_client.links.create(slug="promo", web_url="https://example.ge")
+    with pytest.raises(ValidationError):
+        any_client.qr.generate(link.id, size=100)
+    with pytest.raises(ValidationError):
+        any_client.analytics.get_stats(link.id, period="soon")
+    with pytest.raises(ValidationError):
+        any_client.links.list(page_token="bogus")
+
+
+def test_domains(any_client):
+    domain = any_client.domains.create("links.example.ge").domain
+    verified = any_client.domains.verify(domain.id)
+    assert verified.verified_at.seconds > 0
+    assert verified.updated_at == verified.verified_at
+    with pytest.raises(NotFoundError):
+        any_client.domains.verify("missing")
+
+
+def test_api_key_is_checked():
+    with FakeGo2Server(api_key="right") as server:
+        good, bad = server.client(api_key="right"), server.client(api_key="wrong")
+        good.links.list()
+        with pytest.raises(AuthenticationError):
+            bad.links.list()
+
+
+def test_faults_per_method(server, client):
+    server.set_faults(Faults(max_qps=1, burst=2), method="ListLinks")
+    client.links.list()
+    client.links.list()
+    with pytest.raises(RateLimitError):
+        client.links.list()
+    client.links.create(slug="promo", web_url="https://example.ge")
+    server.set_faults(None, method="ListLinks")
+    client.links.list()
+
+
+def test_latency_fault(server, client):
+    server.set_faults(Faults(latency=0.05))
+    start = time.monotonic()
+    client.links.list()
+    assert time.monotonic() - start >= 0.05
+
+
+def test_calls_are_counted(server, client):
+    client.links.list()
+    client.links.list()
+    assert server.calls["ListLinks"] == 2
+
+
+class Boom:
+    def __call__(self, request, context):
+        raise RuntimeError("boom")
+
+
+def channel(handlers):
+    return InProcessChannel(handlers, ThreadPoolExecutor(1))
+
+
+def test_unknown_methods_are_unimplemented():
+    get = channel({}).unary_unary(GET_LINK)
+    with pytest.raises(grpc.RpcError) as info:
+        get(b"")
+    assert info.value.code() == grpc.StatusCode.UNIMPLEMENTED
+
+
+def test_servicer_exceptions_become_unknown():
+    ch = channel({GET_LINK: (Boom(), bytes)})
+    with pytest.raises(grpc.RpcError) as info:
+        ch.unary_unary(GET_LINK)(b"")
+    assert info.value.code() == grpc.StatusCode.UNKNOWN
+    assert "boom" in info.value.details()
+    future = ch.unary_unary(GET_LINK).future(b"")
+    assert future.exception(timeout=1).code() == grpc.StatusCode.UNKNOWN
+    stream = ch.unary_stream(GET_LINK)(b"")
+    with pytest.raises(grpc.RpcError):
+        next(stream)
+    assert stream.code() == grpc.StatusCode.UNKNOWN
+
+
+def test_client_streaming_is_absent():
+    ch = channel({})
+    assert not hasattr(ch, "stream_unary")
+    assert not hasattr(ch, "stream_stream")
+    with pytest.raises(AttributeError):
+        grpc.intercept_channel(ch).stream_unary("/a.A/B")(iter([]))
@@ -0,0 +1,103 @@
+from concurrent.futures import Future
+
+import grpc
+import pytest
+
+from go2_sdk import Go2Error, Go2Future, NotFoundError, as_completed, gather
+from go2_sdk.testing import Faults
+
+
+@pytest.fixture
+def links(client):
+    return [
+        client.links.create(slug=f"s{i}", web_url="https://example.ge")
+        for i in range(3)
+    ]
+
+
+def test_calls_return_futures(client, links):
+    future = client.links.get(links[0].id, wait=False)
+    assert isinstance(future, Go2Future)
+    assert future.result(timeout=1) == links[0]
+    assert future.exception() is None
+    assert future.done()
+    assert client.links.delete(links[1].id, wait=False).result() is True
+
+
+def test_errors_surface_from_result_and_exception(client):
+    future = client.links.get("missing", wait=False)
+    assert isinstance(future.exception(timeout=1), NotFoundError)
+    with pytest.raises(NotFoundError):
+        future.result()
+
+
+def test_gather_keeps_order(client, links):
+    futures = [client.links.get(link.id, wait=False) for link in reversed(links)]
+    assert gather(futures) == list(reversed(links))
+
+
+def test_gather_raises_or_returns_errors(client, links):
+    futures = [
+        client.links.get(links[0].id, wait=False),
+        client.links.get("missing", wait=False),
+    ]
+    with pytest.raises(NotFoundError):
+        gather(futures)
+    first, error = gather(futures, return_exceptions=True)
+    assert first == links[0]
+    assert isinstance(error, NotFoundError)
+
+
+def test_as_completed_yields_every_future(server, links):
+    client = server.client(in_process=False)
+    futures = [client.links.get(link.id, wait=False) for link in links]
+    assert sorted(f.result().id for f in as_completed(futures, timeout=5)) == sorted(
+        link.id for link in links
+    )
+    client.close()
+
+
+def test_timeouts(server, client, links):
+    server.set_faults(Faults(latency=0.5), method="GetLink")
+    future = client.links.get(links[0].id, wait=False)
+    with pytest.raises(TimeoutError):
+        future.result(timeout=0.01)
+    with pytest.raises(TimeoutError):
+        list(as_completed([future], timeout=0.01))
+    with pytest.raises(TimeoutError):
+        gather([future], timeout=0.01)
+    assert future.result(timeout=5) == links[0]
+
+
+def test_cancelled_calls_fail_with_go2_error():
+    call = Future()
+    future = Go2Future(call)
+    assert future.cancel()
+    assert future.cancelled()
+    error = future.exception()
+    assert isinstance(error, Go2Error)
+    assert error.code == grpc.StatusCode.CANCELLED
+
+
+def test_conversion_errors_are_what_result_raises():
+    call = Future()
+    call.set_result(b"response")
+
+    def convert(response):
+        raise ValueError("bad response")
+
+    future = Go2Future(call, convert)
+    assert isinstance(future.exception(), ValueError)
+    with pytest.raises(ValueError):
+        future.result()
+
+
+def test_completed_and_failed():
+    seen = []
+    done = Go2Future.completed("value")
+    done.add_done_callback(seen.append)
+    assert seen == [done]
+    assert done.result() == "value"
+    error = NotFoundError("gone")
+    assert Go2Future.failed(error).exception() is error
+    assert gather([done, Go2Future.failed(error)], return_exceptions=True) == ["value", error]
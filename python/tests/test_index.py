@@ -0,0 +1,80 @@
+import pytest
+
+from go2_sdk import RedirectTarget, SlugIndex
+from go2_sdk.gen.links.v1 import links_pb2
+
+
+def test_refresh_indexes_every_link(server, client):
+    for i in range(30):
+        client.links.create(slug=f"s{i}", web_url=f"https://example.ge/{i}")
+    index = SlugIndex()
+    assert index.refresh(client.links, per_page=7) == 30
+    assert len(index) == 30
+    assert "s12" in index
+    assert "missing" not in index
+    assert index.get("missing") is None
+    assert index["s12"].web_url == "https://example.ge/12"
+    assert sorted(index) == sorted(f"s{i}" for i in range(30))
+    with pytest.raises(KeyError):
+        index["missing"]
+
+
+def test_refresh_fetches_only_redirect_fields(server, client):
+    client.links.create(slug="promo", title="Promo", web_url="https://example.ge")
+    listed = []
+
+    class Links:
+        def list_all(self, **kwargs):
+            links = list(client.links.list_all(**kwargs))
+            listed.extend(links)
+            return links
+
+    index = SlugIndex()
+    index.refresh(Links())
+    assert index["promo"].is_active
+    assert listed[0].slug == "promo"
+    assert listed[0].title == ""
+    assert listed[0].id == ""
+
+
+def test_refresh_replaces_the_previous_contents(server, client):
+    first = client.links.create(slug="first", web_url="https://example.ge/1")
+    index = SlugIndex()
+    index.refresh(client.links)
+    client.links.delete(first.id)
+    client.links.create(slug="second", web_url="https://example.ge/2")
+    index.refresh(client.links)
+    assert list(index) == ["second"]
+
+
+def test_url_for_falls_back_to_fallback_then_web():
+    target = RedirectTarget(
+        links_pb2.Link(
+            slug="app",
+            ios_url="https://apps.apple.com/app",
+            fallback_url="https://example.ge/fallback",
+            web_url="https://example.ge",
+            is_active=True,
+        )
+    )
+    assert target.url_for("ios") == "https://apps.apple.com/app"
+    assert target.url_for("android") == "https://example.ge/fallback"
+    assert target.url_for("unknown") == "https://example.ge/fallback"
+    target.fallback_url = ""
+    assert target.url_for("android") == "https://example.ge"
+
+
+def test_targets_share_interned_urls():
+    links = [
+        links_pb2.Link(slug=f"s{i}", web_url="https://example.ge/" + "same")
+        for i in range(2)
+    ]
+    index = SlugIndex(links)
+    assert index["s0"].web_url is index["s1"].web_url
+    assert not index["s0"].is_active
+
+
+def test_swap_is_a_single_assignment():
+    index = SlugIndex([links_pb2.Link(slug="old")])
+    index.swap({"new": RedirectTarget(links_pb2.Link(slug="new"))})
+    assert list(index) == ["new"]
@@ -0,0 +1,100 @@
+import json
+
+import pytest
+
+from go2_sdk import loadgen
+from go2_sdk.testing import FakeGo2Server, Faults
+
+
+@pytest.fixture
+def endpoint(server):
+    return server.start()
+
+
+def load(endpoint, **kwargs):
+    kwargs.setdefault("qps", 200)
+    kwargs.setdefault("duration", 0.2)
+    kwargs.setdefault("mix", loadgen.parse_mix("get_link=2,create_link=1,list_links=1"))
+    return loadgen.run(
+        endpoint, "go2_test", insecure=True, workers=4, links=3, seed=1, **kwargs
+    )
+
+
+@pytest.mark.parametrize("mode", ["thread", "async"])
+def test_run_issues_the_scheduled_calls(server, endpoint, mode):
+    summary = load(endpoint, mode=mode)
+    assert summary["calls"] == 40
+    assert summary["errors"] == {}
+    assert summary["cleanup_errors"] == 0
+    assert set(summary["operations"]) == {"get_link", "create_link", "list_links"}
+    assert sum(op["calls"] for op in summary["operations"].values()) == 40
+    assert server.calls["GetLink"] == summary["operations"]["get_link"]["calls"]
+    assert server.state.links == {}
+
+
+def test_errors_are_counted_per_operation(server, endpoint):
+    server.set_faults(Faults(error_rate=1.0), method="GetLink")
+    summary = load(endpoint, mix=[("get_link", 1)])
+    assert summary["errors"] == {"Go2Error": summary["calls"]}
+    assert summary["operations"]["get_link"]["errors"] == {"Go2Error": summary["calls"]}
+
+
+def test_failed_cleanup_is_logged_and_counted(server, endpoint):
+    server.set_faults(Faults(error_rate=1.0), method="DeleteLink")
+    messages = []
+    summary = load(endpoint, mix=[("get_link", 1)], log=messages.append)
+    assert summary["cleanup_errors"] == 3
+    assert sum(m.startswith("could not delete link") for m in messages) == 3
+    assert len(server.state.links) == 3
+    assert "3 links could not be deleted" in loadgen.format_summary(summary)
+
+
+def test_keep_leaves_the_links(server, endpoint):
+    load(endpoint, mix=[("create_link", 1)], keep=True)
+    assert len(server.state.links) == 3 + 40
+
+
+def test_summarize_uses_both_latencies():
+    samples = [("get_link", 0.001 * i, 0.002 * i, None) for i in range(1, 101)]
+    samples.append(("get_stats", 0.5, 0.5, "NotFoundError"))
+    summary = loadgen.summarize(samples, qps=100, duration=2.0)
+    assert summary["achieved_qps"] == pytest.approx(101 / 2.0)
+    get_link = summary["operations"]["get_link"]
+    assert get_link["service_ms"]["p50"] == pytest.approx(50.0)
+    assert get_link["corrected_ms"]["p99"] == pytest.approx(198.0)
+    assert get_link["service_ms"]["max"] == pytest.approx(100.0)
+    assert summary["errors"] == {"NotFoundError": 1}
+    text = loadgen.format_summary(summary)
+    assert "NotFoundError" in text
+    assert "could not be deleted" not in text
+
+
+def test_parse_mix():
+    assert loadgen.parse_mix("get_link=70, get_stats") == [("get_link", 70.0), ("get_stats", 1.0)]
+    with pytest.raises(ValueError):
+        loadgen.parse_mix("get_everything=1")
+    with pytest.raises(ValueError):
+        loadgen.parse_mix("get_link=0")
+
+
+def test_run_validates_arguments(endpoint):
+    with pytest.raises(ValueError):
+        load(endpoint, mode="fork")
+    with pytest.raises(ValueError):
+        load(endpoint, qps=0)
+
+
+def test_main_against_the_fake_server(capsys):
+    code = loadgen.main(
+        ["--fake", "--qps", "100", "--duration", "0.1", "--links", "2", "--json", "--seed", "3"]
+    )
+    assert code == 0
+    summary = json.loads(capsys.readouterr().out)
+    assert summary["calls"] == 10
+    assert summary["cleanup_errors"] == 0
+
+
+def test_fake_server_is_reusable_after_load():
+    with FakeGo2Server(seed=1) as server:
+        summary = load(server.start(), mix=[("check_slug", 1)])
+        assert summary["operations"]["check_slug"]["calls"] == 40
@@ -0,0 +1,121 @@
+import pytest
+
+from go2_sdk import MetricsInterceptor, NotFoundError, ValidationError
+
+GET_LINK = "/links.v1.LinkService/GetLink"
+CREATE_LINK = "/links.v1.LinkService/CreateLink"
+STREAM_CLICKS = "/analytics.v1.AnalyticsService/StreamClicks"
+
+
+@pytest.fixture(params=[True, False], ids=["in_process", "network"])
+def metrics_client(request, server):
+    metrics = MetricsInterceptor(buckets=(0.5, 0.001, 10.0))
+    client = server.client(in_process=request.param, metrics=metrics)
+    yield metrics, client
+    client.close()
+
+
+def test_calls_are_counted_by_code(metrics_client):
+    metrics, client = metrics_client
+    link = client.links.create(slug="promo", web_url="https://example.ge")
+    client.links.get(link.id)
+    with pytest.raises(NotFoundError):
+        client.links.get("missing")
+    snapshot = metrics.snapshot()
+    assert snapshot[GET_LINK]["calls"] == {"OK": 1, "NOT_FOUND": 1}
+    assert snapshot[CREATE_LINK]["calls"] == {"OK": 1}
+    assert snapshot[GET_LINK]["in_flight"] == 0
+
+
+def test_latency_histogram_is_cumulative(metrics_client):
+    metrics, client = metrics_client
+    for i in range(3):
+        client.links.create(slug=f"s{i}", web_url="https://example.ge")
+    latency = metrics.snapshot()[CREATE_LINK]["latency"]
+    bounds = [bound for bound, _ in latency["buckets"]]
+    counts = [count for _, count in latency["buckets"]]
+    assert bounds == [0.001, 0.5, 10.0, float("inf")]
+    assert counts == sorted(counts)
+    assert counts[-1] == latency["count"] == 3
+    assert latency["sum"] > 0
+
+
+def test_payload_sizes(metrics_client):
+    metrics, client = metrics_client
+    link = client.links.create(slug="promo", web_url="https://example.ge")
+    client.links.get(link.id)
+    stats = metrics.snapshot()[GET_LINK]
+    assert stats["request_bytes"] > len(link.id)
+    assert stats["response_bytes"] == link.ByteSize()
+
+
+def test_raw_responses_are_measured(server):
+    metrics = MetricsInterceptor()
+    client = server.client(metrics=metrics)
+    client.links.create(slug="promo", web_url="https://example.ge")
+    data = client.links.list(raw=True)
+    stats = metrics.snapshot()["/links.v1.LinkService/ListLinks"]
+    assert stats["response_bytes"] == len(data)
+    client.close()
+
+
+def test_sizes_can_be_skipped(server):
+    metrics = MetricsInterceptor(record_sizes=False)
+    client = server.client(metrics=metrics)
+    client.links.create(slug="promo", web_url="https://example.ge")
+    stats = metrics.snapshot()[CREATE_LINK]
+    assert stats["request_bytes"] == stats["response_bytes"] == 0
+    client.close()
+
+
+def test_prometheus_text(metrics_client):
+    metrics, client = metrics_client
+    client.links.create(slug="promo", web_url="https://example.ge")
+    text = metrics.prometheus_text(prefix="app")
+    assert f'app_requests_total{{method="{CREATE_LINK}",code="OK"}} 1\n' in text
+    assert f'app_request_duration_seconds_bucket{{method="{CREATE_LINK}",le="+Inf"}} 1\n' in text
+    assert f'app_request_duration_seconds_count{{method="{CREATE_LINK}"}} 1\n' in text
+    assert f'app_in_flight_requests{{method="{CREATE_LINK}"}} 0\n' in text
+    assert "# TYPE app_request_duration_seconds histogram\n" in text
+
+
+def test_streams_are_counted_when_they_end(server, metrics_client):
+    metrics, client = metrics_client
+    client.links.create(slug="promo", web_url="https://example.ge")
+    server.click("promo")
+    server.click("promo")
+    stream = client.analytics.stream_clicks(resume_after="0")
+    events = iter(stream)
+    received = [next(events), next(events)]
+    assert metrics.snapshot()[STREAM_CLICKS]["in_flight"] == 1
+    stream.close()
+    with pytest.raises(ValidationError):
+        next(iter(client.analytics.stream_clicks(resume_after="bogus")))
+    stats = metrics.snapshot()[STREAM_CLICKS]
+    assert stats["calls"] == {"CANCELLED": 1, "INVALID_ARGUMENT": 1}
+    assert stats["in_flight"] == 0
+    assert stats["latency"]["count"] == 2
+    assert stats["response_bytes"] == sum(event.ByteSize() for event in received)
+
+
+def test_failure_to_start_a_call_is_recorded():
+    metrics = MetricsInterceptor()
+
+    class Details:
+        method = GET_LINK
+
+    def continuation(details, request):
+        raise RuntimeError("channel closed")
+
+    with pytest.raises(RuntimeError):
+        metrics.intercept_unary_unary(continuation, Details(), b"")
+    stats = metrics.snapshot()[GET_LINK]
+    assert stats["calls"] == {"UNKNOWN": 1}
+    assert stats["in_flight"] == 0
+
+
+def test_reset(metrics_client):
+    metrics, client = metrics_client
+    client.links.create(slug="promo", web_url="https://example.ge")
+    metrics.reset()
+    assert metrics.snapshot() == {}
@@ -0,0 +1,115 @@
+import pytest
+
+from go2_sdk import LinkMirror
+from go2_sdk.gen.links.v1 import links_pb2
+
+
+@pytest.fixture
+def mirror():
+    mirror = LinkMirror(":memory:")
+    yield mirror
+    mirror.close()
+
+
+@pytest.fixture
+def links(client):
+    return [
+        client.links.create(
+            slug=f"s{i}",
+            web_url=f"https://example.ge/{i % 3}",
+            ios_url=f"https://apps.apple.com/{i}" if i % 2 else None,
+        )
+        for i in range(25)
+    ]
+
+
+def test_full_sync_mirrors_every_link(client, mirror, links):
+    assert mirror.sync(client.links, per_page=10, full=True) == 25
+    assert len(mirror) == 25
+    assert mirror.get(links[3].id) == links[3]
+    assert mirror.get_by_slug("s4").id == links[4].id
+    assert mirror.get("missing") is None
+    assert mirror.get_by_slug("missing") is None
+
+
+def test_lookups_by_url_and_active(client, mirror, links):
+    client.links.update(links[0].id, is_active=False)
+    mirror.sync(client.links, full=True)
+    assert len(mirror.find_by_url("https://example.ge/1")) == 8
+    assert len(mirror.find_by_url("https://example.ge/1", field="web_url")) == 8
+    assert mirror.find_by_url("https://example.ge/1", field="ios_url") == []
+    assert [link.id for link in mirror.find_by_url("https://apps.apple.com/3")] == [links[3].id]
+    assert len(mirror.list()) == 25
+    assert [link.id for link in mirror.list(is_active=False)] == [links[0].id]
+    assert len(mirror.list(is_active=True)) == 24
+
+
+def test_unknown_url_field_is_rejected(mirror):
+    with pytest.raises(ValueError):
+        mirror.find_by_url("https://example.ge", field="slug")
+
+
+def test_incremental_sync_lists_only_changed_links(server, client, mirror, links):
+    mirror.sync(client.links, full=True)
+    assert mirror.sync(client.links) == 0
+    client.links.update(links[7].id, title="Renamed")
+    client.links.update(links[2].id, web_url="https://example.ge/new")
+    calls = server.calls["ListLinks"]
+    assert mirror.sync(client.links, per_page=10) == 2
+    assert server.calls["ListLinks"] == calls + 1
+    assert mirror.get(links[7].id).title == "Renamed"
+    assert [link.id for link in mirror.find_by_url("https://example.ge/new")] == [links[2].id]
+
+
+class Listed:
+    """A links service whose list_all returns the given links."""
+
+    def __init__(self, *links):
+        self.links = links
+
+    def list_all(self, **kwargs):
+        return iter(self.links)
+
+
+def link_at(id, nanos):
+    link = links_pb2.Link(id=id, slug=id)
+    link.updated_at.FromNanoseconds(nanos)
+    return link
+
+
+def test_links_updated_at_the_watermark_are_mirrored(mirror):
+    a, b = link_at("a", 100), link_at("b", 100)
+    assert mirror.sync(Listed(a)) == 1
+    # updated_since is inclusive, so the next sync lists a again.
+    assert mirror.sync(Listed(a, b)) == 1
+    assert mirror.get("b") == b
+    assert mirror.sync(Listed(a, b)) == 0
+
+
+def test_incremental_sync_picks_up_new_links(client, mirror, links):
+    mirror.sync(client.links)
+    created = client.links.create(slug="late", web_url="https://example.ge/late")
+    assert mirror.sync(client.links) == 1
+    assert mirror.get_by_slug("late").id == created.id
+    assert len(mirror) == 26
+
+
+def test_full_sync_drops_deleted_links(client, mirror, links):
+    mirror.sync(client.links, full=True)
+    client.links.delete(links[0].id)
+    mirror.sync(client.links)
+    assert len(mirror) == 25
+    mirror.sync(client.links, full=True)
+    assert len(mirror) == 24
+    assert mirror.get(links[0].id) is None
+
+
+def test_watermark_survives_reopening(tmp_path, server, client, links):
+    path = str(tmp_path / "links.db")
+    with LinkMirror(path) as mirror:
+        mirror.sync(client.links, full=True)
+    client.links.update(links[1].id, title="Changed")
+    with LinkMirror(path) as mirror:
+        assert len(mirror) == 25
+        assert mirror.sync(client.links) == 1
+        assert mirror.get(links[1].id).title == "Changed"
@@ -0,0 +1,83 @@
+import pytest
+
+from go2_sdk import ValidationError
+from go2_sdk.client import _pages
+from go2_sdk.gen.links.v1 import links_pb2
+
+
+@pytest.fixture
+def links(client):
+    return [
+        client.links.create(slug=f"s{i}", web_url="https://example.ge") for i in range(7)
+    ]
+
+
+@pytest.fixture
+def campaign_id(client):
+    campaign = client.campaigns.create(name="Spring", destination_url="https://example.ge")
+    client.campaigns.generate_links(campaign.id, [{"id": str(i)} for i in range(5)])
+    return campaign.id
+
+
+def slugs(response):
+    return [link.slug for link in response.links]
+
+
+def test_tokens_walk_every_link(client, links):
+    first = client.links.list(per_page=3)
+    second = client.links.list(per_page=3, page_token=first.next_page_token)
+    third = client.links.list(per_page=3, page_token=second.next_page_token)
+    assert slugs(first) + slugs(second) + slugs(third) == [link.slug for link in links]
+    assert third.next_page_token == ""
+    assert list(client.links.list_all(per_page=3)) == links
+
+
+def test_deletes_do_not_shift_later_pages(client, links):
+    first = client.links.list(per_page=3)
+    client.links.delete(links[0].id)
+    client.links.delete(links[3].id)
+    second = client.links.list(per_page=3, page_token=first.next_page_token)
+    assert slugs(second) == ["s4", "s5", "s6"]
+
+
+def test_links_created_after_the_first_page_are_left_out(client, links):
+    first = client.links.list(per_page=4)
+    client.links.create(slug="late", web_url="https://example.ge")
+    second = client.links.list(per_page=4, page_token=first.next_page_token)
+    assert slugs(second) == ["s4", "s5", "s6"]
+    assert second.next_page_token == ""
+
+
+def test_bad_tokens_are_rejected(client, links, campaign_id):
+    with pytest.raises(ValidationError):
+        client.links.list(page_token="bogus")
+    other = client.campaigns.list_links(campaign_id, per_page=2).next_page_token
+    with pytest.raises(ValidationError):
+        client.links.list(page_token=other)
+
+
+def test_campaign_link_tokens(client, campaign_id):
+    first = client.campaigns.list_links(campaign_id, per_page=2)
+    second = client.campaigns.list_links(
+        campaign_id, per_page=2, page_token=first.next_page_token
+    )
+    assert [link.recipient_id for link in second.links] == ["2", "3"]
+    page = client.campaigns.list_links(campaign_id, per_page=2, view="records")
+    assert page.next_page_token == first.next_page_token
+    records = list(client.campaigns.list_links_all(campaign_id, per_page=2, view="records"))
+    assert [record.recipient_id for record in records] == ["0", "1", "2", "3", "4"]
+
+
+def test_servers_without_tokens_are_paged_by_number():
+    pages = {
+        1: links_pb2.ListLinksResponse(links=[links_pb2.Link(id="a"), links_pb2.Link(id="b")]),
+        2: links_pb2.ListLinksResponse(links=[links_pb2.Link(id="c")]),
+    }
+    seen = []
+
+    def fetch(page, token):
+        seen.append((page, token))
+        return pages[page]
+
+    assert [response.links[0].id for response in _pages(fetch, 2)] == ["a", "c"]
+    assert seen == [(1, None), (2, None)]
@@ -0,0 +1,95 @@
+import threading
+
+import pytest
+
+from go2_sdk.profiling import Profile
+
+
+@pytest.fixture
+def link(client):
+    return client.links.create(slug="promo", web_url="https://example.ge")
+
+
+def test_calls_are_split_into_phases(client, link):
+    with client.profile() as p:
+        client.links.get(link.id)
+        client.links.get(link.id)
+        client.links.list()
+    get = p["GetLink"]
+    assert get is p["/links.v1.LinkService/GetLink"]
+    assert get.calls == 2
+    assert get.response_bytes == 2 * link.ByteSize()
+    assert get.request_bytes > 0
+    assert get.encode_seconds > 0
+    assert get.decode_seconds > 0
+    assert get.wire_seconds <= get.total_seconds
+    assert p["ListLinks"].calls == 1
+    with pytest.raises(KeyError):
+        p["CreateLink"]
+
+
+def test_calls_outside_the_block_are_not_recorded(client, link):
+    with client.profile() as p:
+        pass
+    client.links.get(link.id)
+    assert p.methods == {}
+
+
+def test_futures_count_toward_the_block_they_started_in(client, link):
+    with client.profile() as p:
+        future = client.links.get(link.id, wait=False)
+    future.result()
+    stats = p["GetLink"]
+    assert stats.calls == 1
+    assert stats.response_bytes == link.ByteSize()
+
+
+def test_blocks_are_per_thread(client, link):
+    started, done = threading.Event(), threading.Event()
+
+    def other():
+        started.wait()
+        client.links.get(link.id)
+        done.set()
+
+    thread = threading.Thread(target=other)
+    thread.start()
+    with client.profile() as p:
+        started.set()
+        done.wait()
+        client.links.list()
+    thread.join()
+    assert list(p.as_dict()) == ["/links.v1.LinkService/ListLinks"]
+
+
+def test_nested_blocks_and_clients(server, client, link):
+    other = server.client()
+    with client.profile() as outer:
+        with client.profile() as inner, other.profile() as theirs:
+            client.links.get(link.id)
+            other.links.list()
+        client.links.list()
+    assert list(inner.as_dict()) == ["/links.v1.LinkService/GetLink"]
+    assert list(theirs.as_dict()) == ["/links.v1.LinkService/ListLinks"]
+    assert list(outer.as_dict()) == ["/links.v1.LinkService/ListLinks"]
+    other.close()
+
+
+def test_raw_calls_count_request_bytes_only(client, link):
+    with client.profile() as p:
+        client.links.list(raw=True)
+    stats = p["ListLinks"]
+    assert stats.calls == 1
+    assert stats.request_bytes > 0
+    assert stats.response_bytes == 0
+
+
+def test_report_orders_by_total_time():
+    profile = Profile()
+    profile._add_call("/a.A/Fast", 0.001)
+    profile._add_call("/a.A/Slow", 0.5)
+    profile._add_decode("/a.A/Slow", 0.2, 10)
+    lines = profile.report().splitlines()
+    assert lines[1].startswith("a.A/Slow")
+    assert lines[2].startswith("a.A/Fast")
+    assert profile["Slow"].wire_seconds == pytest.approx(0.3)
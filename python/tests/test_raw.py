@@ -0,0 +1,83 @@
+import pytest
+
+from go2_sdk import split_records
+from go2_sdk.client import LinksService
+from go2_sdk.gen.campaigns.v1 import campaigns_pb2
+from go2_sdk.gen.links.v1 import links_pb2
+from go2_sdk.raw import read_varint
+
+
+@pytest.fixture
+def campaign_id(client):
+    campaign = client.campaigns.create(name="Spring", destination_url="https://example.ge")
+    client.campaigns.generate_links(campaign.id, [{"id": str(i)} for i in range(5)])
+    return campaign.id
+
+
+def test_export_raw_matches_decoded(client, campaign_id):
+    data = client.campaigns.export_links(campaign_id, raw=True)
+    assert isinstance(data, bytes)
+    decoded = client.campaigns.export_links(campaign_id)
+    assert campaigns_pb2.ExportLinksResponse.FromString(data) == decoded
+    records = [campaigns_pb2.CampaignLink.FromString(r) for r in split_records(data)]
+    assert records == list(decoded.links)
+
+
+def test_list_links_raw(client, campaign_id):
+    data = client.campaigns.list_links(campaign_id, per_page=2, raw=True)
+    response = campaigns_pb2.ListCampaignLinksResponse.FromString(data)
+    assert len(response.links) == 2
+    assert response.total == 5
+    assert len(list(split_records(data))) == 2
+
+
+def test_links_list_raw(client):
+    for slug in ("a", "b", "c"):
+        client.links.create(slug=slug, web_url="https://example.ge")
+    data = client.links.list(raw=True)
+    links = [links_pb2.Link.FromString(r) for r in split_records(data)]
+    assert sorted(link.slug for link in links) == ["a", "b", "c"]
+
+
+def test_raw_in_process(server, campaign_id):
+    client = server.client(in_process=True)
+    data = client.campaigns.export_links(campaign_id, raw=True)
+    assert len(list(split_records(data))) == 5
+    client.close()
+
+
+def test_split_records_shares_memory():
+    data = bytearray(
+        links_pb2.ListLinksResponse(
+            links=[links_pb2.Link(slug="a"), links_pb2.Link(slug="b")], total=2
+        ).SerializeToString()
+    )
+    records = list(split_records(data))
+    assert [links_pb2.Link.FromString(r).slug for r in records] == ["a", "b"]
+    assert records[0].obj is data
+
+
+def test_split_records_skips_other_fields():
+    message = campaigns_pb2.CampaignLink(
+        slug="x", click_count=300, recipient_metadata={"k": "v"}
+    ).SerializeToString()
+    # Field 3 is slug; field 6 entries are the metadata map.
+    assert [bytes(r) for r in split_records(message, field=3)] == [b"x"]
+    assert len(list(split_records(message, field=6))) == 1
+
+
+def test_truncated_buffers_are_rejected():
+    data = links_pb2.ListLinksResponse(links=[links_pb2.Link(slug="a")]).SerializeToString()
+    with pytest.raises(ValueError):
+        list(split_records(data[:-1]))
+    with pytest.raises(ValueError):
+        read_varint(memoryview(b"\x80"), 0)
+
+
+def test_read_varint():
+    assert read_varint(memoryview(b"\xac\x02\x01"), 0) == (300, 2)
+
+
+def test_raw_needs_a_client_service(client):
+    with pytest.raises(ValueError):
+        LinksService(client.links._stub).list(raw=True)
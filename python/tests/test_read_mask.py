@@ -0,0 +1,62 @@
+import grpc
+import pytest
+from google.protobuf import field_mask_pb2
+
+from go2_sdk.gen.links.v1 import links_pb2
+
+
+@pytest.fixture
+def link(client):
+    return client.links.create(
+        slug="promo", title="Promo", web_url="https://example.ge", ios_url="https://apps.ge"
+    )
+
+
+def test_get_returns_only_the_fields(client, link):
+    masked = client.links.get(link.id, fields=["id", "slug"])
+    assert (masked.id, masked.slug) == (link.id, "promo")
+    assert masked.title == ""
+    assert masked.web_url == ""
+    assert not masked.HasField("created_at")
+
+
+def test_list_returns_only_the_fields(client, link):
+    (masked,) = client.links.list(fields=["id", "updated_at"]).links
+    assert masked.id == link.id
+    assert masked.updated_at == link.updated_at
+    assert masked.slug == ""
+    assert [masked] == list(client.links.list_all(fields=["id", "updated_at"]))
+
+
+def test_no_mask_returns_every_field(client, link):
+    assert client.links.get(link.id) == link
+    assert client.links.get(link.id, fields=[]) == link
+    assert client.links.list().links[0] == link
+
+
+def test_sub_fields(client, link):
+    masked = client.links.get(link.id, fields=["created_at.seconds"])
+    assert masked.created_at.seconds == link.created_at.seconds
+    assert masked.created_at.nanos == 0
+    assert masked.id == ""
+
+
+def test_masks_shrink_raw_pages(client, link):
+    assert len(client.links.list(raw=True, fields=["id"])) < len(client.links.list(raw=True))
+
+
+def test_field_names_are_checked_before_the_call(server, client, link):
+    with pytest.raises(ValueError):
+        client.links.get(link.id, fields=["id", "color"])
+    with pytest.raises(TypeError):
+        client.links.list(fields="id")
+    assert "GetLink" not in server.calls
+
+
+def test_server_rejects_invalid_paths(client, link):
+    request = links_pb2.GetLinkRequest(
+        id=link.id, read_mask=field_mask_pb2.FieldMask(paths=["color"])
+    )
+    with pytest.raises(grpc.RpcError) as info:
+        client.links._stub.GetLink(request)
+    assert info.value.code() == grpc.StatusCode.INVALID_ARGUMENT
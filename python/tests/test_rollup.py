@@ -0,0 +1,126 @@
+import pytest
+
+from go2_sdk import AnalyticsRollup
+from go2_sdk.rollup import _TopCounter
+
+
+@pytest.fixture
+def slugs(server, client):
+    slugs = [f"s{i}" for i in range(9)]
+    for slug in slugs:
+        client.links.create(slug=slug, web_url="https://example.ge")
+        server.seed_clicks(slug, 50, days=10)
+    return slugs
+
+
+def expected(client, period="30d"):
+    platforms, countries = {}, {}
+    for link in client.links.list_all():
+        for p in client.analytics.get_platforms(link.id, period).platforms:
+            platforms[p.platform] = platforms.get(p.platform, 0) + p.clicks
+        for c in client.analytics.get_countries(link.id, period, limit=50).countries:
+            countries[c.country_code] = countries.get(c.country_code, 0) + c.clicks
+    return platforms, countries
+
+
+class FailingLinks:
+    """A LinksService that fails after ``pages`` pages and can list extra IDs."""
+
+    def __init__(self, links, pages=None, extra=()):
+        self._links = links
+        self._pages = pages
+        self._extra = list(extra)
+
+    def list(self, **kwargs):
+        if self._pages is not None:
+            if self._pages == 0:
+                raise RuntimeError("interrupted")
+            self._pages -= 1
+        response = self._links.list(**kwargs)
+        for id in self._extra:
+            response.links.add(id=id)
+        self._extra = []
+        return response
+
+
+def test_rollup_sums_every_link(client, slugs):
+    result = AnalyticsRollup(client.links, client.analytics, per_page=4).run()
+    platforms, countries = expected(client)
+    assert result.total_clicks == 9 * 50
+    assert result.links_processed == 9
+    assert result.failed_links == []
+    assert {p.platform: p.clicks for p in result.platforms} == platforms
+    assert {c.country_code: c.clicks for c in result.countries} == countries
+    assert sum(p.percentage for p in result.platforms) == pytest.approx(100.0)
+    assert result.countries[0].country_name
+    assert not result.approximate
+    assert [c.clicks for c in result.countries] == sorted(
+        (c.clicks for c in result.countries), reverse=True
+    )
+
+
+def test_top_k_limits_countries_and_referrers(client, slugs):
+    result = AnalyticsRollup(client.links, client.analytics, top_k=2).run()
+    assert len(result.countries) == 2
+    assert len(result.referrers) == 2
+
+
+def test_truncated_breakdowns_are_reported(tmp_path, client, slugs):
+    path = str(tmp_path / "rollup.json")
+    rollup = AnalyticsRollup(
+        client.links, client.analytics, breakdown_limit=1, checkpoint_path=path
+    )
+    result = rollup.run()
+    assert result.approximate
+    assert result.truncated_links == 9
+    assert result.total_clicks == 9 * 50
+    assert sum(c.clicks for c in result.countries) < 9 * 50
+    assert len(result.countries) <= 9
+    resumed = AnalyticsRollup(
+        client.links, client.analytics, breakdown_limit=1, checkpoint_path=path
+    )
+    assert resumed.result().truncated_links == 9
+
+
+def test_failed_links_are_skipped(client, slugs):
+    links = FailingLinks(client.links, extra=["missing"])
+    result = AnalyticsRollup(links, client.analytics, per_page=100).run()
+    assert result.failed_links == ["missing"]
+    assert result.links_processed == 9
+    assert result.total_clicks == 9 * 50
+
+
+def test_checkpoint_resumes_after_the_last_page(tmp_path, server, client, slugs):
+    path = str(tmp_path / "rollup.json")
+    with pytest.raises(RuntimeError):
+        AnalyticsRollup(
+            FailingLinks(client.links, pages=2), client.analytics,
+            per_page=3, checkpoint_path=path,
+        ).run()
+    calls = server.calls["GetPlatforms"]
+    assert calls == 6
+    # Links created after the first page do not shift the pages.
+    client.links.create(slug="late", web_url="https://example.ge")
+    rollup = AnalyticsRollup(client.links, client.analytics, per_page=3, checkpoint_path=path)
+    assert rollup.result().links_processed == 6
+    result = rollup.run()
+    assert server.calls["GetPlatforms"] == calls + 3
+    assert result.links_processed == 9
+    assert result.total_clicks == 9 * 50
+
+
+def test_checkpoint_for_other_settings_is_rejected(tmp_path, client, slugs):
+    path = str(tmp_path / "rollup.json")
+    AnalyticsRollup(client.links, client.analytics, checkpoint_path=path).run()
+    with pytest.raises(ValueError):
+        AnalyticsRollup(client.links, client.analytics, period="7d", checkpoint_path=path)
+
+
+def test_top_counter_keeps_heavy_hitters():
+    counter = _TopCounter(capacity=4)
+    counter.add("a", 100)
+    for i in range(10):
+        counter.add(f"r{i}", 1)
+    counter.add("a", 1)
+    assert len(counter.counts) <= 4
+    assert counter.top(1) == [("a", 101)]
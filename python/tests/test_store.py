@@ -0,0 +1,152 @@
+from datetime import date, timedelta
+
+import pytest
+
+from go2_sdk import TimeseriesStore
+from go2_sdk import store as store_module
+from go2_sdk.gen.analytics.v1 import analytics_pb2
+
+TODAY = date(2024, 3, 31)
+
+
+class FakeAnalytics:
+    """Answers GetTimeseries windows from a date -> clicks map."""
+
+    def __init__(self):
+        self.clicks = {}
+        self.windows = []
+        self.today = TODAY
+
+    def __call__(self, window):
+        self.windows.append(window)
+        days = int(window[:-1])
+        points = []
+        for offset in range(days - 1, -1, -1):
+            day = (self.today - timedelta(days=offset)).isoformat()
+            count = self.clicks.get(day, 0)
+            points.append(
+                analytics_pb2.TimeseriesPoint(date=day, clicks=count, unique_clicks=count)
+            )
+        return analytics_pb2.GetTimeseriesResponse(points=points)
+
+
+@pytest.fixture
+def api(monkeypatch):
+    api = FakeAnalytics()
+    monkeypatch.setattr(store_module, "_today", lambda: api.today)
+    return api
+
+
+@pytest.fixture
+def store():
+    store = TimeseriesStore(":memory:", min_sync_interval=0)
+    yield store
+    store.close()
+
+
+def clicks(response):
+    return {p.date: p.clicks for p in response.points}
+
+
+def test_first_call_downloads_the_whole_period(store, api):
+    api.clicks = {"2024-01-15": 3, "2024-03-30": 5}
+    response = store.get_timeseries("l1", "90d", api)
+    assert api.windows == ["90d"]
+    assert len(response.points) == 90
+    assert response.points[0].date == "2024-01-02"
+    assert response.points[-1].date == "2024-03-31"
+    assert clicks(response)["2024-01-15"] == 3
+    assert store.coverage("l1")[:2] == ("2024-01-02", "2024-03-31")
+
+
+def test_later_calls_refetch_only_the_smallest_window(store, api):
+    store.get_timeseries("l1", "90d", api)
+    api.clicks["2024-03-31"] = 4
+    response = store.get_timeseries("l1", "90d", api)
+    assert api.windows == ["90d", "7d"]
+    assert clicks(response)["2024-03-31"] == 4
+
+
+def test_gap_since_last_sync_picks_a_wider_window(store, api):
+    store.get_timeseries("l1", "90d", api)
+    api.today = TODAY + timedelta(days=10)
+    api.clicks[(TODAY + timedelta(days=2)).isoformat()] = 7
+    response = store.get_timeseries("l1", "90d", api)
+    assert api.windows == ["90d", "30d"]
+    assert response.points[-1].date == api.today.isoformat()
+    assert clicks(response)[(TODAY + timedelta(days=2)).isoformat()] == 7
+    assert store.coverage("l1")[0] == "2024-01-02"
+
+
+def test_gap_wider_than_every_window_downloads_the_period(store, api):
+    store.get_timeseries("l1", "30d", api)
+    api.today = TODAY + timedelta(days=200)
+    store.get_timeseries("l1", "30d", api)
+    assert api.windows == ["30d", "30d"]
+
+
+def test_period_not_covered_is_downloaded(store, api):
+    store.get_timeseries("l1", "7d", api)
+    store.get_timeseries("l1", "90d", api)
+    assert api.windows == ["7d", "90d"]
+    store.get_timeseries("l1", "30d", api)
+    assert api.windows == ["7d", "90d", "7d"]
+
+
+def test_refetched_window_replaces_stored_days(store, api):
+    api.clicks = {"2024-03-29": 2}
+    store.get_timeseries("l1", "30d", api)
+    api.clicks = {}
+    response = store.get_timeseries("l1", "30d", api)
+    assert clicks(response)["2024-03-29"] == 0
+
+
+def test_recent_sync_is_served_from_disk(api):
+    with TimeseriesStore(":memory:", min_sync_interval=60) as store:
+        store.get_timeseries("l1", "30d", api)
+        store.get_timeseries("l1", "7d", api)
+        assert api.windows == ["30d"]
+
+
+def test_sub_day_periods_bypass_the_store(store, api):
+    calls = []
+    store.get_timeseries("l1", "12h", lambda window: calls.append(window))
+    assert calls == ["12h"]
+    assert store.coverage("l1") is None
+
+
+def test_points_range_query(store, api):
+    api.clicks = {"2024-03-01": 1, "2024-03-02": 2, "2024-03-03": 3}
+    store.get_timeseries("l1", "90d", api)
+    points = store.points("l1", start="2024-03-02", end="2024-03-03")
+    assert [(p.date, p.clicks) for p in points] == [("2024-03-02", 2), ("2024-03-03", 3)]
+    assert store.points("other") == []
+
+
+def test_delete_forgets_a_link(store, api):
+    store.get_timeseries("l1", "7d", api)
+    store.delete("l1")
+    assert store.points("l1") == []
+    assert store.coverage("l1") is None
+
+
+def test_store_persists_across_instances(tmp_path, api):
+    path = str(tmp_path / "analytics.db")
+    with TimeseriesStore(path, min_sync_interval=0) as store:
+        store.get_timeseries("l1", "90d", api)
+    with TimeseriesStore(path, min_sync_interval=0) as store:
+        store.get_timeseries("l1", "90d", api)
+    assert api.windows == ["90d", "7d"]
+
+
+def test_client_serves_timeseries_through_the_store(server):
+    with TimeseriesStore(":memory:") as store:
+        client = server.client(timeseries_store=store)
+        link = client.links.create(slug="promo", web_url="https://example.ge")
+        server.seed_clicks("promo", 100, days=20)
+        first = client.analytics.get_timeseries(link.id, period="30d")
+        second = client.analytics.get_timeseries(link.id, period="7d")
+        client.close()
+    assert server.calls["GetTimeseries"] == 1
+    assert sum(p.clicks for p in first.points) == 100
+    assert [p.date for p in second.points] == [p.date for p in first.points[-7:]]
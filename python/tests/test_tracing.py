@@ -0,0 +1,150 @@
+import grpc
+import pytest
+
+pytest.importorskip("opentelemetry.sdk")
+
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.sdk.trace.sampling import ALWAYS_OFF
+
+from go2_sdk import NotFoundError, TracingInterceptor, ValidationError
+from go2_sdk.calls import _ClientCallDetails
+
+
+@pytest.fixture
+def exporter():
+    return InMemorySpanExporter()
+
+
+def tracer(exporter, **kwargs):
+    provider = TracerProvider(**kwargs)
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    return provider.get_tracer("test")
+
+
+def details(method="/links.v1.LinkService/GetLink"):
+    return _ClientCallDetails(
+        method=method, timeout=None, metadata=[("authorization", "Bearer x")],
+        credentials=None, wait_for_ready=None, compression=None,
+    )
+
+
+class Done:
+    """A call that has already completed with OK."""
+
+    def add_done_callback(self, callback):
+        callback(self)
+
+    def code(self):
+        return grpc.StatusCode.OK
+
+    def result(self):
+        return b"ok"
+
+
+class Capture:
+    """A continuation that records the call details it was given."""
+
+    def __init__(self):
+        self.details = None
+        self.outcome = Done()
+
+    def __call__(self, details, request):
+        self.details = details
+        return self.outcome
+
+
+def sampled(metadata):
+    return bool(int(dict(metadata)["traceparent"].rsplit("-", 1)[1], 16) & 1)
+
+
+@pytest.mark.parametrize("in_process", [True, False], ids=["in_process", "network"])
+def test_spans_per_call(server, exporter, in_process):
+    client = server.client(
+        in_process=in_process, tracing=TracingInterceptor(tracer(exporter))
+    )
+    link = client.links.create(slug="promo", web_url="https://example.ge")
+    with pytest.raises(NotFoundError):
+        client.links.get("missing")
+    client.close()
+    create, get = exporter.get_finished_spans()
+    assert create.name == "links.v1.LinkService/CreateLink"
+    assert create.kind == trace.SpanKind.CLIENT
+    assert create.attributes["rpc.system"] == "grpc"
+    assert create.attributes["rpc.service"] == "links.v1.LinkService"
+    assert create.attributes["rpc.method"] == "CreateLink"
+    assert create.attributes["rpc.grpc.status_code"] == 0
+    assert create.attributes["rpc.response.size"] == link.ByteSize()
+    assert create.attributes["rpc.request.size"] > 0
+    assert create.status.is_ok
+    assert get.attributes["rpc.grpc.status_code"] == 5
+    assert get.status.status_code == trace.StatusCode.ERROR
+    assert get.status.description.startswith("NOT_FOUND")
+
+
+@pytest.mark.parametrize("in_process", [True, False], ids=["in_process", "network"])
+def test_a_span_covers_a_stream(server, exporter, in_process):
+    client = server.client(
+        in_process=in_process, tracing=TracingInterceptor(tracer(exporter))
+    )
+    client.links.create(slug="promo", web_url="https://example.ge")
+    server.click("promo")
+    stream = client.analytics.stream_clicks(resume_after="0")
+    events = iter(stream)
+    next(events)
+    assert len(exporter.get_finished_spans()) == 1
+    stream.close()
+    with pytest.raises(ValidationError):
+        next(iter(client.analytics.stream_clicks(resume_after="bogus")))
+    client.close()
+    _, cancelled, invalid = exporter.get_finished_spans()
+    assert cancelled.name == "analytics.v1.AnalyticsService/StreamClicks"
+    assert cancelled.attributes["rpc.grpc.status_code"] == 1
+    assert cancelled.status.description.startswith("CANCELLED")
+    assert invalid.attributes["rpc.grpc.status_code"] == 3
+    assert "rpc.response.size" not in invalid.attributes
+
+
+def test_context_is_injected(exporter):
+    capture = Capture()
+    interceptor = TracingInterceptor(tracer(exporter))
+    assert interceptor.intercept_unary_unary(capture, details(), b"") is capture.outcome
+    assert dict(capture.details.metadata)["authorization"] == "Bearer x"
+    assert sampled(capture.details.metadata)
+    (span,) = exporter.get_finished_spans()
+    assert span.attributes["rpc.response.size"] == 2
+
+
+def test_unsampled_calls_still_propagate(exporter):
+    capture = Capture()
+    interceptor = TracingInterceptor(tracer(exporter, sampler=ALWAYS_OFF))
+    assert interceptor.intercept_unary_unary(capture, details(), b"") is capture.outcome
+    assert not sampled(capture.details.metadata)
+    assert exporter.get_finished_spans() == ()
+
+
+def test_failure_to_start_a_call_ends_the_span(exporter):
+    def continuation(details, request):
+        raise RuntimeError("channel closed")
+
+    interceptor = TracingInterceptor(tracer(exporter))
+    with pytest.raises(RuntimeError):
+        interceptor.intercept_unary_unary(continuation, details(), b"")
+    (span,) = exporter.get_finished_spans()
+    assert span.status.status_code == trace.StatusCode.ERROR
+    assert span.events[0].name == "exception"
+
+
+def test_sizes_can_be_skipped(server, exporter):
+    client = server.client(tracing=TracingInterceptor(tracer(exporter), record_sizes=False))
+    client.links.create(slug="promo", web_url="https://example.ge")
+    client.close()
+    (span,) = exporter.get_finished_spans()
+    assert "rpc.request.size" not in span.attributes
+    assert "rpc.response.size" not in span.attributes
+
+
+def test_enabled_with_opentelemetry():
+    assert TracingInterceptor().enabled
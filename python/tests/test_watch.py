@@ -0,0 +1,179 @@
+import time
+from concurrent.futures import Future
+
+import grpc
+import pytest
+
+from go2_sdk import CampaignWatcher, Go2Error
+from go2_sdk.testing import Faults
+
+
+def create_campaign(client, recipients=2):
+    """Create a campaign and return its ID with its link slugs."""
+    campaign = client.campaigns.create(name="Spring", destination_url="https://example.ge")
+    response = client.campaigns.generate_links(
+        campaign.id, [{"id": str(i)} for i in range(recipients)]
+    )
+    return campaign.id, [link.slug for link in response.sample_links]
+
+
+@pytest.fixture
+def campaign(client):
+    return create_campaign(client)
+
+
+def watcher(client, campaign_ids, **kwargs):
+    kwargs.setdefault("initial_interval", 0.01)
+    kwargs.setdefault("min_interval", 0.01)
+    return CampaignWatcher(client.campaigns, campaign_ids, **kwargs)
+
+
+def test_new_clicks_are_emitted(server, client, campaign):
+    campaign_id, slugs = campaign
+    server.click(slugs[0])
+    with watcher(client, [campaign_id], emit_initial=True) as w:
+        events = w.events(timeout=2)
+        first = next(events)
+        assert first.campaign_id == campaign_id
+        assert first.new_clicks == 1
+        server.click(slugs[0])
+        server.click(slugs[1])
+        second = next(events)
+    assert second.new_clicks == 2
+    assert sum(second.clicks_by_day.values()) == 2
+    assert list(events) == []
+
+
+def test_interval_backs_off_without_clicks(server, client, campaign):
+    campaign_id, _ = campaign
+    w = watcher(client, [campaign_id], backoff=2.0, max_interval=0.04)
+    w.run(duration=0.3)
+    assert w.interval(campaign_id) == 0.04
+    assert server.calls["GetCampaignStats"] >= 3
+
+
+def test_run_again_after_stop(server, client, campaign):
+    campaign_id, _ = campaign
+    w = watcher(client, [campaign_id], initial_interval=10)
+    w.run(duration=0.05)
+    w.remove(campaign_id)
+    w.add(campaign_id)
+    w.run(duration=0.05)
+    assert server.calls["GetCampaignStats"] == 2
+
+
+def test_readded_campaign_is_polled_once(server, client, campaign):
+    campaign_id, _ = campaign
+    w = watcher(client, [campaign_id], initial_interval=10)
+    w.remove(campaign_id)
+    w.add(campaign_id)
+    w.run(duration=0.2)
+    assert server.calls["GetCampaignStats"] == 1
+
+
+def test_callback_without_iterator_queues_nothing(server, client, campaign):
+    campaign_id, slugs = campaign
+    server.click(slugs[0])
+    received = []
+    w = watcher(client, [campaign_id], on_change=received.append, emit_initial=True)
+    w.run(duration=0.1)
+    assert [d.new_clicks for d in received] == [1]
+    assert list(w.events(timeout=0)) == []
+
+
+def test_pending_deltas_are_bounded(server, client, campaign):
+    campaign_id, slugs = campaign
+    other, (slug,) = create_campaign(client, recipients=1)
+    server.click(slugs[0])
+    server.click(slug)
+    w = watcher(client, [campaign_id, other], emit_initial=True, max_pending=1)
+    w.run(duration=0.1)
+    assert w.dropped == 1
+    assert len(list(w.events())) == 1
+
+
+def test_failed_polls_back_off(server, client, campaign):
+    campaign_id, _ = campaign
+    server.set_faults(Faults(error_rate=1.0), method="GetCampaignStats")
+    errors = []
+    w = watcher(
+        client, [campaign_id], on_error=lambda c, e: errors.append((c, e)),
+        backoff=2.0, max_interval=0.04,
+    )
+    w.run(duration=0.2)
+    assert errors
+    assert all(c == campaign_id and isinstance(e, Go2Error) for c, e in errors)
+    assert w.interval(campaign_id) == 0.04
+
+
+class BrokenCampaigns:
+    """A CampaignsService whose polls fail before reaching the server."""
+
+    def __init__(self, make_future):
+        self._stub = self
+        self.GetCampaignStats = self
+        self._make_future = make_future
+
+    def future(self, request):
+        return self._make_future()
+
+
+def closed_channel():
+    raise ValueError("Cannot invoke RPC on closed channel!")
+
+
+def cancelled_call():
+    future = Future()
+    future.cancel()
+    return future
+
+
+@pytest.mark.parametrize(
+    "make_future, code",
+    [(closed_channel, grpc.StatusCode.UNKNOWN), (cancelled_call, grpc.StatusCode.CANCELLED)],
+    ids=["closed_channel", "cancelled"],
+)
+def test_any_failed_poll_is_reported_and_retried(make_future, code):
+    errors = []
+    w = CampaignWatcher(
+        BrokenCampaigns(make_future), ["c1"], on_error=lambda c, e: errors.append(e),
+        initial_interval=0.01, min_interval=0.01, max_interval=0.01,
+    )
+    w.run(duration=0.1)
+    assert len(errors) >= 2
+    assert all(isinstance(e, Go2Error) and e.code == code for e in errors)
+
+
+def test_callback_exceptions_do_not_stop_polling(server, client, campaign):
+    campaign_id, slugs = campaign
+
+    def on_change(delta):
+        raise RuntimeError("handler bug")
+
+    def on_error(campaign_id, error):
+        raise RuntimeError("error handler bug")
+
+    def wait_for_errors(count):
+        deadline = time.monotonic() + 2
+        while w.callback_errors < count:
+            assert time.monotonic() < deadline, "timed out"
+            time.sleep(0.01)
+
+    server.click(slugs[0])
+    w = watcher(
+        client, [campaign_id], on_change=on_change, on_error=on_error,
+        emit_initial=True, max_interval=0.02,
+    )
+    with w:
+        wait_for_errors(1)
+        server.click(slugs[0])
+        wait_for_errors(2)
+        assert str(w.callback_error) == "handler bug"
+        server.set_faults(Faults(error_rate=1.0), method="GetCampaignStats")
+        wait_for_errors(3)
+    assert str(w.callback_error) == "error handler bug"
+
+
+def test_max_pending_must_be_positive(client):
+    with pytest.raises(ValueError):
+        CampaignWatcher(client.campaigns, max_pending=0)
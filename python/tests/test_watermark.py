@@ -0,0 +1,87 @@
+import pytest
+
+from go2_sdk import HighWaterMark, ValidationError
+from go2_sdk.gen.links.v1 import links_pb2
+
+
+def nanos(link):
+    return link.updated_at.seconds * 1_000_000_000 + link.updated_at.nanos
+
+
+@pytest.fixture
+def links(client):
+    created = [
+        client.links.create(slug=f"s{i}", web_url="https://example.ge") for i in range(3)
+    ]
+    # s0 becomes the most recently updated link.
+    created[0] = client.links.update(created[0].id, title="First")
+    return created
+
+
+def test_order_and_updated_since(client, links):
+    ascending = client.links.list(order=links_pb2.LINK_ORDER_UPDATED_AT_ASC).links
+    assert [link.slug for link in ascending] == ["s1", "s2", "s0"]
+    descending = client.links.list(order=links_pb2.LINK_ORDER_UPDATED_AT_DESC).links
+    assert list(descending) == list(reversed(ascending))
+    since = client.links.list(updated_since=links[2].updated_at).links
+    assert {link.slug for link in since} == {"s0", "s2"}
+    assert client.links.list(updated_since=links[0].updated_at.ToDatetime()).links[0] == links[0]
+
+
+def test_invalid_order_is_rejected(client):
+    with pytest.raises(ValidationError):
+        client.links.list(order=99)
+
+
+def test_first_sync_lists_every_link(client, links):
+    mark = HighWaterMark()
+    assert mark.value is None
+    synced = list(mark.changed(client.links))
+    assert [link.slug for link in synced] == ["s1", "s2", "s0"]
+    assert mark.nanos == nanos(links[0])
+    assert mark.value.year == links[0].updated_at.ToDatetime().year
+
+
+def test_next_sync_lists_only_changes(client, links):
+    mark = HighWaterMark()
+    list(mark.changed(client.links))
+    updated = client.links.update(links[1].id, title="Second")
+    # The link at the mark is listed again; nothing before it is.
+    assert [link.slug for link in mark.changed(client.links)] == ["s0", "s1"]
+    assert mark.nanos == nanos(updated)
+
+
+def test_mark_moves_only_past_handled_links(client, links):
+    mark = HighWaterMark()
+    changed = mark.changed(client.links)
+    next(changed)
+    assert mark.nanos == 0
+    next(changed)
+    assert mark.nanos == nanos(links[1])
+
+
+def test_fields_always_include_updated_at(client, links):
+    mark = HighWaterMark()
+    (link, *_) = mark.changed(client.links, fields=["id"])
+    assert link.slug == ""
+    assert link.updated_at == links[1].updated_at
+
+
+def test_overlap_lists_links_before_the_mark(client, links):
+    mark = HighWaterMark(overlap=3600)
+    list(mark.changed(client.links))
+    assert len(list(mark.changed(client.links))) == 3
+    with pytest.raises(ValueError):
+        HighWaterMark(overlap=-1)
+
+
+def test_save_and_reload(tmp_path, client, links):
+    path = str(tmp_path / "links.mark")
+    mark = HighWaterMark(path)
+    list(mark.changed(client.links))
+    mark.save()
+    assert HighWaterMark(path).nanos == mark.nanos
+    mark.reset()
+    assert mark.nanos == 0
+    assert len(list(mark.changed(client.links))) == 3
+    HighWaterMark().save()